@@ -3,16 +3,171 @@ gateway/research_ws_manager.py
 
 WebSocket connection manager for research monitoring dashboard.
 Manages client connections and broadcasts research events.
+
+Each connected client gets its own bounded send queue drained by a dedicated
+writer task, so a slow browser tab only delays its own events instead of
+stalling the broadcast for every observer. Events are serialized to JSON once
+per broadcast and the same text frame is queued for every recipient.
 """
 from __future__ import annotations
 import logging
-from typing import Dict, List, Set
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, List, Optional, Tuple
 from fastapi import WebSocket
 import json
 import asyncio
 
 logger = logging.getLogger(__name__)
 
+# Max events buffered per client before the drop policy kicks in
+DEFAULT_MAX_QUEUE = 256
+
+# High-frequency event types where only the latest value matters. A newer event
+# replaces a still-queued one of the same type and subject, and these are
+# dropped first when a client's queue is full.
+COALESCE_EVENT_TYPES = frozenset({
+    "progress",
+    "vendor_progress",
+    "deep_browse_progress",
+    "browser_frame",
+})
+
+# Fields (on the event or its "data") naming what a progress event is about,
+# so updates for different vendors don't replace each other
+COALESCE_SUBJECT_FIELDS = ("vendor_id", "vendor", "domain", "id")
+
+
+def coalesce_subject(event: Dict[str, Any]) -> str:
+    """What a coalescible event reports on ("" when it has no subject field)."""
+    data = event.get("data")
+    for source in (event, data if isinstance(data, dict) else {}):
+        for field in COALESCE_SUBJECT_FIELDS:
+            value = source.get(field)
+            if value not in (None, ""):
+                return str(value)
+    return ""
+
+
+@dataclass
+class ClientStats:
+    """Per-client delivery metrics (lag is enqueue -> send completed)."""
+    sent: int = 0
+    dropped: int = 0
+    coalesced: int = 0
+    last_lag_ms: float = 0.0
+    max_lag_ms: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "sent": self.sent,
+            "dropped": self.dropped,
+            "coalesced": self.coalesced,
+            "last_lag_ms": round(self.last_lag_ms, 1),
+            "max_lag_ms": round(self.max_lag_ms, 1),
+        }
+
+
+class ClientStream:
+    """
+    Bounded outbound queue plus writer task for one WebSocket client.
+
+    Queue entries are (event_type, subject, serialized_json, enqueued_at).
+    """
+
+    def __init__(self, websocket: WebSocket, session_id: str, max_queue: int = DEFAULT_MAX_QUEUE):
+        self.websocket = websocket
+        self.session_id = session_id
+        self.max_queue = max_queue
+        self.queue: Deque[Tuple[str, str, str, float]] = deque()
+        self.stats = ClientStats()
+        self.closed = False
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self, on_dead) -> None:
+        """Start the writer task. on_dead(stream) is awaited if a send fails."""
+        self._task = asyncio.create_task(self._writer(on_dead))
+
+    def enqueue(self, event_type: str, payload: str, subject: str = "") -> None:
+        """
+        Queue a serialized event without blocking the broadcaster.
+
+        Args:
+            event_type: Event type
+            payload: Serialized event
+            subject: What a coalescible event is about (see coalesce_subject)
+        """
+        if self.closed:
+            return
+
+        now = time.monotonic()
+        if event_type in COALESCE_EVENT_TYPES:
+            for i, (queued_type, queued_subject, _, enqueued_at) in enumerate(self.queue):
+                if queued_type == event_type and queued_subject == subject:
+                    # Move the update behind anything queued since, so the client
+                    # never sees it before events that came earlier. Keep the
+                    # original enqueue time so lag reflects how stale the slot is.
+                    del self.queue[i]
+                    self.queue.append((event_type, subject, payload, enqueued_at))
+                    self.stats.coalesced += 1
+                    return
+
+        if len(self.queue) >= self.max_queue and not self._make_room(event_type):
+            self.stats.dropped += 1
+            return
+
+        self.queue.append((event_type, subject, payload, now))
+        self._wakeup.set()
+
+    def _make_room(self, incoming_type: str) -> bool:
+        """Drop the oldest coalescible event to fit a new one. Returns False if the new one should be dropped."""
+        for i, (queued_type, _, _, _) in enumerate(self.queue):
+            if queued_type in COALESCE_EVENT_TYPES:
+                del self.queue[i]
+                self.stats.dropped += 1
+                return True
+        # Queue is full of milestone events: a new tick is the least valuable thing here
+        if incoming_type in COALESCE_EVENT_TYPES:
+            return False
+        self.queue.popleft()
+        self.stats.dropped += 1
+        return True
+
+    async def _writer(self, on_dead) -> None:
+        try:
+            while not self.closed:
+                if not self.queue:
+                    self._wakeup.clear()
+                    await self._wakeup.wait()
+                    continue
+                _, _, payload, enqueued_at = self.queue.popleft()
+                await self.websocket.send_text(payload)
+                lag_ms = (time.monotonic() - enqueued_at) * 1000
+                self.stats.sent += 1
+                self.stats.last_lag_ms = lag_ms
+                self.stats.max_lag_ms = max(self.stats.max_lag_ms, lag_ms)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"[ResearchWS] Failed to send to client in session {self.session_id}: {e}")
+            self.closed = True
+            await on_dead(self)
+
+    async def close(self) -> None:
+        """Stop the writer task; queued events are discarded."""
+        self.closed = True
+        if self._task and self._task is not asyncio.current_task():
+            self._task.cancel()
+            try:
+                await self._task
+            except (asyncio.CancelledError, Exception):
+                pass
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {"queue_depth": len(self.queue), **self.stats.to_dict()}
+
 
 class ResearchWebSocketManager:
     """
@@ -24,9 +179,10 @@ class ResearchWebSocketManager:
     - Track active research sessions
     """
 
-    def __init__(self):
-        # WebSocket connections by session_id
-        self.connections: Dict[str, Set[WebSocket]] = {}
+    def __init__(self, max_queue: int = DEFAULT_MAX_QUEUE):
+        # Client streams by session_id, keyed by WebSocket
+        self.connections: Dict[str, Dict[WebSocket, ClientStream]] = {}
+        self.max_queue = max_queue
         # Lock for thread-safe operations
         self.lock = asyncio.Lock()
 
@@ -40,10 +196,12 @@ class ResearchWebSocketManager:
         """
         await websocket.accept()
 
+        stream = ClientStream(websocket, session_id, max_queue=self.max_queue)
         async with self.lock:
             if session_id not in self.connections:
-                self.connections[session_id] = set()
-            self.connections[session_id].add(websocket)
+                self.connections[session_id] = {}
+            self.connections[session_id][websocket] = stream
+        stream.start(self._on_dead_stream)
 
         logger.info(f"[ResearchWS] Client connected to session {session_id} "
                    f"(total: {len(self.connections[session_id])} clients)")
@@ -57,46 +215,57 @@ class ResearchWebSocketManager:
             session_id: Research session identifier
         """
         async with self.lock:
-            if session_id in self.connections:
-                self.connections[session_id].discard(websocket)
-                if not self.connections[session_id]:
-                    del self.connections[session_id]
+            stream = self._remove(websocket, session_id)
+
+        if stream:
+            await stream.close()
 
         logger.info(f"[ResearchWS] Client disconnected from session {session_id}")
 
+    def _remove(self, websocket: WebSocket, session_id: str) -> Optional[ClientStream]:
+        """Drop a client from the registry (caller holds the lock)."""
+        streams = self.connections.get(session_id)
+        if not streams:
+            return None
+        stream = streams.pop(websocket, None)
+        if not streams:
+            del self.connections[session_id]
+        return stream
+
+    async def _on_dead_stream(self, stream: ClientStream):
+        """Writer task hit a send error - forget the client."""
+        async with self.lock:
+            self._remove(stream.websocket, stream.session_id)
+
     async def broadcast_event(self, session_id: str, event: Dict):
         """
         Broadcast an event to all clients in a session.
 
+        Never waits on a client: the event is serialized once and queued on each
+        client's stream, and each writer task delivers at its own pace.
+
         Args:
             session_id: Research session identifier
             event: Event data to broadcast
         """
-        if session_id not in self.connections:
+        streams = self.connections.get(session_id)
+        if not streams:
             logger.warning(f"[ResearchWS] No connections found for session {session_id}")
             return
 
-        # Get snapshot of connections
-        async with self.lock:
-            websockets = self.connections.get(session_id, set()).copy()
+        event_type = event.get("type")
+        # Same compact encoding as WebSocket.send_json
+        payload = json.dumps(event, separators=(",", ":"), ensure_ascii=False)
 
-        logger.info(f"[ResearchWS] Broadcasting {event.get('type')} to {len(websockets)} clients in session {session_id}")
+        subject = ""
+        if event_type in COALESCE_EVENT_TYPES:
+            subject = coalesce_subject(event)
+            logger.debug(f"[ResearchWS] Broadcasting {event_type} to {len(streams)} clients in session {session_id}")
+        else:
+            logger.info(f"[ResearchWS] Broadcasting {event_type} to {len(streams)} clients in session {session_id}")
 
-        # Broadcast to all (remove dead connections)
-        dead_connections = []
-        for websocket in websockets:
-            try:
-                await websocket.send_json(event)
-            except Exception as e:
-                logger.warning(f"[ResearchWS] Failed to send to client: {e}")
-                dead_connections.append(websocket)
-
-        # Clean up dead connections
-        if dead_connections:
-            async with self.lock:
-                for websocket in dead_connections:
-                    if session_id in self.connections:
-                        self.connections[session_id].discard(websocket)
+        for stream in list(streams.values()):
+            stream.enqueue(event_type, payload, subject)
 
     async def broadcast_to_all(self, event: Dict):
         """
@@ -105,10 +274,7 @@ class ResearchWebSocketManager:
         Args:
             event: Event data to broadcast
         """
-        async with self.lock:
-            all_sessions = list(self.connections.keys())
-
-        for session_id in all_sessions:
+        for session_id in list(self.connections.keys()):
             await self.broadcast_event(session_id, event)
 
     def get_active_sessions(self) -> List[str]:
@@ -117,7 +283,24 @@ class ResearchWebSocketManager:
 
     def get_client_count(self, session_id: str) -> int:
         """Get number of connected clients for a session."""
-        return len(self.connections.get(session_id, set()))
+        return len(self.connections.get(session_id, {}))
+
+    def get_client_stats(self, session_id: str = None) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Per-client queue depth, delivery counts and lag.
+
+        Args:
+            session_id: Limit to one session (default: all sessions)
+
+        Returns:
+            Dict of session_id -> list of per-client stats dicts
+        """
+        sessions = [session_id] if session_id else list(self.connections.keys())
+        return {
+            sid: [stream.snapshot() for stream in self.connections.get(sid, {}).values()]
+            for sid in sessions
+            if sid in self.connections
+        }
 
 
 # Global instance
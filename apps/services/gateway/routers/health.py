@@ -63,6 +63,7 @@ async def health_detailed() -> Dict[str, Any]:
         get_llm_client,
         get_claim_registry,
         get_session_contexts,
+        get_research_ws_manager,
     )
     # NOTE: get_tool_router and get_intent_classifier removed - replaced by LLM-driven user_purpose
 
@@ -111,4 +112,6 @@ async def health_detailed() -> Dict[str, Any]:
         "status": status,
         "unified_flow_enabled": is_unified_flow_enabled(),
         "checks": checks,
+        # Per-client queue depth / lag for research monitor sockets
+        "research_ws_clients": get_research_ws_manager().get_client_stats(),
     }
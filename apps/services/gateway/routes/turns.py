@@ -4,8 +4,9 @@ Architecture Reference:
     architecture/services/user-interface.md#Section 6
 
 Endpoints:
-    GET /turns          - List recent turns
-    GET /turns/{id}     - Get specific turn
+    GET /turns              - List recent turns
+    GET /turns/{id}         - Get specific turn
+    GET /turns/{id}/trace   - Span trace of a turn (JSON or flamegraph HTML)
 """
 
 import logging
@@ -13,9 +14,12 @@ from typing import Any, Optional
 
 import httpx
 from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import HTMLResponse
 from pydantic import BaseModel, Field
 
 from apps.services.gateway.config import get_config
+from libs.core.tracing import load_trace, render_flamegraph_html
+from libs.gateway.persistence.user_paths import UserPathResolver
 
 
 logger = logging.getLogger(__name__)
@@ -168,3 +172,37 @@ async def get_turn(turn_id: int) -> TurnDetail:
             status_code=503,
             detail={"error": "Tool Server service unavailable"},
         )
+
+
+@router.get("/{turn_id}/trace")
+async def get_turn_trace(
+    turn_id: int,
+    user_id: Optional[str] = Query(default=None, description="User whose turns directory to read"),
+    format: str = Query(default="html", pattern="^(html|json)$", description="html (flamegraph) or json"),
+):
+    """Get the span trace of a turn.
+
+    Spans cover the turn, its phases, tool calls (gateway and tool server side)
+    and LLM calls, as written to trace.json next to the turn's context.md.
+
+    Args:
+        turn_id: Turn number
+        user_id: Optional user ID (default user if omitted)
+        format: "html" for a flamegraph view, "json" for the raw trace
+
+    Returns:
+        Flamegraph HTML page or the trace document
+    """
+    turn_dir = UserPathResolver(user_id).turns_dir / f"turn_{turn_id:06d}"
+    try:
+        trace = load_trace(turn_dir)
+    except (OSError, ValueError) as e:
+        logger.error(f"Failed to load trace for turn {turn_id}: {e}")
+        raise HTTPException(status_code=500, detail={"error": f"Unreadable trace for turn {turn_id}"})
+
+    if trace is None:
+        raise HTTPException(status_code=404, detail={"error": f"No trace for turn {turn_id}"})
+
+    if format == "json":
+        return trace
+    return HTMLResponse(render_flamegraph_html(trace, title=f"Turn {turn_id}"))
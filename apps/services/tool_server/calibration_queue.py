@@ -0,0 +1,310 @@
+"""
+orchestrator/calibration_queue.py
+
+Background site schema (re)calibration, off the user request path.
+
+Calibration is a multi-second LLM job. Instead of running it inline in the
+middle of a user's search, extraction code asks this queue for it and
+carries on with the schema it has (or the universal JS / HTML+vision
+extractors):
+
+- Jobs are de-duplicated per (domain, page_type) and ordered by priority:
+  traffic (requests seen + schema uses) weighted by failure rate, so busy,
+  degrading sites are recalibrated first
+- A worker loop runs jobs on a dedicated browser session
+  (CALIBRATION_SESSION_ID), never on a user's page
+- The result is published to SiteSchemaRegistry with a single registry
+  assignment, so concurrent requests see either the old schema or the new
+  one; the new version also invalidates compiled extraction plans
+- Failed calibrations are not retried for CALIBRATION_RETRY_SECONDS
+
+Usage:
+    queue = get_calibration_queue()
+    queue.request("shop.com", "listing", url, reason="schema failing")
+"""
+import asyncio
+import heapq
+import itertools
+import logging
+import os
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+from apps.services.tool_server.shared_state.site_schema_registry import (
+    SiteSchema,
+    SiteSchemaRegistry,
+    get_schema_registry,
+)
+
+logger = logging.getLogger(__name__)
+
+CALIBRATION_SESSION_ID = "schema_calibration"
+CALIBRATION_RETRY_SECONDS = float(os.getenv("CALIBRATION_RETRY_SECONDS", "600"))
+CALIBRATION_WORKERS = int(os.getenv("CALIBRATION_WORKERS", "1"))
+CALIBRATION_TIMEOUT_SECONDS = float(os.getenv("CALIBRATION_TIMEOUT_SECONDS", "120"))
+
+# (page, url, page_type) -> calibrated schema (SiteSchema or adapter ExtractionSchema)
+CalibrateFunc = Callable[[Any, str, str], Awaitable[Any]]
+# (job) -> page navigated to job.url
+OpenPageFunc = Callable[["CalibrationJob"], Awaitable[Any]]
+
+
+@dataclass
+class CalibrationJob:
+    """A pending (re)calibration."""
+    domain: str
+    page_type: str
+    url: str
+    reason: str
+    priority: float
+    seq: int
+
+    @property
+    def key(self) -> str:
+        return f"{self.domain}:{self.page_type}"
+
+
+async def _default_open_page(job: CalibrationJob) -> Any:
+    """Open the job URL in the dedicated calibration browser session."""
+    from apps.services.tool_server.crawler_session_manager import get_crawler_session_manager
+    context = await get_crawler_session_manager().get_or_create_session(
+        domain=job.domain,
+        session_id=CALIBRATION_SESSION_ID
+    )
+    page = await context.new_page()
+    await page.goto(job.url, wait_until="domcontentloaded", timeout=30000)
+    return page
+
+
+async def _default_calibrate(page: Any, url: str, page_type: str) -> Any:
+    from apps.services.tool_server.page_intelligence.legacy_adapter import get_smart_calibrator
+    return await get_smart_calibrator().calibrate(page, url, force=True)
+
+
+def _to_site_schema(result: Any, domain: str, page_type: str) -> Optional[SiteSchema]:
+    """Convert a calibrator result to a SiteSchema (None if it has no card selector)."""
+    if isinstance(result, SiteSchema):
+        return result if result.product_card_selector else None
+    card = getattr(result, "product_card_selector", None)
+    if not card:
+        return None
+    return SiteSchema(
+        domain=domain,
+        page_type=page_type,
+        product_card_selector=card,
+        product_link_selector=(
+            getattr(result, "product_link_selector", None) or getattr(result, "link_selector", None) or None
+        ),
+        price_selector=getattr(result, "price_selector", None) or None,
+        title_selector=getattr(result, "title_selector", None) or None,
+        image_selector=getattr(result, "image_selector", None) or None,
+    )
+
+
+class CalibrationQueue:
+    """Priority queue of schema calibrations with a background worker."""
+
+    def __init__(
+        self,
+        registry: Optional[SiteSchemaRegistry] = None,
+        calibrate: Optional[CalibrateFunc] = None,
+        open_page: Optional[OpenPageFunc] = None,
+        workers: int = CALIBRATION_WORKERS,
+        retry_after: float = CALIBRATION_RETRY_SECONDS,
+        timeout: float = CALIBRATION_TIMEOUT_SECONDS
+    ):
+        """
+        Args:
+            registry: Schema registry results are published to (default global)
+            calibrate: Calibration function (default PageIntelligence adapter)
+            open_page: Opens a fresh page on the job URL (default calibration session)
+            workers: Concurrent calibrations
+            retry_after: Seconds before a failed calibration may be queued again
+            timeout: Per-calibration timeout in seconds
+        """
+        self._registry = registry
+        self._calibrate = calibrate or _default_calibrate
+        self._open_page = open_page or _default_open_page
+        self._workers = max(1, workers)
+        self._retry_after = retry_after
+        self._timeout = timeout
+
+        self._heap: List[Tuple[float, int, str]] = []
+        self._jobs: Dict[str, CalibrationJob] = {}
+        self._in_progress: Set[str] = set()
+        self._failed_at: Dict[str, float] = {}
+        self._traffic: Dict[str, int] = {}
+        self._seq = itertools.count()
+        self._tasks: List[asyncio.Task] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._idle: Optional[asyncio.Event] = None
+        self._stats = {"requested": 0, "completed": 0, "failed": 0}
+
+    @property
+    def registry(self) -> SiteSchemaRegistry:
+        return self._registry or get_schema_registry()
+
+    # ------------------------------------------------------------------
+    # Requests
+    # ------------------------------------------------------------------
+
+    def note_request(self, domain: str, page_type: str = "listing") -> None:
+        """Count an extraction request for a domain (feeds priority)."""
+        key = f"{domain}:{page_type}"
+        self._traffic[key] = self._traffic.get(key, 0) + 1
+
+    def priority(self, domain: str, page_type: str = "listing") -> float:
+        """Traffic weighted by failure rate; missing schemas count as failing."""
+        key = f"{domain}:{page_type}"
+        schema = self.registry.get(domain, page_type)
+        traffic = self._traffic.get(key, 0)
+        if schema is None:
+            return (traffic + 1) * 2.0
+        total = schema.successful_extractions + schema.failed_extractions
+        failure_rate = 1.0 - schema.success_rate if total else 0.0
+        failure_rate = max(failure_rate, min(1.0, schema.consecutive_failures / 3))
+        return (traffic + schema.total_uses + 1) * (1.0 + failure_rate)
+
+    def request(self, domain: str, page_type: str, url: str, reason: str = "") -> bool:
+        """
+        Queue a (re)calibration; never blocks.
+
+        Returns:
+            True if queued (or re-prioritized), False if already running or
+            recently failed
+        """
+        key = f"{domain}:{page_type}"
+        if key in self._in_progress:
+            return False
+        failed_at = self._failed_at.get(key)
+        if failed_at is not None and time.monotonic() - failed_at < self._retry_after:
+            logger.debug(f"[CalibrationQueue] {key} failed recently, not re-queued")
+            return False
+
+        priority = self.priority(domain, page_type)
+        job = CalibrationJob(domain, page_type, url, reason, priority, next(self._seq))
+        is_new = key not in self._jobs
+        self._jobs[key] = job  # older heap entries for this key become stale
+        heapq.heappush(self._heap, (-priority, job.seq, key))
+        if is_new:
+            self._stats["requested"] += 1
+            logger.info(f"[CalibrationQueue] Queued {key} (priority {priority:.1f}): {reason}")
+
+        self._ensure_workers()
+        if self._idle is not None:
+            self._idle.clear()
+        self._wakeup.set()
+        return True
+
+    def is_pending(self, domain: str, page_type: str = "listing") -> bool:
+        """True while a calibration is queued or running."""
+        key = f"{domain}:{page_type}"
+        return key in self._jobs or key in self._in_progress
+
+    async def join(self) -> None:
+        """Wait until the queue is empty and no calibration is running."""
+        if self._idle is None:
+            return
+        while self._jobs or self._in_progress:
+            self._idle.clear()
+            await self._idle.wait()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Queue length, running jobs and counters."""
+        return {
+            **self._stats,
+            "queued": len(self._jobs),
+            "running": sorted(self._in_progress),
+        }
+
+    # ------------------------------------------------------------------
+    # Worker
+    # ------------------------------------------------------------------
+
+    def _ensure_workers(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # First use, or a new event loop: workers of the old loop are gone
+            self._loop = loop
+            self._tasks = []
+            self._wakeup = asyncio.Event()
+            self._idle = asyncio.Event()
+        self._tasks = [t for t in self._tasks if not t.done()]
+        while len(self._tasks) < self._workers:
+            self._tasks.append(loop.create_task(self._worker()))
+
+    def _pop(self) -> Optional[CalibrationJob]:
+        while self._heap:
+            _, seq, key = heapq.heappop(self._heap)
+            job = self._jobs.get(key)
+            if job is not None and job.seq == seq:
+                del self._jobs[key]
+                return job
+        return None
+
+    async def _worker(self) -> None:
+        while True:
+            job = self._pop()
+            if job is None:
+                if not self._in_progress:
+                    self._idle.set()
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            self._in_progress.add(job.key)
+            try:
+                await self._run(job)
+            finally:
+                self._in_progress.discard(job.key)
+                if not self._jobs and not self._in_progress:
+                    self._idle.set()
+
+    async def _run(self, job: CalibrationJob) -> None:
+        started = time.monotonic()
+        page = None
+        try:
+            page = await self._open_page(job)
+            result = await asyncio.wait_for(self._calibrate(page, job.url, job.page_type), timeout=self._timeout)
+            schema = _to_site_schema(result, job.domain, job.page_type)
+            if schema is None:
+                raise ValueError("calibration produced no card selector")
+
+            # Publish: one registry assignment swaps the schema for all readers
+            if self.registry.get(job.domain, job.page_type) is not schema:
+                self.registry.save(schema)
+            self._failed_at.pop(job.key, None)
+            self._stats["completed"] += 1
+            logger.info(
+                f"[CalibrationQueue] Calibrated {job.key} in {time.monotonic() - started:.1f}s "
+                f"(v{schema.version}, card={schema.product_card_selector})"
+            )
+        except Exception as e:
+            self._failed_at[job.key] = time.monotonic()
+            self._stats["failed"] += 1
+            logger.warning(f"[CalibrationQueue] Calibration failed for {job.key}: {e}")
+        finally:
+            if page is not None:
+                try:
+                    await page.close()
+                except Exception:
+                    pass
+
+
+# Global singleton instance
+_global_queue: Optional[CalibrationQueue] = None
+
+
+def get_calibration_queue() -> CalibrationQueue:
+    """
+    Get the global calibration queue.
+
+    Returns:
+        CalibrationQueue singleton
+    """
+    global _global_queue
+    if _global_queue is None:
+        _global_queue = CalibrationQueue()
+    return _global_queue
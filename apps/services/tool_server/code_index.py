@@ -0,0 +1,444 @@
+"""
+orchestrator/code_index.py
+
+Persistent per-repository code index for code-mode tools.
+
+One SQLite database per repository (under panda_system_docs/code_index/) holds,
+for every indexable source file:
+- line count, size, language and content hash
+- symbols (classes/functions) with line spans and docstrings
+- imports, resolved to repo paths where possible (gives the reverse-import graph)
+
+Files are keyed by content hash: a file whose mtime changed but whose bytes did
+not is only re-stamped, never re-parsed. Refresh is incremental - every listed
+file is stat()ed and only changed ones are parsed, in a process pool when there
+are many (first build of a large repo).
+
+Used by file.read_outline, repo.scope_discover and context.snapshot_repo so
+repeated code-mode turns stop re-reading and re-scanning the same files.
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import re
+import sqlite3
+import subprocess
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+INDEX_DIR = Path("panda_system_docs/code_index")
+
+# Files we parse for symbols/imports; everything else text-like only gets a line count
+SYMBOL_EXTENSIONS = (".py", ".js", ".ts", ".jsx", ".tsx")
+SKIP_EXTENSIONS = (".pyc", ".so", ".o", ".log", ".lock", ".png", ".jpg", ".jpeg", ".gif",
+                   ".ico", ".pdf", ".zip", ".gz", ".tar", ".whl", ".db", ".sqlite", ".woff", ".woff2")
+SKIP_DIRS = {".git", "__pycache__", "node_modules", ".venv", "venv", ".mypy_cache", ".pytest_cache"}
+MAX_FILE_BYTES = 2 * 1024 * 1024
+
+# Parse in a process pool only when this many files changed (pool startup isn't free)
+PARALLEL_THRESHOLD = 64
+
+LANGUAGE_MAP = {
+    '.py': 'python',
+    '.js': 'javascript',
+    '.ts': 'typescript',
+    '.jsx': 'jsx',
+    '.tsx': 'tsx',
+    '.java': 'java',
+    '.go': 'go',
+    '.rs': 'rust',
+    '.c': 'c',
+    '.cpp': 'cpp',
+    '.rb': 'ruby'
+}
+
+_PY_IMPORT_RE = re.compile(r'^\s*(?:from\s+(\.*[\w\.]*)\s+import|import\s+([\w\.]+))', re.MULTILINE)
+_JS_IMPORT_RES = (
+    re.compile(r'import\s+.*?from\s+[\'"]([^\'"]+)[\'"]'),
+    re.compile(r'require\s*\([\'"]([^\'"]+)[\'"]\)'),
+)
+
+
+# ============================================================================
+# File parsing (runs in worker processes - keep module-level and picklable)
+# ============================================================================
+
+def parse_source_file(args: Tuple[str, str]) -> Optional[Dict[str, Any]]:
+    """
+    Read and parse one file.
+
+    Args:
+        args: (repo_root, relative_path)
+
+    Returns:
+        Dict with hash/size/mtime/lines/language/symbols/imports, or None if unreadable
+    """
+    from apps.services.tool_server.file_operations_mcp import (
+        _extract_python_symbols,
+        _extract_js_symbols,
+    )
+
+    root, rel_path = args
+    full_path = os.path.join(root, rel_path)
+    try:
+        stat = os.stat(full_path)
+        with open(full_path, 'rb') as f:
+            data = f.read()
+    except OSError:
+        return None
+
+    text = data.decode('utf-8', errors='ignore')
+    lines = text.split('\n')
+    ext = os.path.splitext(rel_path)[1]
+
+    symbols: List[Dict[str, Any]] = []
+    imports: List[str] = []
+    if ext == '.py':
+        symbols = _extract_python_symbols(lines, include_docstrings=True)
+        imports = [m.group(1) or m.group(2) for m in _PY_IMPORT_RE.finditer(text)]
+    elif ext in SYMBOL_EXTENSIONS:
+        symbols = _extract_js_symbols(lines)
+        imports = [m.group(1) for pattern in _JS_IMPORT_RES for m in pattern.finditer(text)]
+
+    # Same count as iterating the file line by line
+    line_count = text.count('\n') + (0 if not text or text.endswith('\n') else 1)
+
+    # Span: a symbol ends where the next symbol at the same or shallower indent starts
+    for i, sym in enumerate(symbols):
+        end_line = line_count
+        for later in symbols[i + 1:]:
+            if later.get("indent", 0) <= sym.get("indent", 0):
+                end_line = later["line"] - 1
+                break
+        sym["end_line"] = end_line
+
+    return {
+        "path": rel_path,
+        "content_hash": hashlib.sha1(data).hexdigest(),
+        "mtime": stat.st_mtime,
+        "size": stat.st_size,
+        "lines": line_count,
+        "language": LANGUAGE_MAP.get(ext, 'unknown'),
+        "symbols": symbols,
+        "imports": list(dict.fromkeys(i for i in imports if i)),
+    }
+
+
+# ============================================================================
+# Index
+# ============================================================================
+
+class RepoCodeIndex:
+    """SQLite code index for one repository."""
+
+    def __init__(self, repo_path: str, db_path: Optional[Path] = None):
+        self.root = Path(repo_path).resolve()
+        if db_path is None:
+            digest = hashlib.sha1(str(self.root).encode()).hexdigest()[:16]
+            db_path = INDEX_DIR / f"{self.root.name}-{digest}.db"
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._init_db()
+
+    def _init_db(self):
+        with self._lock:
+            self._conn.executescript("""
+                CREATE TABLE IF NOT EXISTS files (
+                    path TEXT PRIMARY KEY,
+                    content_hash TEXT NOT NULL,
+                    mtime REAL NOT NULL,
+                    size INTEGER NOT NULL,
+                    lines INTEGER NOT NULL,
+                    language TEXT NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS symbols (
+                    path TEXT NOT NULL,
+                    kind TEXT NOT NULL,
+                    name TEXT NOT NULL,
+                    line INTEGER NOT NULL,
+                    end_line INTEGER NOT NULL,
+                    indent INTEGER NOT NULL,
+                    docstring TEXT
+                );
+                CREATE INDEX IF NOT EXISTS idx_symbols_path ON symbols(path, line);
+                CREATE INDEX IF NOT EXISTS idx_symbols_name ON symbols(name);
+                CREATE TABLE IF NOT EXISTS imports (
+                    path TEXT NOT NULL,
+                    module TEXT NOT NULL,
+                    resolved_path TEXT
+                );
+                CREATE INDEX IF NOT EXISTS idx_imports_path ON imports(path);
+                CREATE INDEX IF NOT EXISTS idx_imports_resolved ON imports(resolved_path);
+            """)
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    # ------------------------------------------------------------------
+    # Refresh
+    # ------------------------------------------------------------------
+
+    def list_files(self) -> List[str]:
+        """Tracked + untracked-but-not-ignored files (git), or a filtered walk."""
+        try:
+            result = subprocess.run(
+                ["git", "ls-files", "-co", "--exclude-standard"],
+                cwd=self.root, capture_output=True, text=True, timeout=10
+            )
+            if result.returncode == 0:
+                return [p for p in result.stdout.split("\n") if p and self._indexable(p)]
+        except (OSError, subprocess.TimeoutExpired) as e:
+            logger.debug(f"[CodeIndex] git ls-files failed: {e}")
+
+        files = []
+        for dirpath, dirnames, filenames in os.walk(self.root):
+            dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS]
+            for name in filenames:
+                rel = os.path.relpath(os.path.join(dirpath, name), self.root)
+                if self._indexable(rel):
+                    files.append(rel)
+        return files
+
+    @staticmethod
+    def _indexable(rel_path: str) -> bool:
+        parts = rel_path.replace("\\", "/").split("/")
+        return not rel_path.endswith(SKIP_EXTENSIONS) and not any(p in SKIP_DIRS for p in parts[:-1])
+
+    def refresh(self, paths: Optional[Iterable[str]] = None) -> Dict[str, int]:
+        """
+        Bring the index up to date.
+
+        Args:
+            paths: Relative paths to check (default: every file in the repo).
+                   With the default, files that disappeared are dropped too.
+
+        Returns:
+            {"checked", "parsed", "unchanged", "removed"} counts
+        """
+        full_scan = paths is None
+        candidates = self.list_files() if full_scan else [p for p in dict.fromkeys(paths) if p]
+
+        with self._lock:
+            known = {row["path"]: (row["mtime"], row["size"], row["content_hash"])
+                     for row in self._conn.execute("SELECT path, mtime, size, content_hash FROM files")}
+
+        stale = []
+        missing = []
+        for rel in candidates:
+            try:
+                stat = os.stat(self.root / rel)
+            except OSError:
+                missing.append(rel)
+                continue
+            if stat.st_size > MAX_FILE_BYTES:
+                continue
+            prev = known.get(rel)
+            if prev is None or prev[0] != stat.st_mtime or prev[1] != stat.st_size:
+                stale.append(rel)
+
+        if full_scan:
+            listed = set(candidates)
+            missing.extend(p for p in known if p not in listed)
+
+        parsed = self._parse_all(stale)
+
+        reparsed = unchanged = 0
+        with self._lock:
+            try:
+                for info in parsed:
+                    prev = known.get(info["path"])
+                    if prev and prev[2] == info["content_hash"]:
+                        # Touched but identical - keep symbols, just re-stamp
+                        self._conn.execute(
+                            "UPDATE files SET mtime = ?, size = ? WHERE path = ?",
+                            (info["mtime"], info["size"], info["path"])
+                        )
+                        unchanged += 1
+                    else:
+                        self._store(info)
+                        reparsed += 1
+                for rel in missing:
+                    self._delete(rel)
+                self._conn.commit()
+            except Exception:
+                self._conn.rollback()
+                raise
+
+        if reparsed or missing:
+            logger.info(
+                f"[CodeIndex] {self.root.name}: checked {len(candidates)}, parsed {reparsed}, "
+                f"unchanged {unchanged}, removed {len(missing)}"
+            )
+        return {"checked": len(candidates), "parsed": reparsed, "unchanged": unchanged, "removed": len(missing)}
+
+    def _parse_all(self, rel_paths: List[str]) -> List[Dict[str, Any]]:
+        jobs = [(str(self.root), rel) for rel in rel_paths]
+        if len(jobs) >= PARALLEL_THRESHOLD:
+            workers = min(os.cpu_count() or 2, 8)
+            try:
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    results = list(pool.map(parse_source_file, jobs, chunksize=32))
+                return [r for r in results if r]
+            except Exception as e:
+                logger.warning(f"[CodeIndex] Process pool failed ({e}), parsing inline")
+        return [r for r in map(parse_source_file, jobs) if r]
+
+    def _store(self, info: Dict[str, Any]):
+        path = info["path"]
+        self._delete(path)
+        self._conn.execute(
+            "INSERT INTO files (path, content_hash, mtime, size, lines, language) VALUES (?, ?, ?, ?, ?, ?)",
+            (path, info["content_hash"], info["mtime"], info["size"], info["lines"], info["language"])
+        )
+        self._conn.executemany(
+            "INSERT INTO symbols (path, kind, name, line, end_line, indent, docstring) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [(path, s["type"], s["name"], s["line"], s["end_line"], s.get("indent", 0), s.get("docstring"))
+             for s in info["symbols"]]
+        )
+        self._conn.executemany(
+            "INSERT INTO imports (path, module, resolved_path) VALUES (?, ?, ?)",
+            [(path, module, self._resolve_import(path, module)) for module in info["imports"]]
+        )
+
+    def _delete(self, path: str):
+        for table in ("files", "symbols", "imports"):
+            self._conn.execute(f"DELETE FROM {table} WHERE path = ?", (path,))
+
+    def _resolve_import(self, importer: str, module: str) -> Optional[str]:
+        """Map an import to a repo-relative file, if it points inside the repo."""
+        importer_dir = Path(importer).parent
+        if importer.endswith(".py"):
+            if module.startswith("."):
+                dots = len(module) - len(module.lstrip("."))
+                base = importer_dir
+                for _ in range(dots - 1):
+                    base = base.parent
+                rest = module.lstrip(".")
+                stem = base.joinpath(*rest.split(".")) if rest else base
+            else:
+                stem = Path(*module.split("."))
+            candidates = [stem.with_suffix(".py"), stem / "__init__.py"]
+        else:
+            if not module.startswith("."):
+                return None
+            stem = Path(os.path.normpath(importer_dir / module))
+            candidates = [Path(f"{stem}{ext}") for ext in ("", ".ts", ".tsx", ".js", ".jsx")]
+            candidates += [stem / f"index{ext}" for ext in (".ts", ".tsx", ".js", ".jsx")]
+
+        for candidate in candidates:
+            if (self.root / candidate).is_file():
+                return candidate.as_posix()
+        return None
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def file_info(self, paths: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """Line count, size and language for indexed files."""
+        paths = list(paths)
+        if not paths:
+            return {}
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT path, lines, size, language FROM files WHERE path IN ({','.join('?' * len(paths))})",
+                paths
+            ).fetchall()
+        return {row["path"]: {"lines": row["lines"], "size": row["size"], "language": row["language"]} for row in rows}
+
+    def symbols(self, path: str) -> List[Dict[str, Any]]:
+        """Symbols of one file in line order (same shape as file.read_outline)."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT kind, name, line, end_line, indent, docstring FROM symbols WHERE path = ? ORDER BY line, rowid",
+                (path,)
+            ).fetchall()
+        return [
+            {"type": row["kind"], "name": row["name"], "line": row["line"], "end_line": row["end_line"],
+             "indent": row["indent"], "docstring": row["docstring"]}
+            for row in rows
+        ]
+
+    def imports(self, paths: Iterable[str], top_level: bool = True) -> Dict[str, List[str]]:
+        """
+        Non-relative imports per file, in source order.
+
+        Args:
+            top_level: Reduce "a.b.c" / "pkg/sub" to "a" / "pkg" (what scope discovery reports)
+        """
+        paths = list(paths)
+        if not paths:
+            return {}
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT path, module FROM imports WHERE path IN ({','.join('?' * len(paths))}) ORDER BY rowid",
+                paths
+            ).fetchall()
+        result: Dict[str, List[str]] = {}
+        for row in rows:
+            module = row["module"]
+            if module.startswith("."):
+                continue
+            if top_level:
+                module = re.split(r"[./]", module, maxsplit=1)[0]
+            deps = result.setdefault(row["path"], [])
+            if module not in deps:
+                deps.append(module)
+        return result
+
+    def importers(self, path: str) -> List[str]:
+        """Files in the repo that import the given file (reverse-import graph)."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT DISTINCT path FROM imports WHERE resolved_path = ? ORDER BY path", (path,)
+            ).fetchall()
+        return [row["path"] for row in rows]
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            files = self._conn.execute("SELECT COUNT(*) FROM files").fetchone()[0]
+            symbols = self._conn.execute("SELECT COUNT(*) FROM symbols").fetchone()[0]
+        return {"files": files, "symbols": symbols}
+
+    def is_empty(self) -> bool:
+        with self._lock:
+            return self._conn.execute("SELECT 1 FROM files LIMIT 1").fetchone() is None
+
+
+# ============================================================================
+# Registry
+# ============================================================================
+
+_indexes: Dict[Path, RepoCodeIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_code_index(repo_path: str) -> RepoCodeIndex:
+    """Get (or open) the index for a repository root."""
+    root = Path(repo_path).resolve()
+    with _indexes_lock:
+        index = _indexes.get(root)
+        if index is None:
+            index = _indexes[root] = RepoCodeIndex(str(root))
+        return index
+
+
+def find_repo_root(file_path: str) -> Optional[Path]:
+    """Nearest ancestor directory containing .git, or None."""
+    path = Path(file_path).resolve()
+    for parent in [path] + list(path.parents):
+        if (parent / ".git").exists():
+            return parent
+    return None
@@ -7,9 +7,13 @@ capabilities similar to Claude Code's file operation tools.
 
 import glob
 import hashlib
+import mmap
 import os
 import re
 import subprocess
+import threading
+from array import array
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -23,6 +27,12 @@ CHUNK_SIZE = 100_000
 DEFAULT_LINE_LIMIT = 2000
 # Maximum line length before truncation
 MAX_LINE_LENGTH = 2000
+# Files whose line index is kept for ranged reads
+LINE_INDEX_CACHE_SIZE = 32
+
+# Line breaks str.splitlines() honours besides \n / \r\n. Files containing any of
+# these (or a lone \r) are split the old way so line numbering stays identical.
+_SPECIAL_LINE_BREAKS = re.compile(rb"\r(?!\n)|[\x0b\x0c\x1c\x1d\x1e]|\xc2\x85|\xe2\x80[\xa8\xa9]")
 
 
 def _safe_path(base_path: str, target_path: str) -> Path:
@@ -41,6 +51,96 @@ def _digest(text: str) -> str:
     return hashlib.sha256(text.encode('utf-8')).hexdigest()[:16]
 
 
+class _LineIndex:
+    """
+    Newline offsets and digest for one version (mtime, size) of a file.
+
+    Built with one pass over a memory map; afterwards a ranged read maps the
+    file and decodes only the requested lines.
+    """
+
+    def __init__(self, path: Path, mtime_ns: int, size: int):
+        self.version = (mtime_ns, size)
+        # Byte offset where each line starts
+        self.starts = array("Q")
+        # Only for files with unusual line breaks: the fully split text
+        self.split_lines: Optional[List[str]] = None
+
+        data = _map_file(path)
+        try:
+            if _SPECIAL_LINE_BREAKS.search(data):
+                text = bytes(data).decode("utf-8", errors="replace")
+                text = text.replace("\r\n", "\n").replace("\r", "\n")
+                self.split_lines = text.splitlines()
+                self.total_lines = len(self.split_lines)
+            else:
+                text = bytes(data).decode("utf-8", errors="replace").replace("\r\n", "\n")
+                if size:
+                    self.starts.append(0)
+                    self.starts.extend(m.end() for m in re.finditer(b"\n", data))
+                    if self.starts[-1] == size:
+                        self.starts.pop()  # Trailing newline doesn't start a line
+                self.total_lines = len(self.starts)
+            # Same digest as hashing the text-mode read
+            self.digest = _digest(text)
+        finally:
+            if isinstance(data, mmap.mmap):
+                data.close()
+
+    def read_lines(self, path: Path, start: int, end: int) -> List[str]:
+        """Lines [start, end) without re-reading the rest of the file."""
+        if self.split_lines is not None:
+            return self.split_lines[start:end]
+        if start >= self.total_lines:
+            return []
+
+        end = min(end, self.total_lines)
+        data = _map_file(path)
+        try:
+            stop = self.starts[end] if end < self.total_lines else len(data)
+            chunk = bytes(data[self.starts[start]:stop]).decode("utf-8", errors="replace")
+        finally:
+            if isinstance(data, mmap.mmap):
+                data.close()
+
+        lines = chunk.split("\n")
+        if lines and lines[-1] == "":
+            lines.pop()
+        return [line[:-1] if line.endswith("\r") else line for line in lines]
+
+
+def _map_file(path: Path):
+    """Read-only memory map of a file (empty bytes for empty files)."""
+    with open(path, "rb") as f:
+        try:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            return b""  # Empty file can't be mapped
+
+
+_line_indexes: "OrderedDict[str, _LineIndex]" = OrderedDict()
+_line_indexes_lock = threading.Lock()
+
+
+def _get_line_index(path: Path, stat: os.stat_result) -> _LineIndex:
+    """Cached line index for the current version of a file."""
+    key = str(path)
+    version = (stat.st_mtime_ns, stat.st_size)
+    with _line_indexes_lock:
+        index = _line_indexes.get(key)
+        if index is not None and index.version == version:
+            _line_indexes.move_to_end(key)
+            return index
+
+    index = _LineIndex(path, *version)
+    with _line_indexes_lock:
+        _line_indexes[key] = index
+        _line_indexes.move_to_end(key)
+        while len(_line_indexes) > LINE_INDEX_CACHE_SIZE:
+            _line_indexes.popitem(last=False)
+    return index
+
+
 def read_file(
     file_path: str,
     repo: Optional[str] = None,
@@ -80,28 +180,21 @@ def read_file(
         raise ValueError(f"Not a file: {full_path}")
 
     # Check file size
-    file_size = full_path.stat().st_size
+    stat = full_path.stat()
+    file_size = stat.st_size
     large_file_warning = file_size > LARGE_FILE_WARNING
 
     if file_size > max_bytes:
         raise ValueError(f"File too large: {file_size} bytes (max {max_bytes})")
 
-    # Read file
-    try:
-        with open(full_path, 'r', encoding='utf-8', errors='replace') as f:
-            content = f.read(max_bytes)
-    except UnicodeDecodeError:
-        # Binary file
-        raise ValueError(f"Cannot read binary file: {full_path}")
-
-    # Split into lines
-    all_lines = content.splitlines()
-    total_lines = len(all_lines)
+    # Line offsets + digest are computed once per file version
+    line_index = _get_line_index(full_path, stat)
+    total_lines = line_index.total_lines
 
     # Apply offset and limit
     start = max(0, offset)
     end = start + (limit or DEFAULT_LINE_LIMIT)
-    selected_lines = all_lines[start:end]
+    selected_lines = line_index.read_lines(full_path, start, end)
 
     # Truncate long lines
     truncated_lines = []
@@ -126,7 +219,7 @@ def read_file(
         "offset": start,
         "limit": len(selected_lines),
         "truncated": file_size >= max_bytes or len(selected_lines) < (end - start),
-        "digest": _digest(content),
+        "digest": line_index.digest,
         "suggested_action": "use_chunks" if large_file_warning else None
     }
 
@@ -2,15 +2,22 @@
 Code verification suite tool.
 
 Runs tests, linters, and type checkers in one unified call.
+The selected checks run concurrently; lint results come from the cached
+diagnostics engine, so only files changed since the last run are re-linted.
 """
+import asyncio
 import subprocess
 import re
 import logging
-from typing import Dict, Any, Optional
+from pathlib import Path
+from typing import Dict, Any, List, Optional
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Directories flake8 would skip by default
+LINT_SKIP_DIRS = {".git", "__pycache__", "node_modules", ".venv", "venv", ".tox", ".eggs"}
+
 
 async def code_verify_suite(
     target: str = ".",
@@ -63,17 +70,23 @@ async def code_verify_suite(
         "timestamp": datetime.now().isoformat()
     }
 
+    checks = {}
+
     # Run tests
     if tests:
-        results["tests"] = await _run_tests(target, repo, timeout)
+        checks["tests"] = _run_tests(target, repo, timeout)
 
     # Run linter (opt-in)
     if lint:
-        results["lint"] = await _run_linter(target, repo, timeout // 2)
+        checks["lint"] = _run_linter(target, repo, timeout // 2)
 
     # Run type checker (opt-in)
     if typecheck:
-        results["typecheck"] = await _run_typecheck(target, repo, timeout // 2)
+        checks["typecheck"] = _run_typecheck(target, repo, timeout // 2)
+
+    # Independent tools - run them side by side
+    for name, result in zip(checks, await asyncio.gather(*checks.values())):
+        results[name] = result
 
     # Generate summary
     results["summary"] = _generate_summary(results)
@@ -88,7 +101,8 @@ async def _run_tests(target: str, repo: Optional[str], timeout: int) -> Dict[str
     cmd = ["pytest", target, "-v", "--tb=short", "-q"]
 
     try:
-        result = subprocess.run(
+        result = await asyncio.to_thread(
+            subprocess.run,
             cmd,
             cwd=repo,
             capture_output=True,
@@ -150,7 +164,8 @@ async def _run_unittest(target: str, repo: Optional[str], timeout: int) -> Dict[
     cmd = ["python", "-m", "unittest", "discover", "-s", target, "-v"]
 
     try:
-        result = subprocess.run(
+        result = await asyncio.to_thread(
+            subprocess.run,
             cmd,
             cwd=repo,
             capture_output=True,
@@ -189,53 +204,71 @@ async def _run_unittest(target: str, repo: Optional[str], timeout: int) -> Dict[
 
 
 async def _run_linter(target: str, repo: Optional[str], timeout: int) -> Dict[str, Any]:
-    """Run flake8 linter and parse results."""
-    # Use flake8 (faster than pylint)
-    cmd = ["flake8", target, "--count", "--max-line-length=120"]
+    """Run flake8 (via the cached diagnostics engine) and summarize results."""
+    from apps.services.tool_server.diagnostics_engine import (
+        flake8_excludes, get_diagnostics_engine, is_excluded, repo_relative,
+    )
+
+    root = Path(repo or ".").resolve()
+    target_path = root / target
+    if target_path.is_file():
+        files = [repo_relative(str(target_path.resolve()), str(root))]
+    else:
+        # The engine passes explicit file lists, so apply flake8's own
+        # exclude / extend-exclude here (it would skip those when walking a directory)
+        excludes = flake8_excludes(str(root))
+        files = []
+        for p in sorted(target_path.resolve().glob("**/*.py")):
+            rel = repo_relative(str(p), str(root))
+            if p.is_file() and not LINT_SKIP_DIRS.intersection(Path(rel).parts) and not is_excluded(rel, excludes):
+                files.append(rel)
 
     try:
-        result = subprocess.run(
-            cmd,
-            cwd=repo,
-            capture_output=True,
-            text=True,
-            timeout=timeout
+        # Use flake8 (faster than pylint)
+        summary = await asyncio.to_thread(
+            get_diagnostics_engine().check,
+            str(root),
+            files,
+            tools=["flake8"],
+            extra_args={"flake8": ["--max-line-length=120"]},
+            timeout=timeout,
         )
+    except Exception as e:
+        return {"status": "error", "error": str(e)}
 
-        output = result.stdout + result.stderr
-
-        # Parse issue count (last line usually)
-        lines = output.strip().split('\n')
-        issue_count = 0
-
-        # Try to extract count from last line
-        if lines:
-            count_match = re.search(r'(\d+)$', lines[-1])
-            if count_match:
-                issue_count = int(count_match.group(1))
-            else:
-                # Count lines with issues
-                issue_count = len([l for l in lines if ':' in l and '.' in l])
-
-        # Extract first 10 issues
-        issues = []
-        for line in lines[:10]:
-            if ':' in line and '.' in line:
-                issues.append(line.strip())
-
-        return {
-            "issues": issue_count,
-            "details": issues,
-            "status": "pass" if issue_count == 0 else "warnings",
-            "tool": "flake8"
-        }
+    if "flake8" in summary["skipped_tools"]:
+        return {"status": "skipped", "error": "flake8 not installed"}
 
-    except subprocess.TimeoutExpired:
+    failed = [r for r in summary["results"] if r.get("error")]
+    if failed and all("timed out" in r["error"] for r in failed) and len(failed) == len(summary["results"]):
         return {"status": "timeout", "error": f"Linting exceeded {timeout}s timeout"}
-    except FileNotFoundError:
-        return {"status": "skipped", "error": "flake8 not installed"}
-    except Exception as e:
-        return {"status": "error", "error": str(e)}
+
+    issues: List[str] = []
+    issue_count = 0
+    for file_result in summary["results"]:
+        try:
+            rel_path = str(Path(file_result["file_path"]).relative_to(root))
+        except ValueError:
+            # Target outside the repo
+            rel_path = file_result["file_path"]
+        for d in file_result.get("diagnostics", []):
+            issue_count += 1
+            issues.append(f"{rel_path}:{d['line']}:{d['column']}: {d['rule']} {d['message']}")
+
+    result = {
+        "issues": issue_count,
+        "details": issues[:10],
+        "status": "pass" if issue_count == 0 else "warnings",
+        "tool": "flake8",
+        "files_checked": summary["files_checked"],
+        "files_relinted": summary["files_changed"]
+    }
+    if failed:
+        # Unlinted files must not read as clean
+        result["status"] = "error"
+        result["files_failed"] = len(failed)
+        result["error"] = f"flake8 failed on {len(failed)} file(s): {failed[0]['error']}"
+    return result
 
 
 async def _run_typecheck(target: str, repo: Optional[str], timeout: int) -> Dict[str, Any]:
@@ -243,7 +276,8 @@ async def _run_typecheck(target: str, repo: Optional[str], timeout: int) -> Dict
     cmd = ["mypy", target, "--no-error-summary", "--show-error-codes"]
 
     try:
-        result = subprocess.run(
+        result = await asyncio.to_thread(
+            subprocess.run,
             cmd,
             cwd=repo,
             capture_output=True,
@@ -295,6 +329,8 @@ def _generate_summary(results: Dict[str, Any]) -> str:
             parts.append(f"⚠️ {lint['issues']} lint issues")
         elif lint.get("status") == "pass":
             parts.append("✅ No lint issues")
+        elif lint.get("status") == "error":
+            parts.append("❌ Lint failed")
 
     if "typecheck" in results:
         tc = results["typecheck"]
@@ -11,7 +11,7 @@ import asyncio
 import logging
 import os
 import time
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 from datetime import datetime
 
 from apps.services.tool_server.product_search_config import (
@@ -35,6 +35,7 @@ from apps.services.tool_server.context_manager_memory import (
     get_cached_phase1_intelligence
 )
 from apps.services.tool_server import human_search_engine
+from apps.services.tool_server.domain_concurrency import get_domain_concurrency
 from apps.services.tool_server import playwright_stealth_mcp
 
 logger = logging.getLogger(__name__)
@@ -291,43 +292,31 @@ class MultiPhaseProductSearch:
         all_urls = list(dict.fromkeys(all_urls))
         logger.info(f"[Phase1] Total unique URLs to fetch: {len(all_urls)}")
 
-        # Fetch and extract intelligence (parallel with limit)
+        # Fetch and extract intelligence: total fetches and LLM extractions per
+        # search are each capped by parallel_fetch_limit, per-vendor pacing comes
+        # from the shared AIMD controller
         intelligence_extractions = []
         semaphore = asyncio.Semaphore(config.parallel_fetch_limit)
+        extract_semaphore = asyncio.Semaphore(config.parallel_fetch_limit)
 
         async def fetch_and_extract(url: str):
-            async with semaphore:
-                try:
-                    # Fetch page
-                    from apps.services.tool_server.crawler_session_manager import get_crawler_session_manager
-                    session_mgr = get_crawler_session_manager()
-                    from urllib.parse import urlparse
-                    domain = urlparse(url).netloc
-
-                    context = await session_mgr.get_or_create_session(
-                        domain=domain,
-                        session_id=session_id
-                    )
-
-                    # Use intervention-aware fetch
-                    fetch_result = await self._fetch_with_intervention(
-                        url=url,
-                        context=context,
-                        timeout=config.fetch_timeout_sec,
-                        intervention_manager=intervention_manager
-                    )
+            try:
+                fetch_result = await self._fetch_paced(
+                    url, session_id, config, semaphore, intervention_manager
+                )
 
-                    if not fetch_result.get("success") or fetch_result.get("blocked"):
-                        logger.warning(f"[Phase1] Failed to fetch {url[:60]}: {fetch_result.get('error')}")
-                        return None
+                if not fetch_result.get("success") or fetch_result.get("blocked"):
+                    logger.warning(f"[Phase1] Failed to fetch {url[:60]}: {fetch_result.get('error')}")
+                    return None
 
-                    text_content = fetch_result.get("text_content", "")
-                    if not text_content or len(text_content) < 100:
-                        return None
+                text_content = fetch_result.get("text_content", "")
+                if not text_content or len(text_content) < 100:
+                    return None
 
-                    # Extract intelligence using human-like reading
-                    from apps.services.tool_server.vendor_extractor import extract_vendor_intelligence_human_like
+                # Extract intelligence using human-like reading
+                from apps.services.tool_server.vendor_extractor import extract_vendor_intelligence_human_like
 
+                async with extract_semaphore:
                     intel = await extract_vendor_intelligence_human_like(
                         text=text_content,
                         url=url,
@@ -337,26 +326,25 @@ class MultiPhaseProductSearch:
                         llm_api_key=self.llm_api_key
                     )
 
-                    return intel
-
-                except Exception as e:
-                    logger.error(f"[Phase1] Error processing {url[:60]}: {e}")
-                    return None
+                return intel
 
-        # Execute fetches sequentially (one at a time to avoid triggering blockers)
-        results = []
-        for url in all_urls[:20]:  # Limit to 20 URLs
-            try:
-                result = await fetch_and_extract(url)
-                results.append(result)
             except Exception as e:
-                logger.error(f"[Phase1] Exception fetching {url[:60]}: {e}")
-                results.append(None)
+                logger.error(f"[Phase1] Error processing {url[:60]}: {e}")
+                return None
+
+        # Fetch concurrently; each vendor is only hit as hard as its window allows
+        results = await asyncio.gather(
+            *(fetch_and_extract(url) for url in all_urls[:20]),  # Limit to 20 URLs
+            return_exceptions=True
+        )
+        for url, result in zip(all_urls, results):
+            if isinstance(result, BaseException):
+                logger.error(f"[Phase1] Exception fetching {url[:60]}: {result}")
 
         # Filter out None and exceptions
         intelligence_extractions = [
             r for r in results
-            if r is not None
+            if r is not None and not isinstance(r, BaseException)
         ]
 
         logger.info(f"[Phase1] Successfully extracted from {len(intelligence_extractions)} pages")
@@ -430,45 +418,34 @@ class MultiPhaseProductSearch:
         all_urls = list(dict.fromkeys(all_urls))
         logger.info(f"[Phase2] Total unique product URLs to fetch: {len(all_urls)}")
 
-        # Fetch and extract products
+        # Fetch and extract products (fetches and LLM extractions each capped
+        # by parallel_fetch_limit)
         all_products = []
         semaphore = asyncio.Semaphore(config.parallel_fetch_limit)
+        extract_semaphore = asyncio.Semaphore(config.parallel_fetch_limit)
 
         async def fetch_and_extract_products(url: str):
-            async with semaphore:
-                try:
-                    # Fetch page
-                    from apps.services.tool_server.crawler_session_manager import get_crawler_session_manager
-                    session_mgr = get_crawler_session_manager()
-                    from urllib.parse import urlparse
-                    domain = urlparse(url).netloc
-
-                    context = await session_mgr.get_or_create_session(
-                        domain=domain,
-                        session_id=session_id
-                    )
-
-                    # Use intervention-aware fetch
-                    fetch_result = await self._fetch_with_intervention(
-                        url=url,
-                        context=context,
-                        timeout=config.fetch_timeout_sec,
-                        intervention_manager=intervention_manager
-                    )
+            try:
+                fetch_result = await self._fetch_paced(
+                    url, session_id, config, semaphore, intervention_manager
+                )
 
-                    if not fetch_result.get("success") or fetch_result.get("blocked"):
-                        return []
+                if not fetch_result.get("success") or fetch_result.get("blocked"):
+                    return []
 
-                    text_content = fetch_result.get("text_content", "")
-                    if not text_content:
-                        return []
+                text_content = fetch_result.get("text_content", "")
+                if not text_content:
+                    return []
 
-                    # Determine vendor from URL
-                    vendor_name = domain.split(".")[0] if domain else "unknown"
+                # Determine vendor from URL
+                from urllib.parse import urlparse
+                domain = urlparse(url).netloc
+                vendor_name = domain.split(".")[0] if domain else "unknown"
 
-                    # Extract products using human-like reading
-                    from apps.services.tool_server.vendor_extractor import extract_product_listings_human_like
+                # Extract products using human-like reading
+                from apps.services.tool_server.vendor_extractor import extract_product_listings_human_like
 
+                async with extract_semaphore:
                     products = await extract_product_listings_human_like(
                         text=text_content,
                         url=url,
@@ -479,26 +456,28 @@ class MultiPhaseProductSearch:
                         llm_api_key=self.llm_api_key
                     )
 
-                    # Add source URL to each product
-                    for p in products:
-                        if not p.get("url"):
-                            p["url"] = url
-                        p["source_url"] = url
+                # Add source URL to each product
+                for p in products:
+                    if not p.get("url"):
+                        p["url"] = url
+                    p["source_url"] = url
 
-                    return products
+                return products
 
-                except Exception as e:
-                    logger.error(f"[Phase2] Error processing {url[:60]}: {e}")
-                    return []
-
-        # Execute fetches sequentially (one at a time to avoid triggering blockers)
-        for url in all_urls[:30]:  # Limit to 30 URLs
-            try:
-                result = await fetch_and_extract_products(url)
-                if isinstance(result, list):
-                    all_products.extend(result)
             except Exception as e:
-                logger.error(f"[Phase2] Exception fetching {url[:60]}: {e}")
+                logger.error(f"[Phase2] Error processing {url[:60]}: {e}")
+                return []
+
+        # Fetch concurrently; each vendor is only hit as hard as its window allows
+        results = await asyncio.gather(
+            *(fetch_and_extract_products(url) for url in all_urls[:30]),  # Limit to 30 URLs
+            return_exceptions=True
+        )
+        for url, result in zip(all_urls, results):
+            if isinstance(result, list):
+                all_products.extend(result)
+            elif isinstance(result, BaseException):
+                logger.error(f"[Phase2] Exception fetching {url[:60]}: {result}")
 
         logger.info(f"[Phase2] Extracted {len(all_products)} total products")
 
@@ -558,6 +537,46 @@ class MultiPhaseProductSearch:
 
         return matches
 
+    async def _fetch_paced(
+        self,
+        url: str,
+        session_id: str,
+        config: SearchConfig,
+        semaphore: asyncio.Semaphore,
+        intervention_manager: Optional[Any] = None
+    ) -> Dict:
+        """
+        Fetch a page inside its domain's adaptive concurrency window.
+
+        The domain slot is held only for the fetch itself (not the LLM
+        extraction afterwards); the outcome and latency feed the controller,
+        and a fetch that raises counts as a failure. The browser context is
+        leased so concurrent fetches don't lose pages to restarts or cleanup.
+        """
+        from apps.services.tool_server.crawler_session_manager import get_crawler_session_manager
+        from urllib.parse import urlparse
+        domain = urlparse(url).netloc
+        controller = get_domain_concurrency()
+
+        async with controller.slot(domain), semaphore:
+            session_mgr = get_crawler_session_manager()
+            async with session_mgr.session_lease(domain=domain, session_id=session_id) as context:
+                # Use intervention-aware fetch
+                started = time.monotonic()
+                try:
+                    fetch_result = await self._fetch_with_intervention(
+                        url=url,
+                        context=context,
+                        timeout=config.fetch_timeout_sec,
+                        intervention_manager=intervention_manager
+                    )
+                except Exception:
+                    controller.record_failure(domain)
+                    raise
+
+        controller.record_fetch(domain, fetch_result, time.monotonic() - started)
+        return fetch_result
+
     async def _fetch_with_intervention(
         self,
         url: str,
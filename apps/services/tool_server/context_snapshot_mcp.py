@@ -4,6 +4,7 @@ Context snapshot tool for repository state.
 Captures current repository state for context injection before Guide runs.
 This provides immediate repo awareness without requiring discovery tools.
 """
+import asyncio
 import subprocess
 import logging
 from typing import Dict, Any, List, Optional
@@ -81,12 +82,16 @@ async def context_snapshot_repo(
         # Generate summary
         summary = _generate_summary(branch, dirty_files, last_commits)
 
+        # Warm the code index so outline/scope tools later in the turn skip re-parsing
+        code_index = await _refresh_code_index(repo_path)
+
         return {
             "branch": branch,
             "dirty_files": dirty_files,
             "dirty_count": len(dirty_files),
             "last_commits": last_commits,
-            "summary": summary
+            "summary": summary,
+            "code_index": code_index
         }
 
     except Exception as e:
@@ -192,6 +197,19 @@ async def _get_recent_commits(repo_path: Path, max_commits: int) -> List[Dict[st
         return []
 
 
+async def _refresh_code_index(repo_path: Path) -> Dict[str, Any]:
+    """Incrementally refresh the repo's code index; returns refresh + size stats."""
+    try:
+        from apps.services.tool_server.code_index import get_code_index
+
+        index = get_code_index(str(repo_path))
+        refresh = await asyncio.to_thread(index.refresh)
+        return {**index.stats(), **refresh}
+    except Exception as e:
+        logger.debug(f"[snapshot] Could not refresh code index: {e}")
+        return {}
+
+
 def _generate_summary(
     branch: str,
     dirty_files: List[str],
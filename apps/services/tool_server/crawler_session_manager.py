@@ -16,8 +16,9 @@ import json
 import asyncio
 import os
 import shutil
+from contextlib import asynccontextmanager
 from datetime import datetime, timedelta
-from typing import Optional, Dict, List
+from typing import AsyncIterator, Optional, Dict, List
 import logging
 
 from apps.services.tool_server.shared.browser_factory import get_browser_type
@@ -48,6 +49,8 @@ class CrawlerSession:
         self.created_at = datetime.now()
         self.last_used = datetime.now()
         self.page_count = 0
+        # Leases (see CrawlerSessionManager.session_lease) currently fetching in this context
+        self.in_flight = 0
 
     def is_expired(self, ttl_hours: Optional[int] = None) -> bool:
         """
@@ -130,6 +133,12 @@ class CrawlerSessionManager:
 
         # Deferred restart flag - restart on NEXT call, not mid-operation
         self._pending_restart: bool = False
+        # Held while a deferred restart waits for leases to drain and runs
+        self._restart_gate = asyncio.Lock()
+        # Open session leases across all sessions; _idle is set when there are none
+        self._in_flight = 0
+        self._idle = asyncio.Event()
+        self._idle.set()
 
         # Default mode: local_view (user's browser for CAPTCHA solving)
         # Can be overridden via BROWSER_DEFAULT_MODE env var
@@ -387,11 +396,21 @@ class CrawlerSessionManager:
         # Handle deferred restart from previous call (ensures current operation completes first)
         # Skip if this is a capture operation to avoid losing page content mid-flow
         if self._pending_restart and not skip_deferred_restart:
-            logger.info(
-                f"[CrawlerSessionMgr] Executing deferred browser restart (from previous page limit)"
-            )
-            self._pending_restart = False
-            await self._restart_browser()
+            async with self._restart_gate:
+                if self._pending_restart:
+                    # Concurrent fetches may still be using the old browser
+                    if self._in_flight:
+                        logger.info(
+                            f"[CrawlerSessionMgr] Deferred restart waiting for {self._in_flight} in-flight fetches"
+                        )
+                        await self._idle.wait()
+                    logger.info(
+                        f"[CrawlerSessionMgr] Executing deferred browser restart (from previous page limit)"
+                    )
+                    await self._restart_browser()
+                    # Cleared only once the new browser is up, so callers arriving
+                    # mid-restart queue on the gate instead of using the old browser
+                    self._pending_restart = False
 
         await self._ensure_browser(session_id=session_id)
 
@@ -412,15 +431,18 @@ class CrawlerSessionManager:
                     f"scheduling restart for next navigation (current operation will complete first)"
                 )
                 self._pending_restart = True
-                # Clean up blank pages to help reduce memory before restart
-                await session.cleanup_excess_pages()
+                # Clean up blank pages to help reduce memory before restart. With
+                # other fetches in flight, a blank page may be one they just opened.
+                if not session.in_flight:
+                    await session.cleanup_excess_pages()
                 # Return current context - restart will happen on NEXT call
                 session.touch()
                 return session.context
             else:
                 session.touch()
                 # Clean up blank/unused pages to prevent visible tab accumulation
-                await session.cleanup_excess_pages()
+                if not session.in_flight:
+                    await session.cleanup_excess_pages()
                 logger.info(
                     f"[CrawlerSessionMgr] Reusing session: {session_key} "
                     f"(pages: {session.page_count}/{MAX_PAGES_BEFORE_RESTART}, mode: {self.session_mode.get(session_id, 'headless')})"
@@ -503,6 +525,44 @@ class CrawlerSessionManager:
 
         return context
 
+    @asynccontextmanager
+    async def session_lease(
+        self,
+        domain: str,
+        session_id: str,
+        user_id: str = "default"
+    ) -> AsyncIterator[BrowserContext]:
+        """
+        get_or_create_session for callers that fetch concurrently.
+
+        The context counts as in use until the block exits: a deferred restart
+        waits for every open lease, and blank-page cleanup skips a session while
+        it has leases (a blank page may be one a fetch opened but has not
+        navigated yet).
+
+        Args:
+            domain: Domain name (e.g., "example.com")
+            session_id: Session identifier
+            user_id: User identifier (default: "default")
+
+        Yields:
+            Playwright BrowserContext ready for use
+        """
+        context = await self.get_or_create_session(domain, session_id, user_id)
+        session = self.sessions.get(self._get_session_key(domain, session_id, user_id))
+        self._in_flight += 1
+        self._idle.clear()
+        if session:
+            session.in_flight += 1
+        try:
+            yield context
+        finally:
+            if session:
+                session.in_flight -= 1
+            self._in_flight -= 1
+            if not self._in_flight:
+                self._idle.set()
+
     async def inject_cookies(
         self,
         domain: str,
@@ -458,47 +458,49 @@ def validate_file(file_path: str, repo: Optional[str] = None) -> Dict[str, Any]:
         }
 
 
-def get_diagnostics_summary(repo: str, file_pattern: str = "**/*.py") -> Dict[str, Any]:
+def get_diagnostics_summary(
+    repo: str,
+    file_pattern: str = "**/*.py",
+    tools: Optional[List[str]] = None,
+    changed_only: bool = False,
+    config: Optional[str] = None
+) -> Dict[str, Any]:
     """
     Get diagnostics summary for multiple files.
 
+    Every matching file is checked; results are cached per file content, tool
+    version and config, so repeat calls only re-check files that changed.
+
     Args:
         repo: Repository path
         file_pattern: Glob pattern for files
+        tools: Checks to run (default: ["syntax"]); also flake8, pylint, eslint
+        changed_only: Only report files re-checked by this call
+        config: Optional linter config path
 
     Returns:
         Dict with aggregated diagnostics
     """
+    from apps.services.tool_server.diagnostics_engine import get_diagnostics_engine
+
     repo_path = Path(repo)
 
     if not repo_path.exists():
         raise FileNotFoundError(f"Repository not found: {repo}")
 
     # Find matching files
-    files = list(repo_path.glob(file_pattern))
+    files = [
+        str(file_path.relative_to(repo_path))
+        for file_path in repo_path.glob(file_pattern)
+        if file_path.is_file()
+    ]
 
-    results = []
-    total_errors = 0
-    total_warnings = 0
-
-    for file_path in files[:50]:  # Limit to 50 files
-        try:
-            result = validate_file(str(file_path), repo)
-            results.append(result)
-
-            total_errors += result.get("error_count", 0)
-            total_warnings += result.get("warning_count", 0)
-        except Exception as e:
-            results.append({
-                "file_path": str(file_path),
-                "error": str(e)
-            })
+    summary = get_diagnostics_engine().check(
+        str(repo_path), files, tools=tools or ["syntax"], config=config, changed_only=changed_only
+    )
 
     return {
         "repo": repo,
         "pattern": file_pattern,
-        "files_checked": len(results),
-        "total_errors": total_errors,
-        "total_warnings": total_warnings,
-        "results": results
+        **summary
     }
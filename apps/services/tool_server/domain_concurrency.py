@@ -0,0 +1,286 @@
+"""
+orchestrator/domain_concurrency.py
+
+Adaptive per-domain concurrency for page fetching (AIMD).
+
+Instead of one fixed semaphore for every vendor, each domain gets its own
+concurrency window, shared by all sessions in the tool server:
+
+- Windows start at 1 (the old one-page-at-a-time behaviour)
+- Additive increase: each healthy response (success, latency close to the
+  domain's best) grows the window by 1/window, i.e. about +1 per full window
+  of good responses, up to DOMAIN_MAX_CONCURRENCY
+- Multiplicative decrease: 429/503, captchas and other bot blocks (including
+  VendorRegistry block reports) halve the window and put the domain in a
+  cooldown that doubles with each consecutive throttle; ordinary failures
+  shrink it by a quarter
+- Slow but successful responses hold the window where it is
+
+Usage:
+    controller = get_domain_concurrency()
+    async with controller.slot(url):
+        started = time.monotonic()
+        result = await fetch(url)
+    controller.record_fetch(url, result, time.monotonic() - started)
+"""
+import asyncio
+import logging
+import os
+import threading
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Dict, List, Optional
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+DOMAIN_MAX_CONCURRENCY = int(os.getenv("DOMAIN_MAX_CONCURRENCY", "4"))
+
+# HTTP statuses that mean "slow down" rather than "broken page"
+THROTTLE_STATUSES = {429, 503}
+
+# A response counts as healthy if its latency is within this factor of the
+# domain's best recent latency
+LATENCY_TOLERANCE = 2.0
+
+
+@dataclass
+class _DomainState:
+    limit: float
+    in_flight: int = 0
+    latency_floor: Optional[float] = None
+    cooldown_until: float = 0.0
+    consecutive_throttles: int = 0
+    throttles: int = 0
+    waiters: List[asyncio.Future] = field(default_factory=list)
+
+    @property
+    def window(self) -> int:
+        return max(1, int(self.limit))
+
+
+def domain_key(url_or_domain: str) -> str:
+    """Normalize a URL or domain to the key windows are tracked under."""
+    text = (url_or_domain or "").strip().lower()
+    if "://" in text:
+        text = urlparse(text).netloc
+    text = text.split("/")[0].split(":")[0]
+    if text.startswith("www."):
+        text = text[4:]
+    return text or "unknown"
+
+
+class DomainConcurrencyController:
+    """
+    Per-domain AIMD concurrency windows.
+
+    Thread-safe for the reporting methods (VendorRegistry may report from a
+    worker thread); slots are awaited on the tool server's event loop.
+    """
+
+    def __init__(
+        self,
+        initial_limit: float = 1.0,
+        min_limit: float = 1.0,
+        max_limit: float = DOMAIN_MAX_CONCURRENCY,
+        decrease_factor: float = 0.5,
+        failure_factor: float = 0.75,
+        base_cooldown: float = 5.0,
+        max_cooldown: float = 120.0
+    ):
+        """
+        Args:
+            initial_limit: Starting window for a new domain
+            min_limit: Smallest window
+            max_limit: Largest window
+            decrease_factor: Window multiplier on a throttle signal
+            failure_factor: Window multiplier on an ordinary failure
+            base_cooldown: Cooldown after the first throttle (doubles per repeat)
+            max_cooldown: Maximum cooldown in seconds
+        """
+        self._initial = initial_limit
+        self._min = min_limit
+        self._max = max_limit
+        self._decrease = decrease_factor
+        self._failure = failure_factor
+        self._base_cooldown = base_cooldown
+        self._max_cooldown = max_cooldown
+        self._domains: Dict[str, _DomainState] = {}
+        self._lock = threading.Lock()
+
+    def _state(self, domain: str) -> _DomainState:
+        with self._lock:
+            state = self._domains.get(domain)
+            if state is None:
+                state = _DomainState(limit=self._initial)
+                self._domains[domain] = state
+            return state
+
+    # ------------------------------------------------------------------
+    # Slots
+    # ------------------------------------------------------------------
+
+    async def acquire(self, url_or_domain: str) -> None:
+        """Wait for a free slot in the domain's window (and any cooldown)."""
+        domain = domain_key(url_or_domain)
+        state = self._state(domain)
+        while True:
+            wait = state.cooldown_until - time.monotonic()
+            if wait > 0:
+                logger.info(f"[DomainConcurrency] {domain} cooling down, waiting {wait:.1f}s")
+                await asyncio.sleep(wait)
+                continue
+            if state.in_flight < state.window:
+                state.in_flight += 1
+                return
+            waiter = asyncio.get_running_loop().create_future()
+            state.waiters.append(waiter)
+            try:
+                await waiter
+            except BaseException:
+                if waiter.done() and not waiter.cancelled():
+                    # Woken by release() but cancelled before resuming: pass
+                    # the slot on, or the next waiter never gets it
+                    if waiter in state.waiters:
+                        state.waiters.remove(waiter)
+                    self._wake(state)
+                raise
+            finally:
+                if waiter in state.waiters:
+                    state.waiters.remove(waiter)
+
+    def release(self, url_or_domain: str) -> None:
+        """Give a slot back."""
+        state = self._state(domain_key(url_or_domain))
+        state.in_flight = max(0, state.in_flight - 1)
+        self._wake(state)
+
+    @asynccontextmanager
+    async def slot(self, url_or_domain: str) -> AsyncIterator[None]:
+        """Hold one slot of the domain's window for the duration of the block."""
+        await self.acquire(url_or_domain)
+        try:
+            yield
+        finally:
+            self.release(url_or_domain)
+
+    def _wake(self, state: _DomainState) -> None:
+        free = state.window - state.in_flight
+        for waiter in list(state.waiters):
+            if free <= 0:
+                break
+            if not waiter.done():
+                waiter.set_result(None)
+                free -= 1
+
+    # ------------------------------------------------------------------
+    # Feedback
+    # ------------------------------------------------------------------
+
+    def record_success(self, url_or_domain: str, latency_seconds: Optional[float] = None) -> None:
+        """Successful response: grow the window if latency is healthy."""
+        domain = domain_key(url_or_domain)
+        state = self._state(domain)
+        with self._lock:
+            state.consecutive_throttles = 0
+            healthy = True
+            if latency_seconds is not None:
+                if state.latency_floor is None or latency_seconds < state.latency_floor:
+                    state.latency_floor = latency_seconds
+                else:
+                    # Let the floor drift up slowly so one lucky response doesn't pin it
+                    state.latency_floor += 0.05 * (latency_seconds - state.latency_floor)
+                healthy = latency_seconds <= state.latency_floor * LATENCY_TOLERANCE
+            if healthy and state.limit < self._max:
+                state.limit = min(self._max, state.limit + 1.0 / state.window)
+        self._wake(state)
+
+    def record_failure(self, url_or_domain: str) -> None:
+        """Ordinary failure (timeout, 5xx, empty page): shrink the window."""
+        domain = domain_key(url_or_domain)
+        state = self._state(domain)
+        with self._lock:
+            state.limit = max(self._min, state.limit * self._failure)
+
+    def record_throttle(self, url_or_domain: str, reason: str = "rate_limited") -> None:
+        """Rate limit / captcha / block: halve the window and cool down."""
+        domain = domain_key(url_or_domain)
+        state = self._state(domain)
+        with self._lock:
+            state.throttles += 1
+            state.consecutive_throttles += 1
+            state.limit = max(self._min, state.limit * self._decrease)
+            cooldown = min(
+                self._max_cooldown,
+                self._base_cooldown * (2 ** (state.consecutive_throttles - 1))
+            )
+            state.cooldown_until = max(state.cooldown_until, time.monotonic() + cooldown)
+        logger.warning(
+            f"[DomainConcurrency] {domain} throttled ({reason}): window {state.window}, "
+            f"cooldown {cooldown:.0f}s"
+        )
+
+    def record_fetch(
+        self,
+        url_or_domain: str,
+        fetch_result: Dict[str, Any],
+        latency_seconds: Optional[float] = None
+    ) -> None:
+        """Classify a fetch result dict (success/status/blocked) and record it."""
+        status = fetch_result.get("status") or 0
+        if fetch_result.get("blocked") or status in THROTTLE_STATUSES:
+            self.record_throttle(url_or_domain, fetch_result.get("block_type") or f"HTTP {status}")
+        elif fetch_result.get("success"):
+            self.record_success(url_or_domain, latency_seconds)
+        else:
+            self.record_failure(url_or_domain)
+
+    def attach_vendor_registry(self, registry: Any) -> None:
+        """Throttle domains whenever the vendor registry reports a block."""
+        registry.add_block_listener(lambda domain, block_type: self.record_throttle(domain, block_type or "blocked"))
+
+    # ------------------------------------------------------------------
+    # Introspection
+    # ------------------------------------------------------------------
+
+    def get_limit(self, url_or_domain: str) -> int:
+        """Current window for a domain."""
+        return self._state(domain_key(url_or_domain)).window
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-domain window, in-flight count, latency floor and throttles."""
+        now = time.monotonic()
+        with self._lock:
+            return {
+                domain: {
+                    "limit": round(state.limit, 2),
+                    "in_flight": state.in_flight,
+                    "latency_floor": state.latency_floor,
+                    "cooldown_remaining": max(0.0, state.cooldown_until - now),
+                    "throttles": state.throttles,
+                }
+                for domain, state in self._domains.items()
+            }
+
+
+# Global singleton instance
+_global_controller: Optional[DomainConcurrencyController] = None
+
+
+def get_domain_concurrency() -> DomainConcurrencyController:
+    """
+    Get the global per-domain concurrency controller.
+
+    Returns:
+        DomainConcurrencyController singleton (listening to VendorRegistry blocks)
+    """
+    global _global_controller
+    if _global_controller is None:
+        _global_controller = DomainConcurrencyController()
+        try:
+            from apps.services.tool_server.shared_state.vendor_registry import get_vendor_registry
+            _global_controller.attach_vendor_registry(get_vendor_registry())
+        except Exception as e:
+            logger.warning(f"[DomainConcurrency] Vendor registry hook unavailable: {e}")
+    return _global_controller
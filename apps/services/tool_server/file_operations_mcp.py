@@ -183,19 +183,25 @@ async def file_read_outline(
     if not os.path.exists(file_path):
         return {"error": f"File not found: {file_path}"}
     
-    try:
-        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-            content = f.read()
-            lines = content.split('\n')
-    except Exception as e:
-        return {"error": f"Failed to read file: {str(e)}"}
-    
-    # Extract symbols (Python for now)
-    symbols = []
-    if file_path.endswith('.py'):
-        symbols = _extract_python_symbols(lines, include_docstrings)
-    elif file_path.endswith(('.js', '.ts', '.jsx', '.tsx')):
-        symbols = _extract_js_symbols(lines)
+    # Files inside a git repo come from the persistent code index (re-parsed only if changed)
+    indexed = _outline_from_index(file_path, include_docstrings)
+    if indexed is not None:
+        symbols, line_count, size_bytes = indexed
+    else:
+        try:
+            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+                content = f.read()
+                lines = content.split('\n')
+        except Exception as e:
+            return {"error": f"Failed to read file: {str(e)}"}
+        
+        # Extract symbols (Python for now)
+        symbols = []
+        if file_path.endswith('.py'):
+            symbols = _extract_python_symbols(lines, include_docstrings)
+        elif file_path.endswith(('.js', '.ts', '.jsx', '.tsx')):
+            symbols = _extract_js_symbols(lines)
+        line_count, size_bytes = len(lines), len(content)
     
     # Filter symbols if pattern provided
     if symbol_filter:
@@ -210,13 +216,13 @@ async def file_read_outline(
     
     # File info
     file_info = {
-        "lines": len(lines),
-        "size_kb": len(content) // 1024,
+        "lines": line_count,
+        "size_kb": size_bytes // 1024,
         "language": "python" if file_path.endswith('.py') else "javascript"
     }
     
     # Generate chunk suggestions
-    chunks = _suggest_chunks(symbols, len(lines))
+    chunks = _suggest_chunks(symbols, line_count)
     
     return {
         "symbols": symbols[:50],  # Cap at 50 symbols
@@ -226,6 +232,40 @@ async def file_read_outline(
     }
 
 
+def _outline_from_index(file_path: str, include_docstrings: bool) -> Optional[tuple]:
+    """
+    Symbols, line count and size for a file via the repo code index.
+
+    Returns None when the file is not in a git repo or the index is unavailable,
+    so the caller falls back to parsing the file directly.
+    """
+    from apps.services.tool_server.code_index import find_repo_root, get_code_index
+
+    root = find_repo_root(os.path.dirname(os.path.abspath(file_path)))
+    if root is None:
+        return None
+
+    try:
+        index = get_code_index(str(root))
+        rel_path = Path(file_path).resolve().relative_to(root).as_posix()
+        index.refresh([rel_path])
+        info = index.file_info([rel_path]).get(rel_path)
+        if info is None:
+            return None
+        symbols = index.symbols(rel_path)
+    except Exception as e:
+        logger.debug(f"[file.read_outline] Code index unavailable for {file_path}: {e}")
+        return None
+
+    is_python = file_path.endswith('.py')
+    for symbol in symbols:
+        if not is_python:
+            symbol.pop("docstring", None)
+        elif not include_docstrings:
+            symbol["docstring"] = None
+    return symbols, info["lines"], info["size"]
+
+
 def _extract_python_symbols(lines: list, include_docstrings: bool) -> list:
     """Extract classes and functions from Python code."""
     import re
@@ -0,0 +1,181 @@
+"""
+orchestrator/hedged_search.py
+
+Hedged cross-engine search: race search engines instead of trying them
+strictly one after another.
+
+Design:
+- Start the healthiest engine first
+- If it hasn't returned within its hedge delay (from SearchEngineHealthTracker:
+  expected latency + 2 deviations, shortened for flaky engines), start the
+  next engine alongside it
+- A failed or low-quality result immediately starts the next engine
+- The first result set that passes the quality check wins and the other
+  searches are cancelled (their pages are closed by the engines' finally blocks)
+- Optional merge mode: after the first good result, engines already running
+  get a short grace period, then all good result sets are interleaved and
+  de-duplicated by URL
+
+Kept free of browser imports so the racing logic can be used (and tested)
+independently of the engine implementations in human_search_engine.py.
+"""
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from apps.services.tool_server.search_engine_health import get_engine_health_tracker
+
+logger = logging.getLogger(__name__)
+
+EngineFunc = Callable[..., Awaitable[List[Dict[str, Any]]]]
+
+# A result set needs at least this many usable URLs to win the race
+MIN_GOOD_RESULTS = 3
+
+# Merge mode: how long other running engines may take after the first good result
+MERGE_GRACE_SECONDS = 2.0
+
+
+def passes_quality(results: Optional[List[Dict[str, Any]]], max_results: int = 10) -> bool:
+    """Check that a result set is usable (enough results with http(s) URLs)."""
+    if not results:
+        return False
+    usable = sum(1 for r in results if str(r.get("url", "")).startswith(("http://", "https://")))
+    return usable >= min(MIN_GOOD_RESULTS, max_results)
+
+
+def _url_key(url: str) -> str:
+    parsed = urlparse(url)
+    host = parsed.netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    return f"{host}{parsed.path.rstrip('/')}?{parsed.query}"
+
+
+def merge_results(result_sets: List[List[Dict[str, Any]]], max_results: int) -> List[Dict[str, Any]]:
+    """
+    Interleave result sets by rank and drop duplicate URLs.
+
+    Each merged result keeps the first occurrence and is re-numbered.
+    """
+    merged: List[Dict[str, Any]] = []
+    seen = set()
+    for rank in range(max((len(rs) for rs in result_sets), default=0)):
+        for results in result_sets:
+            if rank >= len(results):
+                continue
+            result = results[rank]
+            key = _url_key(str(result.get("url", "")))
+            if key in seen:
+                continue
+            seen.add(key)
+            merged.append({**result, "position": len(merged) + 1})
+            if len(merged) >= max_results:
+                return merged
+    return merged
+
+
+async def hedged_search(
+    query: str,
+    engines: List[Tuple[str, EngineFunc]],
+    max_results: int = 10,
+    merge: bool = False,
+    acquire: Optional[Callable[[str], Awaitable[None]]] = None,
+    **engine_kwargs: Any
+) -> Tuple[Optional[str], List[Dict[str, Any]], Dict[str, List[Dict[str, Any]]]]:
+    """
+    Race search engines with hedging.
+
+    Args:
+        query: Search query
+        engines: (name, async search function) in preference order
+        max_results: Maximum results to request/return
+        merge: Merge and de-duplicate results from engines that finish in time
+        acquire: Optional per-engine gate awaited before each search (rate limiter)
+        **engine_kwargs: Passed through to each engine function
+
+    Returns:
+        (winning engine name or None, results, good result sets by engine)
+    """
+    health = get_engine_health_tracker()
+    names = [name for name, _ in engines]
+    funcs = dict(engines)
+    order = health.get_healthy_engines(names) or names
+    queue = list(order)
+
+    running: Dict[asyncio.Task, str] = {}
+    good: Dict[str, List[Dict[str, Any]]] = {}
+    winner: Optional[str] = None
+
+    async def run(name: str) -> List[Dict[str, Any]]:
+        if acquire is not None:
+            await acquire(name)
+        started = time.monotonic()
+        results = await funcs[name](query=query, max_results=max_results, **engine_kwargs)
+        if passes_quality(results, max_results):
+            health.report_success(name, latency_seconds=time.monotonic() - started)
+        return results
+
+    def launch(reason: str) -> None:
+        name = queue.pop(0)
+        logger.info(f"[HedgedSearch] Starting {name} ({reason})")
+        running[asyncio.create_task(run(name))] = name
+
+    launch("first")
+    deadline: Optional[float] = None
+
+    try:
+        while running:
+            if winner is not None:
+                timeout = max(0.0, deadline - time.monotonic())
+            elif queue:
+                newest = list(running.values())[-1]
+                timeout = health.get_hedge_delay(newest)
+            else:
+                timeout = None
+
+            done, _ = await asyncio.wait(running, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+
+            if not done:
+                if winner is not None:
+                    break  # merge grace period over
+                launch(f"hedge after {timeout:.1f}s")
+                continue
+
+            for task in done:
+                name = running.pop(task)
+                try:
+                    results = task.result()
+                except Exception as e:
+                    logger.warning(f"[HedgedSearch] {name} failed: {e}")
+                    results = []
+
+                if passes_quality(results, max_results):
+                    good[name] = results
+                    if winner is None:
+                        winner = name
+                        deadline = time.monotonic() + MERGE_GRACE_SECONDS
+                        logger.info(f"[HedgedSearch] {name} won with {len(results)} results")
+                elif winner is None and queue:
+                    logger.info(f"[HedgedSearch] {name} returned {len(results or [])} usable results, falling back")
+                    launch(f"{name} failed")
+
+            if winner is not None and not merge:
+                break
+    finally:
+        for task, name in running.items():
+            task.cancel()
+            logger.info(f"[HedgedSearch] Cancelled {name}")
+        if running:
+            await asyncio.gather(*running, return_exceptions=True)
+
+    if winner is None:
+        return None, [], good
+    if merge and len(good) > 1:
+        ordered = [good[name] for name in order if name in good]
+        merged = merge_results(ordered, max_results)
+        logger.info(f"[HedgedSearch] Merged {len(good)} engines into {len(merged)} results")
+        return winner, merged, good
+    return winner, good[winner], good
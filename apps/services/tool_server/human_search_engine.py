@@ -23,11 +23,16 @@ import logging
 import random
 import asyncio
 import os
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from playwright.async_api import Page, BrowserContext
 
 logger = logging.getLogger(__name__)
 
+# Hedged search: race engines (second one starts after a health-derived delay)
+# instead of trying them strictly in sequence. See hedged_search.py.
+SEARCH_HEDGE_ENABLED = os.getenv("SEARCH_HEDGE_ENABLED", "false").lower() == "true"
+SEARCH_HEDGE_MERGE = os.getenv("SEARCH_HEDGE_MERGE", "false").lower() == "true"
+
 
 async def warmup_session(page: Page, domain: str = "duckduckgo.com") -> None:
     """
@@ -786,13 +791,22 @@ async def search_with_fallback(
     max_results: int = 10,
     session_id: str = "default",
     location: str = "US",
-    human_assist_allowed: bool = True
+    human_assist_allowed: bool = True,
+    hedge: Optional[bool] = None,
+    merge: Optional[bool] = None
 ) -> List[Dict[str, Any]]:
     """
     Try multiple search engines until one succeeds.
 
+    HEDGED MODE (hedge=True or SEARCH_HEDGE_ENABLED=true):
+    - Starts the healthiest engine; if it hasn't returned within its hedge
+      delay (from search_engine_health latency stats), starts the next one too
+    - First result set passing quality checks wins, the others are cancelled
+    - merge=True (or SEARCH_HEDGE_MERGE=true) merges and de-duplicates results
+      from engines that finish shortly after the winner
+
     RATE LIMITING & CACHING:
-    - Checks cache before hitting search engines
+    - Checks the SERP cache for all engines before hitting any search engine
     - Enforces minimum 2s delay between searches (global rate limiter)
     - Adds 3s backoff when switching from DDG to Google
     - Reports rate limits for exponential backoff
@@ -808,6 +822,8 @@ async def search_with_fallback(
         session_id: Session ID for cookie persistence
         location: User location
         human_assist_allowed: Enable human intervention for CAPTCHAs
+        hedge: Race engines instead of trying them in sequence (default: env)
+        merge: In hedged mode, merge results from several engines (default: env)
 
     Returns:
         List of result dicts from whichever engine succeeded
@@ -824,14 +840,38 @@ async def search_with_fallback(
         ("Brave", search_brave_human)
     ]
 
-    for idx, (engine_name, engine_func) in enumerate(engines):
-        # Check cache first
+    # Check every engine's cache before paying for any live search
+    for engine_name, _ in engines:
         cached_results = serp_cache.get(query, engine_name.lower(), session_id)
         if cached_results is not None:
             logger.info(f"[HumanSearch] Using cached {engine_name} results ({len(cached_results)} results)")
             rate_limiter.report_success()
             return cached_results
 
+    if SEARCH_HEDGE_ENABLED if hedge is None else hedge:
+        from apps.services.tool_server.hedged_search import hedged_search
+
+        winner, results, good = await hedged_search(
+            query,
+            engines,
+            max_results=max_results,
+            merge=SEARCH_HEDGE_MERGE if merge is None else merge,
+            acquire=lambda engine_name: rate_limiter.acquire(query, engine_name),
+            session_id=session_id,
+            location=location,
+            human_assist_allowed=human_assist_allowed
+        )
+        for engine_name, engine_results in good.items():
+            serp_cache.put(query, engine_name.lower(), engine_results, session_id)
+        if winner is not None:
+            rate_limiter.report_success()
+            return results
+        for engine_name, _ in engines:
+            rate_limiter.report_rate_limit(engine_name)
+        logger.error(f"[HumanSearch] All search engines failed (hedged) for: {query[:60]}")
+        return []
+
+    for idx, (engine_name, engine_func) in enumerate(engines):
         # Add backoff delay when switching engines (DDG → Google)
         if idx > 0:
             logger.info("[HumanSearch] Switching engines, adding 3s backoff to avoid immediate hammer...")
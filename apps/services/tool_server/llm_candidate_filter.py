@@ -13,6 +13,7 @@ from typing import List, Dict, Any, Optional
 
 import httpx
 
+from apps.services.tool_server.shared.batch_eval import evaluate_batched
 from apps.services.tool_server.source_quality_scorer import get_source_quality_scorer
 
 
@@ -49,7 +50,7 @@ def _load_vendor_validator_prompt() -> str:
             logger.info("[VendorValidator] Loaded prompt from recipe system")
         except Exception as e:
             logger.warning(f"[VendorValidator] Recipe load failed: {e}, using fallback")
-            _vendor_validator_prompt = "Validate vendors for the user's goal. Return JSON with approved and rejected."
+            _vendor_validator_prompt = "Validate vendors for the user's goal. Decide for each vendor whether to approve it, with a short reason."
     return _vendor_validator_prompt
 
 
@@ -690,17 +691,11 @@ async def validate_vendors_for_goal(
     if not api_key:
         api_key = os.getenv("SOLVER_API_KEY", "qwen-local")
 
-    # Build vendor list for prompt
-    vendor_lines = []
-    for i, v in enumerate(vendors, 1):
-        domain = v.get("domain", v.get("name", "unknown"))
-        source = v.get("_source", "intelligence")
-        vendor_lines.append(f"{i}. {domain} (source: {source})")
-
     # Load base prompt from file
     base_prompt = _load_vendor_validator_prompt()
 
-    prompt = f"""{base_prompt}
+    def render_prompt(table: str) -> str:
+        return f"""{base_prompt}
 
 ---
 
@@ -709,73 +704,48 @@ async def validate_vendors_for_goal(
 **USER'S GOAL:** {goal}
 
 **CANDIDATE VENDORS (from research intelligence):**
-{chr(10).join(vendor_lines)}
+{table}
 
 For each vendor, determine if they are LIKELY to have what the user wants."""
 
-    try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                model_url,
-                json={
-                    "model": model_id,
-                    "messages": [{"role": "user", "content": prompt}],
-                    "temperature": 0.1,
-                    "max_tokens": 800
-                },
-                headers={"Authorization": f"Bearer {api_key}"}
-            )
-            response.raise_for_status()
-            result = response.json()
-
-        # Parse LLM response
-        llm_content = result["choices"][0]["message"]["content"].strip()
-        if "```json" in llm_content:
-            llm_content = llm_content.split("```json")[1].split("```")[0].strip()
-        elif "```" in llm_content:
-            llm_content = llm_content.split("```")[1].split("```")[0].strip()
-
-        # Parse with repair fallback
-        try:
-            validation_result = json.loads(llm_content)
-        except json.JSONDecodeError:
-            validation_result = json.loads(_repair_json(llm_content))
-        approved_list = validation_result.get("approved", [])
-        rejected_list = validation_result.get("rejected", [])
-        summary = validation_result.get("summary", "")
-
-        logger.info(f"[VendorValidate] {summary}")
-
-        # Build approved vendor indices
-        approved_indices = {item.get("index") for item in approved_list}
-
-        # Filter vendors
-        validated_vendors = []
-        for i, vendor in enumerate(vendors, 1):
-            if i in approved_indices:
-                # Find the approval reason
-                approval = next((a for a in approved_list if a.get("index") == i), {})
-                vendor["validation_reason"] = approval.get("reason", "Approved by LLM")
-                validated_vendors.append(vendor)
-                logger.info(f"[VendorValidate] APPROVED: {vendor.get('domain', 'unknown')} - {vendor.get('validation_reason')}")
-            else:
-                # Find the rejection reason
-                rejection = next((r for r in rejected_list if r.get("index") == i), {})
-                reason = rejection.get("reason", "Rejected by LLM")
-                logger.info(f"[VendorValidate] REJECTED: {vendor.get('domain', 'unknown')} - {reason}")
-
-        logger.info(f"[VendorValidate] Validated {len(validated_vendors)}/{len(vendors)} vendors for goal: {goal[:50]}")
-        return validated_vendors
-
-    except json.JSONDecodeError as e:
-        logger.error(f"[VendorValidate] Failed to parse LLM response: {e}")
-        # Fallback: return all vendors (don't block on LLM failure)
-        return vendors
+    outcome = await evaluate_batched(
+        items=vendors,
+        columns={
+            "vendor": lambda v: v.get("domain", v.get("name", "unknown")),
+            "source": lambda v: v.get("_source", "intelligence"),
+        },
+        result_fields={
+            "approved": {"type": "boolean"},
+            "reason": {"type": "string"},
+        },
+        render_prompt=render_prompt,
+        id_field="index",
+        tokens_per_item=50,
+        temperature=0.1,
+        llm_url=model_url,
+        llm_model=model_id,
+        llm_api_key=api_key,
+        timeout=30.0,
+        log_prefix="VendorValidate",
+    )
 
-    except Exception as e:
-        logger.error(f"[VendorValidate] Error during validation: {e}")
-        # Fallback: return all vendors (don't block on LLM failure)
-        return vendors
+    validated_vendors = []
+    for i, vendor in enumerate(vendors, 1):
+        verdict = outcome.results.get(i)
+        if verdict is None:
+            # No usable verdict: keep the vendor (don't block on LLM failure)
+            vendor["validation_reason"] = "Not validated (LLM unavailable)"
+            validated_vendors.append(vendor)
+            continue
+        if verdict.get("approved") in (True, "true", "True", 1):
+            vendor["validation_reason"] = verdict.get("reason") or "Approved by LLM"
+            validated_vendors.append(vendor)
+            logger.info(f"[VendorValidate] APPROVED: {vendor.get('domain', 'unknown')} - {vendor.get('validation_reason')}")
+        else:
+            logger.info(f"[VendorValidate] REJECTED: {vendor.get('domain', 'unknown')} - {verdict.get('reason') or 'Rejected by LLM'}")
+
+    logger.info(f"[VendorValidate] Validated {len(validated_vendors)}/{len(vendors)} vendors for goal: {goal[:50]}")
+    return validated_vendors
 
 
 # Quick test
@@ -3,6 +3,10 @@ Observability System for Panda
 
 Lightweight in-memory metrics collection with reflection-specific tracking.
 
+Tool, role and flow samples are also written to the persistent metrics store
+(libs/core/metrics_store.py), which keeps percentile rollups across restarts;
+get_percentiles() queries it.
+
 Usage:
     from apps.services.tool_server.observability import record_tool_call, record_role_call, record_flow, get_collector
 
@@ -16,11 +20,13 @@ Usage:
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Any, Optional
+from typing import Deque, Dict, List, Any, Optional
 from datetime import datetime, timedelta
-from collections import defaultdict
+from collections import defaultdict, deque
 import time
 
+from libs.core.metrics_store import get_metrics_store, record_metric
+
 
 def estimate_tokens(text: str) -> int:
     """Estimate token count (4 chars ≈ 1 token)"""
@@ -97,11 +103,11 @@ class MetricsCollector:
     def __init__(self, retention_hours: int = 24):
         self.retention_hours = retention_hours
 
-        # Raw metrics
-        self.tool_calls: List[ToolCallMetrics] = []
-        self.role_calls: List[RoleMetrics] = []
-        self.reflection_cycles: List[ReflectionMetrics] = []
-        self.flows: List[FlowMetrics] = []
+        # Raw metrics (append-only in time order, so expiry pops from the left)
+        self.tool_calls: Deque[ToolCallMetrics] = deque()
+        self.role_calls: Deque[RoleMetrics] = deque()
+        self.reflection_cycles: Deque[ReflectionMetrics] = deque()
+        self.flows: Deque[FlowMetrics] = deque()
 
         # Aggregated stats (cached)
         self._tool_stats_cache: Dict[str, ToolStats] = {}
@@ -130,6 +136,11 @@ class MetricsCollector:
         self.tool_calls.append(metric)
         self._cleanup_old_metrics()
         self._invalidate_cache()
+        record_metric(
+            "tool", tool,
+            {"latency_ms": duration_ms, "tokens_in": tokens_in, "tokens_out": tokens_out},
+            success=success
+        )
 
     def record_role_call(
         self,
@@ -150,6 +161,11 @@ class MetricsCollector:
 
         self.role_calls.append(metric)
         self._cleanup_old_metrics()
+        record_metric(
+            "role", role,
+            {"latency_ms": duration_ms, "tokens_in": tokens_in, "tokens_out": tokens_out},
+            success=success
+        )
 
     def record_reflection_cycle(
         self,
@@ -196,6 +212,11 @@ class MetricsCollector:
 
         self.flows.append(metric)
         self._cleanup_old_metrics()
+        record_metric(
+            "flow", "request",
+            {"latency_ms": total_duration_ms, "tokens": total_tokens, "tools_called": tools_called},
+            success=not exceeded_budget
+        )
 
     def get_tool_stats(self, hours: int = 24) -> List[ToolStats]:
         """Get aggregated tool statistics"""
@@ -309,6 +330,7 @@ class MetricsCollector:
 
         return {
             "period_hours": hours,
+            "percentiles": self.get_percentiles(hours),
             "tools": [
                 {
                     "name": s.tool,
@@ -326,14 +348,20 @@ class MetricsCollector:
             "flows": flow_stats
         }
 
+    def get_percentiles(self, hours: int = 24, kind: Optional[str] = None) -> Dict[str, Any]:
+        """p50/p95/p99 per phase/tool/role/flow from the persistent metrics store (all processes)."""
+        try:
+            return get_metrics_store().summary(window_seconds=hours * 3600, kind=kind)
+        except Exception as e:
+            return {"error": str(e)}
+
     def _cleanup_old_metrics(self):
         """Remove metrics older than retention window"""
         cutoff = datetime.now() - timedelta(hours=self.retention_hours)
 
-        self.tool_calls = [c for c in self.tool_calls if c.timestamp >= cutoff]
-        self.role_calls = [c for c in self.role_calls if c.timestamp >= cutoff]
-        self.reflection_cycles = [c for c in self.reflection_cycles if c.timestamp >= cutoff]
-        self.flows = [f for f in self.flows if f.timestamp >= cutoff]
+        for metrics in (self.tool_calls, self.role_calls, self.reflection_cycles, self.flows):
+            while metrics and metrics[0].timestamp < cutoff:
+                metrics.popleft()
 
     def _invalidate_cache(self):
         """Invalidate aggregated stats cache"""
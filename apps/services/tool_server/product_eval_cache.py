@@ -0,0 +1,362 @@
+"""
+orchestrator/product_eval_cache.py
+
+Cross-session cache of product viability verdicts.
+
+Design:
+- Keyed by (normalized product URL, requirements fingerprint). The URL is
+  normalized (host case, "www.", tracking parameters, fragment and trailing
+  slash dropped) so the same listing found through different searches hits
+- The fingerprint covers the requirements and the query signature from
+  serp_cache, so re-phrased repeats of a query ("best laptop under $1000" /
+  "laptop under $1000, best") reuse earlier verdicts
+- Each entry stores the verdict, the metadata/reasoning to re-apply to the
+  product, the parsed specs and the price at evaluation time; a changed
+  price is treated as a miss (budget checks depend on it)
+- TTLs follow FreshnessOracle confidence tiers: decisive verdicts live
+  longest, uncertain ones are re-checked soonest
+- Two tiers like SERPCache: in-memory LRU in front of a SQLite store shared
+  by all tool-server workers
+"""
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+from urllib.parse import parse_qsl, urlencode, urlparse
+
+from apps.services.tool_server.serp_cache import QUERY_SIGNATURE_VERSION, query_signature
+from apps.services.tool_server.shared_state.freshness import FreshnessOracle
+
+logger = logging.getLogger(__name__)
+
+PRODUCT_EVAL_CACHE_DB = Path(os.getenv("PRODUCT_EVAL_CACHE_DB", "panda_system_docs/product_eval_cache.db"))
+
+# Query parameters that never identify a product
+TRACKING_PARAMS = {"ref", "ref_", "tag", "psc", "th", "gclid", "fbclid", "msclkid", "srsltid", "cid", "clickid"}
+TRACKING_PREFIXES = ("utm_", "pf_rd_", "pd_rd_", "_encoding")
+
+
+def normalize_product_url(url: str) -> str:
+    """
+    Normalize a product URL for use as a cache key.
+
+    Lowercases the host, drops "www.", the fragment, a trailing slash and
+    tracking parameters, and sorts the remaining query parameters.
+    """
+    if not url:
+        return ""
+    parsed = urlparse(url.strip())
+    host = parsed.netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    params = sorted(
+        (k, v) for k, v in parse_qsl(parsed.query, keep_blank_values=True)
+        if k.lower() not in TRACKING_PARAMS and not k.lower().startswith(TRACKING_PREFIXES)
+    )
+    query = f"?{urlencode(params)}" if params else ""
+    return f"{host}{parsed.path.rstrip('/')}{query}"
+
+
+def requirements_fingerprint(requirements: Union[Dict[str, Any], str, None], query: str = "") -> str:
+    """
+    Fingerprint the requirements a verdict was made against.
+
+    Args:
+        requirements: Structured requirements dict or a reasoning document
+        query: User query (reduced to its serp_cache.query_signature)
+
+    Returns:
+        Short hex digest
+    """
+    if isinstance(requirements, str):
+        reqs: Any = " ".join(requirements.lower().split())
+    else:
+        reqs = requirements or {}
+    key_str = json.dumps(
+        {"requirements": reqs, "query": query_signature(query), "version": QUERY_SIGNATURE_VERSION},
+        sort_keys=True, default=str
+    )
+    return hashlib.sha256(key_str.encode()).hexdigest()[:16]
+
+
+def verdict_confidence(decision: str, score: Optional[float] = None) -> str:
+    """
+    Map a verdict to a FreshnessOracle confidence tier.
+
+    Rejections and confident accepts are stable; uncertain or borderline
+    verdicts expire soonest.
+    """
+    decision = (decision or "").upper()
+    if decision in ("REJECT", "REJECTED"):
+        return "high"
+    if decision == "UNCERTAIN":
+        return "low"
+    if score is not None and score >= 0.75:
+        return "high"
+    return "medium"
+
+
+class ProductEvalCache:
+    """
+    Cache for product viability verdicts.
+
+    Entries are dicts:
+        {"decision": str, "fields": {...}, "specs": {...}, "price": str, "cached_at": float}
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[Path] = None,
+        max_entries: int = 5000,
+        max_disk_entries: int = 100000,
+        freshness: Optional[FreshnessOracle] = None
+    ):
+        """
+        Args:
+            db_path: SQLite file for the persistent tier (None = memory only)
+            max_entries: Maximum in-memory entries before LRU eviction
+            max_disk_entries: Maximum rows kept in the persistent tier
+            freshness: TTL policy (default FreshnessOracle())
+        """
+        self._cache: OrderedDict[str, Tuple[Dict[str, Any], float]] = OrderedDict()
+        self._max_entries = max_entries
+        self._max_disk_entries = max_disk_entries
+        self._freshness = freshness or FreshnessOracle()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._price_misses = 0
+        self._puts_since_prune = 0
+
+        self._db_path = Path(db_path) if db_path else None
+        self._conn: Optional[sqlite3.Connection] = None
+        if self._db_path:
+            try:
+                self._init_db()
+            except sqlite3.Error as e:
+                logger.warning(f"[ProductEvalCache] Persistent tier disabled ({self._db_path}): {e}")
+                self._conn = None
+
+    def _init_db(self) -> None:
+        self._db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self._db_path), timeout=10, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS product_eval_cache (
+                key TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                fingerprint TEXT NOT NULL,
+                entry TEXT NOT NULL,
+                expires_at REAL NOT NULL
+            )
+        """)
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_product_eval_expires ON product_eval_cache(expires_at)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def _make_key(url: str, fingerprint: str) -> str:
+        return f"{fingerprint}:{normalize_product_url(url)}"
+
+    def get(self, url: str, fingerprint: str, price: Any = None) -> Optional[Dict[str, Any]]:
+        """
+        Look up a verdict.
+
+        Args:
+            url: Product URL
+            fingerprint: requirements_fingerprint() of the current requirements
+            price: Current product price; a different cached price is a miss
+
+        Returns:
+            Cached entry, or None
+        """
+        if not url:
+            return None
+        key = self._make_key(url, fingerprint)
+        now = time.time()
+
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None and cached[1] <= now:
+                del self._cache[key]
+                cached = None
+            if cached is not None:
+                self._cache.move_to_end(key)
+
+        if cached is None:
+            cached = self._disk_get(key, now)
+            if cached is not None:
+                self._memory_put(key, cached)
+
+        entry = cached[0] if cached else None
+        if entry is not None and price is not None and str(entry.get("price")) != str(price):
+            with self._lock:
+                self._price_misses += 1
+            entry = None
+
+        with self._lock:
+            if entry is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+        return entry
+
+    def put(
+        self,
+        url: str,
+        fingerprint: str,
+        decision: str,
+        fields: Dict[str, Any],
+        specs: Optional[Dict[str, Any]] = None,
+        price: Any = None,
+        confidence: Optional[str] = None
+    ) -> None:
+        """
+        Store a verdict.
+
+        Args:
+            url: Product URL
+            fingerprint: requirements_fingerprint() the verdict was made against
+            decision: Verdict (e.g. ACCEPT/REJECT/UNCERTAIN)
+            fields: Product fields to re-apply on a hit (score, reasoning, ...)
+            specs: Parsed specs
+            price: Product price at evaluation time
+            confidence: FreshnessOracle tier (default from verdict_confidence)
+        """
+        if not url:
+            return
+        now = time.time()
+        if confidence is None:
+            score = fields.get("viability_score")
+            confidence = verdict_confidence(decision, score if isinstance(score, (int, float)) else None)
+        expires_at = now + self._freshness.suggest_ttl_seconds(confidence)
+        entry = {
+            "decision": decision,
+            "fields": fields,
+            "specs": specs or {},
+            "price": None if price is None else str(price),
+            "cached_at": now,
+        }
+        key = self._make_key(url, fingerprint)
+        self._memory_put(key, (entry, expires_at))
+        self._disk_put(key, normalize_product_url(url), fingerprint, entry, expires_at, now)
+
+    def _memory_put(self, key: str, cached: Tuple[Dict[str, Any], float]) -> None:
+        with self._lock:
+            if len(self._cache) >= self._max_entries and key not in self._cache:
+                self._cache.popitem(last=False)
+            self._cache[key] = cached
+            self._cache.move_to_end(key)
+
+    # ------------------------------------------------------------------
+    # Persistent tier
+    # ------------------------------------------------------------------
+
+    def _disk_get(self, key: str, now: float) -> Optional[Tuple[Dict[str, Any], float]]:
+        if self._conn is None:
+            return None
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT entry, expires_at FROM product_eval_cache WHERE key = ? AND expires_at > ?",
+                    (key, now)
+                ).fetchone()
+            if row is None:
+                return None
+            return json.loads(row[0]), row[1]
+        except (sqlite3.Error, json.JSONDecodeError) as e:
+            logger.warning(f"[ProductEvalCache] Disk read failed: {e}")
+            return None
+
+    def _disk_put(
+        self,
+        key: str,
+        url: str,
+        fingerprint: str,
+        entry: Dict[str, Any],
+        expires_at: float,
+        now: float
+    ) -> None:
+        if self._conn is None:
+            return
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO product_eval_cache (key, url, fingerprint, entry, expires_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (key, url, fingerprint, json.dumps(entry, default=str), expires_at)
+                )
+                self._puts_since_prune += 1
+                if self._puts_since_prune >= 200:
+                    self._prune_locked(now)
+                self._conn.commit()
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            logger.warning(f"[ProductEvalCache] Disk write failed: {e}")
+
+    def _prune_locked(self, now: float) -> None:
+        """Drop expired rows and cap the persistent tier (caller holds _lock)."""
+        self._puts_since_prune = 0
+        self._conn.execute("DELETE FROM product_eval_cache WHERE expires_at <= ?", (now,))
+        self._conn.execute(
+            "DELETE FROM product_eval_cache WHERE key IN ("
+            "SELECT key FROM product_eval_cache ORDER BY expires_at DESC LIMIT -1 OFFSET ?)",
+            (self._max_disk_entries,)
+        )
+
+    def clear(self) -> None:
+        """Clear all cached verdicts (both tiers)."""
+        with self._lock:
+            self._cache.clear()
+            if self._conn is not None:
+                try:
+                    self._conn.execute("DELETE FROM product_eval_cache")
+                    self._conn.commit()
+                except sqlite3.Error as e:
+                    logger.warning(f"[ProductEvalCache] Disk clear failed: {e}")
+            self._hits = 0
+            self._misses = 0
+            self._price_misses = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            {"entries", "hits", "misses", "price_misses", "hit_rate"}
+        """
+        with self._lock:
+            hits, misses = self._hits, self._misses
+            stats = {
+                "entries": len(self._cache),
+                "hits": hits,
+                "misses": misses,
+                "price_misses": self._price_misses,
+            }
+        total = hits + misses
+        stats["hit_rate"] = hits / total if total > 0 else 0.0
+        return stats
+
+
+# Global singleton instance
+_global_product_eval_cache: Optional[ProductEvalCache] = None
+
+
+def get_product_eval_cache() -> ProductEvalCache:
+    """
+    Get the global product evaluation cache instance.
+
+    Returns:
+        ProductEvalCache singleton
+    """
+    global _global_product_eval_cache
+    if _global_product_eval_cache is None:
+        _global_product_eval_cache = ProductEvalCache(db_path=PRODUCT_EVAL_CACHE_DB)
+    return _global_product_eval_cache
@@ -60,6 +60,7 @@ class PerceptionConfig:
     enable_proactive_calibration: bool = True   # Build schema BEFORE extraction, not after
     calibration_timeout_ms: int = 15000         # Max time for schema calibration
     calibration_min_confidence: float = 0.5     # Below this, skip schema and use vision
+    background_calibration: bool = True         # Queue calibration off the request path (CalibrationQueue)
 
     # Debug
     save_debug_screenshots: bool = False
@@ -90,6 +91,7 @@ class PerceptionConfig:
             enable_proactive_calibration=os.getenv("PERCEPTION_PROACTIVE_CALIBRATION", "true").lower() == "true",
             calibration_timeout_ms=int(os.getenv("PERCEPTION_CALIBRATION_TIMEOUT_MS", "15000")),
             calibration_min_confidence=float(os.getenv("PERCEPTION_CALIBRATION_MIN_CONFIDENCE", "0.5")),
+            background_calibration=os.getenv("PERCEPTION_BACKGROUND_CALIBRATION", "true").lower() == "true",
             # Debug
             save_debug_screenshots=os.getenv("PERCEPTION_DEBUG", "false").lower() == "true",
         )
@@ -38,6 +38,8 @@ from apps.services.tool_server.shared_state.site_schema_registry import (
 # Using PageIntelligence adapter for backwards compatibility
 from apps.services.tool_server.page_intelligence.legacy_adapter import get_smart_calibrator, ExtractionSchema
 from apps.services.tool_server.shared_state.site_health_tracker import get_health_tracker
+from apps.services.tool_server.schema_extraction_plan import run_extraction_plan
+from apps.services.tool_server.calibration_queue import get_calibration_queue
 
 if TYPE_CHECKING:
     from playwright.async_api import Page
@@ -1174,75 +1176,44 @@ class ProductPerceptionPipeline:
             if not schema.product_card_selector:
                 return []
 
-            # Find all product cards
-            cards = await page.query_selector_all(schema.product_card_selector)
+            # All cards' fields in one page.evaluate (compiled per schema version)
+            extracted = await run_extraction_plan(page, schema, limit=20)  # Limit to 20 products
+            cards = extracted["cards"]
 
             if not cards:
                 logger.debug(f"[Pipeline] Schema selector '{schema.product_card_selector}' found 0 cards")
                 return []
 
-            logger.info(f"[Pipeline] Schema found {len(cards)} product cards")
+            logger.info(f"[Pipeline] Schema found {extracted['count']} product cards")
 
-            for i, card in enumerate(cards[:20]):  # Limit to 20 products
-                try:
-                    # Get product link
-                    link_el = None
-                    href = None
-                    title = ""
-
-                    if schema.product_link_selector:
-                        link_el = await card.query_selector(schema.product_link_selector)
-
-                    if not link_el:
-                        # Fallback: find any link in the card
-                        link_el = await card.query_selector("a[href]")
-
-                    if link_el:
-                        href = await link_el.get_attribute("href")
-                        title = await link_el.text_content() or ""
-                        title = title.strip()
-
-                    if not href:
-                        continue
-
-                    # Get price
-                    price_text = ""
-                    if schema.price_selector:
-                        price_el = await card.query_selector(schema.price_selector)
-                        if price_el:
-                            price_text = await price_el.text_content() or ""
-
-                    # Get title from dedicated selector if available
-                    if schema.title_selector and not title:
-                        title_el = await card.query_selector(schema.title_selector)
-                        if title_el:
-                            title = await title_el.text_content() or ""
-                            title = title.strip()
-
-                    # Build absolute URL
-                    if href and not href.startswith("http"):
-                        from urllib.parse import urljoin
-                        href = urljoin(url, href)
-
-                    # Skip filter/navigation URLs
-                    if self._is_filter_url(href, schema):
-                        continue
-
-                    # Create candidate
-                    from .models import HTMLCandidate
-                    candidate = HTMLCandidate(
-                        url=href,
-                        link_text=title[:200],
-                        context_text=price_text[:100],
-                        source="schema_driven",
-                        confidence=0.95
-                    )
-                    candidates.append(candidate)
+            from urllib.parse import urljoin
+            from .models import HTMLCandidate
 
-                except Exception as e:
-                    logger.debug(f"[Pipeline] Error extracting card {i}: {e}")
+            for card in cards:
+                href = card.get("href")
+                if not href:
                     continue
 
+                # Title from the product link, else from the dedicated selector
+                title = card.get("link_text") or card.get("title") or ""
+                price_text = card.get("price") or ""
+
+                # Build absolute URL
+                if not href.startswith("http"):
+                    href = urljoin(url, href)
+
+                # Skip filter/navigation URLs
+                if self._is_filter_url(href, schema):
+                    continue
+
+                candidates.append(HTMLCandidate(
+                    url=href,
+                    link_text=title[:200],
+                    context_text=price_text[:100],
+                    source="schema_driven",
+                    confidence=0.95
+                ))
+
             return candidates
 
         except Exception as e:
@@ -1512,6 +1483,10 @@ class ProductPerceptionPipeline:
 
     async def _trigger_calibration(self, page: 'Page', url: str, domain: str) -> None:
         """Trigger background calibration to learn schema."""
+        if self.config.background_calibration:
+            # Calibrate on the queue's own browser session, not the user's page
+            get_calibration_queue().request(domain, "listing", url, reason="reactive")
+            return
         try:
             # Validate page is still valid and on the expected URL
             # (page may have navigated away if this is called as background task)
@@ -1541,10 +1516,15 @@ class ProductPerceptionPipeline:
         Ensure a valid schema exists for this domain/page_type.
 
         PROACTIVE Schema Build Mode:
-        - If no schema exists, calibrate NOW before extraction
-        - If schema needs recalibration, recalibrate NOW
+        - If no schema exists, calibrate before extraction
+        - If schema needs recalibration, recalibrate before extraction
         - This replaces the reactive approach where we only calibrated after success
 
+        With background_calibration (default), the (re)calibration is queued
+        on the CalibrationQueue instead of run inline: this request carries on
+        with the existing schema (if it still has a card selector) or the
+        HTML/vision tiers, and later requests pick up the new schema.
+
         Args:
             page: Playwright page object
             url: Current page URL
@@ -1560,6 +1540,7 @@ class ProductPerceptionPipeline:
             return schema_registry.get(domain, page_type)
 
         schema_registry = get_schema_registry()
+        get_calibration_queue().note_request(domain, page_type)
 
         # Check if we have a valid, non-stale schema
         existing = schema_registry.get(domain, page_type)
@@ -1570,6 +1551,15 @@ class ProductPerceptionPipeline:
 
         # Need to build/rebuild schema proactively
         reason = "no schema exists" if not existing else "schema needs recalibration"
+
+        if self.config.background_calibration:
+            queue = get_calibration_queue()
+            queue.request(domain, page_type, url, reason=reason)
+            logger.info(f"[Pipeline] Queued background calibration for {domain} ({reason}), not waiting")
+            if existing and existing.product_card_selector:
+                return existing
+            return None
+
         logger.info(f"[Pipeline] Proactive calibration for {domain} ({reason})")
 
         try:
@@ -128,6 +128,8 @@ class SearchConfig:
     max_urls_per_vendor_phase2: int = 5
 
     # Performance
+    # Total concurrent page fetches per search; per-vendor pacing is adaptive
+    # (see domain_concurrency.py)
     parallel_fetch_limit: int = 3
     fetch_timeout_sec: int = 30
 
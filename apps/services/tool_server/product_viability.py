@@ -12,11 +12,19 @@ import json
 import logging
 import os
 import re
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import Callable, List, Dict, Any, Optional, Tuple
 from urllib.parse import urlparse
 import httpx
 
+from apps.services.tool_server.product_eval_cache import (
+    ProductEvalCache,
+    get_product_eval_cache,
+    requirements_fingerprint,
+    verdict_confidence,
+)
+from apps.services.tool_server.shared.batch_eval import evaluate_batched
 from apps.services.tool_server.shared.llm_utils import load_prompt_via_recipe as _load_prompt_via_recipe
 
 logger = logging.getLogger(__name__)
@@ -47,7 +55,18 @@ def parse_specs_from_url(url: str) -> Dict[str, str]:
 
     try:
         path = urlparse(url).path.lower()
-        # Also check query string for some retailers
+    except Exception as e:
+        logger.warning(f"[URLSpecs] Failed to parse URL specs: {e}")
+        return {}
+
+    # Memoized per path: the same listing URL is seen on every repeated search
+    return dict(_parse_specs_from_path(path))
+
+
+@lru_cache(maxsize=4096)
+def _parse_specs_from_path(path: str) -> Tuple[Tuple[str, str], ...]:
+    """Run the spec regex families over a lowercased URL path (cached)."""
+    try:
         full_text = path.replace('-', ' ').replace('_', ' ').replace('/', ' ')
         specs = {}
 
@@ -130,11 +149,11 @@ def parse_specs_from_url(url: str) -> Dict[str, str]:
         if specs:
             logger.debug(f"[URLSpecs] Parsed from URL: {specs}")
 
-        return specs
+        return tuple(specs.items())
 
     except Exception as e:
         logger.warning(f"[URLSpecs] Failed to parse URL specs: {e}")
-        return {}
+        return ()
 
 
 def check_keyword_viability(
@@ -253,11 +272,17 @@ async def filter_viable_products(
     model_id = os.getenv("SOLVER_MODEL_ID", "qwen3-coder")
     api_key = os.getenv("SOLVER_API_KEY", "qwen-local")
 
+    # Verdicts from earlier sessions for the same listing + requirements
+    eval_cache = get_product_eval_cache()
+    fingerprint = requirements_fingerprint(requirements, query)
+    cached_viable: List[Dict[str, Any]] = []
+    cached_rejected: List[Dict[str, Any]] = []
+
     # Build products text for prompt with enhanced spec extraction
     products_text = []
     enriched_products = []  # Keep track of products with parsed URL specs
 
-    for i, p in enumerate(products[:10], 1):  # Limit to 10 products
+    for p in products[:10]:  # Limit to 10 products
         # Get description, truncate if too long
         desc = p.get('description', 'N/A') or 'N/A'
         if len(desc) > 200:
@@ -277,7 +302,14 @@ async def filter_viable_products(
         enriched_p = p.copy()
         enriched_p['_parsed_url_specs'] = url_specs
         enriched_p['_merged_specs'] = merged_specs
+
+        cached = eval_cache.get(url, fingerprint, price=p.get('price')) if url else None
+        if cached is not None:
+            _apply_cached_verdict(enriched_p, cached, cached_viable, cached_rejected)
+            continue
+
         enriched_products.append(enriched_p)
+        i = len(enriched_products)
 
         # Build specs text
         specs_text = ""
@@ -302,8 +334,20 @@ async def filter_viable_products(
         )
 
     # Use enriched products for result building
+    total_input = len(enriched_products) + len(cached_viable) + len(cached_rejected)
     products = enriched_products
 
+    if not products:
+        logger.info(f"[Viability] All {total_input} products answered from evaluation cache")
+        return _merge_cached_verdicts(
+            {"viable_products": [], "rejected": []}, cached_viable, cached_rejected, max_products, total_input
+        )
+    if cached_viable or cached_rejected:
+        logger.info(
+            f"[Viability] Evaluation cache: {len(cached_viable) + len(cached_rejected)} cached, "
+            f"{len(products)} to evaluate"
+        )
+
     # Build requirements text - now returns (hard, nice_to_have) tuple
     hard_requirements_text, nice_to_haves_text = _format_requirements(requirements, query)
 
@@ -421,6 +465,7 @@ Evaluate each product against the requirements and determine viability."""
                     original["weaknesses"] = eval_item.get("weaknesses", [])
                     original["viability_summary"] = eval_item.get("summary", "")
                     viable_products.append(original)
+                    _cache_viable_verdict(eval_cache, fingerprint, original)
 
                     logger.info(
                         f"[Viability] VIABLE: {original.get('name', 'Unknown')[:40]} "
@@ -444,6 +489,7 @@ Evaluate each product against the requirements and determine viability."""
                             original["weaknesses"] = ["Viability uncertain - keyword match only"]
                             original["viability_summary"] = "Viable based on keyword matching"
                             viable_products.append(original)
+                            _cache_viable_verdict(eval_cache, fingerprint, original)
                             continue
 
                     rejected.append({
@@ -451,6 +497,11 @@ Evaluate each product against the requirements and determine viability."""
                         "price": original.get("price", "N/A"),
                         "reason": rejection_reason or "Does not meet requirements"
                     })
+                    eval_cache.put(
+                        original.get("url", ""), fingerprint, "REJECT",
+                        {"reason": rejection_reason or "Does not meet requirements"},
+                        specs=original.get("_merged_specs"), price=original.get("price")
+                    )
 
                     logger.info(
                         f"[Viability] REJECTED: {original.get('name', 'Unknown')[:40]} - "
@@ -479,25 +530,87 @@ Evaluate each product against the requirements and determine viability."""
             except Exception as e:
                 logger.warning(f"[Viability] Failed to record rejections: {e}")
 
-        return {
-            "viable_products": viable_products,
-            "rejected": rejected,
-            "stats": {
-                "total_input": len(products),
-                "viable_count": len(viable_products),
-                "rejected_count": len(rejected)
-            }
-        }
+        return _merge_cached_verdicts(
+            {"viable_products": viable_products, "rejected": rejected},
+            cached_viable, cached_rejected, max_products, total_input
+        )
 
     except json.JSONDecodeError as e:
         logger.error(f"[Viability] Failed to parse LLM response: {e}")
         # Fallback: Return products with keyword and price filtering
-        return _heuristic_viability_filter(products, requirements, max_products, query)
+        return _merge_cached_verdicts(
+            _heuristic_viability_filter(products, requirements, max_products, query),
+            cached_viable, cached_rejected, max_products, total_input
+        )
 
     except Exception as e:
         logger.error(f"[Viability] LLM viability check failed: {e}")
         # Fallback: Return products with keyword and price filtering
-        return _heuristic_viability_filter(products, requirements, max_products, query)
+        return _merge_cached_verdicts(
+            _heuristic_viability_filter(products, requirements, max_products, query),
+            cached_viable, cached_rejected, max_products, total_input
+        )
+
+
+# Product fields a cached ACCEPT verdict restores
+_CACHED_VIABLE_FIELDS = (
+    "viability_score", "meets_requirements", "strengths", "weaknesses",
+    "viability_summary", "viability_reasoning",
+)
+
+
+def _cache_viable_verdict(eval_cache: ProductEvalCache, fingerprint: str, product: Dict[str, Any]) -> None:
+    """Store an accepted product's verdict metadata."""
+    eval_cache.put(
+        product.get("url", ""), fingerprint, "ACCEPT",
+        {k: product[k] for k in _CACHED_VIABLE_FIELDS if k in product},
+        specs=product.get("_merged_specs"), price=product.get("price")
+    )
+
+
+def _apply_cached_verdict(
+    product: Dict[str, Any],
+    cached: Dict[str, Any],
+    viable: List[Dict[str, Any]],
+    rejected: List[Dict[str, Any]]
+) -> None:
+    """Sort a product into viable/rejected from a cached verdict."""
+    fields = cached.get("fields", {})
+    if cached.get("decision") == "REJECT":
+        rejected.append({
+            "name": product.get("name", "Unknown"),
+            "price": product.get("price", "N/A"),
+            "reason": fields.get("reason", "Does not meet requirements")
+        })
+    else:
+        product.update(fields)
+        viable.append(product)
+    logger.debug(f"[Viability] Cached {cached.get('decision')}: {product.get('name', 'Unknown')[:40]}")
+
+
+def _merge_cached_verdicts(
+    result: Dict[str, Any],
+    cached_viable: List[Dict[str, Any]],
+    cached_rejected: List[Dict[str, Any]],
+    max_products: int,
+    total_input: int
+) -> Dict[str, Any]:
+    """Combine freshly evaluated results with cached verdicts and rebuild stats."""
+    viable_products = result.get("viable_products", []) + cached_viable
+    rejected = result.get("rejected", []) + cached_rejected
+    viable_products.sort(key=lambda x: x.get("viability_score", 0), reverse=True)
+    viable_products = viable_products[:max_products]
+    return {
+        **result,
+        "viable_products": viable_products,
+        "rejected": rejected,
+        "stats": {
+            "total_input": total_input,
+            "viable_count": len(viable_products),
+            "rejected_count": len(rejected),
+            "cache_hits": len(cached_viable) + len(cached_rejected)
+        }
+    }
 
 
 # ==================== LLM REASONING-BASED VIABILITY FILTER ====================
@@ -562,11 +675,10 @@ async def filter_viable_products_with_reasoning(
         logger.warning("[Viability:Reasoning] Prompt not found via recipe, using inline fallback")
         prompt_template = _get_inline_viability_prompt()
 
-    # Format products for evaluation
-    products_text = _format_products_for_reasoning_eval(products[:10])
+    evaluated = products[:10]
 
-    # Build full prompt
-    prompt = f"""{prompt_template}
+    def render_prompt(table: str) -> str:
+        return f"""{prompt_template}
 
 ---
 
@@ -583,139 +695,190 @@ async def filter_viable_products_with_reasoning(
 
 ## Products to Evaluate
 
-{products_text}
+{table}
 
 ---
 
 Now evaluate each product against the requirements reasoning above.
-Output your evaluations in YAML format as shown in the prompt template.
+Use the JSON response format below instead of the YAML format in the template;
+the fields carry the same meaning.
 """
 
-    logger.info(f"[Viability:Reasoning] Evaluating {len(products)} products with LLM reasoning")
-
-    # LLM call with retry logic
-    import asyncio
-
-    max_retries = 2
-    last_error = None
-    result = None
-
-    for attempt in range(max_retries):
-        try:
-            async with httpx.AsyncClient(timeout=45.0) as client:
-                response = await client.post(
-                    model_url,
-                    json={
-                        "model": model_id,
-                        "messages": [{"role": "user", "content": prompt}],
-                    "temperature": 0.6,
-                        "max_tokens": 2000
-                    },
-                    headers={"Authorization": f"Bearer {api_key}"}
-                )
-                response.raise_for_status()
-                result = response.json()
-                break  # Success, exit retry loop
-
-        except httpx.TimeoutException as e:
-            last_error = e
-            if attempt < max_retries - 1:
-                wait_time = (attempt + 1) * 2  # 2s, 4s backoff
-                logger.warning(f"[Viability:Reasoning] Timeout, retrying in {wait_time}s (attempt {attempt + 1}/{max_retries})")
-                await asyncio.sleep(wait_time)
-            else:
-                logger.error(f"[Viability:Reasoning] Failed after {max_retries} attempts: {e}")
-                # Fall through to fallback handling below
-
-        except Exception as e:
-            last_error = e
-            logger.error(f"[Viability:Reasoning] LLM call failed: {e}")
-            break  # Don't retry on non-timeout errors
+    # Verdicts from earlier sessions for the same listing + requirements
+    eval_cache = get_product_eval_cache()
+    fingerprint = requirements_fingerprint(requirements_reasoning, query)
+    verdicts: Dict[int, Dict[str, Any]] = {}
+    for i, p in enumerate(evaluated, 1):
+        cached = eval_cache.get(p.get("url", ""), fingerprint, price=p.get("price"))
+        if cached is not None:
+            verdicts[i] = cached["fields"]
+
+    pending = [i for i in range(1, len(evaluated) + 1) if i not in verdicts]
+    failed: List[int] = []
+    if verdicts:
+        logger.info(f"[Viability:Reasoning] Evaluation cache: {len(verdicts)} cached, {len(pending)} to evaluate")
+    if pending:
+        failed = await _evaluate_with_reasoning(
+            evaluated, pending, render_prompt, verdicts, eval_cache, fingerprint,
+            model_url, model_id, api_key
+        )
 
-    # If no result after retries, fall back
-    if result is None:
+    # Nothing usable from the LLM: heuristic filter for everything
+    if not verdicts:
         logger.info("[Viability:Reasoning] Falling back to heuristic filter after LLM failure")
-        # Extract any useful info from requirements_reasoning for fallback
         fallback_reqs = _extract_fallback_requirements(requirements_reasoning)
         return _heuristic_viability_filter(products, fallback_reqs, max_products, query)
 
-    try:
-        # Parse LLM response
-        llm_content = result["choices"][0]["message"]["content"].strip()
-        reasoning_chain = llm_content  # Store full response for debugging
+    viable_products = []
+    rejected = []
+    uncertain = []
+    chain_lines = []
 
-        # Parse YAML evaluations from response
-        evaluations = _parse_viability_reasoning_response(llm_content)
+    for product_index, eval_item in sorted(verdicts.items()):
+        product = evaluated[product_index - 1].copy()
 
-        # Categorize by decision
-        viable_products = []
-        rejected = []
-        uncertain = []
-
-        for eval_item in evaluations:
-            product_idx = eval_item.get("product_index", 0) - 1
-            if 0 <= product_idx < len(products):
-                product = products[product_idx].copy()
+        # Add reasoning metadata
+        product["viability_reasoning"] = {
+            key: eval_item.get(key, "")
+            for key in ("fundamental_check", "user_satisfaction", "requirements_check")
+        }
+        product["viability_score"] = float(eval_item.get("score", 0.5))
 
-                # Add reasoning metadata
-                product["viability_reasoning"] = eval_item.get("reasoning", {})
-                product["viability_score"] = eval_item.get("score", 0.5)
+        decision = str(eval_item.get("decision", "UNCERTAIN")).upper()
+        score = product["viability_score"]
+        chain_lines.append(
+            f"{product_index}. {product.get('name', 'Unknown')[:60]}: {decision} ({score:.2f}) - "
+            f"{eval_item.get('fundamental_check', '')}"
+        )
 
-                decision = eval_item.get("decision", "UNCERTAIN").upper()
-                score = product["viability_score"]
+        if decision == "ACCEPT":
+            viable_products.append(product)
+            logger.info(
+                f"[Viability:Reasoning] ACCEPT: {product.get('name', 'Unknown')[:40]} "
+                f"(score: {score:.2f})"
+            )
+        elif decision == "REJECT":
+            product["rejection_reason"] = eval_item.get("rejection_reason") or "Failed reasoning check"
+            rejected.append(product)
+            logger.info(
+                f"[Viability:Reasoning] REJECT: {product.get('name', 'Unknown')[:40]} - "
+                f"{product['rejection_reason']}"
+            )
+        else:
+            # UNCERTAIN products: include if score >= 0.40 (borderline viable)
+            # These are products where the LLM wasn't confident but might still be relevant
+            if score >= 0.40:
+                viable_products.append(product)
+                logger.info(
+                    f"[Viability:Reasoning] UNCERTAIN->VIABLE: {product.get('name', 'Unknown')[:40]} "
+                    f"(score: {score:.2f} >= 0.40 threshold)"
+                )
+            else:
+                uncertain.append(product)
+                logger.info(
+                    f"[Viability:Reasoning] UNCERTAIN: {product.get('name', 'Unknown')[:40]} "
+                    f"(score: {score:.2f})"
+                )
 
-                if decision == "ACCEPT":
-                    viable_products.append(product)
-                    logger.info(
-                        f"[Viability:Reasoning] ACCEPT: {product.get('name', 'Unknown')[:40]} "
-                        f"(score: {score:.2f})"
-                    )
-                elif decision == "REJECT":
-                    product["rejection_reason"] = eval_item.get("rejection_reason", "Failed reasoning check")
-                    rejected.append(product)
-                    logger.info(
-                        f"[Viability:Reasoning] REJECT: {product.get('name', 'Unknown')[:40]} - "
-                        f"{product['rejection_reason']}"
-                    )
-                else:
-                    # UNCERTAIN products: include if score >= 0.40 (borderline viable)
-                    # These are products where the LLM wasn't confident but might still be relevant
-                    if score >= 0.40:
-                        viable_products.append(product)
-                        logger.info(
-                            f"[Viability:Reasoning] UNCERTAIN->VIABLE: {product.get('name', 'Unknown')[:40]} "
-                            f"(score: {score:.2f} >= 0.40 threshold)"
-                        )
-                    else:
-                        uncertain.append(product)
-                        logger.info(
-                            f"[Viability:Reasoning] UNCERTAIN: {product.get('name', 'Unknown')[:40]} "
-                            f"(score: {score:.2f})"
-                        )
+    # Products the LLM never returned a valid verdict for: heuristic check only for those
+    if failed:
+        logger.info(f"[Viability:Reasoning] Heuristic check for {len(failed)} unevaluated products")
+        fallback = _heuristic_viability_filter(
+            [evaluated[i - 1] for i in failed],
+            _extract_fallback_requirements(requirements_reasoning),
+            len(failed),
+            query
+        )
+        viable_products.extend(fallback["viable_products"])
+        rejected.extend(fallback["rejected"])
+        chain_lines.append(f"Heuristic fallback for products {failed}")
 
-        # Sort viable by score and limit
-        viable_products.sort(key=lambda x: x.get("viability_score", 0), reverse=True)
-        viable_products = viable_products[:max_products]
+    # Sort viable by score and limit
+    viable_products.sort(key=lambda x: x.get("viability_score", 0), reverse=True)
+    viable_products = viable_products[:max_products]
 
-        return {
-            "viable_products": viable_products,
-            "rejected": rejected,
-            "uncertain": uncertain,
-            "reasoning_chain": reasoning_chain,
-            "stats": {
-                "total_input": len(products),
-                "viable_count": len(viable_products),
-                "rejected_count": len(rejected),
-                "uncertain_count": len(uncertain)
-            }
+    return {
+        "viable_products": viable_products,
+        "rejected": rejected,
+        "uncertain": uncertain,
+        "reasoning_chain": "\n".join(chain_lines),
+        "stats": {
+            "total_input": len(products),
+            "viable_count": len(viable_products),
+            "rejected_count": len(rejected),
+            "uncertain_count": len(uncertain),
+            "cache_hits": len(evaluated) - len(pending)
         }
+    }
 
-    except Exception as e:
-        logger.error(f"[Viability:Reasoning] Response parsing failed: {e}")
-        # Fallback to structured filter if parsing fails
-        logger.info("[Viability:Reasoning] Falling back to heuristic filter")
-        fallback_reqs = _extract_fallback_requirements(requirements_reasoning)
-        return _heuristic_viability_filter(products, fallback_reqs, max_products, query)
+
+# Per-product fields of the reasoning evaluation (also what the cache stores)
+_REASONING_RESULT_FIELDS = {
+    "fundamental_check": {"type": "string"},
+    "user_satisfaction": {"type": "string"},
+    "requirements_check": {"type": "string"},
+    "decision": {"type": "string", "enum": ["ACCEPT", "REJECT", "UNCERTAIN"]},
+    "score": {"type": "number"},
+    "rejection_reason": {"type": "string"},
+}
+
+
+async def _evaluate_with_reasoning(
+    evaluated: List[Dict[str, Any]],
+    pending: List[int],
+    render_prompt: Callable[[str], str],
+    verdicts: Dict[int, Dict[str, Any]],
+    eval_cache: ProductEvalCache,
+    fingerprint: str,
+    model_url: str,
+    model_id: str,
+    api_key: str
+) -> List[int]:
+    """
+    Run the batched reasoning evaluation for the uncached products.
+
+    Fills `verdicts` (keyed by position in `evaluated`), caches each verdict
+    and returns the positions that got no usable verdict.
+    """
+    logger.info(f"[Viability:Reasoning] Evaluating {len(pending)} products with LLM reasoning")
+
+    outcome = await evaluate_batched(
+        items=[evaluated[i - 1] for i in pending],
+        columns={
+            "name": "name",
+            "price": "price",
+            "vendor": "vendor",
+            "specs": "specs",
+            "description": "description",
+            "url_path": lambda p: urlparse(p.get("url") or "").path,
+        },
+        cell_limits={"description": 300, "url_path": 150},
+        result_fields=_REASONING_RESULT_FIELDS,
+        render_prompt=render_prompt,
+        id_field="product_index",
+        tokens_per_item=160,
+        temperature=0.6,
+        llm_url=model_url,
+        llm_model=model_id,
+        llm_api_key=api_key,
+        timeout=45.0,
+        log_prefix="Viability:Reasoning",
+    )
+
+    for batch_id, eval_item in outcome.results.items():
+        position = pending[batch_id - 1]
+        product = evaluated[position - 1]
+        fields = {key: eval_item.get(key) for key in _REASONING_RESULT_FIELDS}
+        verdicts[position] = fields
+        decision = str(fields.get("decision", "UNCERTAIN")).upper()
+        eval_cache.put(
+            product.get("url", ""), fingerprint, decision, fields,
+            specs=parse_specs_from_url(product.get("url", "")),
+            price=product.get("price"),
+            confidence=verdict_confidence(decision, float(fields.get("score") or 0.5))
+        )
+
+    return [pending[batch_id - 1] for batch_id in outcome.failed]
 
 
 def _extract_fallback_requirements(requirements_reasoning: str) -> Dict[str, Any]:
@@ -783,106 +946,6 @@ def _extract_fallback_requirements(requirements_reasoning: str) -> Dict[str, Any
     return fallback_reqs
 
 
-def _format_products_for_reasoning_eval(products: List[Dict[str, Any]]) -> str:
-    """Format products for the reasoning-based viability evaluation."""
-    lines = []
-    for i, p in enumerate(products, 1):
-        name = p.get("name", "Unknown")
-        price = p.get("price", "N/A")
-        vendor = p.get("vendor", "N/A")
-        desc = p.get("description", "") or ""
-        if len(desc) > 300:
-            desc = desc[:300] + "..."
-
-        # Build specs summary
-        specs = p.get("specs", {}) or {}
-        specs_text = ", ".join(f"{k}: {v}" for k, v in specs.items() if v) if specs else "N/A"
-
-        # Extract URL info
-        url = p.get("url", "")
-        url_info = ""
-        if url:
-            from urllib.parse import urlparse
-            path = urlparse(url).path
-            if path and len(path) > 5:
-                url_info = f"\n   URL path: {path[:150]}"
-
-        lines.append(f"""
-**Product {i}:**
-- Name: {name}
-- Price: {price}
-- Vendor: {vendor}
-- Description: {desc}
-- Specs: {specs_text}{url_info}
-""")
-
-    return "\n".join(lines)
-
-
-def _parse_viability_reasoning_response(response: str) -> List[Dict[str, Any]]:
-    """
-    Parse YAML evaluations from the viability reasoning LLM response.
-
-    Handles various formats including:
-    - Multiple YAML blocks with ```yaml markers
-    - Inline YAML after "```yaml" markers
-    - Plain YAML without markers
-    """
-    import yaml
-
-    evaluations = []
-
-    # Try to find YAML blocks
-    yaml_pattern = r'```yaml\s*(.*?)```'
-    yaml_blocks = re.findall(yaml_pattern, response, re.DOTALL)
-
-    if yaml_blocks:
-        for block in yaml_blocks:
-            try:
-                # Use safe_load_all to handle multiple YAML documents (separated by ---)
-                for parsed in yaml.safe_load_all(block):
-                    if isinstance(parsed, dict):
-                        evaluations.append(parsed)
-                    elif isinstance(parsed, list):
-                        evaluations.extend(parsed)
-            except yaml.YAMLError as e:
-                logger.warning(f"[Viability:Reasoning] YAML parse error: {e}")
-                continue
-    else:
-        # Try to parse entire response as YAML
-        try:
-            # Find product_index patterns to extract evaluations
-            eval_pattern = r'product_index:\s*(\d+).*?decision:\s*"?(\w+)"?.*?score:\s*([\d.]+)'
-            matches = re.findall(eval_pattern, response, re.DOTALL | re.IGNORECASE)
-
-            for match in matches:
-                product_idx, decision, score = match
-                # Try to extract reasoning and rejection_reason
-                eval_block = {
-                    "product_index": int(product_idx),
-                    "decision": decision.upper(),
-                    "score": float(score),
-                    "reasoning": {},
-                    "rejection_reason": ""
-                }
-
-                # Look for rejection_reason if REJECT
-                if decision.upper() == "REJECT":
-                    reason_match = re.search(
-                        rf'product_index:\s*{product_idx}.*?rejection_reason:\s*"([^"]*)"',
-                        response, re.DOTALL | re.IGNORECASE
-                    )
-                    if reason_match:
-                        eval_block["rejection_reason"] = reason_match.group(1)
-
-                evaluations.append(eval_block)
-
-        except Exception as e:
-            logger.warning(f"[Viability:Reasoning] Failed to parse response: {e}")
-
-    return evaluations
-
-
 def _get_inline_viability_prompt() -> str:
     """Load viability reasoning prompt from file, with inline fallback."""
     # Try to load from file first
@@ -153,8 +153,25 @@ class RepoScopeAnalyzer:
 
         return files
 
+    def _code_index(self, files: List[str]):
+        """Repo code index refreshed for these files, or None outside a git repo."""
+        if not (self.repo_path / ".git").exists():
+            return None
+        try:
+            from apps.services.tool_server.code_index import get_code_index
+            index = get_code_index(str(self.repo_path))
+            index.refresh(files)
+            return index
+        except Exception as e:
+            logger.debug(f"Code index unavailable for {self.repo_path}: {e}")
+            return None
+
     async def _analyze_dependencies(self, files: List[str]) -> Dict[str, List[str]]:
         """Analyze import dependencies between files."""
+        index = self._code_index(files)
+        if index is not None:
+            return {path: imports[:10] for path, imports in index.imports(files).items() if imports}
+
         deps = {}
 
         for file_path in files:
@@ -253,9 +270,21 @@ class RepoScopeAnalyzer:
 
     async def _summarize_files(self, files: List[str]) -> Dict[str, Dict[str, Any]]:
         """Get basic summaries of files (line count, size)."""
+        index = self._code_index(files)
+        indexed = index.file_info(files) if index is not None else {}
+
         summaries = {}
 
         for file_path in files:
+            if file_path in indexed:
+                summaries[file_path] = {
+                    "lines": indexed[file_path]["lines"],
+                    "size_kb": indexed[file_path]["size"] // 1024,
+                    "language": indexed[file_path]["language"]
+                }
+                continue
+
+            # Not covered by the index (e.g. over its size limit): scan directly
             full_path = self.repo_path / file_path
             if not full_path.exists():
                 continue
@@ -0,0 +1,174 @@
+"""
+orchestrator/schema_extraction_plan.py
+
+Precompiled per-site extraction plans.
+
+A SiteSchema's CSS selectors are compiled into a single JavaScript function
+that walks every product card in the page and returns all card fields in
+one page.evaluate() round trip, instead of several query_selector /
+text_content calls per card (each a CDP round trip; on a 50-item listing
+that dominated extraction latency).
+
+Plans are cached per (domain, page_type) and recompiled when the schema's
+version or selectors change (i.e. after recalibration).
+
+Usage:
+    from apps.services.tool_server.schema_extraction_plan import run_extraction_plan
+
+    result = await run_extraction_plan(page, schema, limit=20)
+    result["count"]   # total cards matched by product_card_selector
+    result["cards"]   # [{"href", "link_text", "title", "price", "heading", "heading_title", "any_href"}]
+"""
+
+import hashlib
+import json
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+from apps.services.tool_server.shared_state.site_schema_registry import SiteSchema
+
+logger = logging.getLogger(__name__)
+
+# Title-like elements used to check that a card has product structure
+STRUCTURE_TITLE_SELECTORS = ['h1', 'h2', 'h3', 'h4', '[class*="title"]', '[class*="name"]', '[role="heading"]']
+
+# Title-like elements tried (in order) when reading a card's title
+TITLE_GUESS_SELECTORS = ['h3', 'h2', 'h4', 'h1', '[class*="title"]', '[class*="name"]']
+
+# Card fields returned by every plan:
+#   href          - href of the product link (product_link_selector, else first a[href])
+#   link_text     - text of that link
+#   title         - text of title_selector (if the schema has one)
+#   price         - text of price_selector (if the schema has one)
+#   heading       - first STRUCTURE_TITLE_SELECTORS match with > 3 chars of text
+#   heading_title - first TITLE_GUESS_SELECTORS match with > 3 chars of text
+#   any_href      - href of the first a[href] in the card
+_SCRIPT_TEMPLATE = """(opts) => {
+  const PLAN = %s;
+  const text = (el) => (el && el.textContent ? el.textContent.trim() : '');
+  const first = (root, sel) => {
+    if (!sel) return null;
+    try { return root.querySelector(sel); } catch (e) { return null; }
+  };
+  const firstText = (root, sels) => {
+    for (const sel of sels) {
+      const t = text(first(root, sel));
+      if (t.length > 3) return t;
+    }
+    return '';
+  };
+  let cards = [];
+  try { cards = Array.from(document.querySelectorAll(PLAN.card)); } catch (e) { return {count: 0, cards: [], error: String(e)}; }
+  const out = [];
+  for (const card of cards.slice(0, opts.limit)) {
+    const anyLink = first(card, 'a[href]');
+    const link = first(card, PLAN.link) || anyLink;
+    out.push({
+      href: link ? link.getAttribute('href') : null,
+      link_text: text(link),
+      title: text(first(card, PLAN.title)),
+      price: text(first(card, PLAN.price)),
+      heading: firstText(card, PLAN.structure_titles),
+      heading_title: firstText(card, PLAN.title_guesses),
+      any_href: anyLink ? anyLink.getAttribute('href') : null,
+    });
+  }
+  return {count: cards.length, cards: out};
+}"""
+
+
+@dataclass(frozen=True)
+class ExtractionPlan:
+    """A compiled extraction function for one schema version."""
+    domain: str
+    page_type: str
+    version: int
+    signature: str   # hash of the selectors the script was compiled from
+    script: str      # JS function taking {limit}
+
+
+def _selectors(schema: SiteSchema) -> Dict[str, Any]:
+    return {
+        "card": schema.product_card_selector,
+        "link": schema.product_link_selector,
+        "title": schema.title_selector,
+        "price": schema.price_selector,
+        "structure_titles": STRUCTURE_TITLE_SELECTORS,
+        "title_guesses": TITLE_GUESS_SELECTORS,
+    }
+
+
+def _signature(selectors: Dict[str, Any]) -> str:
+    return hashlib.sha256(json.dumps(selectors, sort_keys=True).encode()).hexdigest()[:16]
+
+
+def compile_extraction_plan(schema: SiteSchema) -> ExtractionPlan:
+    """
+    Compile a schema's selectors into a single JS extraction function.
+
+    Selectors are embedded as JSON literals, so they need no escaping.
+    """
+    selectors = _selectors(schema)
+    return ExtractionPlan(
+        domain=schema.domain,
+        page_type=schema.page_type,
+        version=schema.version,
+        signature=_signature(selectors),
+        script=_SCRIPT_TEMPLATE % json.dumps(selectors),
+    )
+
+
+_plans: Dict[Tuple[str, str], ExtractionPlan] = {}
+_plans_lock = threading.Lock()
+
+
+def get_extraction_plan(schema: SiteSchema) -> ExtractionPlan:
+    """
+    Get the compiled plan for a schema (cached per domain + page type).
+
+    Recompiles when the schema version or its selectors changed.
+    """
+    key = (schema.domain, schema.page_type)
+    signature = _signature(_selectors(schema))
+    with _plans_lock:
+        plan = _plans.get(key)
+        if plan is not None and plan.version == schema.version and plan.signature == signature:
+            return plan
+
+    plan = compile_extraction_plan(schema)
+    with _plans_lock:
+        _plans[key] = plan
+    logger.debug(f"[ExtractionPlan] Compiled plan for {schema.domain}:{schema.page_type} v{schema.version}")
+    return plan
+
+
+def clear_extraction_plans() -> None:
+    """Drop all compiled plans (for testing)."""
+    with _plans_lock:
+        _plans.clear()
+
+
+async def run_extraction_plan(page: Any, schema: SiteSchema, limit: int = 20) -> Dict[str, Any]:
+    """
+    Extract all card fields with one page.evaluate() call.
+
+    Args:
+        page: Playwright page
+        schema: Schema with a product_card_selector
+        limit: Maximum cards to return fields for
+
+    Returns:
+        {"count": total matched cards, "cards": [field dicts, at most `limit`]}
+    """
+    if not schema.product_card_selector:
+        return {"count": 0, "cards": []}
+
+    plan = get_extraction_plan(schema)
+    result: Optional[Dict[str, Any]] = await page.evaluate(plan.script, {"limit": limit})
+    if not isinstance(result, dict):
+        return {"count": 0, "cards": []}
+    if result.get("error"):
+        logger.warning(f"[ExtractionPlan] {schema.domain}: invalid selector '{schema.product_card_selector}': {result['error']}")
+    return {"count": int(result.get("count") or 0), "cards": list(result.get("cards") or [])}
@@ -4,7 +4,8 @@ orchestrator/search_engine_health.py
 Per-engine health tracking to avoid wasting time on blocked search engines.
 
 Tracks which engines are currently blocked/rate-limited and provides smart
-engine selection based on health scores.
+engine selection based on health scores. Also keeps a smoothed latency
+estimate per engine, used to pick the hedge delay for hedged searches.
 
 Created: 2025-11-19
 Part of Phase 1 blocker mitigation improvements.
@@ -29,6 +30,8 @@ class EngineHealth:
     total_successes: int = 0
     total_failures: int = 0
     cooldown_until: Optional[float] = None  # Unix timestamp when engine can be retried
+    latency_avg: Optional[float] = None     # Smoothed search latency (seconds)
+    latency_dev: float = 0.0                # Smoothed mean deviation of latency
 
 
 class SearchEngineHealthTracker:
@@ -100,16 +103,22 @@ class SearchEngineHealthTracker:
         )
         return False
 
-    def report_success(self, engine_name: str) -> None:
+    def report_success(self, engine_name: str, latency_seconds: Optional[float] = None) -> None:
         """
         Report successful search on an engine.
 
         Clears cooldown and resets failure count.
+
+        Args:
+            engine_name: Name of search engine
+            latency_seconds: How long the search took (updates latency estimate)
         """
         engine = self._get_or_create_engine(engine_name)
         engine.total_requests += 1
         engine.total_successes += 1
         engine.last_success_time = time.time()
+        if latency_seconds is not None:
+            self.record_latency(engine_name, latency_seconds)
 
         # Clear failures and cooldown
         if engine.consecutive_failures > 0 or engine.cooldown_until is not None:
@@ -157,6 +166,53 @@ class SearchEngineHealthTracker:
             f"Success rate: {success_rate:.1f}% ({engine.total_successes}/{engine.total_requests})"
         )
 
+    def record_latency(self, engine_name: str, latency_seconds: float) -> None:
+        """
+        Update the smoothed latency estimate for an engine.
+
+        Same smoothing as TCP RTT estimation: avg += (x - avg) / 8,
+        dev += (|x - avg| - dev) / 4.
+        """
+        engine = self._get_or_create_engine(engine_name)
+        if engine.latency_avg is None:
+            engine.latency_avg = latency_seconds
+            engine.latency_dev = latency_seconds / 2
+            return
+        error = latency_seconds - engine.latency_avg
+        engine.latency_avg += error / 8
+        engine.latency_dev += (abs(error) - engine.latency_dev) / 4
+
+    def get_hedge_delay(
+        self,
+        engine_name: str,
+        default_seconds: float = 8.0,
+        min_seconds: float = 2.0,
+        max_seconds: float = 20.0
+    ) -> float:
+        """
+        How long to wait on an engine before hedging with the next one.
+
+        Uses the engine's expected latency plus two deviations (so a normal
+        search rarely triggers a hedge), shortened in proportion to its
+        success rate so flaky engines get hedged sooner.
+
+        Args:
+            engine_name: Engine currently being waited on
+            default_seconds: Delay when no latency has been observed yet
+            min_seconds: Lower bound
+            max_seconds: Upper bound
+
+        Returns:
+            Hedge delay in seconds
+        """
+        engine = self._get_or_create_engine(engine_name)
+        if engine.latency_avg is None:
+            delay = default_seconds
+        else:
+            delay = engine.latency_avg + 2 * engine.latency_dev
+        delay *= max(0.25, self._get_success_rate(engine_name))
+        return max(min_seconds, min(max_seconds, delay))
+
     def get_healthy_engines(self, engine_names: List[str]) -> List[str]:
         """
         Filter list of engines to only healthy ones, sorted by health score.
@@ -204,6 +260,8 @@ class SearchEngineHealthTracker:
                 "total_failures": engine.total_failures,
                 "consecutive_failures": engine.consecutive_failures,
                 "success_rate": self._get_success_rate(name),
+                "latency_avg_seconds": engine.latency_avg,
+                "hedge_delay_seconds": self.get_hedge_delay(name),
                 "is_healthy": self.is_healthy(name),
                 "cooldown_remaining": (
                     engine.cooldown_until - time.time()
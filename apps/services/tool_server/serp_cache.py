@@ -4,9 +4,16 @@ orchestrator/serp_cache.py
 Cross-turn SERP result cache to avoid redundant search engine requests.
 
 Design:
-- Caches search results by (query, engine, session_id) key
+- Two tiers: in-memory LRU (per process) in front of a SQLite store that
+  survives restarts and is shared by all tool-server workers
+- Keyed by a normalized query signature (case-folded, punctuation and stop
+  words removed, plurals folded, terms sorted; phrases and operators kept
+  verbatim) so trivially re-phrased queries ("best laptops for gaming" /
+  "gaming laptop best") hit
+- Non-personalized engines use a session-agnostic key, so one session's
+  search serves every other session; personalized engines stay per-session
 - TTL-based expiration (default 1 hour for SERP freshness)
-- LRU eviction when cache grows too large
+- Hit metrics split by tier (memory / disk) plus near-duplicate hits
 - Thread-safe for concurrent access
 
 Created: 2025-11-18
@@ -15,13 +22,94 @@ Part of fix for research pipeline rate limiting issues.
 import logging
 import hashlib
 import json
+import os
+import re
+import sqlite3
+import threading
 import time
+from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple
 from collections import OrderedDict
-from datetime import datetime, timedelta
 
 logger = logging.getLogger(__name__)
 
+SERP_CACHE_DB = Path(os.getenv("SERP_CACHE_DB", "panda_system_docs/serp_cache.db"))
+
+# Engines whose results don't depend on the session (no login/personalization).
+# Their cache entries are shared across sessions.
+SESSION_AGNOSTIC_ENGINES = {
+    e.strip().lower()
+    for e in os.getenv("SERP_CACHE_SHARED_ENGINES", "duckduckgo,brave").split(",")
+    if e.strip()
+}
+
+# Words that don't change what a search engine returns. Negations,
+# comparison words ("not", "without", "under", "vs") and question words
+# ("when" vs "where") are deliberately kept.
+QUERY_STOPWORDS = {
+    "a", "an", "the", "and", "of", "for", "to", "in", "on", "at", "by",
+    "is", "are", "was", "were", "be", "do", "does", "i", "me", "my", "we",
+    "can", "should", "some", "any", "please", "find", "search", "show",
+}
+
+# Part of every key built from query_signature; bump when the signature
+# changes so persisted entries keyed by the old form are never served
+QUERY_SIGNATURE_VERSION = 2
+
+# One query part per match: a quoted phrase (optionally +/- prefixed), a
+# +/- prefixed term, an operator such as site:example.com, or a plain word.
+# Everything but plain words changes what the engine returns, so those parts
+# are kept verbatim. Words keep a trailing + or # so c++, c# and c differ.
+_QUERY_PART_RE = re.compile(
+    r'(?P<phrase>[-+]?"[^"]*"?)'
+    r'|(?P<verbatim>(?<!\S)[-+]\S+|(?<!\S)[^\s:"]+:\S+)'
+    r"|(?P<word>\w+(?:[.']\w+)*[+#]*)"
+)
+
+# Words that end in "s" but are not plurals of a shorter word
+_INVARIANT_WORDS = {"news", "series", "species", "lens", "means", "physics", "electronics", "mathematics"}
+
+
+def _stem(token: str) -> str:
+    """Fold regular plurals onto the singular; other word forms are left alone."""
+    if len(token) <= 4 or not token.isalpha() or token in _INVARIANT_WORDS:
+        return token
+    if token.endswith("ies"):
+        return token[:-3] + "y"
+    if token.endswith(("sses", "shes", "ches", "xes")):
+        return token[:-2]
+    if token.endswith("s") and not token.endswith(("ss", "us", "is")):
+        return token[:-1]
+    return token
+
+
+def query_signature(query: str) -> str:
+    """
+    Normalize a query into a signature shared by trivial rephrasings.
+
+    Case-folds, drops punctuation and stop words, folds plurals and
+    de-duplicates words, keeping their order ("nyc to london" and
+    "london to nyc" stay distinct). Quoted phrases, -excluded / +required
+    terms and operators (site:, filetype:, ...) are kept verbatim and sorted
+    after the words, since their position doesn't change the results. Falls
+    back to the case-folded query when every word is a stop word.
+    """
+    words: Dict[str, None] = {}
+    verbatim = set()
+    for match in _QUERY_PART_RE.finditer(query.casefold()):
+        if match.group("phrase"):
+            sign = match.group("phrase")[0] if match.group("phrase")[0] in "+-" else ""
+            phrase = " ".join(match.group("phrase").lstrip("+-").strip('"').split())
+            if phrase:
+                verbatim.add(f'{sign}"{phrase}"')
+        elif match.group("verbatim"):
+            verbatim.add(match.group("verbatim"))
+        elif match.group("word") not in QUERY_STOPWORDS:
+            words[_stem(match.group("word"))] = None
+    if not words and not verbatim:
+        return " ".join(query.casefold().split())
+    return " ".join([*words, *sorted(verbatim)])
+
 
 class SERPCache:
     """
@@ -34,20 +122,59 @@ class SERPCache:
         self,
         ttl_seconds: int = 3600,      # 1 hour default
         max_entries: int = 1000,       # Max cache size
-        min_results: int = 3           # Min results to cache
+        min_results: int = 3,          # Min results to cache
+        db_path: Optional[Path] = None,
+        max_disk_entries: int = 20000
     ):
         """
         Args:
             ttl_seconds: Time-to-live for cached results (default 1 hour)
-            max_entries: Maximum cache entries before LRU eviction
+            max_entries: Maximum in-memory entries before LRU eviction
             min_results: Minimum results required to cache (skip empty/blocked)
+            db_path: SQLite file for the persistent tier (None = memory only)
+            max_disk_entries: Maximum rows kept in the persistent tier
         """
-        self._cache: OrderedDict[str, Tuple[List[Dict[str, Any]], float]] = OrderedDict()
+        self._cache: OrderedDict[str, Tuple[List[Dict[str, Any]], float, str]] = OrderedDict()
         self._ttl = ttl_seconds
         self._max_entries = max_entries
         self._min_results = min_results
-        self._hits = 0
+        self._max_disk_entries = max_disk_entries
+        self._lock = threading.Lock()
+        self._hits = {"memory": 0, "disk": 0}
+        self._near_duplicate_hits = 0
         self._misses = 0
+        self._puts_since_prune = 0
+
+        self._db_path = Path(db_path) if db_path else None
+        self._conn: Optional[sqlite3.Connection] = None
+        if self._db_path:
+            try:
+                self._init_db()
+            except sqlite3.Error as e:
+                logger.warning(f"[SERPCache] Persistent tier disabled ({self._db_path}): {e}")
+                self._conn = None
+
+    def _init_db(self) -> None:
+        self._db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self._db_path), timeout=10, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS serp_cache (
+                key TEXT PRIMARY KEY,
+                engine TEXT NOT NULL,
+                scope TEXT NOT NULL,
+                query TEXT NOT NULL,
+                results TEXT NOT NULL,
+                cached_at REAL NOT NULL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_serp_cached_at ON serp_cache(cached_at)")
+        self._conn.commit()
+
+    def _scope(self, engine: str, session_id: str) -> str:
+        """Session scope for a key: shared for non-personalized engines."""
+        return "*" if engine.lower() in SESSION_AGNOSTIC_ENGINES else session_id
 
     def _make_key(self, query: str, engine: str, session_id: str) -> str:
         """
@@ -61,14 +188,12 @@ class SERPCache:
         Returns:
             Cache key hash
         """
-        # Normalize query (lowercase, strip whitespace)
-        normalized_query = query.lower().strip()
-
-        # Create deterministic key
+        # Create deterministic key from the normalized signature
         key_data = {
-            "query": normalized_query,
+            "version": QUERY_SIGNATURE_VERSION,
+            "query": query_signature(query),
             "engine": engine.lower(),
-            "session_id": session_id
+            "session_id": self._scope(engine, session_id)
         }
         key_str = json.dumps(key_data, sort_keys=True)
         return hashlib.sha256(key_str.encode()).hexdigest()[:16]
@@ -91,33 +216,39 @@ class SERPCache:
             Cached results if found and not expired, None otherwise
         """
         key = self._make_key(query, engine, session_id)
-
-        if key not in self._cache:
-            self._misses += 1
+        now = time.time()
+        tier = "memory"
+
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None and now - entry[1] > self._ttl:
+                del self._cache[key]
+                entry = None
+            if entry is not None:
+                self._cache.move_to_end(key)
+
+        if entry is None:
+            entry = self._disk_get(key, now)
+            tier = "disk"
+            if entry is not None:
+                self._memory_put(key, entry)
+
+        if entry is None:
+            with self._lock:
+                self._misses += 1
             logger.debug(f"[SERPCache] MISS: {engine} query='{query[:40]}...'")
             return None
 
-        results, cached_at = self._cache[key]
-
-        # Check expiration
-        age = time.time() - cached_at
-        if age > self._ttl:
-            # Expired, remove from cache
-            del self._cache[key]
-            self._misses += 1
-            logger.debug(
-                f"[SERPCache] EXPIRED: {engine} query='{query[:40]}...' "
-                f"(age={age:.0f}s, ttl={self._ttl}s)"
-            )
-            return None
-
-        # Move to end (LRU)
-        self._cache.move_to_end(key)
-        self._hits += 1
+        results, cached_at, cached_query = entry
+        near_duplicate = cached_query != " ".join(query.lower().split())
+        with self._lock:
+            self._hits[tier] += 1
+            if near_duplicate:
+                self._near_duplicate_hits += 1
 
         logger.info(
-            f"[SERPCache] HIT: {engine} query='{query[:40]}...' "
-            f"({len(results)} results, age={age:.0f}s)"
+            f"[SERPCache] HIT ({tier}{', near-duplicate' if near_duplicate else ''}): "
+            f"{engine} query='{query[:40]}...' ({len(results)} results, age={now - cached_at:.0f}s)"
         )
         return results
 
@@ -146,21 +277,78 @@ class SERPCache:
             return
 
         key = self._make_key(query, engine, session_id)
-
-        # Evict oldest if at capacity
-        if len(self._cache) >= self._max_entries and key not in self._cache:
-            evicted_key = next(iter(self._cache))
-            del self._cache[evicted_key]
-            logger.debug(f"[SERPCache] EVICT: {evicted_key} (LRU, at capacity)")
-
-        self._cache[key] = (results, time.time())
-        self._cache.move_to_end(key)
+        entry = (results, time.time(), " ".join(query.lower().split()))
+        self._memory_put(key, entry)
+        self._disk_put(key, engine.lower(), self._scope(engine, session_id), entry)
 
         logger.info(
             f"[SERPCache] STORE: {engine} query='{query[:40]}...' "
             f"({len(results)} results, cache_size={len(self._cache)})"
         )
 
+    def _memory_put(self, key: str, entry: Tuple[List[Dict[str, Any]], float, str]) -> None:
+        with self._lock:
+            # Evict oldest if at capacity
+            if len(self._cache) >= self._max_entries and key not in self._cache:
+                evicted_key, _ = self._cache.popitem(last=False)
+                logger.debug(f"[SERPCache] EVICT: {evicted_key} (LRU, at capacity)")
+            self._cache[key] = entry
+            self._cache.move_to_end(key)
+
+    # ------------------------------------------------------------------
+    # Persistent tier
+    # ------------------------------------------------------------------
+
+    def _disk_get(self, key: str, now: float) -> Optional[Tuple[List[Dict[str, Any]], float, str]]:
+        if self._conn is None:
+            return None
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT results, cached_at, query FROM serp_cache WHERE key = ? AND cached_at >= ?",
+                    (key, now - self._ttl)
+                ).fetchone()
+            if row is None:
+                return None
+            return json.loads(row[0]), row[1], row[2]
+        except (sqlite3.Error, json.JSONDecodeError) as e:
+            logger.warning(f"[SERPCache] Disk read failed: {e}")
+            return None
+
+    def _disk_put(
+        self,
+        key: str,
+        engine: str,
+        scope: str,
+        entry: Tuple[List[Dict[str, Any]], float, str]
+    ) -> None:
+        if self._conn is None:
+            return
+        results, cached_at, query = entry
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO serp_cache (key, engine, scope, query, results, cached_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (key, engine, scope, query, json.dumps(results), cached_at)
+                )
+                self._puts_since_prune += 1
+                if self._puts_since_prune >= 100:
+                    self._prune_locked(cached_at)
+                self._conn.commit()
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            logger.warning(f"[SERPCache] Disk write failed: {e}")
+
+    def _prune_locked(self, now: float) -> None:
+        """Drop expired rows and cap the persistent tier (caller holds _lock)."""
+        self._puts_since_prune = 0
+        self._conn.execute("DELETE FROM serp_cache WHERE cached_at < ?", (now - self._ttl,))
+        self._conn.execute(
+            "DELETE FROM serp_cache WHERE key IN ("
+            "SELECT key FROM serp_cache ORDER BY cached_at DESC LIMIT -1 OFFSET ?)",
+            (self._max_disk_entries,)
+        )
+
     def invalidate(self, query: str, engine: str, session_id: str = "default") -> None:
         """
         Invalidate cached results for a query.
@@ -171,16 +359,30 @@ class SERPCache:
             session_id: Session ID
         """
         key = self._make_key(query, engine, session_id)
-        if key in self._cache:
-            del self._cache[key]
-            logger.info(f"[SERPCache] INVALIDATE: {engine} query='{query[:40]}...'")
+        with self._lock:
+            self._cache.pop(key, None)
+            if self._conn is not None:
+                try:
+                    self._conn.execute("DELETE FROM serp_cache WHERE key = ?", (key,))
+                    self._conn.commit()
+                except sqlite3.Error as e:
+                    logger.warning(f"[SERPCache] Disk invalidate failed: {e}")
+        logger.info(f"[SERPCache] INVALIDATE: {engine} query='{query[:40]}...'")
 
     def clear(self) -> None:
-        """Clear all cached results."""
-        count = len(self._cache)
-        self._cache.clear()
-        self._hits = 0
-        self._misses = 0
+        """Clear all cached results (both tiers)."""
+        with self._lock:
+            count = len(self._cache)
+            self._cache.clear()
+            if self._conn is not None:
+                try:
+                    self._conn.execute("DELETE FROM serp_cache")
+                    self._conn.commit()
+                except sqlite3.Error as e:
+                    logger.warning(f"[SERPCache] Disk clear failed: {e}")
+            self._hits = {"memory": 0, "disk": 0}
+            self._near_duplicate_hits = 0
+            self._misses = 0
         logger.info(f"[SERPCache] CLEAR: removed {count} entries")
 
     def get_stats(self) -> Dict[str, Any]:
@@ -190,18 +392,37 @@ class SERPCache:
         Returns:
             {
                 "entries": int,
+                "disk_entries": int,
                 "hits": int,
+                "hits_by_tier": {"memory": int, "disk": int},
+                "near_duplicate_hits": int,
                 "misses": int,
                 "hit_rate": float
             }
         """
-        total = self._hits + self._misses
-        hit_rate = self._hits / total if total > 0 else 0.0
+        with self._lock:
+            hits = sum(self._hits.values())
+            hits_by_tier = dict(self._hits)
+            near_duplicate_hits = self._near_duplicate_hits
+            misses = self._misses
+            entries = len(self._cache)
+            disk_entries = 0
+            if self._conn is not None:
+                try:
+                    disk_entries = self._conn.execute("SELECT COUNT(*) FROM serp_cache").fetchone()[0]
+                except sqlite3.Error:
+                    pass
+
+        total = hits + misses
+        hit_rate = hits / total if total > 0 else 0.0
 
         return {
-            "entries": len(self._cache),
-            "hits": self._hits,
-            "misses": self._misses,
+            "entries": entries,
+            "disk_entries": disk_entries,
+            "hits": hits,
+            "hits_by_tier": hits_by_tier,
+            "near_duplicate_hits": near_duplicate_hits,
+            "misses": misses,
             "hit_rate": hit_rate,
             "max_entries": self._max_entries,
             "ttl_seconds": self._ttl
@@ -224,6 +445,7 @@ def get_serp_cache() -> SERPCache:
         _global_serp_cache = SERPCache(
             ttl_seconds=3600,    # 1 hour
             max_entries=1000,    # 1000 queries
-            min_results=3        # Must have 3+ results to cache
+            min_results=3,       # Must have 3+ results to cache
+            db_path=SERP_CACHE_DB
         )
     return _global_serp_cache
@@ -12,6 +12,11 @@ from .llm_utils import (
     estimate_document_tokens
 )
 
+from .batch_eval import (
+    BatchEvalResult,
+    evaluate_batched
+)
+
 from .spec_utils import (
     get_spec_value,
     get_spec_confidence,
@@ -26,6 +31,8 @@ __all__ = [
     'load_prompt_via_recipe',
     'summarize_sources_for_budget',
     'estimate_document_tokens',
+    'BatchEvalResult',
+    'evaluate_batched',
     'get_spec_value',
     'get_spec_confidence',
     'get_spec_source',
@@ -0,0 +1,258 @@
+"""
+Batched LLM evaluation of candidate lists.
+
+Packs many independent candidates (search results, vendors, products) into
+a few prompts instead of one call per list/step:
+
+- Candidates are rendered as a compact table keyed by id (no prose blocks)
+- The response is constrained to a JSON schema: {"results": [{id, ...fields}]}
+- Batches are dispatched concurrently, bounded by the LLM's batch capacity
+  (LLM_BATCH_CONCURRENCY, default 4)
+- Only candidates whose result is missing or invalid are retried, in
+  smaller batches; everything else is kept from the first pass
+
+Usage:
+    from apps.services.tool_server.shared.batch_eval import evaluate_batched
+
+    outcome = await evaluate_batched(
+        items=vendors,
+        columns={"domain": "domain", "source": "_source"},
+        result_fields={"approved": {"type": "boolean"}, "reason": {"type": "string"}},
+        render_prompt=lambda table: f"{instructions}\\n\\n{table}",
+    )
+    outcome.results   # {id: {"approved": True, "reason": "..."}}
+    outcome.failed    # ids with no usable result after retries
+"""
+
+import asyncio
+import logging
+import os
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from .llm_utils import call_llm_json
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = int(os.getenv("LLM_BATCH_SIZE", "12"))
+DEFAULT_CONCURRENCY = int(os.getenv("LLM_BATCH_CONCURRENCY", "4"))
+
+LLMCall = Callable[[str, int, float, Dict[str, Any]], Awaitable[Dict[str, Any]]]
+
+
+@dataclass
+class BatchEvalResult:
+    """Outcome of a batched evaluation."""
+    results: Dict[int, Dict[str, Any]] = field(default_factory=dict)  # id -> result fields
+    failed: List[int] = field(default_factory=list)                   # ids without a usable result
+    calls: int = 0                                                    # LLM calls made
+    retried: int = 0                                                  # items sent more than once
+
+
+def _cell(value: Any, max_chars: Optional[int] = None) -> str:
+    if value is None or value == "":
+        return "-"
+    if isinstance(value, dict):
+        value = ", ".join(f"{k}: {v}" for k, v in value.items() if v)
+    elif isinstance(value, (list, tuple)):
+        value = ", ".join(str(v) for v in value)
+    text = " ".join(str(value).split()).replace("|", "/")
+    if max_chars is not None and len(text) > max_chars:
+        text = text[:max_chars - 3] + "..."
+    return text or "-"
+
+
+def format_table(
+    rows: List[Dict[str, Any]],
+    ids: List[int],
+    columns: Dict[str, Any],
+    id_field: str = "id",
+    cell_limits: Optional[Dict[str, int]] = None
+) -> str:
+    """
+    Render candidates as a compact pipe table.
+
+    Args:
+        rows: Candidate dicts
+        ids: Id for each row (printed in the first column)
+        columns: Header -> key in the row dict, or callable(row) -> value
+        id_field: Header of the id column
+        cell_limits: Header -> max characters, for free-text columns
+            (columns not listed are never truncated)
+
+    Returns:
+        Table text, one line per candidate
+    """
+    limits = cell_limits or {}
+    lines = [" | ".join([id_field, *columns])]
+    for item_id, row in zip(ids, rows):
+        cells = [str(item_id)]
+        for header, source in columns.items():
+            value = source(row) if callable(source) else row.get(source)
+            cells.append(_cell(value, limits.get(header)))
+        lines.append(" | ".join(cells))
+    return "\n".join(lines)
+
+
+def results_schema(result_fields: Dict[str, Dict[str, Any]], id_field: str = "id") -> Dict[str, Any]:
+    """JSON schema for {"results": [{id_field, **result_fields}]}."""
+    return {
+        "type": "object",
+        "properties": {
+            "results": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {id_field: {"type": "integer"}, **result_fields},
+                    "required": [id_field, *result_fields],
+                },
+            }
+        },
+        "required": ["results"],
+    }
+
+
+def response_format_instructions(result_fields: Dict[str, Dict[str, Any]], id_field: str = "id") -> str:
+    """Plain-language description of the response schema for the prompt."""
+    fields = ", ".join(
+        f'"{name}": {spec.get("enum") or spec.get("type", "string")}'
+        for name, spec in result_fields.items()
+    )
+    return (
+        "Respond with JSON only, one entry per table row:\n"
+        f'{{"results": [{{"{id_field}": <{id_field} from the table>, {fields}}}]}}'
+    )
+
+
+def _valid(entry: Dict[str, Any], result_fields: Dict[str, Dict[str, Any]]) -> bool:
+    for name, spec in result_fields.items():
+        if name not in entry:
+            return False
+        allowed = spec.get("enum")
+        if allowed and str(entry[name]).upper() not in {str(a).upper() for a in allowed}:
+            return False
+        if spec.get("type") == "number":
+            try:
+                float(entry[name])
+            except (TypeError, ValueError):
+                return False
+    return True
+
+
+async def evaluate_batched(
+    items: List[Dict[str, Any]],
+    columns: Dict[str, Any],
+    result_fields: Dict[str, Dict[str, Any]],
+    render_prompt: Callable[[str], str],
+    id_field: str = "id",
+    cell_limits: Optional[Dict[str, int]] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    max_retries: int = 1,
+    tokens_per_item: int = 80,
+    temperature: float = 0.1,
+    llm_url: Optional[str] = None,
+    llm_model: Optional[str] = None,
+    llm_api_key: Optional[str] = None,
+    timeout: float = 45.0,
+    llm_call: Optional[LLMCall] = None,
+    log_prefix: str = "BatchEval"
+) -> BatchEvalResult:
+    """
+    Evaluate candidates in concurrent, schema-constrained batches.
+
+    Ids are 1-based positions in `items`, so prompts that talk about
+    "index"/"product_index" keep working (pass that name as id_field).
+
+    Args:
+        items: Candidates to evaluate
+        columns: Table columns (header -> row key or callable)
+        result_fields: JSON-schema properties expected per candidate
+        render_prompt: Builds the full prompt around a candidate table
+            (the response-format instructions are appended automatically)
+        id_field: Name of the id column/field
+        cell_limits: Max characters per column (header -> limit); columns
+            not listed are never truncated
+        batch_size: Max candidates per prompt
+        concurrency: Max concurrent LLM calls
+        max_retries: Retry rounds for candidates without a valid result
+        tokens_per_item: Output token budget per candidate
+        temperature: Sampling temperature
+        llm_url: LLM endpoint URL (default from env)
+        llm_model: Model ID (default from env)
+        llm_api_key: API key (default from env)
+        timeout: Per-call timeout in seconds
+        llm_call: Override for the LLM call (prompt, max_tokens, temperature, schema)
+        log_prefix: Log tag
+
+    Returns:
+        BatchEvalResult with results by id and the ids that failed
+    """
+    outcome = BatchEvalResult()
+    if not items:
+        return outcome
+
+    async def default_call(prompt: str, max_tokens: int, temp: float, schema: Dict[str, Any]) -> Dict[str, Any]:
+        return await call_llm_json(
+            prompt,
+            llm_url=llm_url,
+            llm_model=llm_model,
+            llm_api_key=llm_api_key,
+            max_tokens=max_tokens,
+            temperature=temp,
+            timeout=timeout,
+            response_schema=schema,
+        )
+
+    call = llm_call or default_call
+    schema = results_schema(result_fields, id_field)
+    format_text = response_format_instructions(result_fields, id_field)
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def run_batch(batch_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+        table = format_table([items[i - 1] for i in batch_ids], batch_ids, columns, id_field, cell_limits)
+        prompt = f"{render_prompt(table)}\n\n{format_text}"
+        async with semaphore:
+            outcome.calls += 1
+            try:
+                parsed = await call(prompt, 64 + tokens_per_item * len(batch_ids), temperature, schema)
+            except Exception as e:
+                logger.warning(f"[{log_prefix}] Batch of {len(batch_ids)} failed: {e}")
+                return {}
+
+        entries = parsed.get("results", []) if isinstance(parsed, dict) else []
+        wanted = set(batch_ids)
+        good: Dict[int, Dict[str, Any]] = {}
+        for entry in entries:
+            if not isinstance(entry, dict):
+                continue
+            try:
+                item_id = int(entry.get(id_field))
+            except (TypeError, ValueError):
+                continue
+            if item_id in wanted and _valid(entry, result_fields):
+                good[item_id] = entry
+        return good
+
+    pending = list(range(1, len(items) + 1))
+    size = max(1, batch_size)
+    for attempt in range(max_retries + 1):
+        batches = [pending[i:i + size] for i in range(0, len(pending), size)]
+        for good in await asyncio.gather(*(run_batch(b) for b in batches)):
+            outcome.results.update(good)
+
+        pending = [i for i in pending if i not in outcome.results]
+        if not pending:
+            break
+        if attempt < max_retries:
+            outcome.retried += len(pending)
+            # Failures are usually truncation or a confused long batch: retry smaller
+            size = max(1, size // 2)
+            logger.info(f"[{log_prefix}] Retrying {len(pending)} unparsed candidates")
+
+    outcome.failed = pending
+    logger.info(
+        f"[{log_prefix}] Evaluated {len(outcome.results)}/{len(items)} candidates "
+        f"in {outcome.calls} LLM calls ({len(outcome.failed)} failed)"
+    )
+    return outcome
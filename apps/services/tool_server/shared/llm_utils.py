@@ -167,7 +167,8 @@ async def call_llm_json(
     timeout: float = 30.0,
     required_keys: List[str] = None,
     repair_json: bool = True,
-    use_json_mode: bool = True
+    use_json_mode: bool = True,
+    response_schema: Optional[Dict[str, Any]] = None
 ) -> Dict[str, Any]:
     """
     Call LLM and parse JSON response with structured output support.
@@ -191,6 +192,7 @@ async def call_llm_json(
         required_keys: Optional list of keys that must be present in response
         repair_json: Whether to attempt JSON repair on parse failure
         use_json_mode: Use vLLM's structured JSON output (default True)
+        response_schema: JSON schema to constrain the output to (json_schema mode)
 
     Returns:
         Parsed JSON response as dict
@@ -213,7 +215,12 @@ async def call_llm_json(
     }
 
     # Add structured JSON output if enabled (vLLM/OpenAI compatible)
-    if use_json_mode:
+    if use_json_mode and response_schema:
+        request_body["response_format"] = {
+            "type": "json_schema",
+            "json_schema": {"name": "response", "schema": response_schema}
+        }
+    elif use_json_mode:
         request_body["response_format"] = {"type": "json_object"}
 
     async with httpx.AsyncClient(timeout=timeout) as client:
@@ -0,0 +1,266 @@
+"""
+orchestrator/shared_state/append_log.py
+
+Append-only JSONL log with batched background flushes and compaction.
+
+Used by the learned registries (vendors, site schemas) that used to rewrite
+their whole JSONL file on every update. Instead:
+
+- Updates mark a record dirty (latest snapshot per key wins, so repeated
+  updates to the same vendor within a flush interval coalesce to one line)
+- A background thread appends all dirty records in a single write
+- Deletes append a tombstone line
+- When the log grows past `compact_ratio` x live records, it is rewritten
+  (temp file + atomic rename) with one line per live record
+
+The on-disk format stays "one JSON record per line, later lines win", so
+files written by the old full-rewrite code load unchanged.
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import logging
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+TOMBSTONE_FIELD = "_deleted"
+
+DEFAULT_FLUSH_INTERVAL = float(os.getenv("REGISTRY_FLUSH_INTERVAL", "2.0"))
+DEFAULT_COMPACT_RATIO = 2.0
+DEFAULT_MIN_COMPACT_LINES = 200
+
+
+class AppendOnlyLog:
+    """
+    Append-only JSONL store keyed by a record-derived key.
+
+    Thread-safe. Writers call mark_dirty()/mark_deleted() (in-memory only);
+    flush() does the file I/O and runs on a daemon thread when auto_flush
+    is enabled. close() is registered with atexit so pending records are
+    written on shutdown.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        key_fn: Callable[[Dict[str, Any]], str],
+        name: str = "AppendOnlyLog",
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        compact_ratio: float = DEFAULT_COMPACT_RATIO,
+        min_compact_lines: int = DEFAULT_MIN_COMPACT_LINES,
+        auto_flush: bool = True,
+    ):
+        """
+        Args:
+            path: JSONL file to append to
+            key_fn: Returns the record key for a record dict
+            name: Log prefix (e.g. "VendorRegistry")
+            flush_interval: Seconds between background flushes
+            compact_ratio: Compact when lines > ratio * live records
+            min_compact_lines: Never compact logs shorter than this
+            auto_flush: Start a background flush thread on first write
+        """
+        self.path = Path(path)
+        self.key_fn = key_fn
+        self.name = name
+        self.flush_interval = flush_interval
+        self.compact_ratio = compact_ratio
+        self.min_compact_lines = min_compact_lines
+        self.auto_flush = auto_flush
+
+        self._pending: Dict[str, Optional[Dict[str, Any]]] = {}  # key -> record (None = delete)
+        self._lock = threading.Lock()      # guards _pending
+        self._io_lock = threading.Lock()   # serializes appends and compaction
+        self._line_count = 0
+        self._live_keys: set = set()
+        self._flush_thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    # ------------------------------------------------------------------
+    # Loading
+    # ------------------------------------------------------------------
+
+    def load(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Replay the log and return the live records by key.
+
+        Later lines override earlier ones; tombstones remove the key.
+        Unparseable lines are skipped with a warning.
+        """
+        records: Dict[str, Dict[str, Any]] = {}
+        lines = 0
+        if self.path.exists():
+            with self._io_lock, open(self.path, "r") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    lines += 1
+                    try:
+                        data = json.loads(line)
+                        if TOMBSTONE_FIELD in data:
+                            records.pop(data[TOMBSTONE_FIELD], None)
+                        else:
+                            records[self.key_fn(data)] = data
+                    except (json.JSONDecodeError, TypeError, KeyError) as e:
+                        logger.warning(f"[{self.name}] Failed to parse log line: {e}")
+
+        self._line_count = lines
+        self._live_keys = set(records)
+        return records
+
+    # ------------------------------------------------------------------
+    # Writes (in-memory, cheap)
+    # ------------------------------------------------------------------
+
+    def mark_dirty(self, record: Dict[str, Any]) -> None:
+        """Queue the latest snapshot of a record for the next flush."""
+        with self._lock:
+            self._pending[self.key_fn(record)] = record
+        self._ensure_flush_thread()
+
+    def mark_deleted(self, key: str) -> None:
+        """Queue a tombstone for a record."""
+        with self._lock:
+            self._pending[key] = None
+        self._ensure_flush_thread()
+
+    @property
+    def pending_count(self) -> int:
+        """Number of records waiting to be flushed."""
+        with self._lock:
+            return len(self._pending)
+
+    # ------------------------------------------------------------------
+    # Flushing
+    # ------------------------------------------------------------------
+
+    def _ensure_flush_thread(self) -> None:
+        if not self.auto_flush or self._flush_thread is not None:
+            return
+        with self._lock:
+            if self._flush_thread is not None:
+                return
+            self._flush_thread = threading.Thread(
+                target=self._flush_loop, name=f"{self.name}-flush", daemon=True
+            )
+            self._flush_thread.start()
+        atexit.register(self.close)
+
+    def _flush_loop(self) -> None:
+        while not self._stop.wait(self.flush_interval):
+            try:
+                self.flush()
+            except Exception as e:
+                logger.warning(f"[{self.name}] Flush failed: {e}")
+
+    def flush(self) -> int:
+        """
+        Append all pending records in one write, compacting if needed.
+
+        Returns:
+            Number of lines appended
+        """
+        with self._lock:
+            if not self._pending:
+                return 0
+            batch, self._pending = self._pending, {}
+
+        lines = []
+        for key, record in batch.items():
+            if record is None:
+                lines.append(json.dumps({TOMBSTONE_FIELD: key}))
+            else:
+                lines.append(json.dumps(record))
+
+        with self._io_lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                with open(self.path, "a") as f:
+                    f.write("\n".join(lines) + "\n")
+            except Exception:
+                # Put the batch back unless newer snapshots arrived meanwhile
+                with self._lock:
+                    for key, record in batch.items():
+                        self._pending.setdefault(key, record)
+                raise
+
+            self._line_count += len(lines)
+            for key, record in batch.items():
+                if record is None:
+                    self._live_keys.discard(key)
+                else:
+                    self._live_keys.add(key)
+
+            if self._should_compact():
+                self._compact_locked()
+
+        logger.debug(f"[{self.name}] Appended {len(lines)} records to {self.path}")
+        return len(lines)
+
+    def _should_compact(self) -> bool:
+        if self._line_count < self.min_compact_lines:
+            return False
+        return self._line_count > self.compact_ratio * max(1, len(self._live_keys))
+
+    def compact(self) -> None:
+        """Rewrite the log with one line per live record."""
+        with self._io_lock:
+            self._compact_locked()
+
+    def _compact_locked(self) -> None:
+        records: Dict[str, str] = {}
+        if self.path.exists():
+            with open(self.path, "r") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        data = json.loads(line)
+                        if TOMBSTONE_FIELD in data:
+                            records.pop(data[TOMBSTONE_FIELD], None)
+                        else:
+                            records[self.key_fn(data)] = line
+                    except (json.JSONDecodeError, TypeError, KeyError):
+                        continue
+
+        temp_path = None
+        try:
+            with tempfile.NamedTemporaryFile(
+                mode="w", dir=self.path.parent, suffix=".tmp", delete=False
+            ) as f:
+                temp_path = f.name
+                for line in records.values():
+                    f.write(line + "\n")
+            os.replace(temp_path, self.path)
+        except Exception as e:
+            logger.error(f"[{self.name}] Compaction failed: {e}")
+            if temp_path:
+                try:
+                    os.unlink(temp_path)
+                except OSError:
+                    pass
+            return
+
+        logger.info(f"[{self.name}] Compacted {self._line_count} log lines to {len(records)} records")
+        self._line_count = len(records)
+        self._live_keys = set(records)
+
+    def close(self) -> None:
+        """Stop the flush thread and write anything pending (called at exit)."""
+        self._stop.set()
+        if self._flush_thread is not None:
+            self._flush_thread.join(timeout=5)
+            atexit.unregister(self.close)
+        try:
+            self.flush()
+        except Exception as e:
+            logger.debug(f"[{self.name}] Final flush failed: {e}")
@@ -3,18 +3,32 @@ SQLite-backed session ledger for the shared-state backbone.
 
 The ledger keeps an append-only record of key events so we can reconstruct the
 conversation state, replay tool runs, and audit sourced answers.
+
+Writes are group-committed: `log_event` buffers the row and a background
+writer commits the buffer in one transaction every `flush_interval_ms` or
+`flush_max_events` events (WAL, synchronous=NORMAL). Reads flush first, so a
+reader always sees its own writes. `export_jsonl` dumps events as compact
+columnar JSONL chunks for offline analysis.
 """
 
 from __future__ import annotations
 
+import atexit
 import json
+import logging
 import sqlite3
 import threading
 import time
 import uuid
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Iterable, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_COLUMNS = ("event_id", "session_id", "turn_id", "ticket_id", "kind", "payload", "created_at")
+_Row = Tuple[str, str, Optional[str], Optional[str], str, str, float]
+_INSERT = f"INSERT INTO events ({', '.join(_COLUMNS)}) VALUES (?, ?, ?, ?, ?, ?, ?)"
 
 
 @dataclass(frozen=True)
@@ -29,15 +43,40 @@ class LedgerEvent:
 
 
 class SessionLedger:
-    def __init__(self, db_path: str | Path):
+    def __init__(
+        self,
+        db_path: str | Path,
+        *,
+        flush_interval_ms: float = 50.0,
+        flush_max_events: int = 64,
+    ):
+        """
+        Args:
+            db_path: SQLite database file
+            flush_interval_ms: Max time an event waits in the write buffer
+                (0 commits every event immediately)
+            flush_max_events: Buffer size that triggers an immediate commit
+        """
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self._lock = threading.Lock()
         self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
         self._conn.execute("PRAGMA journal_mode=WAL;")
+        self._conn.execute("PRAGMA synchronous=NORMAL;")
         self._conn.execute("PRAGMA foreign_keys=ON;")
         self._ensure_tables()
 
+        self._flush_interval = max(0.0, flush_interval_ms) / 1000.0
+        self._flush_max = max(1, flush_max_events)
+        self._pending: List[_Row] = []
+        self._pending_cond = threading.Condition()
+        # Held from taking the buffer until it is committed, so a reader's
+        # flush() waits for a batch the writer thread has already taken
+        self._flush_lock = threading.Lock()
+        self._closed = False
+        self._writer: Optional[threading.Thread] = None
+        atexit.register(self.flush)
+
     # ------------------------------------------------------------------ #
     # Public API
 
@@ -52,7 +91,14 @@ class SessionLedger:
         event_id: Optional[str] = None,
         created_at: Optional[float] = None,
     ) -> LedgerEvent:
-        """Append an event to the ledger and return the canonical record."""
+        """
+        Append an event to the ledger and return the canonical record.
+
+        With `flush_interval_ms=0` the row is committed before returning and a
+        duplicate `event_id` raises `sqlite3.IntegrityError`. Buffered events
+        are committed later by the writer thread, where a duplicate is logged
+        and skipped so it cannot drop the rest of the batch.
+        """
         if not session_id:
             raise ValueError("session_id is required")
         if not kind:
@@ -60,17 +106,42 @@ class SessionLedger:
         event_id = event_id or uuid.uuid4().hex
         created_at = float(created_at if created_at is not None else time.time())
         blob = json.dumps(payload or {}, ensure_ascii=False)
-        with self._lock:
-            self._conn.execute(
-                """
-                INSERT INTO events (event_id, session_id, turn_id, ticket_id, kind, payload, created_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-                """,
-                (event_id, session_id, turn_id, ticket_id, kind, blob, created_at),
-            )
-            self._conn.commit()
+        row = (event_id, session_id, turn_id, ticket_id, kind, blob, created_at)
+        if self._flush_interval == 0:
+            self._insert([row])
+        else:
+            with self._pending_cond:
+                if self._closed:
+                    raise RuntimeError("ledger is closed")
+                self._pending.append(row)
+                if self._writer is None or not self._writer.is_alive():
+                    self._writer = threading.Thread(target=self._writer_loop, name="ledger-writer", daemon=True)
+                    self._writer.start()
+                # Wake the writer to start the interval, or to commit a full buffer now
+                if len(self._pending) == 1 or len(self._pending) >= self._flush_max:
+                    self._pending_cond.notify()
         return LedgerEvent(event_id, session_id, turn_id, ticket_id, kind, payload or {}, created_at)
 
+    def flush(self) -> int:
+        """
+        Commit buffered events now. Returns the number written.
+
+        If the write fails, the events go back to the front of the buffer
+        and the error is raised. Rows with a duplicate `event_id` are logged
+        and skipped.
+        """
+        with self._flush_lock:
+            with self._pending_cond:
+                rows, self._pending = self._pending, []
+            if rows:
+                try:
+                    self._write(rows)
+                except Exception:
+                    with self._pending_cond:
+                        self._pending[:0] = rows
+                    raise
+        return len(rows)
+
     def iter_events(
         self,
         *,
@@ -80,37 +151,23 @@ class SessionLedger:
         reverse: bool = False,
     ) -> Iterable[LedgerEvent]:
         """Yield events filtered by session/kind."""
-        clauses = []
-        params: list[Any] = []
-        if session_id:
-            clauses.append("session_id = ?")
-            params.append(session_id)
-        if kind:
-            clauses.append("kind = ?")
-            params.append(kind)
+        clauses, params = self._filters(session_id, kind)
         where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
         order = "DESC" if reverse else "ASC"
         limit_sql = f"LIMIT {int(limit)}" if limit else ""
         query = f"""
-            SELECT event_id, session_id, turn_id, ticket_id, kind, payload, created_at
+            SELECT {', '.join(_COLUMNS)}
             FROM events
             {where}
             ORDER BY created_at {order}
             {limit_sql}
         """
-        cursor = self._conn.execute(query, params)
-        rows = cursor.fetchall()
+        self.flush()
+        with self._lock:
+            cursor = self._conn.execute(query, params)
+            rows = cursor.fetchall()
         for row in rows:
-            payload = json.loads(row[5]) if row[5] else {}
-            yield LedgerEvent(
-                event_id=row[0],
-                session_id=row[1],
-                turn_id=row[2],
-                ticket_id=row[3],
-                kind=row[4],
-                payload=payload,
-                created_at=float(row[6]),
-            )
+            yield self._to_event(row)
 
     def latest_event(
         self,
@@ -122,11 +179,71 @@ class SessionLedger:
         events = list(self.iter_events(session_id=session_id, kind=kind, limit=1, reverse=True))
         return events[0] if events else None
 
+    def export_jsonl(
+        self,
+        path: str | Path,
+        *,
+        session_id: Optional[str] = None,
+        kind: Optional[str] = None,
+        since: Optional[float] = None,
+        chunk_size: int = 5000,
+    ) -> int:
+        """
+        Export events as columnar JSONL for offline analysis.
+
+        Each line is one chunk of up to `chunk_size` events, stored column-wise
+        (`{"n": 3, "event_id": [...], "kind": [...], ..., "payload": [...]}`).
+        Payloads are copied as their stored JSON text, so nothing is decoded
+        and re-encoded on the way out. Read back with `read_export`.
+
+        Returns:
+            Number of events written
+        """
+        clauses, params = self._filters(session_id, kind)
+        if since is not None:
+            clauses.append("created_at >= ?")
+            params.append(float(since))
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        query = f"SELECT {', '.join(_COLUMNS)} FROM events {where} ORDER BY created_at ASC"
+        out = Path(path)
+        out.parent.mkdir(parents=True, exist_ok=True)
+        self.flush()
+        total = 0
+        with self._lock, out.open("w", encoding="utf-8") as fh:
+            cursor = self._conn.execute(query, params)
+            while True:
+                rows = cursor.fetchmany(max(1, chunk_size))
+                if not rows:
+                    break
+                chunk: Dict[str, Any] = {"n": len(rows)}
+                for index, column in enumerate(_COLUMNS):
+                    chunk[column] = [row[index] for row in rows]
+                fh.write(json.dumps(chunk, ensure_ascii=False, separators=(",", ":")) + "\n")
+                total += len(rows)
+        return total
+
+    @staticmethod
+    def read_export(path: str | Path) -> Iterator[LedgerEvent]:
+        """Yield the events of a file written by `export_jsonl`."""
+        with Path(path).open(encoding="utf-8") as fh:
+            for line in fh:
+                if not line.strip():
+                    continue
+                chunk = json.loads(line)
+                for row in zip(*(chunk[column] for column in _COLUMNS)):
+                    yield SessionLedger._to_event(row)
+
     def close(self) -> None:
+        with self._pending_cond:
+            self._closed = True
+            self._pending_cond.notify()
+        if self._writer is not None:
+            self._writer.join(timeout=5)
+        self.flush()
         with self._lock:
             self._conn.close()
+        atexit.unregister(self.flush)
 
-    # ------------------------------------------------------------------ #
     # Internal helpers
 
     def _ensure_tables(self) -> None:
@@ -144,7 +261,78 @@ class SessionLedger:
                 )
                 """
             )
-            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_events_session ON events(session_id)")
+            # Covers the iter_events filters and sort; supersedes the old
+            # session_id-only index
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_events_session_kind_ts ON events(session_id, kind, created_at)"
+            )
+            self._conn.execute("DROP INDEX IF EXISTS idx_events_session")
             self._conn.execute("CREATE INDEX IF NOT EXISTS idx_events_ticket ON events(ticket_id)")
             self._conn.commit()
 
+    @staticmethod
+    def _filters(session_id: Optional[str], kind: Optional[str]) -> Tuple[List[str], List[Any]]:
+        clauses: List[str] = []
+        params: List[Any] = []
+        if session_id:
+            clauses.append("session_id = ?")
+            params.append(session_id)
+        if kind:
+            clauses.append("kind = ?")
+            params.append(kind)
+        return clauses, params
+
+    @staticmethod
+    def _to_event(row: Any) -> LedgerEvent:
+        return LedgerEvent(
+            event_id=row[0],
+            session_id=row[1],
+            turn_id=row[2],
+            ticket_id=row[3],
+            kind=row[4],
+            payload=json.loads(row[5]) if row[5] else {},
+            created_at=float(row[6]),
+        )
+
+    def _writer_loop(self) -> None:
+        while True:
+            with self._pending_cond:
+                if not self._pending and not self._closed:
+                    self._pending_cond.wait()
+                if self._closed:
+                    return
+                # Group commit: wait out the interval unless the buffer fills up
+                deadline = time.monotonic() + self._flush_interval
+                while len(self._pending) < self._flush_max and not self._closed:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._pending_cond.wait(remaining)
+            try:
+                self.flush()
+            except Exception as e:
+                # e.g. "database is locked": rows are back in the buffer, retry later
+                logger.warning(f"[SessionLedger] Batch commit failed, will retry: {e}")
+                with self._pending_cond:
+                    if not self._closed:
+                        self._pending_cond.wait(max(self._flush_interval, 0.5))
+
+    def _insert(self, rows: List[_Row]) -> None:
+        """Commit rows in one transaction; raises on a duplicate event_id."""
+        with self._lock, self._conn:
+            self._conn.executemany(_INSERT, rows)
+
+    def _write(self, rows: List[_Row]) -> None:
+        """Commit a buffered batch, skipping rows with a duplicate event_id."""
+        try:
+            self._insert(rows)
+        except sqlite3.IntegrityError:
+            # The caller has already returned, so a duplicate must not drop
+            # the rest of the batch
+            with self._lock:
+                for row in rows:
+                    try:
+                        with self._conn:
+                            self._conn.execute(_INSERT, row)
+                    except sqlite3.IntegrityError:
+                        logger.warning(f"[SessionLedger] Duplicate event {row[0]} ignored")
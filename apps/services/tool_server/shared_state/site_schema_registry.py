@@ -9,19 +9,23 @@ This implements the calibration-based extraction system where:
 3. Schema drift: Detect failures and trigger re-calibration
 
 Similar pattern to lesson_store.py but for site-specific extraction knowledge.
+
+Persistence is an append-only JSONL log: changed schemas are appended in
+batches by a background thread and the file is compacted periodically
+(see append_log.py), instead of rewriting every schema on each extraction.
 """
 
 from __future__ import annotations
 
-import json
 import logging
-import os
 from dataclasses import dataclass, field, asdict
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import List, Optional, Dict, Any, Tuple
 from urllib.parse import urlparse
 
+from apps.services.tool_server.shared_state.append_log import AppendOnlyLog
+
 logger = logging.getLogger(__name__)
 
 # Default storage location
@@ -178,11 +182,17 @@ class SiteSchemaRegistry:
     - Staleness detection
     """
 
-    def __init__(self, schema_dir: Path = None):
+    def __init__(self, schema_dir: Path = None, auto_flush: bool = True):
         self.schema_dir = schema_dir or SCHEMA_DIR
         self.schema_file = self.schema_dir / "site_schemas.jsonl"
         self._schemas: Dict[str, SiteSchema] = {}
         self._loaded = False
+        self._log = AppendOnlyLog(
+            self.schema_file,
+            key_fn=lambda data: f"{data['domain']}:{data['page_type']}",
+            name="SchemaRegistry",
+            auto_flush=auto_flush,
+        )
 
     def _ensure_loaded(self) -> None:
         """Lazy-load schemas from disk."""
@@ -191,58 +201,30 @@ class SiteSchemaRegistry:
 
         self.schema_dir.mkdir(parents=True, exist_ok=True)
 
-        if self.schema_file.exists():
-            try:
-                with open(self.schema_file, 'r') as f:
-                    for line in f:
-                        line = line.strip()
-                        if not line:
-                            continue
-                        try:
-                            data = json.loads(line)
-                            schema = SiteSchema.from_dict(data)
-                            self._schemas[schema.get_key()] = schema
-                        except (json.JSONDecodeError, TypeError) as e:
-                            logger.warning(f"[SchemaRegistry] Failed to parse schema line: {e}")
-
-                logger.info(f"[SchemaRegistry] Loaded {len(self._schemas)} schemas from {self.schema_file}")
-            except Exception as e:
-                logger.error(f"[SchemaRegistry] Failed to load schemas: {e}")
+        try:
+            for key, data in self._log.load().items():
+                try:
+                    self._schemas[key] = SiteSchema.from_dict(data)
+                except TypeError as e:
+                    logger.warning(f"[SchemaRegistry] Failed to parse schema line: {e}")
+
+            logger.info(f"[SchemaRegistry] Loaded {len(self._schemas)} schemas from {self.schema_file}")
+        except Exception as e:
+            logger.error(f"[SchemaRegistry] Failed to load schemas: {e}")
 
         self._loaded = True
 
-    def _save_all(self) -> None:
-        """Save all schemas to disk using atomic write (temp file + rename)."""
-        import tempfile
-        import shutil
+    def _mark_dirty(self, schema: SiteSchema) -> None:
+        """Queue a changed schema for the next batched append."""
+        self._log.mark_dirty(schema.to_dict())
 
-        self.schema_dir.mkdir(parents=True, exist_ok=True)
+    def flush(self) -> int:
+        """Write pending schema changes to disk now (normally done in background)."""
+        return self._log.flush()
 
-        try:
-            # Write to temp file first, then atomic rename
-            # This prevents corruption if process crashes mid-write
-            with tempfile.NamedTemporaryFile(
-                mode='w',
-                dir=self.schema_dir,
-                suffix='.tmp',
-                delete=False
-            ) as f:
-                for schema in self._schemas.values():
-                    f.write(json.dumps(schema.to_dict()) + '\n')
-                temp_path = f.name
-
-            # Atomic rename (on POSIX systems)
-            shutil.move(temp_path, self.schema_file)
-
-            logger.debug(f"[SchemaRegistry] Saved {len(self._schemas)} schemas to {self.schema_file}")
-        except Exception as e:
-            logger.error(f"[SchemaRegistry] Failed to save schemas: {e}")
-            # Clean up temp file if it exists
-            try:
-                if 'temp_path' in locals():
-                    os.unlink(temp_path)
-            except:
-                pass
+    def close(self) -> None:
+        """Flush pending changes and stop the background flush thread."""
+        self._log.close()
 
     def get(self, domain: str, page_type: str) -> Optional[SiteSchema]:
         """
@@ -306,7 +288,7 @@ class SiteSchemaRegistry:
 
         schema.updated_at = datetime.now(timezone.utc).isoformat()
         self._schemas[key] = schema
-        self._save_all()
+        self._mark_dirty(schema)
 
     def record_extraction(
         self,
@@ -344,7 +326,7 @@ class SiteSchemaRegistry:
             if schema.needs_recalibration:
                 logger.warning(f"[SchemaRegistry] Schema {key} needs recalibration (consecutive_failures={schema.consecutive_failures})")
 
-        self._save_all()
+        self._mark_dirty(schema)
 
     def needs_calibration(self, domain: str, page_type: str) -> bool:
         """
@@ -377,7 +359,7 @@ class SiteSchemaRegistry:
             # Force recalibration by setting consecutive failures high
             schema.consecutive_failures = 10
             schema.updated_at = datetime.now(timezone.utc).isoformat()
-            self._save_all()
+            self._mark_dirty(schema)
             logger.info(f"[SchemaRegistry] Marked {key} as stale")
 
     def delete(self, domain: str, page_type: str) -> bool:
@@ -389,7 +371,7 @@ class SiteSchemaRegistry:
 
         if key in self._schemas:
             del self._schemas[key]
-            self._save_all()
+            self._log.mark_deleted(key)
             logger.info(f"[SchemaRegistry] Deleted schema for {key}")
             return True
 
@@ -418,8 +400,8 @@ class SiteSchemaRegistry:
 
         for key in keys_to_delete:
             del self._schemas[key]
+            self._log.mark_deleted(key)
 
-        self._save_all()
         logger.info(f"[SchemaRegistry] Deleted {len(keys_to_delete)} schemas for {domain}")
         return True
 
@@ -499,4 +481,6 @@ def reset_registry() -> None:
     """Reset global registry (for testing)."""
     global _registry
     with _registry_lock:
+        if _registry is not None:
+            _registry.close()
         _registry = None
@@ -4,22 +4,39 @@ Source Reliability Tracker
 SQLite-based tracking of source reliability for confidence calibration.
 Tracks success/failure rates per domain to adjust extraction confidence.
 
+This fires on every extracted field, so the write path is kept O(1):
+- Per-domain aggregates live in memory as day buckets covering the decay
+  window; a new extraction increments the current bucket, expired days
+  are subtracted as the window slides
+- Extractions are queued and written in batches (raw log rows, per-day
+  rollup rows in reliability_buckets, and domain_stats) by a background
+  thread over a single shared connection
+- cleanup_old_records drops whole day buckets and the old prefix of the
+  raw log instead of scanning for old rows
+
 Architecture reference: panda_system_docs/architecture/main-system-patterns/
                        UNIVERSAL_CONFIDENCE_SYSTEM.md
 """
 
+import atexit
+import logging
 import sqlite3
 import os
+import threading
 import time
-from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Optional, Tuple
 from contextlib import contextmanager
 from urllib.parse import urlparse
 import json
 
+logger = logging.getLogger(__name__)
 
 DB_PATH = "panda_system_docs/source_reliability.db"
 
+DAY_SECONDS = 86400
+
 # Reliability thresholds
 RELIABILITY_CONFIG = {
     "min_samples": 5,           # Minimum extractions before reliability is calculated
@@ -27,6 +44,7 @@ RELIABILITY_CONFIG = {
     "high_reliability": 0.85,   # >= this is "reliable"
     "low_reliability": 0.50,    # <= this is "unreliable"
     "default_reliability": 0.70,  # Before enough samples
+    "flush_interval": 2.0,      # Seconds between batched writes
 }
 
 
@@ -43,19 +61,85 @@ class SourceStats:
     extraction_types: Dict[str, int]  # e.g., {"price": 50, "title": 48}
 
 
+@dataclass
+class _DomainWindow:
+    """Rolling decay-window aggregate for one domain (day buckets)."""
+    days: Deque[Tuple[int, Dict[str, List[int]]]] = field(default_factory=deque)  # (day, {type: [total, successes]})
+    total: int = 0
+    successes: int = 0
+    type_counts: Dict[str, int] = field(default_factory=dict)
+    last_success: Optional[float] = None
+    last_failure: Optional[float] = None
+
+    def add(self, extraction_type: str, day: int, total: int, successes: int) -> None:
+        """Add counts to a day bucket."""
+        if not self.days or self.days[-1][0] < day:
+            self.days.append((day, {}))
+        bucket = self.days[-1][1] if self.days[-1][0] == day else self._bucket_for(day)
+        counts = bucket.setdefault(extraction_type, [0, 0])
+        counts[0] += total
+        counts[1] += successes
+        self.total += total
+        self.successes += successes
+        self.type_counts[extraction_type] = self.type_counts.get(extraction_type, 0) + total
+
+    def _bucket_for(self, day: int) -> Dict[str, List[int]]:
+        # Out-of-order day (clock skew or backfill): rare, linear is fine
+        for bucket_day, bucket in self.days:
+            if bucket_day == day:
+                return bucket
+        bucket: Dict[str, List[int]] = {}
+        self.days = deque(sorted([*self.days, (day, bucket)], key=lambda item: item[0]))
+        return bucket
+
+    def expire(self, cutoff_day: int) -> None:
+        """Drop buckets older than cutoff_day (amortized O(1))."""
+        while self.days and self.days[0][0] < cutoff_day:
+            _, bucket = self.days.popleft()
+            for extraction_type, (total, successes) in bucket.items():
+                self.total -= total
+                self.successes -= successes
+                remaining = self.type_counts.get(extraction_type, 0) - total
+                if remaining > 0:
+                    self.type_counts[extraction_type] = remaining
+                else:
+                    self.type_counts.pop(extraction_type, None)
+
+    @property
+    def reliability(self) -> float:
+        if self.total >= RELIABILITY_CONFIG["min_samples"]:
+            return self.successes / self.total
+        return RELIABILITY_CONFIG["default_reliability"]
+
+
 class SourceReliabilityTracker:
     """
     Tracks extraction reliability per source domain.
     Used to adjust confidence based on historical success rates.
     """
 
-    def __init__(self, db_path: str = DB_PATH):
+    def __init__(self, db_path: str = DB_PATH, auto_flush: bool = True):
         self.db_path = db_path
+        self.auto_flush = auto_flush
+        self._conn: Optional[sqlite3.Connection] = None
+        self._db_lock = threading.RLock()
+        self._lock = threading.Lock()
+
+        # In-memory decay windows (loaded lazily per domain from reliability_buckets)
+        self._windows: Dict[str, _DomainWindow] = {}
+
+        # Pending batch
+        self._pending_log: List[tuple] = []
+        self._pending_buckets: Dict[Tuple[str, str, int], List] = {}  # -> [total, successes, last_success, last_failure]
+        self._dirty_domains: set = set()
+
+        self._flush_thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
         self._ensure_db()
 
     def _ensure_db(self):
         """Ensure database and tables exist"""
-        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+        os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
 
         with self._get_connection() as conn:
             cursor = conn.cursor()
@@ -75,7 +159,7 @@ class SourceReliabilityTracker:
                 )
             """)
 
-            # Aggregated stats table (updated periodically)
+            # Aggregated stats table (updated on each batch flush)
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS domain_stats (
                     domain TEXT PRIMARY KEY,
@@ -90,6 +174,22 @@ class SourceReliabilityTracker:
                 )
             """)
 
+            # Per-day rollups (day = unix days); the decay window is a range of these
+            cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='reliability_buckets'")
+            needs_backfill = cursor.fetchone() is None
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS reliability_buckets (
+                    domain TEXT NOT NULL,
+                    extraction_type TEXT NOT NULL,
+                    day INTEGER NOT NULL,
+                    total INTEGER NOT NULL DEFAULT 0,
+                    successes INTEGER NOT NULL DEFAULT 0,
+                    last_success REAL,
+                    last_failure REAL,
+                    PRIMARY KEY (domain, extraction_type, day)
+                ) WITHOUT ROWID
+            """)
+
             # Indexes
             cursor.execute("""
                 CREATE INDEX IF NOT EXISTS idx_log_domain
@@ -99,18 +199,64 @@ class SourceReliabilityTracker:
                 CREATE INDEX IF NOT EXISTS idx_log_timestamp
                 ON extraction_log(timestamp)
             """)
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_buckets_day
+                ON reliability_buckets(day)
+            """)
+
+            if needs_backfill:
+                # Databases created before rollups existed: build buckets from the raw log once
+                cursor.execute(f"""
+                    INSERT INTO reliability_buckets
+                    SELECT domain, extraction_type, CAST(timestamp / {DAY_SECONDS} AS INTEGER),
+                           COUNT(*), SUM(success),
+                           MAX(CASE WHEN success = 1 THEN timestamp END),
+                           MAX(CASE WHEN success = 0 THEN timestamp END)
+                    FROM extraction_log
+                    GROUP BY 1, 2, 3
+                """)
 
             conn.commit()
 
     @contextmanager
     def _get_connection(self):
-        """Get database connection with context manager"""
-        conn = sqlite3.connect(self.db_path, timeout=10)
-        conn.row_factory = sqlite3.Row
-        try:
-            yield conn
-        finally:
-            conn.close()
+        """Get the shared database connection (serialized by _db_lock)"""
+        with self._db_lock:
+            if self._conn is None:
+                self._conn = sqlite3.connect(self.db_path, timeout=10, check_same_thread=False)
+                self._conn.row_factory = sqlite3.Row
+                self._conn.execute("PRAGMA journal_mode=WAL")
+                self._conn.execute("PRAGMA synchronous=NORMAL")
+            yield self._conn
+
+    def _cutoff_day(self, now: Optional[float] = None) -> int:
+        now = time.time() if now is None else now
+        return int((now - RELIABILITY_CONFIG["decay_days"] * DAY_SECONDS) // DAY_SECONDS) + 1
+
+    def _window(self, domain: str) -> _DomainWindow:
+        """Get the in-memory decay window for a domain, loading it on first use."""
+        window = self._windows.get(domain)
+        if window is not None:
+            return window
+
+        window = _DomainWindow()
+        with self._get_connection() as conn:
+            rows = conn.execute("""
+                SELECT extraction_type, day, total, successes, last_success, last_failure
+                FROM reliability_buckets
+                WHERE domain = ? AND day >= ?
+                ORDER BY day
+            """, (domain, self._cutoff_day())).fetchall()
+
+        for row in rows:
+            window.add(row["extraction_type"], row["day"], row["total"], row["successes"])
+            if row["last_success"] is not None:
+                window.last_success = max(window.last_success or 0, row["last_success"])
+            if row["last_failure"] is not None:
+                window.last_failure = max(window.last_failure or 0, row["last_failure"])
+
+        self._windows[domain] = window
+        return window
 
     def log_extraction(
         self,
@@ -124,6 +270,9 @@ class SourceReliabilityTracker:
         """
         Log an extraction attempt.
 
+        Updates the in-memory aggregate immediately; the database write is
+        batched (see flush()).
+
         Args:
             url: Full URL of the page
             extraction_type: Type of extraction ("price", "title", "availability", etc.)
@@ -134,15 +283,18 @@ class SourceReliabilityTracker:
         """
         domain = self._extract_domain(url)
         timestamp = time.time()
+        day = int(timestamp // DAY_SECONDS)
+
+        with self._lock:
+            window = self._window(domain)
+            window.expire(self._cutoff_day(timestamp))
+            window.add(extraction_type, day, 1, 1 if success else 0)
+            if success:
+                window.last_success = timestamp
+            else:
+                window.last_failure = timestamp
 
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-
-            cursor.execute("""
-                INSERT INTO extraction_log
-                (domain, extraction_type, success, confidence, timestamp, url, error_type, metadata)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
+            self._pending_log.append((
                 domain,
                 extraction_type,
                 1 if success else 0,
@@ -152,11 +304,167 @@ class SourceReliabilityTracker:
                 error_type,
                 json.dumps(metadata) if metadata else None
             ))
+            bucket = self._pending_buckets.setdefault((domain, extraction_type, day), [0, 0, None, None])
+            bucket[0] += 1
+            if success:
+                bucket[1] += 1
+                bucket[2] = timestamp
+            else:
+                bucket[3] = timestamp
+            self._dirty_domains.add(domain)
+
+        self._ensure_flush_thread()
+
+    # ------------------------------------------------------------------
+    # Batched writes
+    # ------------------------------------------------------------------
+
+    def _ensure_flush_thread(self) -> None:
+        if not self.auto_flush or self._flush_thread is not None:
+            return
+        with self._lock:
+            if self._flush_thread is not None:
+                return
+            self._flush_thread = threading.Thread(
+                target=self._flush_loop, name="source-reliability-flush", daemon=True
+            )
+            self._flush_thread.start()
+        atexit.register(self.close)
 
-            conn.commit()
+    def _flush_loop(self) -> None:
+        while not self._stop.wait(RELIABILITY_CONFIG["flush_interval"]):
+            try:
+                self.flush()
+            except Exception as e:
+                logger.warning(f"[SourceReliability] Flush failed: {e}")
+
+    def _requeue(
+        self,
+        log_rows: List[Tuple],
+        buckets: Dict[Tuple[str, str, int], List[Any]],
+        domains: set
+    ) -> None:
+        """Put a failed batch back in front of anything queued since."""
+        with self._lock:
+            self._pending_log[:0] = log_rows
+            for key, (total, successes, last_success, last_failure) in buckets.items():
+                bucket = self._pending_buckets.setdefault(key, [0, 0, None, None])
+                bucket[0] += total
+                bucket[1] += successes
+                bucket[2] = max(filter(None, (bucket[2], last_success)), default=None)
+                bucket[3] = max(filter(None, (bucket[3], last_failure)), default=None)
+            self._dirty_domains |= domains
+
+    def flush(self) -> int:
+        """
+        Write queued extractions: raw log rows, day-bucket increments and
+        the refreshed domain_stats rows, in one transaction.
+
+        If the write fails, the transaction is rolled back, the batch goes
+        back on the queue and the error is raised.
+
+        Returns:
+            Number of extractions written
+        """
+        with self._lock:
+            if not self._pending_log:
+                return 0
+            log_rows, self._pending_log = self._pending_log, []
+            buckets, self._pending_buckets = self._pending_buckets, {}
+            domains, self._dirty_domains = self._dirty_domains, set()
+            now = time.time()
+            cutoff_day = self._cutoff_day(now)
+            stats_rows = []
+            for domain in domains:
+                window = self._windows[domain]
+                window.expire(cutoff_day)
+                stats_rows.append((
+                    domain, window.total, window.successes, window.total - window.successes,
+                    window.reliability, window.last_success, window.last_failure,
+                    json.dumps(window.type_counts), now
+                ))
 
-        # Update aggregated stats
-        self._update_domain_stats(domain)
+        try:
+            # `with conn` commits the batch or rolls it back, so a failed write
+            # never leaves log rows without their bucket upserts
+            with self._get_connection() as conn, conn:
+                conn.executemany("""
+                    INSERT INTO extraction_log
+                    (domain, extraction_type, success, confidence, timestamp, url, error_type, metadata)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """, log_rows)
+                conn.executemany("""
+                    INSERT INTO reliability_buckets
+                    (domain, extraction_type, day, total, successes, last_success, last_failure)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(domain, extraction_type, day) DO UPDATE SET
+                        total = total + excluded.total,
+                        successes = successes + excluded.successes,
+                        last_success = COALESCE(MAX(last_success, excluded.last_success), last_success, excluded.last_success),
+                        last_failure = COALESCE(MAX(last_failure, excluded.last_failure), last_failure, excluded.last_failure)
+                """, [(d, t, day, *counts) for (d, t, day), counts in buckets.items()])
+                conn.executemany("""
+                    INSERT INTO domain_stats
+                    (domain, total_extractions, successful, failed, reliability_score,
+                     last_success, last_failure, extraction_types, updated_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(domain) DO UPDATE SET
+                        total_extractions = excluded.total_extractions,
+                        successful = excluded.successful,
+                        failed = excluded.failed,
+                        reliability_score = excluded.reliability_score,
+                        last_success = excluded.last_success,
+                        last_failure = excluded.last_failure,
+                        extraction_types = excluded.extraction_types,
+                        updated_at = excluded.updated_at
+                """, stats_rows)
+        except Exception:
+            self._requeue(log_rows, buckets, domains)
+            raise
+
+        return len(log_rows)
+
+    def close(self) -> None:
+        """Stop the flush thread and write anything pending (called at exit)."""
+        self._stop.set()
+        try:
+            self.flush()
+        except Exception as e:
+            logger.debug(f"[SourceReliability] Final flush failed: {e}")
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def _stats_from_window(self, domain: str) -> Optional[SourceStats]:
+        with self._lock:
+            window = self._window(domain)
+            window.expire(self._cutoff_day())
+            if window.total == 0 and window.last_success is None and window.last_failure is None:
+                return None
+            return SourceStats(
+                domain=domain,
+                total_extractions=window.total,
+                successful_extractions=window.successes,
+                failed_extractions=window.total - window.successes,
+                reliability_score=window.reliability,
+                last_success=window.last_success,
+                last_failure=window.last_failure,
+                extraction_types=dict(window.type_counts)
+            )
+
+    @staticmethod
+    def _stats_from_row(row: sqlite3.Row) -> SourceStats:
+        return SourceStats(
+            domain=row["domain"],
+            total_extractions=row["total_extractions"],
+            successful_extractions=row["successful"],
+            failed_extractions=row["failed"],
+            reliability_score=row["reliability_score"],
+            last_success=row["last_success"],
+            last_failure=row["last_failure"],
+            extraction_types=json.loads(row["extraction_types"] or "{}")
+        )
 
     def get_reliability(self, url_or_domain: str) -> float:
         """
@@ -165,46 +473,15 @@ class SourceReliabilityTracker:
         Returns:
             Reliability score 0.0-1.0
         """
-        domain = self._extract_domain(url_or_domain)
-
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT reliability_score, total_extractions
-                FROM domain_stats
-                WHERE domain = ?
-            """, (domain,))
+        stats = self._stats_from_window(self._extract_domain(url_or_domain))
+        if not stats or stats.total_extractions < RELIABILITY_CONFIG["min_samples"]:
+            return RELIABILITY_CONFIG["default_reliability"]
 
-            row = cursor.fetchone()
-            if not row or row["total_extractions"] < RELIABILITY_CONFIG["min_samples"]:
-                return RELIABILITY_CONFIG["default_reliability"]
-
-            return row["reliability_score"]
+        return stats.reliability_score
 
     def get_domain_stats(self, url_or_domain: str) -> Optional[SourceStats]:
         """Get full statistics for a domain"""
-        domain = self._extract_domain(url_or_domain)
-
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT * FROM domain_stats WHERE domain = ?
-            """, (domain,))
-
-            row = cursor.fetchone()
-            if not row:
-                return None
-
-            return SourceStats(
-                domain=row["domain"],
-                total_extractions=row["total_extractions"],
-                successful_extractions=row["successful"],
-                failed_extractions=row["failed"],
-                reliability_score=row["reliability_score"],
-                last_success=row["last_success"],
-                last_failure=row["last_failure"],
-                extraction_types=json.loads(row["extraction_types"] or "{}")
-            )
+        return self._stats_from_window(self._extract_domain(url_or_domain))
 
     def adjust_confidence(
         self,
@@ -246,6 +523,7 @@ class SourceReliabilityTracker:
     ) -> List[SourceStats]:
         """Get list of unreliable domains"""
         threshold = threshold or RELIABILITY_CONFIG["low_reliability"]
+        self.flush()
 
         with self._get_connection() as conn:
             cursor = conn.cursor()
@@ -256,22 +534,12 @@ class SourceReliabilityTracker:
                 ORDER BY reliability_score ASC
             """, (threshold, RELIABILITY_CONFIG["min_samples"]))
 
-            return [
-                SourceStats(
-                    domain=row["domain"],
-                    total_extractions=row["total_extractions"],
-                    successful_extractions=row["successful"],
-                    failed_extractions=row["failed"],
-                    reliability_score=row["reliability_score"],
-                    last_success=row["last_success"],
-                    last_failure=row["last_failure"],
-                    extraction_types=json.loads(row["extraction_types"] or "{}")
-                )
-                for row in cursor.fetchall()
-            ]
+            return [self._stats_from_row(row) for row in cursor.fetchall()]
 
     def get_top_domains(self, limit: int = 20) -> List[SourceStats]:
         """Get most reliable domains"""
+        self.flush()
+
         with self._get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("""
@@ -281,85 +549,7 @@ class SourceReliabilityTracker:
                 LIMIT ?
             """, (RELIABILITY_CONFIG["min_samples"], limit))
 
-            return [
-                SourceStats(
-                    domain=row["domain"],
-                    total_extractions=row["total_extractions"],
-                    successful_extractions=row["successful"],
-                    failed_extractions=row["failed"],
-                    reliability_score=row["reliability_score"],
-                    last_success=row["last_success"],
-                    last_failure=row["last_failure"],
-                    extraction_types=json.loads(row["extraction_types"] or "{}")
-                )
-                for row in cursor.fetchall()
-            ]
-
-    def _update_domain_stats(self, domain: str):
-        """Update aggregated stats for a domain"""
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-
-            # Calculate time-weighted stats
-            cutoff = time.time() - (RELIABILITY_CONFIG["decay_days"] * 86400)
-
-            cursor.execute("""
-                SELECT
-                    COUNT(*) as total,
-                    SUM(success) as successes,
-                    MAX(CASE WHEN success = 1 THEN timestamp END) as last_success,
-                    MAX(CASE WHEN success = 0 THEN timestamp END) as last_failure
-                FROM extraction_log
-                WHERE domain = ? AND timestamp > ?
-            """, (domain, cutoff))
-
-            row = cursor.fetchone()
-            total = row["total"] or 0
-            successes = row["successes"] or 0
-            failures = total - successes
-            last_success = row["last_success"]
-            last_failure = row["last_failure"]
-
-            # Calculate reliability score
-            if total >= RELIABILITY_CONFIG["min_samples"]:
-                reliability = successes / total
-            else:
-                reliability = RELIABILITY_CONFIG["default_reliability"]
-
-            # Get extraction type breakdown
-            cursor.execute("""
-                SELECT extraction_type, COUNT(*) as cnt
-                FROM extraction_log
-                WHERE domain = ? AND timestamp > ?
-                GROUP BY extraction_type
-            """, (domain, cutoff))
-
-            extraction_types = {
-                row["extraction_type"]: row["cnt"]
-                for row in cursor.fetchall()
-            }
-
-            # Upsert domain stats
-            cursor.execute("""
-                INSERT INTO domain_stats
-                (domain, total_extractions, successful, failed, reliability_score,
-                 last_success, last_failure, extraction_types, updated_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT(domain) DO UPDATE SET
-                    total_extractions = excluded.total_extractions,
-                    successful = excluded.successful,
-                    failed = excluded.failed,
-                    reliability_score = excluded.reliability_score,
-                    last_success = excluded.last_success,
-                    last_failure = excluded.last_failure,
-                    extraction_types = excluded.extraction_types,
-                    updated_at = excluded.updated_at
-            """, (
-                domain, total, successes, failures, reliability,
-                last_success, last_failure, json.dumps(extraction_types), time.time()
-            ))
-
-            conn.commit()
+            return [self._stats_from_row(row) for row in cursor.fetchall()]
 
     def _extract_domain(self, url_or_domain: str) -> str:
         """Extract domain from URL or return as-is if already domain"""
@@ -369,27 +559,48 @@ class SourceReliabilityTracker:
         return url_or_domain.lower()
 
     def cleanup_old_records(self, days: int = 90):
-        """Remove extraction logs older than specified days"""
+        """
+        Remove extraction logs older than specified days.
+
+        Drops whole day buckets (primary-key range) and the old prefix of the
+        raw log (ids grow with time, so it is a rowid range, not a scan).
+        """
+        self.flush()
         cutoff = time.time() - (days * 86400)
+        cutoff_day = int(cutoff // DAY_SECONDS)
 
         with self._get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("""
-                DELETE FROM extraction_log WHERE timestamp < ?
+                SELECT id FROM extraction_log
+                WHERE timestamp < ?
+                ORDER BY timestamp DESC LIMIT 1
             """, (cutoff,))
-            deleted = cursor.rowcount
+            row = cursor.fetchone()
+            deleted = 0
+            if row:
+                cursor.execute("DELETE FROM extraction_log WHERE id <= ?", (row["id"],))
+                deleted = cursor.rowcount
+            cursor.execute("DELETE FROM reliability_buckets WHERE day < ?", (cutoff_day,))
             conn.commit()
 
+        with self._lock:
+            for window in self._windows.values():
+                window.expire(cutoff_day)
+
         return deleted
 
 
 # Singleton instance
 _tracker_instance: Optional[SourceReliabilityTracker] = None
+_tracker_lock = threading.Lock()
 
 
 def get_tracker() -> SourceReliabilityTracker:
     """Get singleton tracker instance"""
     global _tracker_instance
     if _tracker_instance is None:
-        _tracker_instance = SourceReliabilityTracker()
+        with _tracker_lock:
+            if _tracker_instance is None:
+                _tracker_instance = SourceReliabilityTracker()
     return _tracker_instance
@@ -11,20 +11,22 @@ The system learns which vendors work through experience:
 
 NO HARDCODED LISTS. The registry learns and adapts.
 
-Persistence: panda_system_docs/schemas/vendor_registry.jsonl
+Persistence: panda_system_docs/schemas/vendor_registry.jsonl (append-only log,
+changed vendors are appended in batches off the request path, see append_log.py)
 """
 
 from __future__ import annotations
 
-import json
 import logging
 import threading
 from dataclasses import dataclass, field, asdict
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Set
+from typing import Callable, Dict, List, Optional, Any, Set
 from urllib.parse import urlparse
 
+from apps.services.tool_server.shared_state.append_log import AppendOnlyLog
+
 logger = logging.getLogger(__name__)
 
 # Storage
@@ -284,11 +286,19 @@ class VendorRegistry:
     - LLM-evaluated - quality assessments are made by LLM
     """
 
-    def __init__(self, registry_file: Path = None):
+    def __init__(self, registry_file: Path = None, auto_flush: bool = True):
         self.registry_file = registry_file or VENDOR_REGISTRY_FILE
         self._vendors: Dict[str, VendorRecord] = {}
         self._loaded = False
         self._lock = threading.Lock()
+        self._log = AppendOnlyLog(
+            self.registry_file,
+            key_fn=lambda data: data["domain"],
+            name="VendorRegistry",
+            auto_flush=auto_flush,
+        )
+        # Called as listener(domain, block_type) whenever a block is reported
+        self._block_listeners: List[Callable[[str, str], None]] = []
 
     def _ensure_loaded(self) -> None:
         """Lazy-load vendors from disk."""
@@ -299,37 +309,35 @@ class VendorRegistry:
             if self._loaded:
                 return
 
-            if self.registry_file.exists():
-                try:
-                    with open(self.registry_file, 'r') as f:
-                        for line in f:
-                            line = line.strip()
-                            if not line:
-                                continue
-                            try:
-                                data = json.loads(line)
-                                vendor = VendorRecord.from_dict(data)
-                                self._vendors[vendor.domain] = vendor
-                            except (json.JSONDecodeError, TypeError) as e:
-                                logger.warning(f"[VendorRegistry] Failed to parse: {e}")
-
-                    logger.info(f"[VendorRegistry] Loaded {len(self._vendors)} vendors")
-                except Exception as e:
-                    logger.error(f"[VendorRegistry] Failed to load: {e}")
+            try:
+                for domain, data in self._log.load().items():
+                    try:
+                        self._vendors[domain] = VendorRecord.from_dict(data)
+                    except TypeError as e:
+                        logger.warning(f"[VendorRegistry] Failed to parse: {e}")
+
+                logger.info(f"[VendorRegistry] Loaded {len(self._vendors)} vendors")
+            except Exception as e:
+                logger.error(f"[VendorRegistry] Failed to load: {e}")
 
             self._loaded = True
 
-    def _save_all(self) -> None:
-        """Save all vendors to disk."""
-        self.registry_file.parent.mkdir(parents=True, exist_ok=True)
+    def add_block_listener(self, listener: Callable[[str, str], None]) -> None:
+        """Register a callback for block reports (e.g. to throttle fetch concurrency)."""
+        if listener not in self._block_listeners:
+            self._block_listeners.append(listener)
 
-        try:
-            with open(self.registry_file, 'w') as f:
-                for vendor in self._vendors.values():
-                    f.write(json.dumps(vendor.to_dict()) + '\n')
-            logger.debug(f"[VendorRegistry] Saved {len(self._vendors)} vendors")
-        except Exception as e:
-            logger.error(f"[VendorRegistry] Failed to save: {e}")
+    def _mark_dirty(self, vendor: VendorRecord) -> None:
+        """Queue a changed vendor for the next batched append."""
+        self._log.mark_dirty(vendor.to_dict())
+
+    def flush(self) -> int:
+        """Write pending vendor changes to disk now (normally done in background)."""
+        return self._log.flush()
+
+    def close(self) -> None:
+        """Flush pending changes and stop the background flush thread."""
+        self._log.close()
 
     def _normalize_domain(self, domain: str) -> str:
         """Normalize domain name."""
@@ -402,7 +410,7 @@ class VendorRegistry:
                 self._vendors[domain] = vendor
                 logger.info(f"[VendorRegistry] Discovered new vendor: {domain} via {discovered_via}")
 
-            self._save_all()
+            self._mark_dirty(vendor)
             return vendor
 
     def record_visit(
@@ -446,8 +454,15 @@ class VendorRegistry:
                 # Record normal visit - may return recovery suggestion on failure
                 recovery_suggestion = vendor.record_visit(success, extraction_time_ms)
 
-            self._save_all()
-            return recovery_suggestion
+            self._mark_dirty(vendor)
+
+        if blocked:
+            for listener in self._block_listeners:
+                try:
+                    listener(domain, block_type)
+                except Exception as e:
+                    logger.warning(f"[VendorRegistry] Block listener failed: {e}")
+        return recovery_suggestion
 
     def record_recovery_attempt(
         self,
@@ -463,7 +478,7 @@ class VendorRegistry:
             vendor = self._vendors.get(domain)
             if vendor:
                 vendor.record_recovery_attempt(strategy, success)
-                self._save_all()
+                self._mark_dirty(vendor)
 
     def get_vendors_needing_recovery(self) -> List[VendorRecord]:
         """Get all vendors that need recovery attempts."""
@@ -572,7 +587,7 @@ class VendorRegistry:
                 vendor.is_blocked = False
                 vendor.block_detected_at = None
                 vendor.block_type = ""
-                self._save_all()
+                self._mark_dirty(vendor)
                 logger.info(f"[VendorRegistry] Cleared blocked status for {domain}")
                 return True
         return False
@@ -585,7 +600,7 @@ class VendorRegistry:
         with self._lock:
             if domain in self._vendors:
                 del self._vendors[domain]
-                self._save_all()
+                self._log.mark_deleted(domain)
                 logger.info(f"[VendorRegistry] Deleted vendor: {domain}")
                 return True
         return False
@@ -610,4 +625,6 @@ def reset_registry() -> None:
     """Reset global registry (for testing)."""
     global _registry
     with _registry_lock:
+        if _registry is not None:
+            _registry.close()
         _registry = None
@@ -51,6 +51,7 @@ from apps.services.tool_server.shared_state.site_schema_registry import (
     SiteSchemaRegistry,
     get_schema_registry
 )
+from apps.services.tool_server.schema_extraction_plan import run_extraction_plan
 
 logger = logging.getLogger(__name__)
 
@@ -739,9 +740,10 @@ class SiteCalibrator:
 
             selector = schema.product_card_selector
 
-            # Try to find product cards
-            cards = await page.query_selector_all(selector)
-            card_count = len(cards)
+            # Read every sampled card's fields in one page.evaluate round trip
+            extracted = await run_extraction_plan(page, schema, limit=15)
+            cards = extracted["cards"]
+            card_count = extracted["count"]
 
             # ═══════════════════════════════════════════════════════════════
             # CHECK 1: Element count validation (not too few, not too many)
@@ -767,30 +769,13 @@ class SiteCalibrator:
             structure_valid = 0
 
             for card in cards[:sample_size]:
-                try:
-                    # Check for title element (h1-h4, or common title classes)
-                    has_title = False
-                    for title_sel in ['h1', 'h2', 'h3', 'h4', '[class*="title"]', '[class*="name"]', '[role="heading"]']:
-                        title_elem = await card.query_selector(title_sel)
-                        if title_elem:
-                            title_text = await title_elem.text_content() or ""
-                            if len(title_text.strip()) > 3:
-                                has_title = True
-                                break
-
-                    # Check for link element
-                    has_link = False
-                    link_elem = await card.query_selector('a[href]')
-                    if link_elem:
-                        href = await link_elem.get_attribute("href") or ""
-                        if href.startswith("http") or href.startswith("/"):
-                            has_link = True
-
-                    if has_title and has_link:
-                        structure_valid += 1
+                # Title element (h1-h4, or common title classes) and a real link
+                has_title = bool(card.get("heading"))
+                href = card.get("any_href") or ""
+                has_link = href.startswith("http") or href.startswith("/")
 
-                except Exception:
-                    continue
+                if has_title and has_link:
+                    structure_valid += 1
 
             structure_ratio = structure_valid / sample_size if sample_size > 0 else 0
 
@@ -806,19 +791,11 @@ class SiteCalibrator:
             # CHECK 3: Content extraction validation
             # ═══════════════════════════════════════════════════════════════
             extracted_items = []
-            link_selector = schema.product_link_selector or "a[href]"
 
             for card in cards[:sample_size]:
                 try:
-                    # Extract URL
-                    link = await card.query_selector(link_selector)
-                    if not link:
-                        link = await card.query_selector("a[href]")
-
-                    if not link:
-                        continue
-
-                    href = await link.get_attribute("href") or ""
+                    # Product link (product_link_selector, else first a[href])
+                    href = card.get("href") or ""
 
                     # Skip navigation/filter/javascript URLs
                     if not href or href.startswith("javascript:") or href == "#":
@@ -826,20 +803,8 @@ class SiteCalibrator:
                     if any(skip in href.lower() for skip in ["/search?", "/category/", "/filter", "/sort", "login", "signin"]):
                         continue
 
-                    # Extract title
-                    title = ""
-                    for title_sel in ['h3', 'h2', 'h4', 'h1', '[class*="title"]', '[class*="name"]']:
-                        title_elem = await card.query_selector(title_sel)
-                        if title_elem:
-                            title = await title_elem.text_content() or ""
-                            title = title.strip()
-                            if len(title) > 3:
-                                break
-
-                    # Fallback: use link text
-                    if not title or len(title) <= 3:
-                        title = await link.text_content() or ""
-                        title = title.strip()
+                    # Title from a heading/title element, else the link text
+                    title = card.get("heading_title") or card.get("link_text") or ""
 
                     # ENHANCED VALIDATION: Check title is real product content, not navigation/placeholder
                     if href and title and len(title) > 3:
@@ -8,19 +8,17 @@ from __future__ import annotations
 import json
 import logging
 import os
-import re
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 from urllib.parse import urlparse
 
-import httpx
-
 from apps.services.tool_server.shared_state.source_reliability import (
     RELIABILITY_CONFIG,
     get_tracker,
 )
 
+from apps.services.tool_server.shared.batch_eval import evaluate_batched
 from apps.services.tool_server.shared.llm_utils import load_prompt_via_recipe as _load_prompt_via_recipe
 
 logger = logging.getLogger(__name__)
@@ -48,18 +46,6 @@ SOURCE_TYPES = [
 ]
 
 
-def _repair_json(text: str) -> str:
-    """Attempt to repair common LLM JSON errors."""
-    text = re.sub(r",(\s*[}\]])", r"\1", text)
-    text = re.sub(r"\}(\s*)\{", r"},\1{", text)
-    text = re.sub(r"\"(\s*)\{", r"\",\1{", text)
-    text = re.sub(r"\}(\s*)\"", r"},\1\"", text)
-    text = re.sub(r"\](\s*)\"", r"],\1\"", text)
-    text = re.sub(r"(\d)(\s*)\"(\w+)\":", r"\1,\2\"\3\":", text)
-    text = re.sub(r"(true|false|null)(\s*)\"(\w+)\":", r"\1,\2\"\3\":", text)
-    return text
-
-
 def _extract_domain(url: str) -> str:
     try:
         parsed = urlparse(url)
@@ -137,18 +123,11 @@ class SourceQualityScorer:
         if key_requirements:
             requirements_text = f"\nKey requirements: {', '.join(key_requirements[:6])}"
 
-        candidate_lines = []
-        for i, c in enumerate(candidates, 1):
-            candidate_lines.append(
-                f"{i}. URL: {c.get('url', 'N/A')}\n"
-                f"   Title: {c.get('title', 'N/A')}\n"
-                f"   Snippet: {c.get('snippet', 'N/A')[:160]}"
-            )
-
         # Load base prompt from file
         base_prompt = _load_source_quality_scorer_prompt()
 
-        prompt = f"""{base_prompt}
+        def render_prompt(table: str) -> str:
+            return f"""{base_prompt}
 
 ---
 
@@ -158,43 +137,42 @@ class SourceQualityScorer:
 **Original query:** {query}{requirements_text}
 
 **Candidates:**
-{chr(10).join(candidate_lines)}
+{table}
 
 Score each candidate."""
 
-        try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    model_url,
-                    json={
-                        "model": model_id,
-                        "messages": [{"role": "user", "content": prompt}],
-                        "temperature": 0.1,
-                        "max_tokens": 1200,
-                    },
-                    headers={"Authorization": f"Bearer {api_key}"},
-                )
-                response.raise_for_status()
-                result = response.json()
-
-            llm_content = result["choices"][0]["message"]["content"].strip()
-            if "```json" in llm_content:
-                llm_content = llm_content.split("```json")[1].split("```")[0].strip()
-            elif "```" in llm_content:
-                llm_content = llm_content.split("```")[1].split("```")[0].strip()
-
-            try:
-                parsed = json.loads(llm_content)
-            except json.JSONDecodeError:
-                parsed = json.loads(_repair_json(llm_content))
-
-            results = parsed.get("results", [])
-            # Log LLM reasoning for debugging
-            for r in results:
-                logger.info(f"[SourceQuality] LLM scored idx={r.get('index')} score={r.get('llm_quality_score')} reason={r.get('reasoning', '')[:100]}")
-        except Exception as e:
-            logger.warning(f"[SourceQuality] LLM scoring failed: {e}")
-            results = []
+        # Large candidate lists are split into concurrent batches; only
+        # candidates whose score failed to parse are re-asked
+        outcome = await evaluate_batched(
+            items=candidates,
+            columns={
+                "url": "url",
+                "title": "title",
+                "snippet": "snippet",
+            },
+            cell_limits={"snippet": 160},
+            result_fields={
+                "source_type": {"type": "string", "enum": SOURCE_TYPES},
+                "llm_quality_score": {"type": "number"},
+                "confidence": {"type": "number"},
+                "reasoning": {"type": "string"},
+            },
+            render_prompt=render_prompt,
+            id_field="index",
+            tokens_per_item=90,
+            temperature=0.1,
+            llm_url=model_url,
+            llm_model=model_id,
+            llm_api_key=api_key,
+            timeout=30.0,
+            log_prefix="SourceQuality",
+        )
+        results = list(outcome.results.values())
+        # Log LLM reasoning for debugging
+        for r in results:
+            logger.info(f"[SourceQuality] LLM scored idx={r.get('index')} score={r.get('llm_quality_score')} reason={r.get('reasoning', '')[:100]}")
+        if outcome.failed:
+            logger.warning(f"[SourceQuality] LLM scoring failed for {len(outcome.failed)} candidates, using defaults")
 
         result_by_index: Dict[int, SourceQualityResult] = {}
         for entry in results:
@@ -0,0 +1,105 @@
+import asyncio
+import re
+from typing import Any, Dict, List
+
+from apps.services.tool_server.shared.batch_eval import evaluate_batched, format_table
+
+FIELDS = {
+    "decision": {"type": "string", "enum": ["ACCEPT", "REJECT"]},
+    "score": {"type": "number"},
+}
+
+
+def _ids_in(prompt: str) -> List[int]:
+    return [int(m) for m in re.findall(r"^(\d+) \|", prompt, re.MULTILINE)]
+
+
+def test_format_table_is_compact_and_escaped() -> None:
+    rows = [
+        {"name": "Cage | XL", "specs": {"size": "40in", "color": ""}, "price": None},
+        {"name": "  Wheel\n  8in ", "specs": {}, "price": "$12"},
+    ]
+    table = format_table(rows, [1, 2], {"name": "name", "specs": "specs", "price": "price"}, "index")
+    assert table.splitlines() == [
+        "index | name | specs | price",
+        "1 | Cage / XL | size: 40in | -",
+        "2 | Wheel 8in | - | $12",
+    ]
+
+
+def test_format_table_caps_only_limited_columns() -> None:
+    specs = {f"spec_{i}": "x" * 20 for i in range(12)}
+    url = "https://shop.example.com/" + "p" * 300
+    row = {"specs": specs, "url": url, "description": "d" * 500}
+    table = format_table(
+        [row], [1], {"specs": "specs", "url": "url", "description": "description"}, cell_limits={"description": 300}
+    )
+    _, specs_cell, url_cell, description_cell = table.splitlines()[1].split(" | ")
+    assert specs_cell.count("spec_") == 12 and not specs_cell.endswith("...")
+    assert url_cell == url
+    assert len(description_cell) == 300 and description_cell.endswith("...")
+
+
+async def test_only_failed_ids_are_retried_with_bounded_concurrency() -> None:
+    items = [{"name": f"product {i}"} for i in range(1, 11)]
+    calls: List[List[int]] = []
+    active = 0
+    peak = 0
+
+    async def fake_llm(prompt: str, max_tokens: int, temperature: float, schema: Dict[str, Any]) -> Dict[str, Any]:
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        ids = _ids_in(prompt)
+        calls.append(ids)
+        first_pass = len(calls) <= 4
+        results = []
+        for i in ids:
+            if first_pass and i == 3:
+                continue  # dropped
+            if first_pass and i == 7:
+                results.append({"id": i, "decision": "MAYBE", "score": 0.5})  # invalid enum
+                continue
+            results.append({"id": i, "decision": "ACCEPT", "score": i / 10})
+        return {"results": results}
+
+    outcome = await evaluate_batched(
+        items=items,
+        columns={"name": "name"},
+        result_fields=FIELDS,
+        render_prompt=lambda table: table,
+        batch_size=3,
+        concurrency=2,
+        llm_call=fake_llm,
+    )
+
+    assert sorted(outcome.results) == list(range(1, 11))
+    assert outcome.failed == []
+    assert outcome.calls == 6 and outcome.retried == 2
+    assert sorted(calls[:4]) == [[1, 2, 3], [4, 5, 6], [7, 8, 9], [10]]
+    # Retried alone (halved batch size), nothing else re-sent
+    assert sorted(calls[4:]) == [[3], [7]]
+    assert peak == 2
+
+
+async def test_persistent_failures_are_reported() -> None:
+    async def broken_llm(prompt: str, max_tokens: int, temperature: float, schema: Dict[str, Any]) -> Dict[str, Any]:
+        if "2 |" in prompt:
+            raise ValueError("unparseable response")
+        return {"results": [{"id": i, "decision": "REJECT", "score": 0.1} for i in _ids_in(prompt)]}
+
+    outcome = await evaluate_batched(
+        items=[{"name": "a"}, {"name": "b"}],
+        columns={"name": "name"},
+        result_fields=FIELDS,
+        render_prompt=lambda table: table,
+        batch_size=2,
+        max_retries=1,
+        llm_call=broken_llm,
+    )
+
+    assert outcome.failed == [2]
+    assert list(outcome.results) == [1]
+    assert outcome.calls == 3
@@ -0,0 +1,90 @@
+import asyncio
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, List
+
+from apps.services.tool_server.calibration_queue import CalibrationJob, CalibrationQueue
+from apps.services.tool_server.shared_state.site_schema_registry import SiteSchema, SiteSchemaRegistry
+
+
+class FakePage:
+    def __init__(self, url: str) -> None:
+        self.url = url
+        self.closed = False
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+def _registry(tmp_path: Path) -> SiteSchemaRegistry:
+    return SiteSchemaRegistry(schema_dir=tmp_path, auto_flush=False)
+
+
+async def test_busy_failing_sites_are_calibrated_first(tmp_path: Path) -> None:
+    registry = _registry(tmp_path)
+    healthy = SiteSchema(domain="healthy.com", page_type="listing", product_card_selector=".card")
+    healthy.successful_extractions = healthy.total_uses = 5
+    registry.save(healthy)
+    failing = SiteSchema(domain="failing.com", page_type="listing", product_card_selector=".card")
+    failing.failed_extractions = failing.total_uses = 5
+    registry.save(failing)
+    order: List[str] = []
+    gate = asyncio.Event()
+
+    async def calibrate(page: Any, url: str, page_type: str) -> Any:
+        await gate.wait()
+        order.append(url)
+        return SimpleNamespace(product_card_selector=".new", link_selector="a.title", price_selector=".price")
+
+    async def open_page(job: CalibrationJob) -> FakePage:
+        return FakePage(job.url)
+
+    queue = CalibrationQueue(registry=registry, calibrate=calibrate, open_page=open_page)
+    assert queue.request("blocker.com", "listing", "https://blocker.com/s") is True
+    await asyncio.sleep(0)  # worker picks up the first job and waits on the gate
+    for _ in range(20):
+        queue.note_request("popular.com")
+    queue.request("healthy.com", "listing", "https://healthy.com/s")
+    queue.request("failing.com", "listing", "https://failing.com/s")
+    queue.request("popular.com", "listing", "https://popular.com/s")
+    assert queue.request("popular.com", "listing", "https://popular.com/s") is True  # de-duplicated
+    assert queue.get_stats()["queued"] == 3
+
+    gate.set()
+    await queue.join()
+
+    assert order == ["https://blocker.com/s", "https://popular.com/s", "https://failing.com/s", "https://healthy.com/s"]
+    published = registry.get("popular.com", "listing")
+    assert published.product_card_selector == ".new" and published.product_link_selector == "a.title"
+    assert registry.get("healthy.com", "listing").version == 2
+    assert queue.get_stats()["completed"] == 4
+
+
+async def test_request_does_not_block_and_failures_back_off(tmp_path: Path) -> None:
+    registry = _registry(tmp_path)
+    pages: List[FakePage] = []
+    calls = 0
+
+    async def calibrate(page: Any, url: str, page_type: str) -> Any:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return None  # nothing found
+
+    async def open_page(job: CalibrationJob) -> FakePage:
+        pages.append(FakePage(job.url))
+        return pages[-1]
+
+    queue = CalibrationQueue(registry=registry, calibrate=calibrate, open_page=open_page, retry_after=60)
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    queue.request("shop.com", "listing", "https://shop.com/s")
+    assert loop.time() - started < 0.01
+    assert queue.is_pending("shop.com")
+
+    await queue.join()
+
+    assert calls == 1 and registry.get("shop.com", "listing") is None
+    assert all(p.closed for p in pages)
+    assert queue.request("shop.com", "listing", "https://shop.com/s") is False
+    assert queue.get_stats()["failed"] == 1 and not queue.is_pending("shop.com")
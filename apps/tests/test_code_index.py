@@ -0,0 +1,96 @@
+import os
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from apps.services.tool_server import code_index
+from apps.services.tool_server.code_index import RepoCodeIndex
+from apps.services.tool_server.file_operations_mcp import file_read_outline
+
+
+def _make_repo(root: Path) -> None:
+    (root / "pkg").mkdir()
+    (root / "pkg" / "__init__.py").write_text("")
+    (root / "pkg" / "util.py").write_text(
+        'import os\n\n\ndef helper():\n    """Help."""\n    return os.sep\n'
+    )
+    (root / "app.py").write_text(
+        "import json\nfrom pkg.util import helper\n\n\nclass App:\n"
+        '    """Main app."""\n\n    def run(self):\n        return helper()\n\n\ndef main():\n    App().run()\n'
+    )
+    subprocess.run(["git", "init", "-q"], cwd=root, check=True)
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    root = tmp_path / "repo"
+    root.mkdir()
+    _make_repo(root)
+    return root
+
+
+def test_index_symbols_imports_and_reverse_graph(repo: Path, tmp_path: Path) -> None:
+    index = RepoCodeIndex(str(repo), db_path=tmp_path / "index.db")
+    stats = index.refresh()
+    assert stats["parsed"] == 3
+
+    symbols = index.symbols("app.py")
+    assert [(s["type"], s["name"], s["line"], s["end_line"]) for s in symbols] == [
+        ("class", "App", 5, 11),
+        ("function", "run", 8, 11),
+        ("function", "main", 12, 13),
+    ]
+    assert symbols[0]["docstring"] == "Main app."
+
+    assert index.imports(["app.py"]) == {"app.py": ["json", "pkg"]}
+    assert index.importers("pkg/util.py") == ["app.py"]
+    assert index.file_info(["app.py"])["app.py"]["lines"] == 13
+
+
+def test_refresh_only_reparses_changed_files(repo: Path, tmp_path: Path) -> None:
+    index = RepoCodeIndex(str(repo), db_path=tmp_path / "index.db")
+    index.refresh()
+
+    assert index.refresh()["parsed"] == 0
+
+    # Touched but identical content is re-stamped, not re-parsed
+    util = repo / "pkg" / "util.py"
+    os.utime(util, (util.stat().st_atime, util.stat().st_mtime + 10))
+    assert index.refresh() == {"checked": 3, "parsed": 0, "unchanged": 1, "removed": 0}
+
+    util.write_text("def other():\n    pass\n")
+    (repo / "app.py").unlink()
+    stats = index.refresh()
+    assert stats["parsed"] == 1 and stats["removed"] == 1
+    assert [s["name"] for s in index.symbols("pkg/util.py")] == ["other"]
+    assert index.importers("pkg/util.py") == []
+
+    # Persistent across instances
+    index.close()
+    reopened = RepoCodeIndex(str(repo), db_path=tmp_path / "index.db")
+    assert reopened.stats() == {"files": 2, "symbols": 1}
+
+
+async def test_read_outline_uses_index(repo: Path, tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(code_index, "INDEX_DIR", tmp_path / "indexes")
+    monkeypatch.setattr(code_index, "_indexes", {})
+
+    result = await file_read_outline(str(repo / "app.py"), include_docstrings=False)
+    assert [s["name"] for s in result["symbols"]] == ["App", "run", "main"]
+    assert all(s["docstring"] is None for s in result["symbols"])
+    assert result["file_info"]["lines"] == 13
+    assert code_index.get_code_index(str(repo)).stats()["files"] == 1
+
+
+async def test_scope_summaries_fall_back_for_files_the_index_skips(repo: Path, tmp_path: Path, monkeypatch) -> None:
+    from apps.services.tool_server.repo_scope_mcp import RepoScopeAnalyzer
+
+    monkeypatch.setattr(code_index, "INDEX_DIR", tmp_path / "indexes")
+    monkeypatch.setattr(code_index, "_indexes", {})
+    monkeypatch.setattr(code_index, "MAX_FILE_BYTES", 64)
+    (repo / "big.py").write_text("VALUE = 1\n" * 20)
+
+    summaries = await RepoScopeAnalyzer(str(repo))._summarize_files(["app.py", "big.py"])
+    assert summaries["app.py"]["lines"] == 13
+    assert summaries["big.py"] == {"lines": 20, "size_kb": 0, "language": "python"}
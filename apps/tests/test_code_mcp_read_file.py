@@ -0,0 +1,55 @@
+import hashlib
+import os
+from pathlib import Path
+
+from apps.services.tool_server import code_mcp
+
+
+def _old_read(path: Path) -> tuple:
+    with open(path, "r", encoding="utf-8", errors="replace") as f:
+        content = f.read()
+    return content.splitlines(), hashlib.sha256(content.encode("utf-8")).hexdigest()[:16]
+
+
+def _text(result: dict) -> list:
+    return [line.split("\t", 1)[1] for line in result["lines"]]
+
+
+def test_ranged_read_matches_full_split(tmp_path: Path) -> None:
+    path = tmp_path / "big.log"
+    path.write_bytes(b"".join(f"line {i}\r\n".encode() for i in range(5000)) + b"caf\xc3\xa9 \xff tail")
+    expected_lines, expected_digest = _old_read(path)
+
+    result = code_mcp.read_file(str(path), offset=4998, limit=5)
+    assert _text(result) == expected_lines[4998:5003]
+    assert result["total_lines"] == len(expected_lines) == 5001
+    assert result["digest"] == expected_digest
+    assert result["lines"][0].startswith("  4999\t")
+
+    assert code_mcp.read_file(str(path), offset=6000)["lines"] == []
+
+
+def test_unusual_line_breaks_keep_splitlines_numbering(tmp_path: Path) -> None:
+    path = tmp_path / "odd.txt"
+    path.write_bytes(b"a\x0cb\rc\nd\n")
+    expected_lines, expected_digest = _old_read(path)
+
+    result = code_mcp.read_file(str(path))
+    assert _text(result) == expected_lines == ["a", "b", "c", "d"]
+    assert result["digest"] == expected_digest
+
+
+def test_line_index_is_reused_until_file_changes(tmp_path: Path) -> None:
+    path = tmp_path / "gen.py"
+    path.write_text("one\ntwo\nthree\n")
+
+    code_mcp.read_file(str(path), offset=0, limit=1)
+    index = code_mcp._line_indexes[str(path.resolve())]
+    code_mcp.read_file(str(path), offset=2, limit=1)
+    assert code_mcp._line_indexes[str(path.resolve())] is index
+
+    path.write_text("one\ntwo\nthree\nfour\n")
+    os.utime(path, ns=(path.stat().st_atime_ns, path.stat().st_mtime_ns + 1_000_000))
+    result = code_mcp.read_file(str(path), offset=3, limit=1)
+    assert _text(result) == ["four"]
+    assert code_mcp._line_indexes[str(path.resolve())] is not index
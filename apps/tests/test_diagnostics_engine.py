@@ -0,0 +1,196 @@
+import os
+import stat
+from pathlib import Path
+
+import pytest
+
+from apps.services.tool_server import code_verify_mcp, diagnostics_engine
+from apps.services.tool_server.diagnostics_engine import DiagnosticsEngine
+
+
+@pytest.fixture
+def engine(tmp_path: Path) -> DiagnosticsEngine:
+    return DiagnosticsEngine(db_path=tmp_path / "diagnostics.db", batch_size=10)
+
+
+def _write_files(repo: Path, count: int) -> list:
+    repo.mkdir(exist_ok=True)
+    names = []
+    for i in range(count):
+        (repo / f"mod_{i}.py").write_text(f"VALUE = {i}\n")
+        names.append(f"mod_{i}.py")
+    return names
+
+
+def test_syntax_results_are_cached_per_content(engine: DiagnosticsEngine, tmp_path: Path) -> None:
+    repo = tmp_path / "repo"
+    files = _write_files(repo, 60)
+    (repo / "broken.py").write_text("def f(:\n")
+    files.append("broken.py")
+
+    first = engine.check(str(repo), files)
+    assert first["files_checked"] == 61  # no 50-file cap
+    assert first["files_changed"] == 61
+    assert first["total_errors"] == 1
+
+    second = engine.check(str(repo), files)
+    assert second["files_changed"] == 0
+    assert second["cache_hits"] == 61
+    assert second["total_errors"] == 1
+
+    (repo / "broken.py").write_text("def f():\n    pass\n")
+    third = engine.check(str(repo), files, changed_only=True)
+    assert [r["file_path"] for r in third["results"]] == [str((repo / "broken.py").resolve())]
+    assert third["results"][0]["valid"] and not third["results"][0]["cached"]
+    assert third["total_errors"] == 0
+
+
+def test_linters_run_once_per_batch(engine: DiagnosticsEngine, tmp_path: Path, monkeypatch) -> None:
+    # Minimal flake8 stand-in: flags any file containing "bad", logs each invocation
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    calls = tmp_path / "calls.log"
+    fake = bin_dir / "flake8"
+    fake.write_text(
+        "#!/usr/bin/env python3\n"
+        "import sys\n"
+        "if '--version' in sys.argv:\n"
+        "    print('7.0.0'); sys.exit(0)\n"
+        f"open({str(calls)!r}, 'a').write('call\\n')\n"
+        "for path in [a for a in sys.argv[1:] if a.endswith('.py')]:\n"
+        "    if 'bad' in open(path).read():\n"
+        "        print(f'{path}:1:1: E999 bad token')\n"
+    )
+    fake.chmod(fake.stat().st_mode | stat.S_IEXEC)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    diagnostics_engine.tool_version.cache_clear()
+
+    repo = tmp_path / "repo"
+    files = _write_files(repo, 25)
+    (repo / "mod_3.py").write_text("bad = 1\n")
+
+    result = engine.check(str(repo), files, tools=["flake8"])
+    assert calls.read_text().count("call") == 3  # 25 files / batches of 10
+    flagged = [r for r in result["results"] if r["error_count"]]
+    assert [Path(r["file_path"]).name for r in flagged] == ["mod_3.py"]
+    assert flagged[0]["diagnostics"][0]["rule"] == "E999"
+
+    (repo / "mod_7.py").write_text("bad = 2\n")
+    result = engine.check(str(repo), files, tools=["flake8"], changed_only=True)
+    assert calls.read_text().count("call") == 4
+    assert result["files_changed"] == 1 and result["total_errors"] == 1
+
+    # Different args are a different cache key
+    engine.check(str(repo), files, tools=["flake8"], extra_args={"flake8": ["--max-line-length=120"]})
+    assert calls.read_text().count("call") == 7
+
+    # So is an auto-discovered config file, without passing --config
+    (repo / "setup.cfg").write_text("[flake8]\nmax-line-length = 100\n")
+    engine.check(str(repo), files, tools=["flake8"])
+    assert calls.read_text().count("call") == 10
+
+    # Same relative paths in another repo neither hit nor evict this repo's entries
+    other = tmp_path / "other"
+    _write_files(other, 25)
+    engine.check(str(other), files, tools=["flake8"])
+    assert calls.read_text().count("call") == 13
+    result = engine.check(str(repo), files, tools=["flake8"])
+    assert calls.read_text().count("call") == 13 and result["cache_hits"] == 25
+    diagnostics_engine.tool_version.cache_clear()
+
+
+def _install_fake_flake8(tmp_path: Path, monkeypatch, body: str) -> Path:
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir(exist_ok=True)
+    calls = tmp_path / "calls.log"
+    fake = bin_dir / "flake8"
+    fake.write_text(
+        "#!/usr/bin/env python3\n"
+        "import sys\n"
+        "if '--version' in sys.argv:\n"
+        "    print('7.0.0'); sys.exit(0)\n"
+        f"open({str(calls)!r}, 'a').write('call\\n')\n" + body
+    )
+    fake.chmod(fake.stat().st_mode | stat.S_IEXEC)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    diagnostics_engine.tool_version.cache_clear()
+    return calls
+
+
+async def test_crashed_linter_batches_fail_and_are_not_cached(
+    engine: DiagnosticsEngine, tmp_path: Path, monkeypatch
+) -> None:
+    calls = _install_fake_flake8(
+        tmp_path, monkeypatch, "print('flake8: error: unrecognized arguments', file=sys.stderr)\nsys.exit(2)\n"
+    )
+    repo = tmp_path / "repo"
+    files = _write_files(repo, 3)
+
+    result = engine.check(str(repo), files, tools=["flake8"])
+    assert all(not r["valid"] and "exit code 2" in r["error"] for r in result["results"])
+    assert "unrecognized arguments" in result["results"][0]["error"]
+
+    # Crashing with no output is a failure too, even with the "issues found" code
+    _install_fake_flake8(tmp_path, monkeypatch, "raise SystemExit(1)\n")
+    result = engine.check(str(repo), files, tools=["flake8"])
+    assert all(not r["valid"] for r in result["results"])
+    assert calls.read_text().count("call") == 2
+
+    # Nothing was cached, so a working linter re-checks every file
+    _install_fake_flake8(tmp_path, monkeypatch, "")
+    result = engine.check(str(repo), files, tools=["flake8"])
+    assert calls.read_text().count("call") == 3
+    assert result["cache_hits"] == 0 and all(r["valid"] for r in result["results"])
+
+    # code_verify_suite reports unlinted files as an error, not a pass
+    _install_fake_flake8(tmp_path, monkeypatch, "sys.exit(3)\n")
+    monkeypatch.setattr(diagnostics_engine, "_engine", engine)
+    lint = await code_verify_mcp._run_linter(".", str(repo), timeout=30)
+    assert lint["status"] == "error" and lint["files_failed"] == 3
+    diagnostics_engine.tool_version.cache_clear()
+
+
+async def test_absolute_and_dot_prefixed_targets_keep_their_diagnostics(
+    engine: DiagnosticsEngine, tmp_path: Path, monkeypatch
+) -> None:
+    # Report paths as absolute, like flake8 does for absolute arguments
+    _install_fake_flake8(
+        tmp_path, monkeypatch,
+        "import os\n"
+        "for path in [a for a in sys.argv[1:] if a.endswith('.py')]:\n"
+        "    if 'import os' in open(path).read():\n"
+        "        print(f\"{os.path.abspath(path)}:1:1: F401 'os' imported but unused\")\n"
+        "        sys.exit(1)\n"
+    )
+    monkeypatch.setattr(diagnostics_engine, "_engine", engine)
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    (repo / "a.py").write_text("import os\n")
+
+    for target in (str(repo / "a.py"), "./a.py", "a.py"):
+        lint = await code_verify_mcp._run_linter(target, str(repo), timeout=30)
+        assert lint["status"] == "warnings" and lint["issues"] == 1, target
+        assert lint["details"] == ["a.py:1:1: F401 'os' imported but unused"]
+
+    result = engine.check(str(repo), [str(repo / "a.py"), "./a.py"], tools=["flake8"])
+    assert result["files_checked"] == 1 and len(result["results"][0]["diagnostics"]) == 1
+    diagnostics_engine.tool_version.cache_clear()
+
+
+def test_flake8_excludes_follow_repo_config(tmp_path: Path) -> None:
+    assert diagnostics_engine.is_excluded("pkg/__pycache__/x.py", diagnostics_engine.flake8_excludes(str(tmp_path)))
+
+    (tmp_path / "tox.ini").write_text("[flake8]\nextend-exclude =\n    vendor/,\n    build_*\n")
+    excludes = diagnostics_engine.flake8_excludes(str(tmp_path))
+    assert diagnostics_engine.is_excluded("vendor/lib/six.py", excludes)
+    assert diagnostics_engine.is_excluded("src/build_tmp/gen.py", excludes)
+    assert diagnostics_engine.is_excluded(".git/hooks/x.py", excludes)
+    assert not diagnostics_engine.is_excluded("src/app/vendor_utils.py", excludes)
+
+
+def test_missing_linter_is_skipped(engine: DiagnosticsEngine, tmp_path: Path) -> None:
+    repo = tmp_path / "repo"
+    files = _write_files(repo, 2)
+    result = engine.check(str(repo), files, tools=["syntax", "nonexistent"])
+    assert result["skipped_tools"] == {"nonexistent": "unsupported"}
+    assert result["files_checked"] == 2
@@ -0,0 +1,79 @@
+import asyncio
+from pathlib import Path
+from typing import Dict
+
+from apps.services.tool_server.domain_concurrency import DomainConcurrencyController
+from apps.services.tool_server.shared_state.vendor_registry import VendorRegistry
+
+
+def test_window_grows_additively_and_halves_on_throttle() -> None:
+    ctl = DomainConcurrencyController(max_limit=4, base_cooldown=0.0)
+    for _ in range(6):
+        ctl.record_success("https://www.fast.com/p/1", latency_seconds=0.5)
+    assert ctl.get_limit("fast.com") == 4
+
+    ctl.record_throttle("fast.com", "429")
+    assert ctl.get_limit("fast.com") == 2
+    # Slow responses don't grow the window
+    for _ in range(5):
+        ctl.record_success("fast.com", latency_seconds=5.0)
+    assert ctl.get_limit("fast.com") == 2
+
+    ctl.record_fetch("fast.com", {"success": False, "status": 200, "blocked": True, "block_type": "captcha"})
+    assert ctl.get_limit("fast.com") == 1
+    assert ctl.get_stats()["fast.com"]["throttles"] == 2
+    # Other domains are unaffected
+    assert ctl.get_limit("other.com") == 1
+
+
+async def test_each_domain_is_bounded_by_its_own_window() -> None:
+    ctl = DomainConcurrencyController(max_limit=3)
+    for _ in range(10):
+        ctl.record_success("fast.com", latency_seconds=0.1)
+    active: Dict[str, int] = {"fast.com": 0, "fragile.com": 0}
+    peak = dict(active)
+
+    async def fetch(domain: str) -> None:
+        async with ctl.slot(domain):
+            active[domain] += 1
+            peak[domain] = max(peak[domain], active[domain])
+            await asyncio.sleep(0.01)
+            active[domain] -= 1
+
+    await asyncio.gather(*(fetch(d) for d in ["fast.com", "fragile.com"] * 6))
+
+    assert peak == {"fast.com": 3, "fragile.com": 1}
+    assert ctl.get_stats()["fast.com"]["in_flight"] == 0
+
+
+async def test_cooldown_and_vendor_registry_blocks(tmp_path: Path) -> None:
+    ctl = DomainConcurrencyController(base_cooldown=0.05)
+    registry = VendorRegistry(registry_file=tmp_path / "vendors.jsonl", auto_flush=False)
+    ctl.attach_vendor_registry(registry)
+    for _ in range(2):
+        ctl.record_success("shop.com", latency_seconds=0.1)
+    assert ctl.get_limit("shop.com") == 2
+
+    registry.record_visit("www.shop.com", success=False, blocked=True, block_type="cloudflare")
+    assert ctl.get_limit("shop.com") == 1
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    async with ctl.slot("shop.com"):
+        pass
+    assert loop.time() - started >= 0.04
+
+
+async def test_waiter_cancelled_after_wake_passes_slot_on() -> None:
+    ctl = DomainConcurrencyController()
+    await ctl.acquire("shop.com")
+    first = asyncio.create_task(ctl.acquire("shop.com"))
+    second = asyncio.create_task(ctl.acquire("shop.com"))
+    await asyncio.sleep(0)  # both waiting
+
+    ctl.release("shop.com")  # wakes `first`...
+    first.cancel()           # ...which is cancelled before it resumes
+    await asyncio.wait_for(second, timeout=1)
+
+    assert first.cancelled()
+    assert ctl.get_stats()["shop.com"]["in_flight"] == 1
@@ -0,0 +1,38 @@
+from libs.gateway.knowledge.entity_extractor import EntityExtractor
+
+
+SAMPLE = (
+    'We found Syrian hamsters from Example Pet Store for $75. Check petco.com or visit '
+    'https://www.example.com/hamsters. "Best hamster cage for beginners thread" Looking for a '
+    'dwarf hamster online. Hamsters for sale at Happy Paws Hamstery, 30 dollars. Prices run '
+    '$20 - $30. Acme Inc is highly rated. The discussion on reddit.com covers it.'
+)
+
+
+def test_anchored_scan_matches_full_regex_scan() -> None:
+    extractor = EntityExtractor()
+    compiled = (
+        extractor._compiled_vendor
+        + extractor._compiled_price
+        + extractor._compiled_site
+        + extractor._compiled_product
+        + extractor._compiled_thread
+    )
+    scanned = [matches for family in extractor._scan(SAMPLE) for matches in family]
+
+    assert len(scanned) == len(compiled)
+    for (pattern, _), matches in zip(compiled, scanned):
+        assert [m.span() for m in matches] == [m.span() for m in pattern.finditer(SAMPLE)], pattern.pattern
+
+
+def test_extract_from_text_finds_each_entity_type() -> None:
+    entities = EntityExtractor().extract_from_text(SAMPLE)
+    found = {(e.entity_type, e.canonical_name) for e in entities}
+
+    assert ("vendor", "Acme Inc") in found
+    assert ("price", "$75") in found
+    assert ("price", "$20-$30") in found
+    assert ("site", "petco.com") in found
+    assert ("site", "www.example.com") in found
+    assert ("product", "Dwarf Hamster") in found
+    assert ("thread", "Best hamster cage for beginners thread") in found
@@ -0,0 +1,80 @@
+import asyncio
+from typing import Any, Dict, List
+
+import pytest
+
+from apps.services.tool_server import hedged_search as hs
+from apps.services.tool_server.search_engine_health import SearchEngineHealthTracker
+
+
+def _results(prefix: str, n: int = 5) -> List[Dict[str, Any]]:
+    return [{"url": f"https://{prefix}.com/{i}", "title": f"{prefix} {i}", "position": i + 1} for i in range(n)]
+
+
+def _engine(delay: float, results: List[Dict[str, Any]], log: List[str], name: str):
+    async def search(query: str, max_results: int = 10, **kwargs: Any) -> List[Dict[str, Any]]:
+        log.append(f"start:{name}")
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            log.append(f"cancel:{name}")
+            raise
+        return results
+    return search
+
+
+@pytest.fixture
+def health(monkeypatch: pytest.MonkeyPatch) -> SearchEngineHealthTracker:
+    tracker = SearchEngineHealthTracker()
+    monkeypatch.setattr(hs, "get_engine_health_tracker", lambda: tracker)
+    return tracker
+
+
+async def test_slow_engine_is_hedged_and_cancelled(health: SearchEngineHealthTracker) -> None:
+    # Real hedge delays are seconds; shrink it for the test
+    health.get_hedge_delay = lambda name, **kw: 0.05
+    log: List[str] = []
+    engines = [
+        ("DuckDuckGo", _engine(5.0, _results("ddg"), log, "DuckDuckGo")),
+        ("Google", _engine(0.01, _results("google"), log, "Google")),
+        ("Brave", _engine(0.01, _results("brave"), log, "Brave")),
+    ]
+
+    winner, results, good = await hs.hedged_search("hamster cages", engines)
+
+    assert winner == "Google"
+    assert results[0]["url"] == "https://google.com/0"
+    assert log == ["start:DuckDuckGo", "start:Google", "cancel:DuckDuckGo"]
+    assert health.engines["Google"].latency_avg is not None
+
+
+async def test_bad_result_falls_back_immediately_and_merge_dedupes(health: SearchEngineHealthTracker) -> None:
+    log: List[str] = []
+    shared = _results("shared", 2)
+    engines = [
+        ("DuckDuckGo", _engine(0.0, [], log, "DuckDuckGo")),
+        ("Google", _engine(0.03, shared + _results("google", 3), log, "Google")),
+        ("Brave", _engine(0.04, [{**shared[0], "url": "https://www.shared.com/0/"}] + _results("brave", 3), log, "Brave")),
+    ]
+    health.get_hedge_delay = lambda name, **kw: 0.01
+
+    winner, results, good = await hs.hedged_search("hamster cages", engines, merge=True, max_results=8)
+
+    assert winner == "Google"
+    # Brave was hedged in while Google ran and finished within the merge grace period
+    assert log == ["start:DuckDuckGo", "start:Google", "start:Brave"]
+    assert set(good) == {"Google", "Brave"}
+    urls = [r["url"] for r in results]
+    assert len(urls) == 8 and urls.count("https://shared.com/0") == 1
+    assert [r["position"] for r in results] == list(range(1, 9))
+
+
+def test_hedge_delay_tracks_latency_and_reliability() -> None:
+    tracker = SearchEngineHealthTracker()
+    assert tracker.get_hedge_delay("Google") == 8.0
+    for _ in range(20):
+        tracker.report_success("Google", latency_seconds=6.0)
+    assert tracker.get_hedge_delay("Google") == pytest.approx(6.0, abs=0.5)
+    tracker.report_failure("Google")
+    tracker.report_failure("Google")
+    assert tracker.get_hedge_delay("Google") < 6.0
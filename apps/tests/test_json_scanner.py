@@ -0,0 +1,92 @@
+from libs.gateway.parsing.forgiving_parser import ForgivingParser
+from libs.gateway.parsing.json_scanner import StreamingJSONScanner, scan_json
+
+
+def test_repairs_common_llm_errors_in_one_pass() -> None:
+    raw = """Here is the plan:
+```json
+{route_to: 'executor', // pick executor
+ "steps": [{"tool": "internet.research", "args": {"query": "a, b"}},],
+ "ok": True "notes": None,
+}
+```"""
+    result = scan_json(raw)
+    assert result.value == {
+        "route_to": "executor",
+        "steps": [{"tool": "internet.research", "args": {"query": "a, b"}}],
+        "ok": True,
+        "notes": None,
+    }
+    assert result.complete
+    assert set(result.repairs) == {
+        "unquoted_keys", "single_quotes", "comments", "trailing_commas",
+        "python_literals", "missing_commas",
+    }
+
+
+def test_truncated_output_keeps_closed_values() -> None:
+    result = scan_json('{"decision": "RETRY", "issues": ["price missing", "url bro')
+    assert not result.complete
+    assert result.value == {"decision": "RETRY", "issues": ["price missing", "url bro"]}
+
+
+def test_truncated_fenced_output_stops_at_closing_fence() -> None:
+    assert ForgivingParser().parse('```\n{"a": [1, 2,\n```').data == {"a": [1, 2]}
+
+    result = scan_json('```json\n{"a": 1, "b": {"c": 2,\n  ```\nHope this helps')
+    assert not result.complete
+    assert result.value == {"a": 1, "b": {"c": 2}}
+    # A fence inside a line is still data
+    assert scan_json('{"a": 1, "b": x```y}').value == {"a": 1, "b": "x```y"}
+
+
+def test_prefers_objects_and_ignores_prose_brackets() -> None:
+    assert scan_json('See [1] and {"a": 1}').value == {"a": 1}
+    assert scan_json('Result: [{"a": 1}, {"b": 2}]').value == [{"a": 1}, {"b": 2}]
+    assert scan_json("no json here") is None
+
+
+def test_forgiving_parser_reports_repairs() -> None:
+    schema = {"decision": {"type": "string", "default": "PROCEED"}}
+    direct = ForgivingParser().parse('{"decision": "CLARIFY"}', schema)
+    assert direct.strategy_used == "json_direct"
+
+    repaired = ForgivingParser().parse("{decision: 'CLARIFY',}", schema)
+    assert repaired.strategy_used == "json_repaired"
+    assert repaired.data == {"decision": "CLARIFY"}
+
+    prose = ForgivingParser().parse("I think [citation needed] we should CLARIFY. decision: CLARIFY", schema)
+    assert prose.strategy_used == "semantic"
+
+
+def test_truncated_brace_in_prose_falls_back_to_semantic_extraction() -> None:
+    schema = {"decision": {"type": "string", "default": "CLARIFY"}}
+    prose = ForgivingParser().parse("decision: APPROVE\nNote: use {", schema)
+    assert prose.strategy_used == "semantic"
+    assert prose.data["decision"] == "APPROVE"
+
+    fenced = ForgivingParser().parse('```json\n{"decision": "APPROVE", "reason": "ok', schema)
+    assert fenced.strategy_used == "json_repaired"
+    assert fenced.data["decision"] == "APPROVE"
+
+
+def test_streaming_reports_fields_as_they_close() -> None:
+    text = (
+        'Plan:\n{"route_to": "executor", "steps": [{"tool": "a", "args": {"q": "x,y]"}}, {"tool": "b"}],'
+        ' "reasoning": "don\'t wait for this'
+    )
+    scanner = StreamingJSONScanner()
+    seen = []
+    for i in range(0, len(text), 5):
+        seen.extend((key, i + 5) for key, _ in scanner.feed(text[i:i + 5]))
+
+    steps_closed_at = dict(seen)["steps"]
+    assert [key for key, _ in seen] == ["route_to", "steps"]
+    assert steps_closed_at <= text.index('"reasoning"') + 5
+    assert scanner.fields["steps"][0]["args"] == {"q": "x,y]"}
+    assert not scanner.done
+    assert scanner.snapshot().value["reasoning"] == "don't wait for this"
+
+    scanner.feed('"}')
+    assert scanner.done
+    assert scanner.fields["reasoning"] == "don't wait for this"
@@ -0,0 +1,171 @@
+from pathlib import Path
+
+import pytest
+
+from libs.gateway.knowledge import knowledge_graph_db
+from libs.gateway.knowledge.knowledge_graph_db import KnowledgeGraphDB
+
+
+@pytest.fixture
+def kg(tmp_path: Path) -> KnowledgeGraphDB:
+    # Connections are cached per thread, so drop any left over from another db
+    knowledge_graph_db._local.knowledge_graph_connection = None
+    yield KnowledgeGraphDB(tmp_path / "kg.db")
+    knowledge_graph_db._local.knowledge_graph_connection = None
+
+
+def test_ingest_batch_creates_entities_relationships_and_mentions(kg: KnowledgeGraphDB) -> None:
+    ids = kg.ingest_batch(
+        entities=[
+            {"entity_type": "vendor", "canonical_name": "Example Pet Store", "aliases": ["example-petstore"],
+             "data": {"location": "TX"}, "turn_number": 3, "confidence": 0.8},
+            {"entity_type": "product", "canonical_name": "Syrian Hamster", "turn_number": 3},
+        ],
+        relationships=[
+            {"source": ("vendor", "Example Pet Store"), "target": ("product", "Syrian Hamster"),
+             "relationship_type": "sells", "confidence": 0.9, "turn": 3},
+        ],
+        mentions=[
+            {"entity": ("vendor", "Example Pet Store"), "document_path": "turn_3", "turn_number": 3,
+             "context": "buy from Example Pet Store"},
+        ],
+    )
+
+    vendor_id = ids[("vendor", "Example Pet Store")]
+    product_id = ids[("product", "Syrian Hamster")]
+    vendor = kg.get_entity(vendor_id)
+    assert vendor.aliases == ["example-petstore"]
+    assert vendor.entity_data == {"location": "TX"}
+
+    sellers = kg.get_related_entities(product_id, "sells", direction="incoming")
+    assert [e.id for e in sellers] == [vendor_id]
+    assert len(kg.get_entity_mentions(vendor_id)) == 1
+
+
+def test_ingest_batch_merges_with_existing_rows(kg: KnowledgeGraphDB) -> None:
+    vendor_id = kg.add_entity("vendor", "Example Pet Store", aliases=["a"], data={"url": "https://x"},
+                              turn_number=1, confidence=0.9)
+    product_id = kg.add_entity("product", "Syrian Hamster", turn_number=1)
+    kg.add_relationship(vendor_id, product_id, "sells", confidence=0.4, weight=1.0, turn=1)
+
+    ids = kg.ingest_batch(
+        entities=[
+            {"entity_type": "vendor", "canonical_name": "Example Pet Store", "aliases": ["b"],
+             "data": {"location": "TX"}, "turn_number": 5, "confidence": 0.5},
+            {"entity_type": "vendor", "canonical_name": "Example Pet Store", "aliases": ["a", "c"],
+             "turn_number": 4},
+        ],
+        relationships=[
+            {"source": vendor_id, "target": product_id, "relationship_type": "sells",
+             "confidence": 0.7, "weight": 2.0, "turn": 5},
+        ],
+    )
+
+    assert ids[("vendor", "Example Pet Store")] == vendor_id
+    vendor = kg.get_entity(vendor_id)
+    assert sorted(vendor.aliases) == ["a", "b", "c"]
+    assert vendor.entity_data == {"url": "https://x", "location": "TX"}
+    assert vendor.first_seen_turn == 1
+    assert vendor.last_seen_turn == 5
+    assert vendor.confidence == 0.9
+
+    [rel] = kg.get_relationships(vendor_id, "sells")
+    assert rel.confidence == 0.7
+    assert rel.weight == 3.0
+    assert rel.source_turn == 5
+
+
+def test_ingest_batch_matches_case_variants_and_aliases(kg: KnowledgeGraphDB) -> None:
+    product_id = kg.add_entity("product", "syrian hamster", turn_number=1)
+    vendor_id = kg.add_entity("vendor", "Example Pet Store", aliases=["example-petstore"], turn_number=1)
+
+    ids = kg.ingest_batch(
+        entities=[
+            {"entity_type": "product", "canonical_name": "Syrian Hamster", "aliases": ["golden hamster"],
+             "turn_number": 2},
+            {"entity_type": "vendor", "canonical_name": "Example-PetStore", "data": {"location": "TX"},
+             "turn_number": 2},
+            {"entity_type": "product", "canonical_name": "Dwarf Hamster", "turn_number": 2},
+            {"entity_type": "product", "canonical_name": "dwarf hamster", "turn_number": 2},
+        ],
+        mentions=[
+            {"entity": ("vendor", "example-petstore"), "document_path": "turn_2", "turn_number": 2},
+        ],
+    )
+
+    assert ids[("product", "Syrian Hamster")] == product_id
+    assert ids[("vendor", "Example-PetStore")] == vendor_id
+    assert ids[("vendor", "example-petstore")] == vendor_id
+    assert ids[("product", "Dwarf Hamster")] == ids[("product", "dwarf hamster")]
+    assert kg.get_stats()["entity_types"] == {"product": 2, "vendor": 1}
+
+    product = kg.get_entity(product_id)
+    assert product.canonical_name == "syrian hamster"
+    assert product.aliases == ["golden hamster"]
+    assert product.last_seen_turn == 2
+    assert kg.get_entity(vendor_id).entity_data == {"location": "TX"}
+    assert len(kg.get_entity_mentions(vendor_id)) == 1
+
+    # Aliases added by the batch are matched next time
+    assert kg.ingest_batch(
+        entities=[{"entity_type": "product", "canonical_name": "Golden Hamster"}]
+    )[("product", "Golden Hamster")] == product_id
+
+
+def test_ingest_batch_is_atomic(kg: KnowledgeGraphDB) -> None:
+    with pytest.raises(KeyError):
+        kg.ingest_batch(
+            entities=[{"entity_type": "vendor", "canonical_name": "Example Pet Store"}],
+            mentions=[{"entity": ("vendor", "Example Pet Store"), "turn_number": 1}],
+        )
+
+    assert kg.find_entity("Example Pet Store", "vendor") is None
+
+
+def _build_chain(kg: KnowledgeGraphDB) -> dict:
+    ids = kg.ingest_batch(
+        entities=[
+            {"entity_type": "vendor", "canonical_name": "Example Pet Store"},
+            {"entity_type": "product", "canonical_name": "Syrian Hamster"},
+            {"entity_type": "thread", "canonical_name": "Best hamster breeders"},
+            {"entity_type": "vendor", "canonical_name": "Other Store"},
+        ],
+        relationships=[
+            {"source": ("vendor", "Example Pet Store"), "target": ("product", "Syrian Hamster"),
+             "relationship_type": "sells"},
+            {"source": ("product", "Syrian Hamster"), "target": ("thread", "Best hamster breeders"),
+             "relationship_type": "mentioned_in"},
+            {"source": ("vendor", "Example Pet Store"), "target": ("vendor", "Other Store"),
+             "relationship_type": "competes_with"},
+        ],
+    )
+    return {name: entity_id for (_, name), entity_id in ids.items()}
+
+
+@pytest.mark.parametrize("adjacency_cache", [False, True])
+def test_traverse_walks_multiple_hops(tmp_path: Path, adjacency_cache: bool) -> None:
+    knowledge_graph_db._local.knowledge_graph_connection = None
+    kg = KnowledgeGraphDB(tmp_path / "kg.db", adjacency_cache=adjacency_cache)
+    ids = _build_chain(kg)
+    vendor_id = ids["Example Pet Store"]
+
+    subgraph = kg.traverse(vendor_id, max_depth=2, relationship_types=["sells", "mentioned_in"])
+    assert {node_id: node["depth"] for node_id, node in subgraph.nodes.items()} == {
+        vendor_id: 0,
+        ids["Syrian Hamster"]: 1,
+        ids["Best hamster breeders"]: 2,
+    }
+    assert sorted(subgraph.neighbors(ids["Syrian Hamster"])) == sorted([vendor_id, ids["Best hamster breeders"]])
+    assert len(subgraph.edges) == 2
+
+    # Depth and direction limits
+    assert set(kg.traverse(vendor_id, max_depth=1).nodes) == {vendor_id, ids["Syrian Hamster"], ids["Other Store"]}
+    incoming = kg.traverse(ids["Best hamster breeders"], max_depth=3, direction="incoming")
+    assert set(incoming.nodes) == {ids["Best hamster breeders"], ids["Syrian Hamster"], vendor_id}
+    assert len(kg.traverse(vendor_id, max_depth=3, limit=2).nodes) == 2
+
+    # Writes invalidate the cached adjacency list
+    kg.add_relationship(ids["Other Store"], ids["Syrian Hamster"], "sells")
+    other = kg.traverse(ids["Other Store"], max_depth=1, relationship_types=["sells"], direction="outgoing")
+    assert set(other.nodes) == {ids["Other Store"], ids["Syrian Hamster"]}
+    knowledge_graph_db._local.knowledge_graph_connection = None
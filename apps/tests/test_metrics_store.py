@@ -0,0 +1,103 @@
+import random
+import threading
+import time
+from pathlib import Path
+
+from libs.core.metrics_store import HOUR, MINUTE, MetricsStore, StreamingHistogram
+
+
+def test_histogram_quantiles_within_relative_error() -> None:
+    rng = random.Random(7)
+    values = [rng.lognormvariate(5, 1) for _ in range(20000)]
+    hist = StreamingHistogram()
+    for value in values:
+        hist.add(value)
+
+    ordered = sorted(values)
+    for q in (0.5, 0.95, 0.99):
+        exact = ordered[int(q * (len(ordered) - 1))]
+        assert abs(hist.quantile(q) - exact) / exact < 0.03
+
+    restored = StreamingHistogram.from_dict(hist.to_dict())
+    assert restored.count == hist.count
+    assert restored.quantile(0.95) == hist.quantile(0.95)
+
+
+def test_rollups_persist_across_instances(tmp_path: Path) -> None:
+    db = tmp_path / "metrics.db"
+    store = MetricsStore(db_path=db, auto_flush=False)
+    for i in range(1, 101):
+        store.record("tool", "internet.research", {"latency_ms": i * 10, "tokens_out": 50}, success=i % 10 != 0)
+    store.record("phase", "planner", {"latency_ms": 800})
+    store.flush(include_current=True)
+    store.close()
+
+    reopened = MetricsStore(db_path=db, auto_flush=False)
+    stats = reopened.percentiles("tool", "internet.research", "latency_ms", window_seconds=HOUR)
+    assert stats["count"] == 100
+    assert stats["errors"] == 10
+    assert abs(stats["p50"] - 500) / 500 < 0.03
+    assert abs(stats["p99"] - 990) / 990 < 0.03
+
+    summary = reopened.summary(window_seconds=HOUR)
+    assert set(summary) == {"phase", "tool"}
+    assert summary["tool"]["internet.research"]["tokens_out"]["count"] == 100
+    assert summary["phase"]["planner"]["latency_ms"]["p50"] > 0
+
+
+def test_hour_rollup_counts_repeated_flushes_once(tmp_path: Path) -> None:
+    store = MetricsStore(db_path=tmp_path / "metrics.db", auto_flush=False)
+    minute_start = (int(time.time()) // HOUR) * HOUR + MINUTE
+    store.record("role", "planner", {"latency_ms": 100}, timestamp=minute_start)
+    store.flush(include_current=True)
+    store.record("role", "planner", {"latency_ms": 300}, timestamp=minute_start + 5)
+    store.flush(include_current=True)
+    store.flush(include_current=True)
+
+    rows = store._conn.execute(
+        "SELECT resolution, count FROM metric_rollups WHERE kind = 'role' ORDER BY resolution"
+    ).fetchall()
+    assert rows == [(MINUTE, 2), (HOUR, 2)]
+
+
+class _GatedLock:
+    """Lock whose first acquisition waits until the test lets it through."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.reached = threading.Event()
+        self.release = threading.Event()
+
+    def __enter__(self) -> None:
+        if not self.reached.is_set():
+            self.reached.set()
+            self.release.wait(5)
+        self._lock.acquire()
+
+    def __exit__(self, *exc) -> None:
+        self._lock.release()
+
+
+def test_concurrent_flushes_never_write_an_older_snapshot_last(tmp_path: Path) -> None:
+    store = MetricsStore(db_path=tmp_path / "metrics.db", auto_flush=False)
+    gate = _GatedLock()
+    store._db_lock = gate
+    minute_start = (int(time.time()) // HOUR) * HOUR + MINUTE
+    store.record("role", "planner", {"latency_ms": 100}, timestamp=minute_start)
+
+    # First flush snapshots one sample, then stalls before writing it
+    first = threading.Thread(target=store.flush, kwargs={"include_current": True})
+    first.start()
+    assert gate.reached.wait(5)
+    store.record("role", "planner", {"latency_ms": 300}, timestamp=minute_start + 5)
+    second = threading.Thread(target=store.flush, kwargs={"include_current": True})
+    second.start()
+    time.sleep(0.1)
+    gate.release.set()
+    first.join(5)
+    second.join(5)
+
+    rows = store._conn.execute(
+        "SELECT resolution, count FROM metric_rollups WHERE kind = 'role' ORDER BY resolution"
+    ).fetchall()
+    assert rows == [(MINUTE, 2), (HOUR, 2)]
@@ -0,0 +1,84 @@
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+
+from apps.services.tool_server import product_viability as pv
+from apps.services.tool_server.product_eval_cache import (
+    ProductEvalCache,
+    normalize_product_url,
+    requirements_fingerprint,
+)
+from apps.services.tool_server.shared.batch_eval import BatchEvalResult
+from apps.services.tool_server.shared_state.freshness import FreshnessOracle
+
+
+def test_keys_ignore_tracking_params_and_query_phrasing() -> None:
+    assert normalize_product_url("https://www.Example.com/p/laptop-123/?utm_source=x&ref=sr_1#reviews") == \
+        normalize_product_url("https://example.com/p/laptop-123")
+    assert normalize_product_url("https://shop.com/item?sku=2&color=red") == \
+        normalize_product_url("https://shop.com/item?color=red&sku=2")
+
+    reqs = {"budget": "<$1000", "gpu": "RTX 4060+"}
+    assert requirements_fingerprint(reqs, "best laptop under $1000") == \
+        requirements_fingerprint(dict(reversed(list(reqs.items()))), "Best laptops under $1000")
+    assert requirements_fingerprint(reqs, "best laptop under $1000") != \
+        requirements_fingerprint({**reqs, "budget": "<$800"}, "best laptop under $1000")
+    assert requirements_fingerprint(reqs, "laptop to replace macbook") != \
+        requirements_fingerprint(reqs, "macbook to replace laptop")
+
+
+def test_ttl_tiers_price_check_and_persistence(tmp_path: Path) -> None:
+    freshness = FreshnessOracle(low_conf_seconds=0)
+    cache = ProductEvalCache(db_path=tmp_path / "eval.db", freshness=freshness)
+    url = "https://shop.com/laptop-a"
+    cache.put(url, "fp", "ACCEPT", {"viability_score": 0.9}, specs={"gpu": "RTX 4060"}, price="$999")
+    cache.put("https://shop.com/laptop-b", "fp", "UNCERTAIN", {"viability_score": 0.3}, price="$500")
+
+    restarted = ProductEvalCache(db_path=tmp_path / "eval.db", freshness=freshness)
+    entry = restarted.get(url + "?utm_campaign=deal", "fp", price="$999")
+    assert entry is not None and entry["specs"] == {"gpu": "RTX 4060"}
+    assert restarted.get(url, "fp", price="$899") is None           # price changed
+    assert restarted.get(url, "other-requirements") is None
+    assert restarted.get("https://shop.com/laptop-b", "fp") is None  # low-confidence TTL expired
+    assert restarted.get_stats()["price_misses"] == 1
+
+
+def _products() -> List[Dict[str, Any]]:
+    return [
+        {"name": f"Laptop {c}", "price": "$999", "url": f"https://shop.com/laptop-{c}", "vendor": "shop.com"}
+        for c in "abc"
+    ]
+
+
+async def test_repeated_query_only_evaluates_new_products(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    cache = ProductEvalCache(db_path=tmp_path / "eval.db")
+    monkeypatch.setattr(pv, "get_product_eval_cache", lambda: cache)
+    # The recipe loader imports the whole gateway package; the prompt text doesn't matter here
+    monkeypatch.setattr(pv, "_load_prompt_via_recipe", lambda name, category: "Evaluate products.")
+    evaluated: List[List[str]] = []
+
+    async def fake_evaluate_batched(items: List[Dict[str, Any]], **kwargs: Any) -> BatchEvalResult:
+        evaluated.append([p["name"] for p in items])
+        return BatchEvalResult(results={
+            i: {"fundamental_check": "laptop", "user_satisfaction": "yes", "requirements_check": "ok",
+                "decision": "REJECT" if p["name"] == "Laptop b" else "ACCEPT",
+                "score": 0.8, "rejection_reason": "refurbished"}
+            for i, p in enumerate(items, 1)
+        })
+
+    monkeypatch.setattr(pv, "evaluate_batched", fake_evaluate_batched)
+
+    first = await pv.filter_viable_products_with_reasoning(
+        _products()[:2], "must be a new laptop", "best laptop under $1000"
+    )
+    second = await pv.filter_viable_products_with_reasoning(
+        _products(), "must be a new laptop", "Best laptops under $1000"
+    )
+
+    assert evaluated == [["Laptop a", "Laptop b"], ["Laptop c"]]
+    assert first["stats"]["cache_hits"] == 0 and second["stats"]["cache_hits"] == 2
+    assert [p["name"] for p in second["viable_products"]] == ["Laptop a", "Laptop c"]
+    assert second["rejected"][0]["rejection_reason"] == "refurbished"
@@ -0,0 +1,80 @@
+import json
+from pathlib import Path
+
+from apps.services.tool_server.shared_state.append_log import AppendOnlyLog
+from apps.services.tool_server.shared_state.site_schema_registry import SiteSchema, SiteSchemaRegistry
+from apps.services.tool_server.shared_state.vendor_registry import VendorRegistry
+
+
+def test_vendor_visits_are_batched_and_reloaded(tmp_path: Path) -> None:
+    path = tmp_path / "vendor_registry.jsonl"
+    # Pre-existing file in the old full-rewrite format
+    path.write_text(json.dumps({"domain": "bestbuy.com", "name": "Best Buy", "total_visits": 4}) + "\n")
+
+    registry = VendorRegistry(registry_file=path, auto_flush=False)
+    for i in range(20):
+        registry.record_visit("www.bestbuy.com", success=i % 4 != 0)
+        registry.record_visit(f"shop{i % 3}.com", success=True)
+    registry.add_or_update("newegg.com", name="Newegg")
+    registry.delete("shop2.com")
+
+    # Nothing written on the request path
+    assert path.read_text().count("\n") == 1
+
+    # One line per changed vendor, regardless of how many visits
+    assert registry.flush() == 5
+    assert registry.flush() == 0
+
+    reloaded = VendorRegistry(registry_file=path, auto_flush=False)
+    vendor = reloaded.get("bestbuy.com")
+    assert vendor.total_visits == 24
+    assert vendor.failed_extractions == 5
+    assert reloaded.get("newegg.com").name == "Newegg"
+    assert reloaded.get("shop2.com") is None
+    assert reloaded.get("shop1.com").total_visits == 7
+
+
+def test_schema_registry_roundtrip(tmp_path: Path) -> None:
+    registry = SiteSchemaRegistry(schema_dir=tmp_path, auto_flush=False)
+    registry.save(SiteSchema(domain="bestbuy.com", page_type="listing", price_selector=".price"))
+    registry.save(SiteSchema(domain="bestbuy.com", page_type="pdp"))
+    for _ in range(10):
+        registry.record_extraction("bestbuy.com", "listing", success=True, method="schema")
+    registry.record_extraction("bestbuy.com", "listing", success=False, method="vision")
+    assert registry.delete_schema("bestbuy.com")
+    registry.save(SiteSchema(domain="bestbuy.com", page_type="listing", price_selector=".new-price"))
+    registry.flush()
+
+    reloaded = SiteSchemaRegistry(schema_dir=tmp_path, auto_flush=False)
+    assert reloaded.get("bestbuy.com", "pdp") is None
+    schema = reloaded.get("bestbuy.com", "listing")
+    assert schema.price_selector == ".new-price"
+    assert schema.total_uses == 0
+
+
+def test_log_compacts_when_mostly_stale(tmp_path: Path) -> None:
+    path = tmp_path / "log.jsonl"
+    log = AppendOnlyLog(path, key_fn=lambda d: d["k"], auto_flush=False, min_compact_lines=10)
+    log.load()
+    for i in range(30):
+        log.mark_dirty({"k": "a", "v": i})
+        log.mark_dirty({"k": "b", "v": i})
+        log.flush()
+    log.mark_deleted("b")
+    log.flush()
+
+    lines = path.read_text().splitlines()
+    assert len(lines) < 10
+    assert AppendOnlyLog(path, key_fn=lambda d: d["k"]).load() == {"a": {"k": "a", "v": 29}}
+
+
+def test_close_stops_flush_thread_and_writes_pending(tmp_path: Path) -> None:
+    path = tmp_path / "vendor_registry.jsonl"
+    registry = VendorRegistry(registry_file=path)
+    registry.record_visit("shop.com", success=True)
+    thread = registry._log._flush_thread
+    assert thread is not None and thread.is_alive()
+
+    registry.close()
+    assert not thread.is_alive()
+    assert VendorRegistry(registry_file=path, auto_flush=False).get("shop.com").total_visits == 1
@@ -0,0 +1,116 @@
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from libs.gateway.orchestration.request_handler import RequestHandler, RequestHandlerConfig
+
+
+class StopAfterPhase2(Exception):
+    pass
+
+
+def _make_handler(decision: str, prefetch, phase2_calls: list) -> RequestHandler:
+    handler = RequestHandler(llm_client=None, config=RequestHandlerConfig(speculative_context=True))
+    decisions = {}
+
+    async def emit_phase_event(*args, **kwargs):
+        pass
+
+    async def phase1_reflection(context_doc, turn_dir):
+        # Yield like a real gate would while the prefetch runs
+        await asyncio.sleep(0.01)
+        return context_doc, decision
+
+    async def phase2_context_gatherer(context_doc, **kwargs):
+        phase2_calls.append(kwargs)
+        raise StopAfterPhase2()
+
+    callbacks = {name: MagicMock() for name in (
+        "init_turn_metrics", "start_phase", "end_phase", "finalize_turn_metrics",
+        "phase3_4_planning_loop", "phase5_synthesis", "phase6_validation", "phase7_save",
+        "archive_attempt", "write_retry_context", "invalidate_claims",
+        "update_plan_state_from_validation", "get_turn_metrics", "set_turn_metrics",
+    )}
+    handler.set_callbacks(
+        emit_phase_event=emit_phase_event,
+        record_decision=lambda kind, value, context="": decisions.__setitem__(kind, value),
+        phase1_reflection=phase1_reflection,
+        phase2_context_gatherer=phase2_context_gatherer,
+        phase2_prefetch=prefetch,
+        extract_clarification=lambda doc: "Which hamster?",
+        **callbacks,
+    )
+    handler.decisions = decisions
+    return handler
+
+
+async def _run(handler: RequestHandler):
+    context_doc = MagicMock(query="find a hamster")
+    context_doc.has_section.return_value = False
+    return await handler.run(
+        context_doc=context_doc, turn_dir=None, mode="chat", intent="", trace_id="t1",
+        turn_number=1, session_id="s1", query_analysis=SimpleNamespace(is_multi_task=False),
+        start_time=0.0, request_turn_saver=None,
+    )
+
+
+async def test_clarify_cancels_speculative_prefetch() -> None:
+    state = {}
+
+    async def prefetch(context_doc):
+        state["started"] = True
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            state["cancelled"] = True
+            raise
+
+    phase2_calls = []
+    handler = _make_handler("CLARIFY", prefetch, phase2_calls)
+    result = await _run(handler)
+
+    assert result["needs_clarification"] is True
+    assert state == {"started": True, "cancelled": True}
+    assert handler.decisions["speculative_context"] == "cancelled"
+    assert phase2_calls == []
+
+
+async def test_proceed_hands_prefetched_gatherer_to_phase2() -> None:
+    gatherer = object()
+
+    async def prefetch(context_doc):
+        return gatherer
+
+    phase2_calls = []
+    handler = _make_handler("PROCEED", prefetch, phase2_calls)
+    with pytest.raises(StopAfterPhase2):
+        await _run(handler)
+
+    assert phase2_calls == [{"gatherer": gatherer}]
+
+
+async def test_failed_turn_ends_its_reuse_tracking(monkeypatch) -> None:
+    from libs.gateway.execution import tool_result_reuse
+
+    reuse = tool_result_reuse.ToolResultReuse()
+    monkeypatch.setattr(tool_result_reuse, "_reuse", reuse)
+
+    async def phase2_context_gatherer(context_doc, **kwargs):
+        return context_doc
+
+    async def planning_loop(*args, **kwargs):
+        assert reuse.is_tracking("s1", 1)
+        raise RuntimeError("planner crashed")
+
+    handler = _make_handler("PROCEED", None, [])
+    handler.config.incremental_retry = True
+    handler._phase2_context_gatherer = phase2_context_gatherer
+    handler._phase3_4_planning_loop = planning_loop
+    monkeypatch.setattr(handler, "_extract_and_write_constraints", lambda context_doc, turn_dir: None)
+
+    with pytest.raises(RuntimeError, match="planner crashed"):
+        await _run(handler)
+
+    assert not reuse.is_tracking("s1", 1)
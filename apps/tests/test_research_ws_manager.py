@@ -0,0 +1,108 @@
+import asyncio
+import json
+
+from apps.services.gateway.research_ws_manager import ResearchWebSocketManager
+
+
+class FakeWebSocket:
+    def __init__(self, delay: float = 0.0, fail: bool = False):
+        self.delay = delay
+        self.fail = fail
+        self.sent = []
+        self.gate = asyncio.Event()
+        self.gate.set()
+
+    async def accept(self) -> None:
+        pass
+
+    async def send_text(self, data: str) -> None:
+        await self.gate.wait()
+        if self.fail:
+            raise RuntimeError("socket closed")
+        await asyncio.sleep(self.delay)
+        self.sent.append(json.loads(data))
+
+
+async def _drain() -> None:
+    for _ in range(20):
+        await asyncio.sleep(0)
+
+
+async def test_slow_client_does_not_block_fast_client() -> None:
+    manager = ResearchWebSocketManager()
+    fast, slow = FakeWebSocket(), FakeWebSocket()
+    slow.gate.clear()
+    await manager.connect(fast, "s1")
+    await manager.connect(slow, "s1")
+
+    await asyncio.wait_for(manager.broadcast_event("s1", {"type": "search_started", "n": 1}), timeout=1)
+    await _drain()
+
+    assert fast.sent == [{"type": "search_started", "n": 1}]
+    assert slow.sent == []
+
+    slow.gate.set()
+    await _drain()
+    assert slow.sent == [{"type": "search_started", "n": 1}]
+    await manager.disconnect(fast, "s1")
+    await manager.disconnect(slow, "s1")
+    assert manager.get_active_sessions() == []
+
+
+async def test_progress_events_coalesce_and_milestones_survive_overflow() -> None:
+    manager = ResearchWebSocketManager(max_queue=3)
+    ws = FakeWebSocket()
+    ws.gate.clear()
+    await manager.connect(ws, "s1")
+    await _drain()
+
+    for i in range(10):
+        await manager.broadcast_event("s1", {"type": "progress", "i": i})
+    await manager.broadcast_event("s1", {"type": "candidate_found", "i": 1})
+    await manager.broadcast_event("s1", {"type": "candidate_found", "i": 2})
+    await manager.broadcast_event("s1", {"type": "research_complete"})
+
+    [stats] = manager.get_client_stats("s1")["s1"]
+    assert stats["coalesced"] == 9
+    assert stats["dropped"] == 1
+
+    ws.gate.set()
+    await _drain()
+    assert [e["type"] for e in ws.sent] == ["candidate_found", "candidate_found", "research_complete"]
+    await manager.disconnect(ws, "s1")
+
+
+async def test_failed_send_removes_client() -> None:
+    manager = ResearchWebSocketManager()
+    ws = FakeWebSocket(fail=True)
+    await manager.connect(ws, "s1")
+
+    await manager.broadcast_event("s1", {"type": "progress"})
+    await _drain()
+
+    assert manager.get_client_count("s1") == 0
+
+
+async def test_progress_coalesces_per_vendor_behind_newer_events() -> None:
+    manager = ResearchWebSocketManager()
+    ws = FakeWebSocket()
+    ws.gate.clear()
+    await manager.connect(ws, "s1")
+    await _drain()
+
+    await manager.broadcast_event("s1", {"type": "vendor_progress", "data": {"vendor_id": "a"}, "i": 0})
+    await manager.broadcast_event("s1", {"type": "vendor_progress", "data": {"vendor_id": "b"}, "i": 0})
+    await manager.broadcast_event("s1", {"type": "candidate_found", "i": 1})
+    await manager.broadcast_event("s1", {"type": "vendor_progress", "data": {"vendor_id": "a"}, "i": 1})
+
+    [stats] = manager.get_client_stats("s1")["s1"]
+    assert stats["coalesced"] == 1
+
+    ws.gate.set()
+    await _drain()
+    assert [(e["type"], e.get("data", {}).get("vendor_id"), e["i"]) for e in ws.sent] == [
+        ("vendor_progress", "b", 0),
+        ("candidate_found", None, 1),
+        ("vendor_progress", "a", 1),
+    ]
+    await manager.disconnect(ws, "s1")
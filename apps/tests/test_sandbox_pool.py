@@ -0,0 +1,132 @@
+import asyncio
+import os
+from pathlib import Path
+
+import pytest
+
+from libs.gateway.self_extension.sandbox_pool import DEFAULT_POOL_SIZE, SandboxWorkerPool, pool_supported
+from libs.gateway.self_extension import sandbox_runner
+from libs.gateway.self_extension.sandbox_runner import SandboxRunner
+
+pytestmark = pytest.mark.skipif(not pool_supported(), reason="warm workers need fork()")
+
+
+def _write_test(path: Path, body: str) -> Path:
+    path.write_text(body)
+    return path
+
+
+async def test_runner_runs_files_in_parallel_on_warm_workers(tmp_path: Path) -> None:
+    pool = SandboxWorkerPool(size=2, max_uses=2)
+    runner = SandboxRunner(timeout=20, pool=pool)
+    files = [
+        _write_test(tmp_path / "test_ok.py", "def test_ok():\n    assert 1 + 1 == 2\n"),
+        _write_test(tmp_path / "test_fail.py", "def test_fail():\n    assert False, 'boom'\n"),
+        # Module state set here must not leak into later runs on the same worker
+        _write_test(tmp_path / "test_state.py",
+                    "import sys\n\ndef test_state():\n    assert not hasattr(sys, 'leaked')\n    sys.leaked = True\n"),
+    ]
+    try:
+        assert await runner.warm_up() == 2
+
+        result = await runner.run_tests(files + [tmp_path / "missing.py"])
+        assert result.tests_run == 3
+        assert [r.passed for r in result.results] == [True, False, True]
+        assert "boom" in result.results[1].stdout
+
+        again = await runner.run_tests([files[2]])
+        assert again.success
+
+        # 4 jobs on 2 workers with max_uses=2: both workers recycled
+        assert pool.stats["jobs"] == 4
+        assert pool.stats["recycled"] == 2
+    finally:
+        await pool.close()
+
+
+async def test_pool_enforces_timeout_and_keeps_worker(tmp_path: Path) -> None:
+    pool = SandboxWorkerPool(size=1)
+    runner = SandboxRunner(timeout=1, pool=pool)
+    slow = _write_test(tmp_path / "test_slow.py", "import time\n\ndef test_slow():\n    time.sleep(30)\n")
+    fast = _write_test(tmp_path / "test_fast.py", "def test_fast():\n    pass\n")
+    try:
+        timed_out = await runner.run_single_test(slow)
+        assert not timed_out.passed
+        assert "timed out" in timed_out.error_message
+
+        assert (await runner.run_single_test(fast)).passed
+        assert pool.stats["spawned"] == 1
+    finally:
+        await pool.close()
+
+
+async def test_cancelled_run_kills_worker_and_test_child(tmp_path: Path) -> None:
+    pool = SandboxWorkerPool(size=1)
+    pid_file = tmp_path / "child.pid"
+    slow = _write_test(
+        tmp_path / "test_slow.py",
+        f"import os, time\n\ndef test_slow():\n    open({str(pid_file)!r}, 'w').write(str(os.getpid()))\n"
+        "    time.sleep(30)\n",
+    )
+    try:
+        task = asyncio.create_task(pool.run(slow, str(tmp_path), timeout=30))
+        for _ in range(200):
+            if pid_file.exists() and pid_file.read_text():
+                break
+            await asyncio.sleep(0.05)
+        child_pid = int(pid_file.read_text())
+
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert pool._all == [] and pool._idle == []
+
+        for _ in range(100):
+            try:
+                os.kill(child_pid, 0)
+            except ProcessLookupError:
+                break
+            await asyncio.sleep(0.05)
+        else:
+            pytest.fail("forked test child still running")
+    finally:
+        await pool.close()
+
+
+def test_run_tests_sync_stops_workers_before_its_loop_closes(tmp_path: Path) -> None:
+    pool = SandboxWorkerPool(size=1)
+    runner = SandboxRunner(timeout=20, pool=pool)
+    test_file = _write_test(tmp_path / "test_ok.py", "def test_ok():\n    pass\n")
+    spawned = []
+    spawn = pool._spawn
+
+    async def tracking_spawn():
+        spawned.append(await spawn())
+        return spawned[-1]
+
+    pool._spawn = tracking_spawn
+    for _ in range(2):
+        assert runner.run_tests_sync([test_file]).success
+        assert pool._all == [] and spawned and not any(w.alive for w in spawned)
+    assert pool.stats["spawned"] == 2
+
+
+async def test_fallback_without_pool_is_bounded(tmp_path: Path, monkeypatch) -> None:
+    runner = SandboxRunner(use_pool=False)
+    files = [_write_test(tmp_path / f"test_{i}.py", "def test_ok():\n    pass\n") for i in range(DEFAULT_POOL_SIZE * 3)]
+    active = peak = 0
+
+    async def fake_run(test_file: Path, working_dir=None) -> sandbox_runner.TestResult:
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return sandbox_runner.TestResult(
+            passed=True, exit_code=0, stdout="", stderr="", duration_ms=10, test_file=str(test_file)
+        )
+
+    monkeypatch.setattr(runner, "run_single_test", fake_run)
+    result = await runner.run_tests(files)
+    assert result.tests_run == len(files)
+    assert peak == DEFAULT_POOL_SIZE
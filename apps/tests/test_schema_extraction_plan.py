@@ -0,0 +1,72 @@
+import shutil
+import subprocess
+import warnings
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from apps.services.tool_server import schema_extraction_plan as sep
+from apps.services.tool_server.shared_state.site_schema_registry import SiteSchema, SiteSchemaRegistry
+
+with warnings.catch_warnings():
+    warnings.simplefilter("ignore", DeprecationWarning)
+    from apps.services.tool_server.site_calibrator import SiteCalibrator
+
+
+class FakePage:
+    """Answers page.evaluate() with canned card data and counts round trips."""
+
+    def __init__(self, cards: List[Dict[str, Any]], count: Optional[int] = None) -> None:
+        self.cards = cards
+        self.count = len(cards) if count is None else count
+        self.calls: List[Any] = []
+
+    async def evaluate(self, script: str, arg: Any = None) -> Any:
+        self.calls.append(arg)
+        if arg is None:
+            return "results for laptops"  # body text for the no-results check
+        return {"count": self.count, "cards": self.cards[:arg["limit"]]}
+
+    async def query_selector_all(self, selector: str) -> List[Any]:
+        raise AssertionError("per-card Playwright queries should not be used")
+
+
+def _schema(version: int = 1, card: str = ".sku-item") -> SiteSchema:
+    return SiteSchema(domain="shop.com", page_type="listing", version=version,
+                      product_card_selector=card, product_link_selector="a.title", price_selector=".price")
+
+
+def _card(i: int) -> Dict[str, Any]:
+    return {"href": f"/p/{i}", "link_text": f"Gaming Laptop Model {i}", "title": "", "price": f"${900 + i}",
+            "heading": f"Gaming Laptop Model {i}", "heading_title": f"Gaming Laptop Model {i}", "any_href": f"/p/{i}"}
+
+
+def test_plans_are_cached_per_schema_version() -> None:
+    sep.clear_extraction_plans()
+    plan = sep.get_extraction_plan(_schema())
+    assert sep.get_extraction_plan(_schema()) is plan
+    assert '".sku-item"' in plan.script and '"a.title"' in plan.script
+
+    recalibrated = sep.get_extraction_plan(_schema(version=2, card="li.product"))
+    assert recalibrated is not plan and recalibrated.version == 2
+    assert sep.get_extraction_plan(_schema(version=2, card="li.product")) is recalibrated
+
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="node not installed")
+def test_compiled_script_is_valid_javascript() -> None:
+    script = sep.compile_extraction_plan(_schema(card='div[data-test="product \\"card\\""]')).script
+    subprocess.run(["node", "-e", f"new Function('return (' + {script!r} + ')')"], check=True)
+
+
+async def test_validation_and_extraction_use_one_round_trip(tmp_path: Path) -> None:
+    calibrator = SiteCalibrator(registry=SiteSchemaRegistry(schema_dir=tmp_path, auto_flush=False))
+    page = FakePage([_card(i) for i in range(40)], count=48)
+
+    ok, reason, details = await calibrator._validate_listing_schema(page, _schema())
+
+    assert (ok, reason) == (True, "passed")
+    assert page.calls == [None, {"limit": 15}]  # no-results check + one extraction call
+
+    result = await sep.run_extraction_plan(page, _schema(), limit=20)
+    assert result["count"] == 48 and len(result["cards"]) == 20
@@ -0,0 +1,68 @@
+from pathlib import Path
+
+from apps.services.tool_server.serp_cache import SERPCache, query_signature
+
+RESULTS = [{"url": f"https://example.com/{i}", "title": f"Result {i}"} for i in range(5)]
+
+
+def test_query_signature_folds_rephrasings() -> None:
+    assert query_signature("Best laptops for gaming") == query_signature("best laptop, gaming")
+    assert query_signature("Is the cheapest  hamster cage?") == query_signature("cheapest hamster cages")
+    assert query_signature("laptop with touchscreen") != query_signature("laptop without touchscreen")
+    assert query_signature("the") == "the"
+
+
+def test_query_signature_keeps_operators_and_distinct_words() -> None:
+    assert query_signature("laptops -refurbished") != query_signature("laptops refurbished")
+    assert query_signature('"hamster cage" -wire') != query_signature("hamster wire cage")
+    assert query_signature('"hamster  cage" -wire') == query_signature('-wire "Hamster cage"')
+    assert query_signature("site:amazon.com ssd") != query_signature("ssd")
+    assert query_signature("news") != query_signature("new")
+    assert query_signature("crème brûlée recipe") != query_signature("recipe")
+    assert query_signature("Crème Brûlée recipes") == query_signature("crème brûlée recipe")
+    signatures = {query_signature(q) for q in ("c++ tutorial", "c# tutorial", "c tutorial", "f# tutorial")}
+    assert len(signatures) == 4
+    assert query_signature("C++ tutorials") == query_signature("c++ tutorial")
+
+
+def test_query_signature_keeps_word_order_and_question_words() -> None:
+    for first, second in (
+        ("flights from nyc to london", "flights from london to nyc"),
+        ("convert python to java", "convert java to python"),
+        ("when was einstein born", "where was einstein born"),
+        ("who founded apple", "what founded apple"),
+    ):
+        assert query_signature(first) != query_signature(second), (first, second)
+
+
+def test_disk_tier_survives_restart_and_is_shared(tmp_path: Path) -> None:
+    db = tmp_path / "serp.db"
+    cache = SERPCache(db_path=db)
+    cache.put("best laptops for gaming", "duckduckgo", RESULTS, session_id="alice")
+    cache.put("best laptops for gaming", "google", RESULTS, session_id="alice")
+
+    other_worker = SERPCache(db_path=db)
+    # Non-personalized engine: shared across sessions and rephrasings
+    assert other_worker.get("Best laptop, gaming", "duckduckgo", session_id="bob") == RESULTS
+    # Personalized engine stays per-session
+    assert other_worker.get("best laptops for gaming", "google", session_id="bob") is None
+    assert other_worker.get("best laptops for gaming", "google", session_id="alice") == RESULTS
+    # Promoted into memory on the first disk hit
+    assert other_worker.get("best laptops for gaming", "google", session_id="alice") == RESULTS
+
+    stats = other_worker.get_stats()
+    assert stats["hits_by_tier"] == {"memory": 1, "disk": 2}
+    assert stats["near_duplicate_hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["disk_entries"] == 2
+
+
+def test_expired_and_invalidated_entries_miss(tmp_path: Path) -> None:
+    cache = SERPCache(ttl_seconds=0, db_path=tmp_path / "serp.db")
+    cache.put("hamster cages", "brave", RESULTS)
+    assert cache.get("hamster cages", "brave") is None
+
+    cache = SERPCache(db_path=tmp_path / "serp2.db")
+    cache.put("hamster cages", "brave", RESULTS)
+    cache.invalidate("hamster cage", "brave")
+    assert SERPCache(db_path=tmp_path / "serp2.db").get("hamster cages", "brave") is None
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import sqlite3
+import threading
+import time
 from pathlib import Path
 
 from apps.services.tool_server.shared_state import (
@@ -32,6 +35,124 @@ def test_session_ledger_records_events(tmp_path: Path) -> None:
     assert latest.event_id == event.event_id
 
 
+def test_session_ledger_group_commits_and_exports(tmp_path: Path) -> None:
+    ledger = SessionLedger(tmp_path / "ledger.db", flush_interval_ms=10_000, flush_max_events=1000)
+    for i in range(5):
+        ledger.log_event(session_id="sess1", kind="tool.call", payload={"i": i}, created_at=100.0 + i)
+    ledger.log_event(session_id="sess2", kind="turn.start", created_at=50.0)
+
+    # Buffered, not yet committed; reads flush first
+    assert ledger._pending
+    calls = list(ledger.iter_events(session_id="sess1", kind="tool.call"))
+    assert [e.payload["i"] for e in calls] == [0, 1, 2, 3, 4]
+    plan = ledger._conn.execute(
+        "EXPLAIN QUERY PLAN SELECT event_id FROM events WHERE session_id = ? AND kind = ? ORDER BY created_at",
+        ("sess1", "tool.call"),
+    ).fetchall()
+    assert "idx_events_session_kind_ts" in str(plan)
+
+    export = tmp_path / "export.jsonl"
+    assert ledger.export_jsonl(export, chunk_size=4) == 6
+    assert len(export.read_text().splitlines()) == 2
+    exported = list(SessionLedger.read_export(export))
+    assert [e.session_id for e in exported] == ["sess2"] + ["sess1"] * 5
+    assert exported[-1].payload == {"i": 4}
+
+    ledger.log_event(session_id="sess1", kind="turn.end", created_at=200.0)
+    ledger.close()
+    reopened = SessionLedger(tmp_path / "ledger.db")
+    assert reopened.latest_event(session_id="sess1").kind == "turn.end"
+    reopened.close()
+
+
+def test_session_ledger_reads_wait_for_in_flight_batch(tmp_path: Path) -> None:
+    ledger = SessionLedger(tmp_path / "ledger.db", flush_interval_ms=1)
+    write = ledger._write
+
+    def slow_write(rows):
+        if threading.current_thread() is ledger._writer:
+            time.sleep(0.2)  # writer thread has taken the batch but not committed it
+        write(rows)
+
+    ledger._write = slow_write
+    event = ledger.log_event(session_id="sess1", kind="turn.start")
+    time.sleep(0.05)
+    assert not ledger._pending
+    latest = ledger.latest_event(session_id="sess1")
+    assert latest is not None and latest.event_id == event.event_id
+    ledger.close()
+
+
+def test_session_ledger_duplicate_event_ids(tmp_path: Path) -> None:
+    # Immediate mode writes in the caller, so the duplicate is the caller's error
+    immediate = SessionLedger(tmp_path / "immediate.db", flush_interval_ms=0)
+    immediate.log_event(session_id="sess1", kind="turn.start", event_id="dup")
+    try:
+        immediate.log_event(session_id="sess1", kind="turn.end", event_id="dup")
+    except sqlite3.IntegrityError:
+        pass
+    else:
+        raise AssertionError("duplicate event_id should raise in immediate mode")
+    immediate.close()
+
+    # Buffered: the duplicate is skipped and the rest of the batch still lands
+    buffered = SessionLedger(tmp_path / "buffered.db", flush_interval_ms=10_000, flush_max_events=1000)
+    buffered.log_event(session_id="sess1", kind="turn.start", event_id="dup", created_at=1.0)
+    buffered.log_event(session_id="sess1", kind="turn.end", event_id="dup", created_at=2.0)
+    buffered.log_event(session_id="sess1", kind="tool.call", created_at=3.0)
+    assert buffered.flush() == 3
+    assert [e.kind for e in buffered.iter_events(session_id="sess1")] == ["turn.start", "tool.call"]
+    buffered.close()
+
+
+def _committed_rows(db: Path) -> int:
+    conn = sqlite3.connect(db)
+    try:
+        return conn.execute("SELECT COUNT(*) FROM events").fetchone()[0]
+    finally:
+        conn.close()
+
+
+def _wait_for(condition, timeout: float = 2.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return condition()
+
+
+def test_session_ledger_commits_every_interval(tmp_path: Path) -> None:
+    db = tmp_path / "ledger.db"
+    ledger = SessionLedger(db, flush_interval_ms=20)
+    ledger.log_event(session_id="sess1", kind="turn.start")
+    assert _wait_for(lambda: _committed_rows(db) == 1)
+
+    # Later events are committed within the interval too, without a reader
+    ledger.log_event(session_id="sess1", kind="turn.end")
+    assert _wait_for(lambda: _committed_rows(db) == 2)
+    ledger.close()
+
+
+def test_session_ledger_writer_survives_write_errors(tmp_path: Path) -> None:
+    db = tmp_path / "ledger.db"
+    ledger = SessionLedger(db, flush_interval_ms=10)
+    write = ledger._write
+    failures = []
+
+    def flaky_write(rows):
+        if not failures:
+            failures.append(len(rows))
+            raise sqlite3.OperationalError("database is locked")
+        write(rows)
+
+    ledger._write = flaky_write
+    ledger.log_event(session_id="sess1", kind="turn.start")
+    assert _wait_for(lambda: _committed_rows(db) == 1)
+    assert failures == [1] and ledger._writer.is_alive()
+    ledger.close()
+
+
 def test_claim_registry_delta(tmp_path: Path) -> None:
     db_path = tmp_path / "ledger.db"
     registry = ClaimRegistry(db_path)
@@ -0,0 +1,111 @@
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from apps.services.tool_server.shared_state import source_reliability
+from apps.services.tool_server.shared_state.source_reliability import DAY_SECONDS, SourceReliabilityTracker
+
+
+class _Clock:
+    def __init__(self, now: float) -> None:
+        self.now = now
+
+    def time(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> _Clock:
+    fake = _Clock(1_800_000_000.0)
+    monkeypatch.setattr(source_reliability, "time", fake)
+    return fake
+
+
+def test_incremental_stats_batched_and_reloaded(tmp_path: Path, clock: _Clock) -> None:
+    db = tmp_path / "reliability.db"
+    tracker = SourceReliabilityTracker(db_path=str(db), auto_flush=False)
+    for i in range(10):
+        tracker.log_extraction("https://shop.com/p/1", "price", success=i < 8)
+        tracker.log_extraction("https://shop.com/p/1", "title", success=True)
+
+    # Served from memory before anything is written
+    assert tracker.get_reliability("shop.com") == pytest.approx(18 / 20)
+    assert sqlite3.connect(db).execute("SELECT COUNT(*) FROM extraction_log").fetchone()[0] == 0
+
+    assert tracker.flush() == 20
+    assert [s.domain for s in tracker.get_top_domains()] == ["shop.com"]
+
+    reopened = SourceReliabilityTracker(db_path=str(db), auto_flush=False)
+    stats = reopened.get_domain_stats("https://shop.com/other")
+    assert stats.total_extractions == 20
+    assert stats.failed_extractions == 2
+    assert stats.extraction_types == {"price": 10, "title": 10}
+    assert stats.last_failure is not None
+
+
+def test_failed_flush_rolls_back_and_requeues(tmp_path: Path, clock: _Clock) -> None:
+    db = tmp_path / "reliability.db"
+    tracker = SourceReliabilityTracker(db_path=str(db), auto_flush=False)
+    for i in range(4):
+        tracker.log_extraction("shop.com", "price", success=i < 3)
+
+    # Fail the last statement of the batch, after the log and bucket writes
+    blocker = sqlite3.connect(db)
+    blocker.execute(
+        "CREATE TRIGGER block_stats BEFORE INSERT ON domain_stats BEGIN SELECT RAISE(ABORT, 'disk full'); END"
+    )
+    blocker.commit()
+    with pytest.raises(sqlite3.DatabaseError, match="disk full"):
+        tracker.flush()
+    assert blocker.execute("SELECT COUNT(*) FROM extraction_log").fetchone()[0] == 0
+
+    tracker.log_extraction("shop.com", "price", success=False)
+    blocker.execute("DROP TRIGGER block_stats")
+    blocker.commit()
+    assert tracker.flush() == 5
+
+    assert blocker.execute("SELECT COUNT(*) FROM extraction_log").fetchone()[0] == 5
+    assert blocker.execute("SELECT total, successes FROM reliability_buckets").fetchone() == (5, 3)
+    assert blocker.execute("SELECT successful, failed FROM domain_stats").fetchone() == (3, 2)
+
+
+def test_window_slides_and_cleanup_drops_buckets(tmp_path: Path, clock: _Clock) -> None:
+    db = tmp_path / "reliability.db"
+    tracker = SourceReliabilityTracker(db_path=str(db), auto_flush=False)
+    for _ in range(6):
+        tracker.log_extraction("flaky.com", "price", success=False)
+
+    clock.now += 40 * DAY_SECONDS
+    for _ in range(6):
+        tracker.log_extraction("flaky.com", "price", success=True)
+
+    # Failures from 40 days ago are outside the 30-day decay window
+    assert tracker.get_reliability("flaky.com") == 1.0
+    assert tracker.get_unreliable_domains() == []
+
+    assert tracker.cleanup_old_records(days=30) == 6
+    conn = sqlite3.connect(db)
+    assert conn.execute("SELECT COUNT(*) FROM extraction_log").fetchone()[0] == 6
+    assert conn.execute("SELECT SUM(total) FROM reliability_buckets").fetchone()[0] == 6
+
+
+def test_existing_log_is_backfilled_into_buckets(tmp_path: Path, clock: _Clock) -> None:
+    db = tmp_path / "reliability.db"
+    conn = sqlite3.connect(db)
+    conn.execute("""
+        CREATE TABLE extraction_log (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, domain TEXT NOT NULL, extraction_type TEXT NOT NULL,
+            success INTEGER NOT NULL, confidence REAL, timestamp REAL NOT NULL, url TEXT,
+            error_type TEXT, metadata TEXT
+        )
+    """)
+    conn.executemany(
+        "INSERT INTO extraction_log (domain, extraction_type, success, timestamp) VALUES (?, ?, ?, ?)",
+        [("old.com", "price", int(i % 2 == 0), clock.now - 3600) for i in range(6)],
+    )
+    conn.commit()
+    conn.close()
+
+    tracker = SourceReliabilityTracker(db_path=str(db), auto_flush=False)
+    assert tracker.get_reliability("old.com") == pytest.approx(0.5)
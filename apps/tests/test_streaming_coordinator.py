@@ -0,0 +1,93 @@
+from types import SimpleNamespace
+
+import pytest
+
+from libs.gateway import unified_flow
+from libs.gateway.parsing.response_parser import ResponseParser
+from libs.gateway.unified_flow import UnifiedFlow
+
+SELECTION = (
+    '{"_type": "COORDINATOR_SELECTION", "workflow_selected": "research",'
+    ' "workflow_args": {"query": "hamster cages, under $100"}, "status": "selected"}'
+)
+
+
+class FakeStreamingClient:
+    def __init__(self, text: str, fail: bool = False):
+        self.text = text
+        self.fail = fail
+        self.chunks_sent = 0
+        self.closed = False
+        self.blocking_calls = 0
+
+    async def call_stream(self, **kwargs):
+        if self.fail:
+            raise ConnectionError("stream not supported")
+        try:
+            for i in range(0, len(self.text), 8):
+                self.chunks_sent += 1
+                yield self.text[i:i + 8]
+        finally:
+            self.closed = True
+
+    async def call(self, **kwargs):
+        self.blocking_calls += 1
+        return self.text
+
+
+def _flow(client) -> SimpleNamespace:
+    flow = SimpleNamespace(llm_client=client, response_parser=ResponseParser())
+    flow._as_coordinator_selection = lambda text: UnifiedFlow._as_coordinator_selection(flow, text)
+    return flow
+
+
+async def test_stream_stops_as_soon_as_selection_closes(monkeypatch) -> None:
+    monkeypatch.setattr(unified_flow, "STREAMING_COORDINATOR", True)
+    client = FakeStreamingClient(SELECTION + "\n\nReasoning: " + "x" * 400)
+
+    selection = await UnifiedFlow._coordinator_select(_flow(client), "prompt", max_tokens=400, temperature=0.4)
+
+    assert selection["workflow_selected"] == "research"
+    assert selection["workflow_args"] == {"query": "hamster cages, under $100"}
+    assert client.closed
+    assert client.chunks_sent <= len(SELECTION) // 8 + 1
+    assert client.blocking_calls == 0
+
+
+async def test_falls_back_to_blocking_call(monkeypatch) -> None:
+    monkeypatch.setattr(unified_flow, "STREAMING_COORDINATOR", True)
+    client = FakeStreamingClient(SELECTION, fail=True)
+
+    selection = await UnifiedFlow._coordinator_select(_flow(client), "prompt", max_tokens=400, temperature=0.4)
+
+    assert selection["status"] == "selected"
+    assert client.blocking_calls == 1
+
+
+@pytest.mark.parametrize("prefix", [
+    "I will pick the workflow for [hamster cages].\n",
+    "Selecting {research}:\n```json\n",
+])
+async def test_brackets_in_prose_before_selection_are_skipped(monkeypatch, prefix: str) -> None:
+    monkeypatch.setattr(unified_flow, "STREAMING_COORDINATOR", True)
+    client = FakeStreamingClient(prefix + SELECTION + "\n```\nReasoning: " + "x" * 400)
+
+    selection = await UnifiedFlow._coordinator_select(_flow(client), "prompt", max_tokens=400, temperature=0.4)
+
+    assert selection["workflow_selected"] == "research"
+    assert client.closed and client.blocking_calls == 0
+    assert client.chunks_sent <= (len(prefix) + len(SELECTION)) // 8 + 1
+
+
+async def test_unparseable_stream_falls_back_to_blocking_call(monkeypatch) -> None:
+    monkeypatch.setattr(unified_flow, "STREAMING_COORDINATOR", True)
+
+    class TruncatedStreamClient(FakeStreamingClient):
+        async def call_stream(self, **kwargs):
+            yield "I could not decide [sorry]"
+
+    client = TruncatedStreamClient(SELECTION)
+    selection = await UnifiedFlow._coordinator_select(_flow(client), "prompt", max_tokens=400, temperature=0.4)
+
+    assert selection["status"] == "selected"
+    assert client.blocking_calls == 1
@@ -0,0 +1,59 @@
+from libs.gateway.execution.tool_result_reuse import ToolResultReuse, normalize_tool_args
+from libs.gateway.validation.validation_result import ValidationFailureContext
+
+
+def _result(url: str) -> dict:
+    return {
+        "tool": "internet.research",
+        "status": "success",
+        "raw_result": {"findings": [{"url": url, "price": "$20"}]},
+        "claims": [{"content": "Hamster cage $20", "confidence": 0.8, "source": url}],
+    }
+
+
+def test_normalize_ignores_volatile_keys_and_whitespace_but_keeps_case() -> None:
+    assert normalize_tool_args({"query": "hamster  cages ", "session_id": "a", "turn_number": 1}) == \
+        normalize_tool_args({"turn_number": 2, "query": "hamster cages"})
+    assert normalize_tool_args({"query": "hamster"}) != normalize_tool_args({"query": "gerbil"})
+    assert normalize_tool_args({"path": "README.md"}) != normalize_tool_args({"path": "readme.md"})
+
+
+def test_retry_reuses_fresh_results_and_reruns_invalidated_ones() -> None:
+    reuse = ToolResultReuse()
+    reuse.begin_turn("s1", 7)
+
+    reuse.put("internet.research", {"query": "hamster cage"}, "s1", 7, _result("https://a.example/cage"), 4000)
+    reuse.put("internet.research", {"query": "hamster food"}, "s1", 7, _result("https://b.example/food"), 3000)
+    # Other turns are never reused
+    assert reuse.get("internet.research", {"query": "hamster cage"}, "s1", 8) is None
+
+    failure = ValidationFailureContext(reason="URL_NOT_IN_RESEARCH", failed_urls=["https://a.example/cage"])
+    assert reuse.mark_stale("s1", 7, failure) == 1
+
+    reuse.start_attempt("s1", 7, 2)
+    assert reuse.get("internet.research", {"query": "hamster cage"}, "s1", 7) is None
+    cached = reuse.get("internet.research", {"query": "hamster  food", "session_id": "s"}, "s1", 7)
+    assert cached["reused"] is True
+    assert cached["reused_from_attempt"] == 1
+
+    stats = reuse.attempt_stats("s1", 7).to_dict()
+    assert stats == {"attempt": 2, "executed": 0, "reused": 1, "invalidated": 1, "reused_ms": 3000}
+
+    reuse.end_turn("s1", 7)
+    assert not reuse.is_tracking("s1", 7)
+
+
+def test_sessions_are_isolated_and_writes_invalidate_reads() -> None:
+    reuse = ToolResultReuse()
+    reuse.begin_turn("alice", 3)
+    reuse.begin_turn("bob", 3)
+    reuse.put("file.read", {"path": "notes.md"}, "alice", 3, {"status": "success", "raw_result": "alice"})
+
+    assert reuse.get("file.read", {"path": "notes.md"}, "bob", 3) is None
+    reuse.end_turn("bob", 3)
+    assert reuse.get("file.read", {"path": "notes.md"}, "alice", 3)["raw_result"] == "alice"
+
+    # Mutating (non-allowlisted) tools are never replayed and drop the turn's reads
+    reuse.put("code.apply_patch", {"patch": "..."}, "alice", 3, {"status": "success"})
+    assert reuse.get("code.apply_patch", {"patch": "..."}, "alice", 3) is None
+    assert reuse.get("file.read", {"path": "notes.md"}, "alice", 3) is None
@@ -0,0 +1,86 @@
+import asyncio
+import json
+from pathlib import Path
+
+from libs.core import tracing
+from libs.core.tracing import (
+    begin_turn_trace,
+    current_span,
+    end_phase_span,
+    extract_parent,
+    inject_headers,
+    load_trace,
+    render_flamegraph_html,
+    start_phase_span,
+    start_span,
+)
+
+
+async def _fake_tool_server(headers: dict) -> None:
+    # What TracingMiddleware does in the tool server process
+    with start_span("tool_server /internet.research", kind="server",
+                    parent=extract_parent(headers), service="tool_server"):
+        await asyncio.sleep(0)
+
+
+async def test_turn_trace_links_phases_tools_and_remote_spans(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(tracing, "TRACE_SPOOL_DIR", tmp_path / "spool")
+    turn_dir = tmp_path / "turn_000001"
+
+    turn = begin_turn_trace(turn_dir, {"turn_number": 1})
+    start_phase_span("executor")
+    with start_span("tool.internet.research", kind="client") as tool_span:
+        headers = inject_headers()
+        await asyncio.gather(_fake_tool_server(headers), asyncio.sleep(0))
+    end_phase_span("executor", {"tokens_in": 10})
+    with start_span("llm.call", kind="client"):
+        pass
+    turn.end()
+
+    assert current_span() is None
+    trace = load_trace(turn_dir)
+    by_name = {s["name"]: s for s in trace["spans"]}
+    assert set(by_name) == {
+        "turn", "phase.executor", "tool.internet.research",
+        "tool_server /internet.research", "llm.call",
+    }
+    assert {s["traceId"] for s in trace["spans"]} == {turn.trace_id}
+    assert by_name["phase.executor"]["parentSpanId"] == turn.span_id
+    assert by_name["tool.internet.research"]["parentSpanId"] == by_name["phase.executor"]["spanId"]
+    assert by_name["tool_server /internet.research"]["parentSpanId"] == tool_span.span_id
+    assert by_name["tool_server /internet.research"]["service"] == "tool_server"
+    assert by_name["llm.call"]["parentSpanId"] == turn.span_id
+    assert by_name["phase.executor"]["attributes"]["tokens_in"] == 10
+    assert not list((tmp_path / "spool").glob("*.jsonl"))
+
+
+def test_errors_and_traceparent_parsing(tmp_path: Path) -> None:
+    turn = begin_turn_trace(tmp_path, {})
+    try:
+        with start_span("tool.file.read"):
+            raise ValueError("boom")
+    except ValueError:
+        pass
+    turn.end()
+
+    spans = {s["name"]: s for s in json.loads((tmp_path / "trace.json").read_text())["spans"]}
+    assert spans["tool.file.read"]["status"] == {"code": "error", "message": "ValueError: boom"}
+    assert spans["turn"]["status"]["code"] == "ok"
+
+    assert extract_parent({"traceparent": turn.traceparent()}) == (turn.trace_id, turn.span_id)
+    assert extract_parent({"traceparent": "00-" + "0" * 32 + "-" + "1" * 16 + "-01"}) is None
+    assert extract_parent({}) is None
+    assert "traceparent" not in inject_headers()
+
+
+def test_flamegraph_places_children_below_parents(tmp_path: Path) -> None:
+    turn = begin_turn_trace(tmp_path, {})
+    with start_span("phase.planner"):
+        with start_span("llm.call", kind="client"):
+            pass
+    turn.end()
+
+    page = render_flamegraph_html(load_trace(tmp_path), title="Turn 7")
+    assert "Turn 7" in page
+    assert page.count('class="bar"') == 3
+    assert "top:44px" in page  # llm.call at depth 2
@@ -0,0 +1,60 @@
+import json
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from libs.gateway.persistence import turn_index_db
+from libs.gateway.persistence.turn_counter import TurnCounter
+from libs.gateway.persistence.turn_index_db import TurnIndexDB
+
+
+@pytest.fixture
+def index_db(tmp_path: Path) -> TurnIndexDB:
+    # Connections are cached per thread, so drop any left over from another db
+    turn_index_db._local.connection = None
+    yield TurnIndexDB(tmp_path / "turn_index.db")
+    turn_index_db._local.connection = None
+
+
+def test_counters_are_per_session_and_seeded_from_turn_dirs(tmp_path: Path, index_db: TurnIndexDB) -> None:
+    turns_dir = tmp_path / "turns"
+    (turns_dir / "turn_000007").mkdir(parents=True)
+    counter = TurnCounter(turns_dir, index_db=index_db)
+
+    assert counter.get_next_turn_number("s1") == 8
+    assert counter.get_next_turn_number("s1") == 9
+    # A new session continues after the highest number handed out in this dir
+    assert counter.get_next_turn_number("s2") == 10
+    assert counter.get_next_turn_number() == 11
+
+    counter.reset("s1")
+    assert counter.get_next_turn_number("s1") == 12
+
+
+def test_legacy_json_counters_are_migrated_once(tmp_path: Path, index_db: TurnIndexDB) -> None:
+    turns_dir = tmp_path / "turns"
+    turns_dir.mkdir()
+    (turns_dir / ".turn_counter.json").write_text(json.dumps({"s1": 41, "_global": 12}))
+
+    counter = TurnCounter(turns_dir, index_db=index_db)
+    assert not (turns_dir / ".turn_counter.json").exists()
+    assert counter.get_next_turn_number("s1") == 42
+    assert counter.get_next_turn_number() == 13
+
+    # Re-opening does not re-import
+    assert TurnCounter(turns_dir, index_db=index_db).get_next_turn_number("s1") == 43
+
+
+def _allocate_many(args) -> list:
+    db_path, turns_dir, count = args
+    counter = TurnCounter(Path(turns_dir), index_db=TurnIndexDB(Path(db_path)))
+    return [counter.get_next_turn_number("shared") for _ in range(count)]
+
+
+def test_allocation_is_unique_across_processes(tmp_path: Path) -> None:
+    args = (str(tmp_path / "turn_index.db"), str(tmp_path / "turns"), 25)
+    with ProcessPoolExecutor(max_workers=4) as pool:
+        results = [n for batch in pool.map(_allocate_many, [args] * 4) for n in batch]
+
+    assert sorted(results) == list(range(1, 101))
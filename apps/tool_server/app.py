@@ -174,6 +174,46 @@ class PermissionMiddleware(BaseHTTPMiddleware):
 app.add_middleware(PermissionMiddleware)
 
 
+# ============================================================================
+# Tracing Middleware
+# ============================================================================
+# Requests carrying a W3C traceparent header (set by the gateway's ToolExecutor)
+# get a server span; it is spooled for the gateway to merge into the turn's trace.json.
+
+from libs.core.tracing import extract_parent, start_span
+
+
+class TracingMiddleware(BaseHTTPMiddleware):
+    """Wrap traced tool calls in a server span linked to the caller's span."""
+
+    async def dispatch(self, request: Request, call_next):
+        parent = extract_parent(request.headers)
+        if parent is None:
+            return await call_next(request)
+
+        span = start_span(
+            f"tool_server {request.url.path}",
+            kind="server",
+            parent=parent,
+            service="tool_server",
+            attributes={"http.method": request.method, "http.route": request.url.path},
+        )
+        try:
+            response = await call_next(request)
+        except Exception as e:
+            span.end(e)
+            raise
+        span.set_attribute("http.status_code", response.status_code)
+        if response.status_code >= 500:
+            span.status = "error"
+            span.status_message = f"HTTP {response.status_code}"
+        span.end()
+        return response
+
+
+app.add_middleware(TracingMiddleware)
+
+
 # Module-scope callback for research event broadcasting
 async def send_research_event_to_gateway(event: Dict[str, Any]):
     """
@@ -2439,13 +2479,18 @@ def code_lint(inp: RunLinterIn):
 class DiagnosticsSummaryIn(BaseModel):
     repo: str
     file_pattern: str = "**/*.py"
+    tools: Optional[List[str]] = None  # syntax (default), flake8, pylint, eslint
+    changed_only: bool = False
+    config: Optional[str] = None
 
 
 @app.post("/code.diagnostics_summary")
 def code_diagnostics_summary(inp: DiagnosticsSummaryIn):
     """Get diagnostics summary for multiple files."""
     try:
-        return diagnostics_mcp.get_diagnostics_summary(inp.repo, inp.file_pattern)
+        return diagnostics_mcp.get_diagnostics_summary(
+            inp.repo, inp.file_pattern, tools=inp.tools, changed_only=inp.changed_only, config=inp.config
+        )
     except FileNotFoundError as e:
         raise HTTPException(404, str(e))
     except Exception as e:
@@ -2729,18 +2774,31 @@ async def context_recall_turn_endpoint(req: dict):
 
 
 @app.get("/debug/observability")
-async def debug_observability(hours: int = 24):
+async def debug_observability(
+    hours: int = 24,
+    kind: Optional[str] = None,
+    name: Optional[str] = None,
+    field: str = "latency_ms",
+    window_minutes: Optional[int] = None
+):
     """
     Observability dashboard endpoint.
 
-    Returns metrics for tools, roles, reflection cycles, and flows.
+    Returns metrics for tools, roles, reflection cycles, and flows, plus
+    p50/p95/p99 from the persistent metrics store (gateway phases/tools too).
 
     Query params:
         hours: Number of hours to include in metrics (default: 24)
+        kind: With this set, return one percentile query instead of the dashboard
+              (phase, tool, role, flow)
+        name: Series name within kind (default: all merged)
+        field: latency_ms, tokens_in, tokens_out, ... (default: latency_ms)
+        window_minutes: Query window (default: hours)
 
     Returns:
         {
             "period_hours": 24,
+            "percentiles": {kind: {name: {field: {"count", "p50", "p95", "p99", ...}}}},
             "tools": [...],
             "roles": {...},
             "reflection": {...},
@@ -2748,6 +2806,17 @@ async def debug_observability(hours: int = 24):
         }
     """
     from apps.services.tool_server.observability import get_collector
+    from libs.core.metrics_store import get_metrics_store
+
+    if kind:
+        window_seconds = (window_minutes or hours * 60) * 60
+        return {
+            "kind": kind,
+            "name": name,
+            "field": field,
+            "window_seconds": window_seconds,
+            **get_metrics_store().percentiles(kind, name, field, window_seconds=window_seconds)
+        }
 
     collector = get_collector()
     return collector.get_dashboard_data(hours=hours)
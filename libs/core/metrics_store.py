@@ -0,0 +1,537 @@
+"""
+Metrics Store - Persistent time-series metrics with percentile queries.
+
+One store for per-phase, per-tool, per-role and per-flow latency/token
+metrics, shared by the gateway (PhaseMetrics, ToolMetrics) and the tool
+server (observability.MetricsCollector).
+
+- Samples go into streaming log-bucketed histograms (DDSketch-style, ~1%
+  relative error), one per (kind, name, field) per minute. Memory is bounded
+  by bucket count, not by sample count.
+- Recent minutes are kept in an in-memory ring buffer per series.
+- A background thread flushes finished minutes to SQLite every
+  FLUSH_INTERVAL_SECONDS as minute rollups, merged into hourly rollups too;
+  old minute rollups are pruned, hourly ones are kept for capacity planning.
+- percentiles()/summary() flush this process's open minutes and merge the
+  rollups of every process, so p50/p95/p99 over any window come back without
+  scanning raw samples.
+
+Usage:
+    from libs.core.metrics_store import get_metrics_store
+
+    store = get_metrics_store()
+    store.record("tool", "internet.research", {"latency_ms": 1500, "tokens_out": 2000}, success=True)
+    store.percentiles("tool", "internet.research", "latency_ms", window_seconds=3600)
+"""
+
+import atexit
+import json
+import logging
+import math
+import os
+import sqlite3
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any, Deque, Dict, Iterable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DB_PATH = Path("panda_system_docs/metrics.db")
+
+MINUTE = 60
+HOUR = 3600
+
+FLUSH_INTERVAL_SECONDS = 30
+
+# Minutes kept in memory per series (unflushed or recently flushed)
+RING_MINUTES = 120
+
+# Rollup retention
+MINUTE_RETENTION_SECONDS = 2 * 24 * HOUR
+HOUR_RETENTION_SECONDS = 180 * 24 * HOUR
+
+DEFAULT_QUANTILES = (0.5, 0.95, 0.99)
+
+
+# ============================================================================
+# Streaming histogram
+# ============================================================================
+
+class StreamingHistogram:
+    """
+    Mergeable log-bucketed histogram for non-negative values.
+
+    Quantiles are within RELATIVE_ACCURACY of the true value (clamped to the
+    observed min/max). Serializes to a small dict for SQLite.
+    """
+
+    RELATIVE_ACCURACY = 0.01
+    _GAMMA = (1 + RELATIVE_ACCURACY) / (1 - RELATIVE_ACCURACY)
+    _LOG_GAMMA = math.log(_GAMMA)
+
+    __slots__ = ("buckets", "zero_count", "count", "total", "min", "max")
+
+    def __init__(self):
+        self.buckets: Dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value: float, count: int = 1) -> None:
+        value = max(0.0, float(value))
+        if value <= 0:
+            self.zero_count += count
+        else:
+            key = math.ceil(math.log(value) / self._LOG_GAMMA)
+            self.buckets[key] = self.buckets.get(key, 0) + count
+        self.count += count
+        self.total += value * count
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def merge(self, other: "StreamingHistogram") -> None:
+        for key, count in other.buckets.items():
+            self.buckets[key] = self.buckets.get(key, 0) + count
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def quantile(self, q: float) -> float:
+        if self.count == 0:
+            return 0.0
+        rank = q * (self.count - 1)
+        seen = self.zero_count
+        if rank < seen:
+            return 0.0
+        for key in sorted(self.buckets):
+            seen += self.buckets[key]
+            if rank < seen:
+                value = 2 * self._GAMMA ** key / (self._GAMMA + 1)
+                return min(max(value, self.min), self.max)
+        return self.max
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "b": {str(k): v for k, v in self.buckets.items()},
+            "z": self.zero_count,
+            "n": self.count,
+            "s": self.total,
+            "lo": self.min if self.count else 0,
+            "hi": self.max if self.count else 0,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "StreamingHistogram":
+        hist = cls()
+        hist.buckets = {int(k): v for k, v in data.get("b", {}).items()}
+        hist.zero_count = data.get("z", 0)
+        hist.count = data.get("n", 0)
+        hist.total = data.get("s", 0.0)
+        if hist.count:
+            hist.min = data.get("lo", 0)
+            hist.max = data.get("hi", 0)
+        return hist
+
+
+class RollupBucket:
+    """One time bucket of one series: histogram plus success/error counts."""
+
+    __slots__ = ("start", "hist", "errors", "flushed")
+
+    def __init__(self, start: int):
+        self.start = start
+        self.hist = StreamingHistogram()
+        self.errors = 0
+        self.flushed = False
+
+
+SeriesKey = Tuple[str, str, str]  # (kind, name, field)
+
+
+# ============================================================================
+# Store
+# ============================================================================
+
+class MetricsStore:
+    """
+    Time-series metrics with in-memory ring buffers and SQLite rollups.
+
+    Thread-safe. One instance per process (see get_metrics_store).
+    """
+
+    def __init__(
+        self,
+        db_path: Path = DEFAULT_DB_PATH,
+        auto_flush: bool = True,
+        flush_interval: float = FLUSH_INTERVAL_SECONDS,
+    ):
+        """
+        Args:
+            db_path: SQLite rollup database
+            auto_flush: Start a background flush thread on first record
+            flush_interval: Seconds between background flushes
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.flush_interval = flush_interval
+        self.auto_flush = auto_flush
+        self.source = f"{os.uname().nodename if hasattr(os, 'uname') else 'local'}:{os.getpid()}"
+
+        self._series: Dict[SeriesKey, Deque[RollupBucket]] = {}
+        self._lock = threading.Lock()
+        self._db_lock = threading.Lock()
+        # Held from snapshot to commit, so an older snapshot of a bucket can
+        # never be written over a newer one by a concurrent flush
+        self._flush_lock = threading.Lock()
+        self._flush_thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._init_db()
+
+    def _init_db(self) -> None:
+        # One connection per store, serialized by _db_lock (flush thread + queries)
+        self._conn = sqlite3.connect(str(self.db_path), timeout=10, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        with self._db_lock, self._conn as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS metric_rollups (
+                    resolution INTEGER NOT NULL,
+                    bucket_start INTEGER NOT NULL,
+                    kind TEXT NOT NULL,
+                    name TEXT NOT NULL,
+                    field TEXT NOT NULL,
+                    source TEXT NOT NULL,
+                    count INTEGER NOT NULL,
+                    errors INTEGER NOT NULL,
+                    histogram TEXT NOT NULL,
+                    PRIMARY KEY (resolution, kind, name, field, bucket_start, source)
+                ) WITHOUT ROWID
+            """)
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_rollups_window ON metric_rollups(resolution, bucket_start)"
+            )
+
+    # ------------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------------
+
+    def record(
+        self,
+        kind: str,
+        name: str,
+        values: Dict[str, float],
+        success: Optional[bool] = None,
+        timestamp: Optional[float] = None,
+    ) -> None:
+        """
+        Record one observation.
+
+        Args:
+            kind: Series family - "phase", "tool", "role", "flow"
+            name: Phase/tool/role name
+            values: Field -> value, e.g. {"latency_ms": 120, "tokens_out": 300}
+            success: Counted as an error on each field's series when False
+            timestamp: Epoch seconds (default: now)
+        """
+        ts = timestamp if timestamp is not None else time.time()
+        minute = int(ts // MINUTE) * MINUTE
+        with self._lock:
+            for field, value in values.items():
+                if value is None:
+                    continue
+                ring = self._series.get((kind, name, field))
+                if ring is None:
+                    ring = self._series[(kind, name, field)] = deque(maxlen=RING_MINUTES)
+                bucket = self._bucket_for(ring, minute)
+                bucket.hist.add(value)
+                if success is False:
+                    bucket.errors += 1
+                bucket.flushed = False
+
+        if self.auto_flush and self._flush_thread is None:
+            self._start_flush_thread()
+
+    @staticmethod
+    def _bucket_for(ring: Deque[RollupBucket], minute: int) -> RollupBucket:
+        for bucket in reversed(ring):
+            if bucket.start == minute:
+                return bucket
+            if bucket.start < minute:
+                break
+        bucket = RollupBucket(minute)
+        ring.append(bucket)
+        if len(ring) > 1 and ring[-2].start > minute:
+            # Late sample: keep the ring ordered
+            ordered = sorted(ring, key=lambda b: b.start)
+            ring.clear()
+            ring.extend(ordered)
+        return bucket
+
+    # ------------------------------------------------------------------
+    # Flushing
+    # ------------------------------------------------------------------
+
+    def _start_flush_thread(self) -> None:
+        with self._lock:
+            if self._flush_thread is not None:
+                return
+            self._flush_thread = threading.Thread(target=self._flush_loop, name="metrics-flush", daemon=True)
+            self._flush_thread.start()
+        atexit.register(self.close)
+
+    def _flush_loop(self) -> None:
+        while not self._stop.wait(self.flush_interval):
+            try:
+                self.flush()
+            except Exception as e:
+                logger.warning(f"[MetricsStore] Flush failed: {e}")
+
+    def flush(self, include_current: bool = False) -> int:
+        """
+        Write unflushed minute buckets to SQLite (minute + hourly rollups).
+
+        Args:
+            include_current: Also flush the still-open current minute
+
+        Returns:
+            Number of buckets written
+        """
+        with self._flush_lock:
+            return self._flush_locked(include_current)
+
+    def _flush_locked(self, include_current: bool) -> int:
+        current_minute = int(time.time() // MINUTE) * MINUTE
+        pending: List[Tuple[SeriesKey, RollupBucket, Dict[str, Any], int]] = []
+        with self._lock:
+            for key, ring in self._series.items():
+                for bucket in ring:
+                    if bucket.flushed or (bucket.start >= current_minute and not include_current):
+                        continue
+                    # Snapshot: the bucket may keep receiving samples until its minute ends
+                    pending.append((key, bucket, bucket.hist.to_dict(), bucket.errors))
+                    bucket.flushed = True
+
+        if not pending:
+            return 0
+
+        try:
+            self._write_pending(pending)
+        except Exception:
+            # Not written: leave the buckets for the next flush
+            with self._lock:
+                for _, bucket, _, _ in pending:
+                    bucket.flushed = False
+            raise
+        logger.debug(f"[MetricsStore] Flushed {len(pending)} buckets")
+        return len(pending)
+
+    def _write_pending(self, pending: List[Tuple[SeriesKey, RollupBucket, Dict[str, Any], int]]) -> None:
+        with self._db_lock, self._conn as conn:
+            for (kind, name, field), bucket, hist_data, errors in pending:
+                # Samples added after a partial flush are re-written as a full replacement
+                # of this source's minute row; the hourly row gets only the delta.
+                previous = conn.execute(
+                    "SELECT histogram, errors FROM metric_rollups WHERE resolution = ? AND kind = ? AND name = ? "
+                    "AND field = ? AND bucket_start = ? AND source = ?",
+                    (MINUTE, kind, name, field, bucket.start, self.source)
+                ).fetchone()
+                conn.execute(
+                    "INSERT OR REPLACE INTO metric_rollups VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (MINUTE, bucket.start, kind, name, field, self.source,
+                     hist_data["n"], errors, json.dumps(hist_data))
+                )
+
+                delta = StreamingHistogram.from_dict(hist_data)
+                delta_errors = errors
+                if previous:
+                    delta = _subtract(delta, StreamingHistogram.from_dict(json.loads(previous[0])))
+                    delta_errors -= previous[1]
+                self._merge_hour(conn, kind, name, field, bucket.start, delta, delta_errors)
+
+            now = time.time()
+            conn.execute(
+                "DELETE FROM metric_rollups WHERE resolution = ? AND bucket_start < ?",
+                (MINUTE, now - MINUTE_RETENTION_SECONDS)
+            )
+            conn.execute(
+                "DELETE FROM metric_rollups WHERE resolution = ? AND bucket_start < ?",
+                (HOUR, now - HOUR_RETENTION_SECONDS)
+            )
+
+    def _merge_hour(
+        self,
+        conn: sqlite3.Connection,
+        kind: str,
+        name: str,
+        field: str,
+        minute_start: int,
+        delta: StreamingHistogram,
+        delta_errors: int,
+    ) -> None:
+        hour_start = int(minute_start // HOUR) * HOUR
+        row = conn.execute(
+            "SELECT histogram, errors FROM metric_rollups WHERE resolution = ? AND kind = ? AND name = ? "
+            "AND field = ? AND bucket_start = ? AND source = ?",
+            (HOUR, kind, name, field, hour_start, self.source)
+        ).fetchone()
+        hist = StreamingHistogram.from_dict(json.loads(row[0])) if row else StreamingHistogram()
+        hist.merge(delta)
+        errors = (row[1] if row else 0) + delta_errors
+        conn.execute(
+            "INSERT OR REPLACE INTO metric_rollups VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (HOUR, hour_start, kind, name, field, self.source, hist.count, errors, json.dumps(hist.to_dict()))
+        )
+
+    def close(self) -> None:
+        """Stop the flush thread and flush everything (called at exit)."""
+        self._stop.set()
+        try:
+            self.flush(include_current=True)
+        except Exception as e:
+            logger.debug(f"[MetricsStore] Final flush failed: {e}")
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def _collect(
+        self,
+        window_seconds: int,
+        kind: Optional[str] = None,
+        name: Optional[str] = None,
+        field: Optional[str] = None,
+    ) -> Dict[SeriesKey, Tuple[StreamingHistogram, int]]:
+        """Merged histogram + errors per series over the window (all processes)."""
+        # Push this process's open minutes first so SQLite alone has the full picture
+        self.flush(include_current=True)
+
+        since = time.time() - window_seconds
+        resolution = MINUTE if window_seconds <= MINUTE_RETENTION_SECONDS else HOUR
+        since_bucket = int(since // resolution) * resolution
+
+        filters = ["resolution = ?", "bucket_start >= ?"]
+        params: List[Any] = [resolution, since_bucket]
+        for column, value in (("kind", kind), ("name", name), ("field", field)):
+            if value is not None:
+                filters.append(f"{column} = ?")
+                params.append(value)
+
+        with self._db_lock, self._conn as conn:
+            rows = conn.execute(
+                f"SELECT kind, name, field, histogram, errors FROM metric_rollups WHERE {' AND '.join(filters)}",
+                params
+            ).fetchall()
+
+        merged: Dict[SeriesKey, Tuple[StreamingHistogram, int]] = {}
+        for k, n, f, hist_json, errors in rows:
+            hist = StreamingHistogram.from_dict(json.loads(hist_json))
+            if (k, n, f) in merged:
+                merged[(k, n, f)][0].merge(hist)
+                merged[(k, n, f)] = (merged[(k, n, f)][0], merged[(k, n, f)][1] + errors)
+            else:
+                merged[(k, n, f)] = (hist, errors)
+        return merged
+
+    def percentiles(
+        self,
+        kind: str,
+        name: Optional[str] = None,
+        field: str = "latency_ms",
+        window_seconds: int = HOUR,
+        quantiles: Sequence[float] = DEFAULT_QUANTILES,
+    ) -> Dict[str, Any]:
+        """
+        Percentiles for one series (or all names of a kind merged).
+
+        Returns:
+            {"count", "mean", "min", "max", "p50", "p95", "p99", "errors", "error_rate"}
+        """
+        total = StreamingHistogram()
+        errors = 0
+        for hist, series_errors in self._collect(window_seconds, kind, name, field).values():
+            total.merge(hist)
+            errors += series_errors
+        return _describe(total, errors, quantiles)
+
+    def summary(
+        self,
+        window_seconds: int = HOUR,
+        kind: Optional[str] = None,
+        quantiles: Sequence[float] = DEFAULT_QUANTILES,
+    ) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """
+        Percentiles for every series in the window.
+
+        Returns:
+            {kind: {name: {field: stats}}}
+        """
+        result: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        for (k, n, f), (hist, errors) in sorted(self._collect(window_seconds, kind).items()):
+            result.setdefault(k, {}).setdefault(n, {})[f] = _describe(hist, errors, quantiles)
+        return result
+
+
+def _subtract(total: StreamingHistogram, part: StreamingHistogram) -> StreamingHistogram:
+    """total - part (part must be a subset of total). min/max stay those of total."""
+    result = StreamingHistogram()
+    for key, count in total.buckets.items():
+        remaining = count - part.buckets.get(key, 0)
+        if remaining > 0:
+            result.buckets[key] = remaining
+    result.zero_count = max(0, total.zero_count - part.zero_count)
+    result.count = max(0, total.count - part.count)
+    result.total = max(0.0, total.total - part.total)
+    if result.count:
+        result.min, result.max = total.min, total.max
+    return result
+
+
+def _describe(hist: StreamingHistogram, errors: int, quantiles: Iterable[float]) -> Dict[str, Any]:
+    stats: Dict[str, Any] = {
+        "count": hist.count,
+        "mean": round(hist.mean, 2),
+        "min": round(hist.min, 2) if hist.count else 0,
+        "max": round(hist.max, 2) if hist.count else 0,
+    }
+    for q in quantiles:
+        stats[f"p{round(q * 100, 1):g}"] = round(hist.quantile(q), 2)
+    stats["errors"] = errors
+    stats["error_rate"] = round(errors / hist.count, 4) if hist.count else 0.0
+    return stats
+
+
+# Global singleton
+_store: Optional[MetricsStore] = None
+_store_lock = threading.Lock()
+
+
+def get_metrics_store() -> MetricsStore:
+    """Get the global MetricsStore instance."""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = MetricsStore()
+    return _store
+
+
+def record_metric(
+    kind: str,
+    name: str,
+    values: Dict[str, float],
+    success: Optional[bool] = None,
+) -> None:
+    """Record into the global store; never raises (metrics must not break callers)."""
+    try:
+        get_metrics_store().record(kind, name, values, success)
+    except Exception as e:
+        logger.debug(f"[MetricsStore] Failed to record {kind}/{name}: {e}")
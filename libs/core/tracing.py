@@ -0,0 +1,478 @@
+"""
+Tracing - Per-turn spans across gateway phases, tool server calls and LLM requests.
+
+A small OpenTelemetry-compatible span API (same ids, W3C `traceparent`
+propagation and OTLP-style JSON field names) without the SDK dependency:
+
+- start_span() opens a child of the current span (contextvars, so it follows
+  asyncio tasks) and works as a sync context manager or via span.end().
+- begin_turn_trace() opens the root span of a turn; when it ends, every span
+  of the turn is written to `trace.json` next to the turn's context.md.
+- inject_headers()/extract_parent() carry the trace across HTTP. The tool
+  server wraps traced requests in server spans and spools them to
+  TRACE_SPOOL_DIR/<trace_id>.jsonl; the gateway merges the spool into the
+  turn's trace.json when the turn ends.
+- render_flamegraph_html() draws a trace as an icicle chart.
+
+Usage:
+    from libs.core.tracing import start_span, inject_headers
+
+    with start_span("tool.internet.research", kind="client", attributes={"tool.name": name}) as span:
+        response = await client.post(url, json=payload, headers=inject_headers())
+        span.set_attribute("http.status_code", response.status_code)
+"""
+
+import contextvars
+import html
+import json
+import logging
+import os
+import re
+import secrets
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+TRACE_FILE_NAME = "trace.json"
+TRACE_SPOOL_DIR = Path(os.getenv("PANDA_TRACE_SPOOL_DIR", "panda_system_docs/traces/spool"))
+TRACING_ENABLED = os.getenv("PANDA_TRACING", "1") == "1"
+
+# Spool files are left behind when a turn never finishes; drop them after a day
+SPOOL_MAX_AGE_SECONDS = 24 * 3600
+
+_TRACEPARENT_RE = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$")
+
+# Span kinds (OpenTelemetry SpanKind names)
+KINDS = ("internal", "server", "client", "producer", "consumer")
+
+
+# ============================================================================
+# Spans
+# ============================================================================
+
+@dataclass
+class Span:
+    """One timed operation. Ids follow the W3C trace-context format."""
+    name: str
+    trace_id: str
+    span_id: str
+    parent_span_id: Optional[str] = None
+    kind: str = "internal"
+    service: str = "gateway"
+    start_ns: int = field(default_factory=time.time_ns)
+    end_ns: Optional[int] = None
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    status: str = "unset"  # unset | ok | error
+    status_message: str = ""
+    events: List[Dict[str, Any]] = field(default_factory=list)
+
+    _previous: Optional["Span"] = field(default=None, repr=False)
+    _recorder: Optional["TraceRecorder"] = field(default=None, repr=False)
+
+    @property
+    def duration_ms(self) -> float:
+        end = self.end_ns if self.end_ns is not None else time.time_ns()
+        return (end - self.start_ns) / 1e6
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def add_event(self, name: str, attributes: Optional[Dict[str, Any]] = None) -> None:
+        self.events.append({
+            "name": name,
+            "timeUnixNano": time.time_ns(),
+            "attributes": attributes or {},
+        })
+
+    def record_error(self, error: BaseException) -> None:
+        self.status = "error"
+        self.status_message = f"{type(error).__name__}: {error}"[:500]
+
+    def end(self, error: Optional[BaseException] = None) -> None:
+        """Finish the span and make its parent current again. Idempotent."""
+        if self.end_ns is not None:
+            return
+        if error is not None:
+            self.record_error(error)
+        elif self.status == "unset":
+            self.status = "ok"
+        self.end_ns = time.time_ns()
+
+        if _current_span.get() is self:
+            # Phases may close out of order; never fall back onto a finished span
+            previous = self._previous
+            while previous is not None and previous.end_ns is not None:
+                previous = previous._previous
+            _current_span.set(previous)
+        _export(self)
+
+    def __enter__(self) -> "Span":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.end(exc if isinstance(exc, Exception) else None)
+
+    def traceparent(self) -> str:
+        return f"00-{self.trace_id}-{self.span_id}-01"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """OTLP-style JSON span (ids as hex, times as unix nanos)."""
+        return {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "parentSpanId": self.parent_span_id or "",
+            "name": self.name,
+            "kind": self.kind,
+            "service": self.service,
+            "startTimeUnixNano": self.start_ns,
+            "endTimeUnixNano": self.end_ns,
+            "durationMs": round(self.duration_ms, 3),
+            "attributes": self.attributes,
+            "status": {"code": self.status, "message": self.status_message},
+            "events": self.events,
+        }
+
+
+class _NoopSpan(Span):
+    """Returned when tracing is disabled; accepts every call and records nothing."""
+
+    def end(self, error: Optional[BaseException] = None) -> None:
+        pass
+
+
+_current_span: contextvars.ContextVar[Optional[Span]] = contextvars.ContextVar("panda_span", default=None)
+_current_recorder: contextvars.ContextVar[Optional["TraceRecorder"]] = contextvars.ContextVar(
+    "panda_trace_recorder", default=None
+)
+
+
+def _new_trace_id() -> str:
+    return secrets.token_hex(16)
+
+
+def _new_span_id() -> str:
+    return secrets.token_hex(8)
+
+
+def current_span() -> Optional[Span]:
+    """The active span in this context, if any."""
+    return _current_span.get()
+
+
+def start_span(
+    name: str,
+    kind: str = "internal",
+    attributes: Optional[Dict[str, Any]] = None,
+    parent: Optional[Tuple[str, str]] = None,
+    service: Optional[str] = None,
+) -> Span:
+    """
+    Start a span as a child of the current span and make it current.
+
+    Args:
+        name: Operation name (e.g. "phase.planner", "llm.call")
+        kind: OpenTelemetry span kind
+        attributes: Initial attributes
+        parent: Remote (trace_id, span_id) from extract_parent(); overrides the current span
+        service: Service name (default: the parent's, or "gateway")
+
+    Returns:
+        The started span; end it with span.end() or use it in a with-block
+    """
+    if not TRACING_ENABLED:
+        return _NoopSpan(name=name, trace_id="0" * 32, span_id="0" * 16)
+
+    current = _current_span.get()
+    if parent is not None:
+        trace_id, parent_span_id = parent
+    elif current is not None:
+        trace_id, parent_span_id = current.trace_id, current.span_id
+    else:
+        trace_id, parent_span_id = _new_trace_id(), None
+
+    span = Span(
+        name=name,
+        trace_id=trace_id,
+        span_id=_new_span_id(),
+        parent_span_id=parent_span_id,
+        kind=kind if kind in KINDS else "internal",
+        service=service or (current.service if current is not None else "gateway"),
+        attributes=dict(attributes or {}),
+        _previous=current,
+        _recorder=_current_recorder.get(),
+    )
+    _current_span.set(span)
+    return span
+
+
+# ============================================================================
+# Propagation
+# ============================================================================
+
+def inject_headers(headers: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+    """Add a W3C `traceparent` header for the current span (no-op without one)."""
+    headers = dict(headers or {})
+    span = _current_span.get()
+    if span is not None and not isinstance(span, _NoopSpan):
+        headers["traceparent"] = span.traceparent()
+    return headers
+
+
+def extract_parent(headers: Mapping[str, str]) -> Optional[Tuple[str, str]]:
+    """Parse a `traceparent` header into (trace_id, parent_span_id)."""
+    value = (headers.get("traceparent") or "").strip().lower()
+    match = _TRACEPARENT_RE.match(value)
+    if not match or match.group(1) == "0" * 32 or match.group(2) == "0" * 16:
+        return None
+    return match.group(1), match.group(2)
+
+
+# ============================================================================
+# Export
+# ============================================================================
+
+class TraceRecorder:
+    """Collects the spans of one turn and writes them to the turn directory."""
+
+    def __init__(self, turn_dir: Path, root: Optional[Span] = None):
+        self.turn_dir = Path(turn_dir)
+        self.root = root
+        self.spans: List[Span] = []
+        self.open_spans: Dict[str, Span] = {}
+        self._lock = threading.Lock()
+
+    def add(self, span: Span) -> None:
+        with self._lock:
+            self.spans.append(span)
+
+    def write(self) -> Optional[Path]:
+        """Write trace.json (own spans + spooled remote spans for this trace)."""
+        if self.root is None:
+            return None
+        with self._lock:
+            spans = [s.to_dict() for s in self.spans]
+        known = {s["spanId"] for s in spans}
+        spans.extend(s for s in _drain_spool(self.root.trace_id, known) if s["spanId"] not in known)
+        spans.sort(key=lambda s: s["startTimeUnixNano"])
+
+        document = {
+            "traceId": self.root.trace_id,
+            "rootSpanId": self.root.span_id,
+            "name": self.root.name,
+            "startTimeUnixNano": self.root.start_ns,
+            "endTimeUnixNano": self.root.end_ns,
+            "durationMs": round(self.root.duration_ms, 3),
+            "attributes": self.root.attributes,
+            "spans": spans,
+        }
+        path = self.turn_dir / TRACE_FILE_NAME
+        try:
+            self.turn_dir.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(".json.tmp")
+            tmp.write_text(json.dumps(document, indent=2, default=str))
+            tmp.replace(path)
+        except OSError as e:
+            logger.warning(f"[Tracing] Failed to write {path}: {e}")
+            return None
+        logger.info(f"[Tracing] Wrote {len(spans)} spans to {path}")
+        return path
+
+
+def _export(span: Span) -> None:
+    recorder = span._recorder
+    if recorder is not None:
+        recorder.add(span)
+        if span is recorder.root:
+            if _current_recorder.get() is recorder:
+                _current_recorder.set(_parent_recorder(span))
+            recorder.write()
+        return
+    if span.parent_span_id is not None:
+        # Remote child without a local turn (tool server): hand it back via the spool
+        _spool(span)
+
+
+def _parent_recorder(span: Span) -> Optional[TraceRecorder]:
+    previous = span._previous
+    return previous._recorder if previous is not None else None
+
+
+def _spool_path(trace_id: str) -> Path:
+    return TRACE_SPOOL_DIR / f"{trace_id}.jsonl"
+
+
+def _spool(span: Span) -> None:
+    try:
+        TRACE_SPOOL_DIR.mkdir(parents=True, exist_ok=True)
+        line = json.dumps(span.to_dict(), default=str)
+        with open(_spool_path(span.trace_id), "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+    except OSError as e:
+        logger.debug(f"[Tracing] Failed to spool span {span.name}: {e}")
+
+
+def _drain_spool(trace_id: str, known: set) -> List[Dict[str, Any]]:
+    """Read and remove the spooled remote spans of a trace."""
+    path = _spool_path(trace_id)
+    if not path.exists():
+        return []
+    spans = []
+    try:
+        for line in path.read_text(encoding="utf-8").splitlines():
+            try:
+                spans.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+        path.unlink()
+    except OSError as e:
+        logger.debug(f"[Tracing] Failed to read spool {path}: {e}")
+    _prune_spool()
+    return spans
+
+
+def _prune_spool() -> None:
+    cutoff = time.time() - SPOOL_MAX_AGE_SECONDS
+    try:
+        for stale in TRACE_SPOOL_DIR.glob("*.jsonl"):
+            if stale.stat().st_mtime < cutoff:
+                stale.unlink()
+    except OSError:
+        pass
+
+
+# ============================================================================
+# Turn helpers
+# ============================================================================
+
+def begin_turn_trace(turn_dir: Path, attributes: Optional[Dict[str, Any]] = None) -> Span:
+    """
+    Start the root span of a turn; ending it writes `<turn_dir>/trace.json`.
+
+    Nested turns (e.g. Panda Loop subtasks) become children of the outer turn's
+    span and get their own trace.json.
+    """
+    if not TRACING_ENABLED:
+        return start_span("turn")
+    recorder = TraceRecorder(Path(turn_dir))
+    _current_recorder.set(recorder)
+    span = start_span("turn", kind="server", attributes=attributes)
+    recorder.root = span
+    return span
+
+
+def start_phase_span(phase_name: str, attributes: Optional[Dict[str, Any]] = None) -> None:
+    """Open a phase span for the current turn (paired with end_phase_span)."""
+    recorder = _current_recorder.get()
+    if recorder is None:
+        return
+    attrs = {"phase.name": phase_name}
+    attrs.update(attributes or {})
+    recorder.open_spans[phase_name] = start_span(f"phase.{phase_name}", attributes=attrs)
+
+
+def end_phase_span(phase_name: str, attributes: Optional[Dict[str, Any]] = None) -> None:
+    """Close the phase span opened by start_phase_span."""
+    recorder = _current_recorder.get()
+    span = recorder.open_spans.pop(phase_name, None) if recorder is not None else None
+    if span is None:
+        return
+    for key, value in (attributes or {}).items():
+        span.set_attribute(key, value)
+    span.end()
+
+
+def load_trace(turn_dir: Path) -> Optional[Dict[str, Any]]:
+    """Load a turn's trace.json, or None if the turn was not traced."""
+    path = Path(turn_dir) / TRACE_FILE_NAME
+    if not path.exists():
+        return None
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+# ============================================================================
+# Flamegraph
+# ============================================================================
+
+_SERVICE_COLORS = {"gateway": "#6baed6", "tool_server": "#fd8d3c"}
+_KIND_COLORS = {"client": "#9e9ac8"}
+
+
+def _span_depths(spans: List[Dict[str, Any]], root_id: str) -> Dict[str, int]:
+    parents = {s["spanId"]: s.get("parentSpanId") or "" for s in spans}
+    depths: Dict[str, int] = {}
+
+    def depth(span_id: str) -> int:
+        if span_id in depths:
+            return depths[span_id]
+        chain, current = [], span_id
+        while current and current not in depths and current != root_id and current in parents:
+            chain.append(current)
+            current = parents[current]
+            if len(chain) > len(parents):
+                break
+        base = depths.get(current, 0) if current != root_id else 0
+        for offset, item in enumerate(reversed(chain), start=1):
+            depths[item] = base + offset
+        return depths.get(span_id, 0)
+
+    for span_id in parents:
+        depth(span_id)
+    depths[root_id] = 0
+    return depths
+
+
+def render_flamegraph_html(trace: Dict[str, Any], title: str = "") -> str:
+    """Render a trace document as a self-contained HTML icicle chart."""
+    spans = trace.get("spans", [])
+    start = trace.get("startTimeUnixNano") or min((s["startTimeUnixNano"] for s in spans), default=0)
+    end = trace.get("endTimeUnixNano") or max((s.get("endTimeUnixNano") or start for s in spans), default=start)
+    total = max(end - start, 1)
+    depths = _span_depths(spans, trace.get("rootSpanId", ""))
+    row_height = 22
+
+    bars = []
+    for span in spans:
+        span_start = span["startTimeUnixNano"]
+        span_end = span.get("endTimeUnixNano") or end
+        left = max(0.0, (span_start - start) / total * 100)
+        width = max(0.15, (span_end - span_start) / total * 100)
+        color = _KIND_COLORS.get(span.get("kind"), _SERVICE_COLORS.get(span.get("service"), "#74c476"))
+        if span.get("status", {}).get("code") == "error":
+            color = "#de2d26"
+        tooltip = html.escape(
+            f"{span['name']} - {span.get('durationMs', 0):.1f} ms ({span.get('service', '')})\n"
+            + "\n".join(f"{k}: {v}" for k, v in (span.get("attributes") or {}).items())
+            + (f"\nerror: {span['status'].get('message', '')}" if color == "#de2d26" else "")
+        )
+        label = html.escape(f"{span['name']} ({span.get('durationMs', 0):.0f} ms)")
+        bars.append(
+            f'<div class="bar" style="left:{left:.4f}%;width:{width:.4f}%;'
+            f'top:{depths.get(span["spanId"], 0) * row_height}px;background:{color}" '
+            f'title="{tooltip}">{label}</div>'
+        )
+
+    height = (max(depths.values(), default=0) + 1) * row_height + 10
+    heading = html.escape(title or f"Trace {trace.get('traceId', '')}")
+    return f"""<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>{heading}</title>
+<style>
+body {{ font-family: sans-serif; margin: 16px; }}
+.chart {{ position: relative; height: {height}px; border: 1px solid #ccc; }}
+.bar {{ position: absolute; height: {row_height - 2}px; line-height: {row_height - 2}px; font-size: 11px;
+        overflow: hidden; white-space: nowrap; box-sizing: border-box; padding: 0 3px;
+        border: 1px solid #fff; color: #111; cursor: default; }}
+</style></head>
+<body>
+<h3>{heading}</h3>
+<p>{len(spans)} spans, {trace.get('durationMs', total / 1e6):.0f} ms total.
+Blue: gateway, orange: tool server, purple: outgoing calls, red: errors. Hover for attributes.</p>
+<div class="chart">
+{chr(10).join(bars)}
+</div>
+</body></html>
+"""
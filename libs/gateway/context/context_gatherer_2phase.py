@@ -19,6 +19,7 @@ Architecture Reference:
     architecture/concepts/main-system-patterns/phase2-context-gathering.md
 """
 
+import asyncio
 import json
 import logging
 import os
@@ -215,6 +216,10 @@ class ContextGatherer2Phase:
         self._last_retrieval_plan: Optional[Dict[str, Any]] = None
         self._last_search_results: Optional[SearchResults] = None
 
+        # Speculative prefetch results (see prefetch())
+        self._prefetched: Optional[Dict[str, Any]] = None
+        self._prefetched_turn_index: Optional[TurnIndexDoc] = None
+
         # Load recipes
         self.recipes = self._load_recipes()
 
@@ -410,22 +415,17 @@ class ContextGatherer2Phase:
         # Load retry context if this is a validation retry
         self._load_retry_context(turn_dir)
 
-        # Check supplementary sources (using effective_query with resolved references)
-        self._check_intelligence_cache(effective_query)
-        _, inherited_topic = self._detect_followup(effective_query, turn_number)
-        self._check_research_index(effective_query, intent=None, inherited_topic=inherited_topic)
-
-        # Derive memory intent from data requirements (legacy compatibility)
-        memory_intent = "informational"
-        if self.query_analysis:
-            data_reqs = self.query_analysis.data_requirements or {}
-            if data_reqs.get("needs_current_prices") or data_reqs.get("needs_product_urls"):
-                memory_intent = "commerce"
-
-        await self._check_forever_memory(effective_query, intent=memory_intent)  # Check obsidian_memory for relevant knowledge
-        self._check_matching_lessons(effective_query)
-        self._load_session_memory()
-        self._gather_repo_context()  # Gather repo context for code mode
+        # Check supplementary sources (using effective_query with resolved references),
+        # unless a speculative prefetch already did it for this exact query
+        prefetched = self._prefetched
+        self._prefetched = None
+        if prefetched and prefetched["turn_number"] == turn_number and prefetched["query"] == effective_query:
+            logger.info("[ContextGatherer2Phase] Using speculatively prefetched supplementary sources")
+            inherited_topic = prefetched["inherited_topic"]
+            self._prefetched_turn_index = prefetched["turn_index"]
+        else:
+            self._prefetched_turn_index = None
+            inherited_topic = await self._check_supplementary_sources(effective_query, turn_number)
 
         # Detect user feedback on previous response
         self.user_feedback = self._detect_user_feedback(effective_query)
@@ -543,6 +543,61 @@ class ContextGatherer2Phase:
         logger.info(f"[ContextGatherer2Phase] Gather complete for turn {turn_number}")
         return context_doc
 
+    async def _check_supplementary_sources(self, effective_query: str, turn_number: int) -> Optional[str]:
+        """
+        Run the non-LLM lookups (intel cache, research index, memory, lessons,
+        session memory, repo context) that feed retrieval.
+
+        Returns:
+            Topic inherited from N-1, if any
+        """
+        self._check_intelligence_cache(effective_query)
+        _, inherited_topic = self._detect_followup(effective_query, turn_number)
+        self._check_research_index(effective_query, intent=None, inherited_topic=inherited_topic)
+
+        # Derive memory intent from data requirements (legacy compatibility)
+        memory_intent = "informational"
+        if self.query_analysis:
+            data_reqs = self.query_analysis.data_requirements or {}
+            if data_reqs.get("needs_current_prices") or data_reqs.get("needs_product_urls"):
+                memory_intent = "commerce"
+
+        await self._check_forever_memory(effective_query, intent=memory_intent)  # Check obsidian_memory for relevant knowledge
+        self._check_matching_lessons(effective_query)
+        self._load_session_memory()
+        self._gather_repo_context()  # Gather repo context for code mode
+        return inherited_topic
+
+    async def prefetch(self, query: str, turn_number: int) -> None:
+        """
+        Speculatively run the LLM-free part of gathering ahead of gather().
+
+        Started by RequestHandler while Phase 1.5 is still deciding PROCEED vs
+        CLARIFY, and cancelled on CLARIFY. Only read-only lookups happen here
+        (feedback detection writes to the turn index, so it stays in gather()).
+        Steps yield to the event loop so a cancel lands between lookups.
+
+        Args:
+            query: Original user query
+            turn_number: Turn being gathered for
+        """
+        turn_dir = self.turns_dir / f"turn_{turn_number:06d}"
+        self.query_analysis = QueryAnalysis.load(turn_dir)
+        effective_query = self.query_analysis.resolved_query if self.query_analysis else query
+        await asyncio.sleep(0)
+
+        inherited_topic = await self._check_supplementary_sources(effective_query, turn_number)
+        await asyncio.sleep(0)
+
+        turn_index = self._build_turn_index(turn_number)
+        self._prefetched = {
+            "turn_number": turn_number,
+            "query": effective_query,
+            "inherited_topic": inherited_topic,
+            "turn_index": turn_index,
+        }
+        logger.info(f"[ContextGatherer2Phase] Prefetched supplementary sources for turn {turn_number}")
+
     # ==================================================================
     # PHASE 1: RETRIEVAL
     # ==================================================================
@@ -572,7 +627,8 @@ class ContextGatherer2Phase:
         is_followup = bool(inherited_topic)
 
         # Build turn index (still needed for N-1 preloading and safety checks)
-        turn_index = self._build_turn_index(turn_number)
+        turn_index = self._prefetched_turn_index or self._build_turn_index(turn_number)
+        self._prefetched_turn_index = None
 
         # PRE-LOAD N-1 for follow-ups (deterministic, runs BEFORE search)
         n1_available, preloaded_n1 = self._preload_for_followup(query, turn_number, turn_index)
@@ -8,6 +8,7 @@ Contains:
 - ToolExecutor: Main tool execution with permissions and constraints
 - ToolCatalog: Low-level tool registry and dispatch
 - ExecutionGuard: Budget and safety checks
+- ToolResultReuse: Tool results kept across validation retries of a turn
 - PermissionValidator: Mode and repo-scoped permission gates
 - Workflow system: Registry, matcher, step runner, manager
 
@@ -37,6 +38,7 @@ from libs.gateway.execution.tool_approval import (
     APPROVAL_SYSTEM_ENABLED,
 )
 from libs.gateway.execution.tool_metrics import ToolMetrics
+from libs.gateway.execution.tool_result_reuse import ToolResultReuse, get_tool_result_reuse
 from libs.gateway.execution.workflow_registry import WorkflowRegistry
 from libs.gateway.execution.workflow_matcher import WorkflowMatcher
 from libs.gateway.execution.workflow_step_runner import WorkflowStepRunner, WorkflowResult
@@ -56,6 +58,8 @@ __all__ = [
     "get_tool_approval_manager",
     "APPROVAL_SYSTEM_ENABLED",
     "ToolMetrics",
+    "ToolResultReuse",
+    "get_tool_result_reuse",
     "WorkflowRegistry",
     "WorkflowMatcher",
     "WorkflowStepRunner",
@@ -27,6 +27,9 @@ from typing import Any, Dict, List, Optional, Tuple
 
 import aiohttp
 
+from libs.core.tracing import inject_headers, start_span
+from libs.gateway.execution.tool_result_reuse import get_tool_result_reuse
+
 logger = logging.getLogger(__name__)
 
 
@@ -173,7 +176,21 @@ class ToolExecutor:
         skip_urls: List[str] = None,
         turn_dir=None  # TurnDirectory
     ) -> Dict[str, Any]:
-        """Execute a single tool and extract claims."""
+        """Execute a single tool and extract claims (traced as a "tool.<name>" span)."""
+        with start_span(f"tool.{tool_name}", kind="client", attributes={"tool.name": tool_name}) as span:
+            result = await self._execute_single_tool(tool_name, config, context_doc, skip_urls, turn_dir)
+            span.set_attribute("tool.status", result.get("status"))
+            span.set_attribute("tool.claims", len(result.get("claims") or []))
+            return result
+
+    async def _execute_single_tool(
+        self,
+        tool_name: str,
+        config: Dict[str, Any],
+        context_doc,  # ContextDocument
+        skip_urls: List[str] = None,
+        turn_dir=None  # TurnDirectory
+    ) -> Dict[str, Any]:
         import httpx
         from libs.gateway.execution.permission_validator import get_validator, PermissionDecision
         from apps.services.gateway.services.thinking import emit_thinking_event, ThinkingEvent
@@ -239,6 +256,14 @@ class ToolExecutor:
 
             logger.info(f"[ToolExecutor] Approval granted for {tool_name}")
 
+        # === Reuse result from an earlier validation attempt of this turn ===
+        reuse = get_tool_result_reuse()
+        turn_number = getattr(context_doc, "turn_number", None)
+        cached = reuse.get(tool_name, config, session_id, turn_number)
+        if cached is not None:
+            return cached
+        started = time.time()
+
         # === Build Tool Request ===
         try:
             tool_request = self._build_tool_request(tool_name, config, context_doc)
@@ -249,7 +274,7 @@ class ToolExecutor:
             if tool_name.startswith("memory."):
                 tool_result = await self.execute_memory_tool(tool_name, tool_request, context_doc)
                 claims = self.claims_manager.extract_claims_from_result(tool_name, tool_result, config, skip_urls=skip_urls)
-                return {
+                result = {
                     "tool": tool_name,
                     "status": "success",
                     "description": f"Executed {tool_name}",
@@ -257,6 +282,8 @@ class ToolExecutor:
                     "claims": claims,
                     "resolved_query": tool_request.get("query", context_doc.query)
                 }
+                reuse.put(tool_name, config, session_id, turn_number, result, int((time.time() - started) * 1000))
+                return result
 
             # === Call tool server ===
             orch_url = os.environ.get("TOOL_SERVER_URL", "http://127.0.0.1:8090")
@@ -271,7 +298,8 @@ class ToolExecutor:
             async with httpx.AsyncClient(timeout=timeout) as client:
                 response = await client.post(
                     tool_endpoint,
-                    json=tool_request
+                    json=tool_request,
+                    headers=inject_headers()
                 )
                 response.raise_for_status()
                 tool_result = response.json()
@@ -302,7 +330,7 @@ class ToolExecutor:
             # Extract claims from result
             claims = self.claims_manager.extract_claims_from_result(tool_name, tool_result, config, skip_urls=skip_urls)
 
-            return {
+            result = {
                 "tool": tool_name,
                 "status": "success",
                 "description": f"Executed {tool_name}",
@@ -310,6 +338,8 @@ class ToolExecutor:
                 "claims": claims,
                 "resolved_query": tool_request.get("query", context_doc.query)
             }
+            reuse.put(tool_name, config, session_id, turn_number, result, int((time.time() - started) * 1000))
+            return result
 
         except httpx.TimeoutException as e:
             logger.error(f"[ToolExecutor] Tool timeout ({tool_name}): {type(e).__name__}")
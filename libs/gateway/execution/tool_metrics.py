@@ -4,6 +4,9 @@ Tool Execution Metrics Tracking
 Provides simple metrics tracking for tool executions, enabling observability
 into tool usage patterns, success rates, and performance.
 
+Recent executions stay in memory here; latency percentiles over time live in
+the persistent metrics store (libs/core/metrics_store.py).
+
 Architecture Reference:
     architecture/Implementation/KNOWLEDGE_GRAPH_AND_UI_PLAN.md#Part 4: Coordinator Verification
     Task 4.1: Add Tool Execution Metrics
@@ -32,6 +35,8 @@ import time
 import threading
 import logging
 
+from libs.core.metrics_store import record_metric
+
 logger = logging.getLogger(__name__)
 
 
@@ -115,6 +120,8 @@ class ToolMetrics:
                 # Keep most recent half
                 self._executions = self._executions[-(self.MAX_EXECUTIONS // 2) :]
 
+        record_metric("tool", tool_name, {"latency_ms": duration_ms}, success=status == "success")
+
         logger.debug(
             f"[ToolMetrics] Recorded: {tool_name} {status} "
             f"({duration_ms}ms, turn {turn_number})"
@@ -0,0 +1,318 @@
+"""
+Tool Result Reuse - Keep tool results across validation retries of a turn.
+
+When Phase 7 validation sends a turn back for RETRY, the planning loop runs
+again and usually asks for most of the same tools. This cache keys each
+successful result by (session, turn) and (tool, normalized args) so a retry
+only re-executes what the validator flagged (failed URLs / claims /
+mismatches) or what the planner newly asks for.
+
+Only tools in READ_ONLY_TOOLS are reused. Any other tool always executes and,
+since it may have changed files or memory, drops the results cached so far
+for its turn.
+
+Usage:
+    reuse = get_tool_result_reuse()
+    reuse.begin_turn(session, turn)                    # RequestHandler, incremental retry mode
+    reuse.start_attempt(session, turn, attempt)
+    cached = reuse.get(tool, args, session, turn)      # ToolExecutor, before executing
+    reuse.put(tool, args, session, turn, result, ms)   # ToolExecutor, after success
+    reuse.mark_stale(session, turn, failure_context)   # RequestHandler, on RETRY
+    reuse.attempt_stats(session, turn)                 # Work reused in the current attempt
+    reuse.end_turn(session, turn)
+"""
+
+import json
+import logging
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Read-only tools whose results may be replayed within a turn. Anything not
+# listed is treated as mutating: never replayed, and it invalidates the turn.
+READ_ONLY_TOOLS = frozenset({
+    # Research / commerce
+    "internet.research",
+    "internet.research_full",
+    "research.orchestrate",
+    "research.deep",
+    "research.general",
+    "research.discover_sources",
+    "search.orchestrate",
+    "commerce.search_offers",
+    "commerce.search_with_recommendations",
+    "commerce.quick_search",
+    "purchasing.lookup",
+    "web.fetch",
+    "web.fetch_text",
+    # Docs / memory lookups
+    "doc.search",
+    "wiki.search",
+    "docs.read_spreadsheet",
+    "spreadsheet.read",
+    "memory.search",
+    "memory.query",
+    "memory.retrieve",
+    "memory.recall",
+    # Code / repo reads
+    "file.read",
+    "file.read_outline",
+    "file.read_chunked",
+    "file.grep",
+    "file.glob",
+    "fs.read",
+    "code.search",
+    "code.verify_suite",
+    "repo.describe",
+    "repo.scope_discover",
+    "git.status",
+    "git.diff",
+    "git.log",
+    "test.run",
+    "skill.list",
+})
+
+# Args that identify the request rather than the work (turn is part of the key already)
+VOLATILE_ARG_KEYS = frozenset({"session_id", "turn_number", "trace_id", "force_refresh"})
+
+# (session_id, turn_number)
+TurnKey = Tuple[str, int]
+
+# Turns tracked at once (oldest dropped first if a request never called end_turn)
+MAX_TRACKED_TURNS = 32
+
+_URL_RE = re.compile(r"https?://[^\s\"'<>\]\)]+")
+
+
+def normalize_tool_args(args: Dict[str, Any]) -> str:
+    """
+    Canonical string for tool args: sorted keys, volatile keys dropped,
+    strings whitespace-collapsed (case is kept: paths and patterns are
+    case-sensitive).
+    """
+    def normalize(value: Any) -> Any:
+        if isinstance(value, str):
+            return " ".join(value.split())
+        if isinstance(value, dict):
+            return {k: normalize(v) for k, v in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [normalize(v) for v in value]
+        return value
+
+    stable = {k: normalize(v) for k, v in (args or {}).items() if k not in VOLATILE_ARG_KEYS}
+    return json.dumps(stable, sort_keys=True, default=str)
+
+
+@dataclass
+class ReuseEntry:
+    """A cached tool result and where it came from."""
+    tool: str
+    result: Dict[str, Any]
+    attempt: int
+    duration_ms: int = 0
+    stale: bool = False
+
+    def references(self, urls: Set[str], claims: Set[str]) -> bool:
+        """True if this result mentions any of the failed URLs or claim contents."""
+        text = json.dumps(self.result, default=str)
+        if urls and any(url in urls for url in _URL_RE.findall(text)):
+            return True
+        return bool(claims) and any(claim in text for claim in claims)
+
+
+@dataclass
+class AttemptStats:
+    """Work done vs reused in one planning attempt."""
+    attempt: int
+    executed: int = 0
+    reused: int = 0
+    invalidated: int = 0
+    reused_ms: int = 0
+    executed_tools: List[str] = field(default_factory=list)
+    reused_tools: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "attempt": self.attempt,
+            "executed": self.executed,
+            "reused": self.reused,
+            "invalidated": self.invalidated,
+            "reused_ms": self.reused_ms,
+        }
+
+
+class ToolResultReuse:
+    """Per-turn tool result cache used by incremental validation retries."""
+
+    def __init__(self, max_turns: int = MAX_TRACKED_TURNS):
+        self.max_turns = max_turns
+        self._turns: "OrderedDict[TurnKey, Dict[Tuple[str, str], ReuseEntry]]" = OrderedDict()
+        self._stats: Dict[TurnKey, AttemptStats] = {}
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Turn lifecycle (RequestHandler)
+    # ------------------------------------------------------------------
+
+    def begin_turn(self, session_id: str, turn: int) -> None:
+        """Start tracking a session's turn. Results for untracked turns are never cached."""
+        key = (session_id, turn)
+        with self._lock:
+            self._turns[key] = {}
+            self._stats[key] = AttemptStats(attempt=1)
+            while len(self._turns) > self.max_turns:
+                old_key, _ = self._turns.popitem(last=False)
+                self._stats.pop(old_key, None)
+
+    def end_turn(self, session_id: str, turn: int) -> None:
+        """Drop everything cached for a session's turn."""
+        key = (session_id, turn)
+        with self._lock:
+            self._turns.pop(key, None)
+            self._stats.pop(key, None)
+
+    def is_tracking(self, session_id: Optional[str], turn: Optional[int]) -> bool:
+        return (session_id, turn) in self._turns
+
+    def start_attempt(self, session_id: str, turn: int, attempt: int) -> None:
+        """Reset per-attempt counters (invalidations from the previous RETRY carry over)."""
+        key = (session_id, turn)
+        with self._lock:
+            if key not in self._turns:
+                return
+            invalidated = self._stats[key].invalidated if attempt > 1 else 0
+            self._stats[key] = AttemptStats(attempt=attempt, invalidated=invalidated)
+
+    def mark_stale(self, session_id: str, turn: int, failure_context: Any) -> int:
+        """
+        Mark cached results that the validator's failure context points at.
+
+        Args:
+            session_id: Session the turn belongs to
+            turn: Turn number
+            failure_context: ValidationFailureContext (failed_urls, failed_claims, mismatches)
+
+        Returns:
+            Number of entries invalidated
+        """
+        key = (session_id, turn)
+        entries = self._turns.get(key)
+        if not entries or failure_context is None:
+            return 0
+
+        urls = set(getattr(failure_context, "failed_urls", None) or [])
+        claims = set()
+        for claim in getattr(failure_context, "failed_claims", None) or []:
+            if isinstance(claim, dict):
+                urls.update(v for k, v in claim.items() if k in ("url", "source") and isinstance(v, str) and v.startswith("http"))
+                if claim.get("content"):
+                    claims.add(str(claim["content"]))
+        for mismatch in getattr(failure_context, "mismatches", None) or []:
+            if isinstance(mismatch, dict) and isinstance(mismatch.get("url"), str):
+                urls.add(mismatch["url"])
+
+        if not urls and not claims:
+            return 0
+
+        invalidated = 0
+        with self._lock:
+            for entry in entries.values():
+                if not entry.stale and entry.references(urls, claims):
+                    entry.stale = True
+                    invalidated += 1
+            self._stats[key].invalidated += invalidated
+
+        logger.info(f"[ToolResultReuse] Turn {turn}: {invalidated}/{len(entries)} cached results invalidated by validation")
+        return invalidated
+
+    # ------------------------------------------------------------------
+    # Lookup / store (ToolExecutor)
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def is_reusable_tool(tool: str) -> bool:
+        return tool in READ_ONLY_TOOLS
+
+    def get(
+        self,
+        tool: str,
+        args: Dict[str, Any],
+        session_id: Optional[str],
+        turn: Optional[int],
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Return a copy of a fresh cached result, marked reused=True, or None.
+        Misses are not counted here; put() counts executions.
+        """
+        key = (session_id, turn)
+        entries = self._turns.get(key)
+        if entries is None or not self.is_reusable_tool(tool):
+            return None
+
+        entry = entries.get((tool, normalize_tool_args(args)))
+        if entry is None or entry.stale:
+            return None
+
+        with self._lock:
+            stats = self._stats[key]
+            stats.reused += 1
+            stats.reused_ms += entry.duration_ms
+            stats.reused_tools.append(tool)
+
+        logger.info(f"[ToolResultReuse] Reusing {tool} result from attempt {entry.attempt} (turn {turn})")
+        return {**entry.result, "reused": True, "reused_from_attempt": entry.attempt}
+
+    def put(
+        self,
+        tool: str,
+        args: Dict[str, Any],
+        session_id: Optional[str],
+        turn: Optional[int],
+        result: Dict[str, Any],
+        duration_ms: int = 0,
+    ) -> None:
+        """
+        Record an executed tool. Successful read-only results are kept; any
+        other tool may have changed what earlier reads saw, so the turn's
+        cached results are dropped.
+        """
+        key = (session_id, turn)
+        entries = self._turns.get(key)
+        if entries is None:
+            return
+
+        with self._lock:
+            stats = self._stats[key]
+            stats.executed += 1
+            stats.executed_tools.append(tool)
+            if not self.is_reusable_tool(tool):
+                if entries:
+                    logger.info(f"[ToolResultReuse] {tool} may have side effects, dropping {len(entries)} cached results (turn {turn})")
+                    entries.clear()
+            elif result.get("status") == "success":
+                entries[(tool, normalize_tool_args(args))] = ReuseEntry(
+                    tool=tool,
+                    result=result,
+                    attempt=stats.attempt,
+                    duration_ms=duration_ms,
+                )
+
+    def attempt_stats(self, session_id: str, turn: int) -> Optional[AttemptStats]:
+        """Counters for the current attempt of a session's turn."""
+        return self._stats.get((session_id, turn))
+
+
+# Global singleton
+_reuse: Optional[ToolResultReuse] = None
+
+
+def get_tool_result_reuse() -> ToolResultReuse:
+    """Get the global ToolResultReuse instance."""
+    global _reuse
+    if _reuse is None:
+        _reuse = ToolResultReuse()
+    return _reuse
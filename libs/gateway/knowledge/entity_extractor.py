@@ -16,6 +16,7 @@ See: architecture/Implementation/KNOWLEDGE_GRAPH_AND_UI_PLAN.md
 
 import logging
 import re
+import string
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, Set, Tuple
 from urllib.parse import urlparse
@@ -90,6 +91,125 @@ ENTITY_TYPES = {
 }
 
 
+# =============================================================================
+# Anchored Multi-Pattern Scanner
+# =============================================================================
+
+# How far before an "end" anchor a match may start, and how far past it it may run
+ANCHOR_BACK_WINDOW = 200
+ANCHOR_FORWARD_WINDOW = 100
+
+_ASCII_LOWER = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
+# Character that must precede an "end" anchor for the pattern to be able to match there
+_ANCHOR_GUARDS = {
+    "after_space": lambda ch: ch.isspace(),
+    "after_digit": lambda ch: ch.isspace() or ch.isdigit(),
+    "after_word": lambda ch: ch.isalnum() or ch in "_-",
+}
+
+
+class AnchoredScanner:
+    """
+    Runs a family of regexes over a text by jumping between literal anchors.
+
+    Every extraction pattern contains at least one literal keyword ("from",
+    "$", "for sale", ".com", ...). Instead of letting each regex walk the
+    whole text, the scanner finds all anchor literals in one ASCII-lowercased
+    copy of the text with str.find (C-speed substring search), then only tries a
+    pattern where one of its anchors occurs:
+
+    - "start" anchors begin the match, so the pattern is tried with
+      pattern.match() at the anchor position.
+    - "end" anchors (after_space / after_digit / after_word) sit at the tail
+      of the match, so the pattern is searched for in a bounded window before
+      the anchor. Anchors not preceded by the required character are skipped.
+
+    Results follow finditer() semantics per pattern (leftmost, non-overlapping).
+    They only differ from a full scan for "end" matches longer than
+    ANCHOR_BACK_WINDOW / ANCHOR_FORWARD_WINDOW characters.
+    """
+
+    def __init__(self, patterns: List[Tuple[re.Pattern, Tuple[Tuple[str, ...], str]]]):
+        """
+        Args:
+            patterns: List of (compiled_pattern, (anchor_literals, mode)) tuples.
+                Anchor literals must be lowercase.
+        """
+        self._patterns = patterns
+        # Distinct anchor literal -> indexes of the patterns it anchors
+        self._literal_index: Dict[str, List[int]] = {}
+        for idx, (_, (literals, _mode)) in enumerate(patterns):
+            for literal in literals:
+                self._literal_index.setdefault(literal, []).append(idx)
+
+    def scan(self, text: str) -> List[List[re.Match]]:
+        """
+        Find all matches of every pattern.
+
+        Returns:
+            One list of matches per pattern, in pattern order, each in text order
+        """
+        # ASCII-only lowercasing keeps offsets aligned with the original text
+        lowered = text.translate(_ASCII_LOWER)
+
+        # One pass per distinct literal (shared between patterns) to collect anchors
+        anchors: List[List[Tuple[int, int]]] = [[] for _ in self._patterns]
+        for literal, pattern_indexes in self._literal_index.items():
+            positions = []
+            pos = lowered.find(literal)
+            while pos != -1:
+                positions.append((pos, pos + len(literal)))
+                pos = lowered.find(literal, pos + 1)
+            if positions:
+                for idx in pattern_indexes:
+                    anchors[idx].extend(positions)
+
+        results: List[List[re.Match]] = []
+        for (pattern, (_, mode)), hits in zip(self._patterns, anchors):
+            hits.sort()
+            if mode == "start":
+                results.append(self._match_at_starts(pattern, text, hits))
+            else:
+                results.append(self._search_before_ends(pattern, text, hits, _ANCHOR_GUARDS[mode]))
+        return results
+
+    @staticmethod
+    def _match_at_starts(pattern, text: str, hits: List[Tuple[int, int]]) -> List[re.Match]:
+        """Try the pattern at each anchor that starts outside the previous match."""
+        matches = []
+        last_end = 0
+        for start, _ in hits:
+            if start < last_end:
+                continue
+            match = pattern.match(text, start)
+            if match:
+                matches.append(match)
+                last_end = max(match.end(), start + 1)
+        return matches
+
+    @staticmethod
+    def _search_before_ends(pattern, text: str, hits: List[Tuple[int, int]], guard) -> List[re.Match]:
+        """Search a window ending just past each anchor for the leftmost match."""
+        matches = []
+        last_end = 0
+        text_len = len(text)
+        for start, end in hits:
+            if end <= last_end or start == 0 or not guard(text[start - 1]):
+                continue
+            window_start = max(last_end, start - ANCHOR_BACK_WINDOW)
+            window_end = min(text_len, end + ANCHOR_FORWARD_WINDOW)
+            match = pattern.search(text, window_start, window_end)
+            if match and window_end < text_len:
+                # The window edge may have cut a greedy match short (or faked
+                # a boundary there) - re-run from the same start on the full text
+                match = pattern.match(text, match.start()) or pattern.search(text, window_start)
+            if match:
+                matches.append(match)
+                last_end = max(match.end(), match.start() + 1)
+        return matches
+
+
 # =============================================================================
 # Entity Extractor
 # =============================================================================
@@ -104,6 +224,9 @@ class EntityExtractor:
     - Sites: Domain names and URLs
     - Products: Items being searched for or purchased
 
+    All pattern families are evaluated in a single AnchoredScanner pass, so
+    large documents are not re-walked once per regex.
+
     Example:
         extractor = EntityExtractor()
         entities = extractor.extract_from_text("Buy from Example Pet Store for $75")
@@ -175,6 +298,41 @@ class EntityExtractor:
         (r"(?:thread|post|article|discussion)(?:\s+titled?)?\s*[:\-]?\s*\"?([^\".\n]{10,100})\"?", 0.75),
     ]
 
+    # Literal anchors for each pattern above, in the same order (see AnchoredScanner).
+    # "start": the match begins with the anchor. Other modes: the anchor ends the
+    # match and must be preceded by whitespace / a digit / a word character.
+    VENDOR_ANCHORS = [
+        (("hamstery", "pet", "breeder", "store", "market", "shop", "llc", "inc"), "after_space"),
+        (("from", "at", "via", "by", "through"), "start"),
+        (("sells", "offers", "has", "carries", "stocks", "is"), "after_space"),
+        (("sold",), "start"),
+        (("available",), "start"),
+        (("buy", "order", "purchase"), "start"),
+    ]
+
+    PRICE_ANCHORS = [
+        (("$",), "start"),
+        (("dollar", "usd"), "after_digit"),
+        (("$",), "start"),
+    ]
+
+    SITE_ANCHORS = [
+        (("http",), "start"),
+        (("on", "at", "from", "visit", "check"), "start"),
+        ((".com", ".org", ".net", ".io"), "after_word"),
+    ]
+
+    PRODUCT_ANCHORS = [
+        (("buy", "find", "looking", "searching", "want"), "start"),
+        (("sale",), "after_space"),
+        (("best", "cheapest", "top"), "start"),
+    ]
+
+    THREAD_ANCHORS = [
+        (('"',), "start"),
+        (("thread", "post", "article", "discussion"), "start"),
+    ]
+
     def __init__(self):
         """Initialize the entity extractor."""
         # Compile patterns for efficiency
@@ -184,6 +342,36 @@ class EntityExtractor:
         self._compiled_product = [(re.compile(p, re.IGNORECASE), c) for p, c in self.PRODUCT_PATTERNS]
         self._compiled_thread = [(re.compile(p, re.IGNORECASE), c) for p, c in self.THREAD_PATTERNS]
 
+        # One scanner over all families so shared anchors ("from", "at", "$") are located once
+        self._families = [
+            (self._compiled_vendor, self.VENDOR_ANCHORS),
+            (self._compiled_price, self.PRICE_ANCHORS),
+            (self._compiled_site, self.SITE_ANCHORS),
+            (self._compiled_product, self.PRODUCT_ANCHORS),
+            (self._compiled_thread, self.THREAD_ANCHORS),
+        ]
+        self._scanner = AnchoredScanner([
+            (pattern, anchor)
+            for compiled, anchors in self._families
+            for (pattern, _), anchor in zip(compiled, anchors)
+        ])
+
+    def _scan(self, text: str) -> List[List[List[re.Match]]]:
+        """
+        Run every pattern over the text in a single anchored scan.
+
+        Returns:
+            Matches grouped per family (vendor, price, site, product, thread),
+            then per pattern in declaration order
+        """
+        flat = self._scanner.scan(text)
+        grouped = []
+        offset = 0
+        for compiled, _ in self._families:
+            grouped.append(flat[offset:offset + len(compiled)])
+            offset += len(compiled)
+        return grouped
+
     # =========================================================================
     # Main Extraction Methods
     # =========================================================================
@@ -209,12 +397,13 @@ class EntityExtractor:
         entities: List[ExtractedEntity] = []
         context = context or {}
 
-        # Extract each entity type
-        entities.extend(self._extract_vendors(text))
-        entities.extend(self._extract_prices(text))
-        entities.extend(self._extract_sites(text))
-        entities.extend(self._extract_products(text))
-        entities.extend(self._extract_threads(text))
+        # Extract each entity type from a single scan of the text
+        vendor_matches, price_matches, site_matches, product_matches, thread_matches = self._scan(text)
+        entities.extend(self._extract_vendors(text, vendor_matches))
+        entities.extend(self._extract_prices(text, price_matches))
+        entities.extend(self._extract_sites(text, site_matches))
+        entities.extend(self._extract_products(text, product_matches))
+        entities.extend(self._extract_threads(text, thread_matches))
 
         # Normalize all entities
         entities = [self.normalize_entity(e) for e in entities]
@@ -325,13 +514,17 @@ class EntityExtractor:
     # Type-Specific Extraction
     # =========================================================================
 
-    def _extract_vendors(self, text: str) -> List[ExtractedEntity]:
+    def _extract_vendors(
+        self,
+        text: str,
+        pattern_matches: List[List[re.Match]]
+    ) -> List[ExtractedEntity]:
         """Extract vendor entities from text."""
         entities = []
         seen_texts: Set[str] = set()
 
-        for pattern, base_confidence in self._compiled_vendor:
-            for match in pattern.finditer(text):
+        for (_, base_confidence), matches in zip(self._compiled_vendor, pattern_matches):
+            for match in matches:
                 vendor_name = match.group(1).strip()
 
                 # Skip if too short or already seen
@@ -359,12 +552,16 @@ class EntityExtractor:
 
         return entities
 
-    def _extract_prices(self, text: str) -> List[ExtractedEntity]:
+    def _extract_prices(
+        self,
+        text: str,
+        pattern_matches: List[List[re.Match]]
+    ) -> List[ExtractedEntity]:
         """Extract price entities from text."""
         entities = []
 
-        for pattern, base_confidence in self._compiled_price:
-            for match in pattern.finditer(text):
+        for (_, base_confidence), matches in zip(self._compiled_price, pattern_matches):
+            for match in matches:
                 groups = match.groups()
 
                 # Handle single price or price range
@@ -397,13 +594,17 @@ class EntityExtractor:
 
         return entities
 
-    def _extract_sites(self, text: str) -> List[ExtractedEntity]:
+    def _extract_sites(
+        self,
+        text: str,
+        pattern_matches: List[List[re.Match]]
+    ) -> List[ExtractedEntity]:
         """Extract site/URL entities from text."""
         entities = []
         seen_domains: Set[str] = set()
 
-        for pattern, base_confidence in self._compiled_site:
-            for match in pattern.finditer(text):
+        for (_, base_confidence), matches in zip(self._compiled_site, pattern_matches):
+            for match in matches:
                 url_or_domain = match.group(1).strip()
 
                 # Parse to get domain
@@ -439,13 +640,17 @@ class EntityExtractor:
 
         return entities
 
-    def _extract_products(self, text: str) -> List[ExtractedEntity]:
+    def _extract_products(
+        self,
+        text: str,
+        pattern_matches: List[List[re.Match]]
+    ) -> List[ExtractedEntity]:
         """Extract product entities from text."""
         entities = []
         seen_products: Set[str] = set()
 
-        for pattern, base_confidence in self._compiled_product:
-            for match in pattern.finditer(text):
+        for (_, base_confidence), matches in zip(self._compiled_product, pattern_matches):
+            for match in matches:
                 product_name = match.group(1).strip()
 
                 # Clean up product name
@@ -478,13 +683,17 @@ class EntityExtractor:
 
         return entities
 
-    def _extract_threads(self, text: str) -> List[ExtractedEntity]:
+    def _extract_threads(
+        self,
+        text: str,
+        pattern_matches: List[List[re.Match]]
+    ) -> List[ExtractedEntity]:
         """Extract thread/article title entities from text."""
         entities = []
         seen_titles: Set[str] = set()
 
-        for pattern, base_confidence in self._compiled_thread:
-            for match in pattern.finditer(text):
+        for (_, base_confidence), matches in zip(self._compiled_thread, pattern_matches):
+            for match in matches:
                 title = match.group(1).strip()
 
                 # Skip if too short or already seen
@@ -5,7 +5,7 @@ This module implements the compounding context pattern where entity documents
 grow over time as new information is discovered. When research results arrive,
 the EntityUpdater:
 1. Extracts entities using EntityExtractor
-2. Finds or creates each entity in the knowledge graph
+2. Upserts all extracted entities into the knowledge graph in one batch
 3. Loads or creates the EntityDocument
 4. Updates with new properties and mentions
 5. Saves the updated document
@@ -94,50 +94,68 @@ class EntityUpdater:
             f"[EntityUpdater] Processing {len(entities)} entities from turn {turn_number}"
         )
 
+        # Upsert all entities and their mentions in one transaction rather
+        # than a find_entity/add_entity round trip per entity.
+        try:
+            entity_ids = self.kg.ingest_batch(
+                entities=[
+                    {
+                        "entity_type": entity.entity_type,
+                        "canonical_name": entity.canonical_name,
+                        "aliases": [entity.text] if entity.text != entity.canonical_name else [],
+                        "data": entity.properties,
+                        "turn_number": turn_number,
+                        "confidence": entity.confidence,
+                    }
+                    for entity in entities
+                ],
+                mentions=[
+                    {
+                        "entity": (entity.entity_type, entity.canonical_name),
+                        "document_path": f"turn_{turn_number}",
+                        "turn_number": turn_number,
+                        "context": entity.context,
+                        "confidence": entity.confidence,
+                    }
+                    for entity in entities
+                ],
+            )
+        except Exception as e:
+            logger.error(
+                f"[EntityUpdater] Knowledge graph ingest failed for turn {turn_number}: {e}"
+            )
+            return
+
         for entity in entities:
             try:
-                self._process_entity(entity, turn_number)
+                entity_id = entity_ids.get((entity.entity_type, entity.canonical_name))
+                self._process_entity(entity, entity_id, turn_number)
             except Exception as e:
                 logger.error(
                     f"[EntityUpdater] Failed to process entity "
                     f"{entity.canonical_name}: {e}"
                 )
 
-    def _process_entity(self, entity: Any, turn_number: int):
+    def _process_entity(self, entity: Any, entity_id: Optional[int], turn_number: int):
         """
-        Process a single extracted entity.
+        Update the entity document for a single extracted entity.
+
+        The entity itself has already been upserted into the knowledge graph
+        by process_research_results.
 
         Args:
             entity: ExtractedEntity from EntityExtractor
+            entity_id: Knowledge graph ID for the entity
             turn_number: The turn where this entity was found
         """
-        # Check if entity exists in knowledge graph
-        existing = self.kg.find_entity(entity.canonical_name, entity.entity_type)
-
-        if existing:
-            entity_id = existing.id
-            # Load existing document
-            doc = self._load_entity_document(existing)
-            if doc is None:
-                # Document doesn't exist but entity does - create new doc
-                doc = EntityDocument(
-                    entity_type=entity.entity_type,
-                    canonical_name=entity.canonical_name,
-                    entity_id=entity_id
-                )
-        else:
-            # Create new entity in knowledge graph
-            entity_id = self.kg.add_entity(
-                entity_type=entity.entity_type,
-                canonical_name=entity.canonical_name,
-                aliases=[entity.text] if entity.text != entity.canonical_name else [],
-                data=entity.properties,
-                turn_number=turn_number
-            )
-            # Create new document
+        # The name may have matched an existing entity by case or alias, whose
+        # document lives under the stored canonical name
+        existing = self.kg.get_entity(entity_id) if entity_id is not None else None
+        doc = self._load_entity_document(existing or entity)
+        if doc is None:
             doc = EntityDocument(
                 entity_type=entity.entity_type,
-                canonical_name=entity.canonical_name,
+                canonical_name=existing.canonical_name if existing else entity.canonical_name,
                 entity_id=entity_id
             )
 
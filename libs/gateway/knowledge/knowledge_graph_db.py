@@ -25,7 +25,7 @@ import logging
 import threading
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterable, Optional, Tuple, Union
 from dataclasses import dataclass, field
 
 logger = logging.getLogger(__name__)
@@ -39,6 +39,13 @@ SCHEMA_VERSION = 1
 # Default database path
 DEFAULT_DB_PATH = Path("panda_system_docs/knowledge_graph.db")
 
+# Max (entity_type, canonical_name) pairs per IN (VALUES ...) lookup.
+# Keeps us well under SQLite's bound-parameter limit.
+_LOOKUP_CHUNK_SIZE = 400
+
+# An entity reference in batch APIs: either a row id or (entity_type, canonical_name)
+EntityRef = Union[int, Tuple[str, str]]
+
 
 # =============================================================================
 # Data Classes
@@ -89,6 +96,33 @@ class Relationship:
     created_at: Optional[datetime] = None
 
 
+@dataclass
+class Subgraph:
+    """
+    Compact result of a multi-hop traversal.
+
+    Nodes carry only identity and hop distance (no aliases or entity_data JSON);
+    call get_entity() for the full record of the nodes you actually need.
+    """
+    root_id: int
+    # entity id -> {"entity_type", "canonical_name", "depth"}
+    nodes: Dict[int, Dict[str, Any]] = field(default_factory=dict)
+    # (source_id, target_id, relationship_type, confidence, weight)
+    edges: List[Tuple[int, int, str, float, float]] = field(default_factory=list)
+
+    def neighbors(self, entity_id: int, relationship_type: str = None) -> List[int]:
+        """IDs connected to entity_id by an edge in this subgraph (either direction)."""
+        result = []
+        for source_id, target_id, rel_type, _, _ in self.edges:
+            if relationship_type and rel_type != relationship_type:
+                continue
+            if source_id == entity_id:
+                result.append(target_id)
+            elif target_id == entity_id:
+                result.append(source_id)
+        return result
+
+
 @dataclass
 class EntityMention:
     """
@@ -153,19 +187,37 @@ class KnowledgeGraphDB:
         # Query relationships
         relationships = kg.get_relationships(product_id, "sells", direction="incoming")
 
+        # Multi-hop neighborhood in one query
+        subgraph = kg.traverse(vendor_id, max_depth=2, relationship_types=["sells", "mentioned_in"])
+
         # Get backlinks to a document
         backlinks = kg.get_backlinks_to("Knowledge/Products/syrian-hamster.md")
+
+        # Bulk upsert in one transaction (post-research graph updates)
+        ids = kg.ingest_batch(
+            entities=[{"entity_type": "vendor", "canonical_name": "Example Pet Store"}],
+            mentions=[{"entity": ("vendor", "Example Pet Store"), "document_path": "turn_64"}],
+        )
     """
 
-    def __init__(self, db_path: Path = None):
+    def __init__(self, db_path: Path = None, adjacency_cache: bool = False):
         """
         Initialize the knowledge graph database.
 
         Args:
             db_path: Path to SQLite database file. Defaults to panda_system_docs/knowledge_graph.db
+            adjacency_cache: Answer traverse() from an in-memory adjacency list
+                instead of SQL. The list is rebuilt lazily after relationship
+                writes made through this instance.
         """
         self.db_path = db_path or DEFAULT_DB_PATH
         self._lock = threading.Lock()
+        # (entity_type, canonical_name) -> entity id. Entities are never deleted,
+        # so ids are stable and the map only ever grows.
+        self._entity_ids: Dict[Tuple[str, str], int] = {}
+        self.adjacency_cache = adjacency_cache
+        # entity id -> [(neighbor_id, relationship_type, is_outgoing, confidence, weight)]
+        self._adjacency: Optional[Dict[int, List[Tuple[int, str, bool, float, float]]]] = None
         self._init_db()
 
     def _get_connection(self) -> sqlite3.Connection:
@@ -374,6 +426,7 @@ class KnowledgeGraphDB:
                 logger.debug(f"[KnowledgeGraphDB] Created entity {entity_id}: {canonical_name}")
 
             conn.commit()
+            self._entity_ids[(entity_type, canonical_name)] = entity_id
             return entity_id
 
     def find_entity(
@@ -597,6 +650,7 @@ class KnowledgeGraphDB:
                 logger.debug(f"[KnowledgeGraphDB] Created relationship {rel_id}")
 
             conn.commit()
+            self._adjacency = None
             return rel_id
 
     def get_relationships(
@@ -767,6 +821,189 @@ class KnowledgeGraphDB:
             created_at=datetime.fromisoformat(row["created_at"]) if row["created_at"] else None
         )
 
+    # =========================================================================
+    # Graph Traversal
+    # =========================================================================
+
+    def traverse(
+        self,
+        entity_id: int,
+        max_depth: int = 2,
+        relationship_types: List[str] = None,
+        limit: int = 100,
+        direction: str = "both"
+    ) -> Subgraph:
+        """
+        Walk the relationship graph outward from an entity.
+
+        Replaces chains of get_related_entities() calls: a vendor -> product ->
+        thread walk is answered by a single recursive CTE (or from the
+        adjacency cache when enabled) instead of one query per hop.
+
+        Args:
+            entity_id: Entity to start from (depth 0)
+            max_depth: Maximum number of hops to follow
+            relationship_types: Only follow these relationship types (default: all)
+            limit: Maximum number of nodes to return, nearest first
+            direction: "outgoing" (follow source -> target), "incoming"
+                (target -> source), or "both"
+
+        Returns:
+            Subgraph with the reached nodes and the edges between them
+        """
+        if direction not in ("outgoing", "incoming", "both"):
+            raise ValueError(f"Invalid direction: {direction}")
+
+        if self.adjacency_cache:
+            return self._traverse_cached(entity_id, max_depth, relationship_types, limit, direction)
+
+        type_filter = ""
+        type_params: List[Any] = []
+        if relationship_types:
+            type_filter = f"AND r.relationship_type IN ({', '.join('?' for _ in relationship_types)})"
+            type_params = list(relationship_types)
+
+        steps = []
+        step_params: List[Any] = []
+        if direction in ("outgoing", "both"):
+            steps.append(f"""
+                SELECT r.target_entity_id, w.depth + 1
+                FROM walk w JOIN relationships r ON r.source_entity_id = w.entity_id
+                WHERE w.depth < ? {type_filter}
+            """)
+            step_params += [max_depth] + type_params
+        if direction in ("incoming", "both"):
+            steps.append(f"""
+                SELECT r.source_entity_id, w.depth + 1
+                FROM walk w JOIN relationships r ON r.target_entity_id = w.entity_id
+                WHERE w.depth < ? {type_filter}
+            """)
+            step_params += [max_depth] + type_params
+
+        # Nodes and the edges between them come back from one statement,
+        # tagged by kind so both can share a column layout.
+        query = f"""
+            WITH RECURSIVE walk(entity_id, depth) AS (
+                SELECT ?, 0
+                UNION
+                {" UNION ".join(steps)}
+            ),
+            nodes AS (
+                SELECT entity_id, MIN(depth) AS depth
+                FROM walk
+                GROUP BY entity_id
+                ORDER BY depth, entity_id
+                LIMIT ?
+            )
+            SELECT 'node' AS kind, n.entity_id AS a, NULL AS b,
+                   e.entity_type AS label, e.canonical_name AS name,
+                   n.depth AS depth, NULL AS confidence, NULL AS weight
+            FROM nodes n JOIN entities e ON e.id = n.entity_id
+            UNION ALL
+            SELECT 'edge', r.source_entity_id, r.target_entity_id,
+                   r.relationship_type, NULL, NULL, r.confidence, r.weight
+            FROM relationships r
+            WHERE r.source_entity_id IN (SELECT entity_id FROM nodes)
+              AND r.target_entity_id IN (SELECT entity_id FROM nodes)
+              {type_filter}
+        """
+        params = [entity_id] + step_params + [limit] + type_params
+
+        conn = self._get_connection()
+        subgraph = Subgraph(root_id=entity_id)
+        for row in conn.execute(query, params):
+            if row["kind"] == "node":
+                subgraph.nodes[row["a"]] = {
+                    "entity_type": row["label"],
+                    "canonical_name": row["name"],
+                    "depth": row["depth"],
+                }
+            else:
+                subgraph.edges.append(
+                    (row["a"], row["b"], row["label"], row["confidence"], row["weight"])
+                )
+        return subgraph
+
+    def _traverse_cached(
+        self,
+        entity_id: int,
+        max_depth: int,
+        relationship_types: Optional[List[str]],
+        limit: int,
+        direction: str
+    ) -> Subgraph:
+        """Breadth-first traverse() over the in-memory adjacency list."""
+        adjacency = self._load_adjacency()
+        allowed = set(relationship_types) if relationship_types else None
+
+        def follows(rel_type: str, is_outgoing: bool) -> bool:
+            if allowed is not None and rel_type not in allowed:
+                return False
+            if direction == "outgoing":
+                return is_outgoing
+            if direction == "incoming":
+                return not is_outgoing
+            return True
+
+        depths = {entity_id: 0}
+        frontier = [entity_id]
+        for depth in range(1, max_depth + 1):
+            next_frontier = []
+            for node_id in frontier:
+                for neighbor_id, rel_type, is_outgoing, _, _ in adjacency.get(node_id, ()):
+                    if neighbor_id not in depths and follows(rel_type, is_outgoing):
+                        depths[neighbor_id] = depth
+                        next_frontier.append(neighbor_id)
+            frontier = next_frontier
+
+        # Match the SQL path: nearest first, ties by id
+        selected = sorted(depths, key=lambda node_id: (depths[node_id], node_id))[:limit]
+        selected_set = set(selected)
+
+        conn = self._get_connection()
+        subgraph = Subgraph(root_id=entity_id)
+        for start in range(0, len(selected), _LOOKUP_CHUNK_SIZE):
+            chunk = selected[start:start + _LOOKUP_CHUNK_SIZE]
+            cursor = conn.execute(f"""
+                SELECT id, entity_type, canonical_name FROM entities
+                WHERE id IN ({', '.join('?' for _ in chunk)})
+            """, chunk)
+            for row in cursor:
+                subgraph.nodes[row["id"]] = {
+                    "entity_type": row["entity_type"],
+                    "canonical_name": row["canonical_name"],
+                    "depth": depths[row["id"]],
+                }
+
+        for node_id in selected:
+            for neighbor_id, rel_type, is_outgoing, confidence, weight in adjacency.get(node_id, ()):
+                if not is_outgoing or neighbor_id not in selected_set:
+                    continue
+                if allowed is not None and rel_type not in allowed:
+                    continue
+                subgraph.edges.append((node_id, neighbor_id, rel_type, confidence, weight))
+        return subgraph
+
+    def _load_adjacency(self) -> Dict[int, List[Tuple[int, str, bool, float, float]]]:
+        """Build (or return) the in-memory adjacency list of all relationships."""
+        adjacency = self._adjacency
+        if adjacency is not None:
+            return adjacency
+
+        adjacency = {}
+        conn = self._get_connection()
+        cursor = conn.execute("""
+            SELECT source_entity_id, target_entity_id, relationship_type, confidence, weight
+            FROM relationships
+        """)
+        for source_id, target_id, rel_type, confidence, weight in cursor:
+            adjacency.setdefault(source_id, []).append((target_id, rel_type, True, confidence, weight))
+            adjacency.setdefault(target_id, []).append((source_id, rel_type, False, confidence, weight))
+
+        self._adjacency = adjacency
+        logger.debug(f"[KnowledgeGraphDB] Loaded adjacency cache for {len(adjacency)} entities")
+        return adjacency
+
     # =========================================================================
     # Entity Mention Operations
     # =========================================================================
@@ -1016,6 +1253,301 @@ class KnowledgeGraphDB:
         logger.info("[KnowledgeGraphDB] rebuild_backlink_index() called - awaiting scanner integration")
         pass
 
+    # =========================================================================
+    # Batch Ingestion
+    # =========================================================================
+
+    def ingest_batch(
+        self,
+        entities: List[Dict[str, Any]],
+        relationships: List[Dict[str, Any]] = None,
+        mentions: List[Dict[str, Any]] = None
+    ) -> Dict[Tuple[str, str], int]:
+        """
+        Upsert entities, relationships and mentions in a single transaction.
+
+        Equivalent to calling add_entity / add_relationship / add_mention for
+        each item, but uses executemany with INSERT ... ON CONFLICT so alias and
+        entity_data merging happens inside SQLite instead of round-tripping
+        JSON through Python. Either the whole batch is applied or none of it.
+
+        Names resolve like find_entity: an entity whose canonical name or alias
+        matches case-insensitively is updated rather than duplicated.
+
+        Args:
+            entities: Dicts with the add_entity arguments:
+                entity_type, canonical_name, aliases, data, turn_number, confidence
+            relationships: Dicts with the add_relationship arguments, where
+                "source" and "target" are entity ids or (entity_type, canonical_name)
+                tuples: source, target, relationship_type, confidence, weight,
+                source_document, turn
+            mentions: Dicts with the add_mention arguments, where "entity" is an
+                entity id or (entity_type, canonical_name) tuple: entity,
+                document_path, turn_number, context, property_name,
+                property_value, confidence
+
+        Returns:
+            Mapping of (entity_type, canonical_name) -> entity id for every
+            entity in the batch and every tuple reference that was resolved,
+            keyed by the names as given
+        """
+        relationships = relationships or []
+        mentions = mentions or []
+        conn = self._get_connection()
+
+        # Every (entity_type, name) the batch refers to, in first-seen order
+        requested: Dict[Tuple[str, str], None] = {}
+        for spec in entities:
+            requested[(spec["entity_type"], spec["canonical_name"])] = None
+        for rel in relationships:
+            for ref in (rel["source"], rel["target"]):
+                if not isinstance(ref, int):
+                    requested[tuple(ref)] = None
+        for mention in mentions:
+            if not isinstance(mention["entity"], int):
+                requested[tuple(mention["entity"])] = None
+
+        with self._lock:
+            try:
+                # Same matching as find_entity: an existing entity whose canonical
+                # name or alias equals the name case-insensitively absorbs it, and
+                # otherwise case variants within the batch collapse onto the first
+                # spelling, so each stored key is upserted once
+                targets = self._match_existing_entities(conn, requested)
+                first_spelling: Dict[Tuple[str, str], Tuple[str, str]] = {}
+                for key in requested:
+                    if key not in targets:
+                        targets[key] = first_spelling.setdefault((key[0], key[1].lower()), key)
+
+                merged: Dict[Tuple[str, str], Dict[str, Any]] = {}
+                for spec in entities:
+                    key = targets[(spec["entity_type"], spec["canonical_name"])]
+                    turn = spec.get("turn_number", 0)
+                    current = merged.get(key)
+                    if current is None:
+                        merged[key] = {
+                            "aliases": list(dict.fromkeys(spec.get("aliases") or [])),
+                            "data": dict(spec.get("data") or {}),
+                            "first_turn": turn,
+                            "last_turn": turn,
+                            "confidence": spec.get("confidence", 0.5),
+                        }
+                        continue
+                    current["aliases"].extend(
+                        a for a in (spec.get("aliases") or []) if a not in current["aliases"]
+                    )
+                    current["data"].update(spec.get("data") or {})
+                    current["first_turn"] = min(current["first_turn"], turn)
+                    current["last_turn"] = max(current["last_turn"], turn)
+                    current["confidence"] = max(current["confidence"], spec.get("confidence", 0.5))
+
+                entity_rows = [
+                    (
+                        entity_type,
+                        canonical_name,
+                        json.dumps(values["aliases"]),
+                        json.dumps(values["data"]),
+                        values["first_turn"],
+                        values["last_turn"],
+                        values["confidence"],
+                    )
+                    for (entity_type, canonical_name), values in merged.items()
+                ]
+
+                conn.executemany("""
+                    INSERT INTO entities
+                    (entity_type, canonical_name, aliases, entity_data,
+                     first_seen_turn, last_seen_turn, confidence)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(entity_type, canonical_name) DO UPDATE SET
+                        aliases = (
+                            SELECT json_group_array(value) FROM (
+                                SELECT value FROM json_each(COALESCE(entities.aliases, '[]'))
+                                UNION
+                                SELECT value FROM json_each(excluded.aliases)
+                            )
+                        ),
+                        entity_data = json_patch(COALESCE(entities.entity_data, '{}'), excluded.entity_data),
+                        last_seen_turn = MAX(entities.last_seen_turn, excluded.last_seen_turn),
+                        confidence = MAX(entities.confidence, excluded.confidence),
+                        updated_at = CURRENT_TIMESTAMP
+                """, entity_rows)
+
+                # Resolve ids for the stored keys, then map every requested key onto them
+                stored_ids = self._resolve_entity_ids(conn, set(targets.values()))
+                id_map = {key: stored_ids[target] for key, target in targets.items() if target in stored_ids}
+
+                def resolve(ref: EntityRef) -> Optional[int]:
+                    return ref if isinstance(ref, int) else id_map.get(tuple(ref))
+
+                relationship_rows = []
+                for rel in relationships:
+                    source_id = resolve(rel["source"])
+                    target_id = resolve(rel["target"])
+                    if source_id is None or target_id is None:
+                        logger.warning(
+                            f"[KnowledgeGraphDB] Skipping relationship with unknown endpoint: "
+                            f"{rel['source']} -> {rel['target']}"
+                        )
+                        continue
+                    relationship_rows.append((
+                        source_id,
+                        target_id,
+                        rel["relationship_type"],
+                        rel.get("confidence", 0.5),
+                        rel.get("weight", 1.0),
+                        rel.get("source_document"),
+                        rel.get("turn", 0),
+                    ))
+
+                conn.executemany("""
+                    INSERT INTO relationships
+                    (source_entity_id, target_entity_id, relationship_type,
+                     confidence, weight, source_document, source_turn)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(source_entity_id, target_entity_id, relationship_type) DO UPDATE SET
+                        confidence = MAX(relationships.confidence, excluded.confidence),
+                        weight = relationships.weight + excluded.weight,
+                        source_document = COALESCE(excluded.source_document, relationships.source_document),
+                        source_turn = MAX(relationships.source_turn, excluded.source_turn)
+                """, relationship_rows)
+
+                mention_rows = []
+                mention_turns: Dict[int, int] = {}
+                for mention in mentions:
+                    entity_id = resolve(mention["entity"])
+                    if entity_id is None:
+                        logger.warning(
+                            f"[KnowledgeGraphDB] Skipping mention of unknown entity: {mention['entity']}"
+                        )
+                        continue
+                    turn = mention.get("turn_number", 0)
+                    context = mention.get("context") or ""
+                    mention_rows.append((
+                        entity_id,
+                        mention["document_path"],
+                        turn,
+                        context[:500],
+                        mention.get("property_name"),
+                        mention.get("property_value"),
+                        mention.get("confidence", 0.5),
+                    ))
+                    mention_turns[entity_id] = max(mention_turns.get(entity_id, turn), turn)
+
+                conn.executemany("""
+                    INSERT INTO entity_mentions
+                    (entity_id, document_path, turn_number, mention_context,
+                     property_name, property_value, confidence)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                """, mention_rows)
+
+                # One last_seen_turn bump per entity rather than one per mention
+                conn.executemany("""
+                    UPDATE entities
+                    SET last_seen_turn = MAX(last_seen_turn, ?),
+                        updated_at = CURRENT_TIMESTAMP
+                    WHERE id = ?
+                """, [(turn, entity_id) for entity_id, turn in mention_turns.items()])
+
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+
+            self._entity_ids.update(stored_ids)
+            if relationship_rows:
+                self._adjacency = None
+
+        logger.debug(
+            f"[KnowledgeGraphDB] Ingested batch: {len(entity_rows)} entities, "
+            f"{len(relationship_rows)} relationships, {len(mention_rows)} mentions"
+        )
+        return id_map
+
+    def _match_existing_entities(
+        self,
+        conn: sqlite3.Connection,
+        keys: Iterable[Tuple[str, str]]
+    ) -> Dict[Tuple[str, str], Tuple[str, str]]:
+        """
+        Map (entity_type, name) keys to the stored (entity_type, canonical_name)
+        they refer to, matching like find_entity: canonical name first (an exact
+        match wins over a case variant), then aliases, case-insensitively.
+
+        Keys with no stored entity are left out.
+        """
+        by_lower: Dict[Tuple[str, str], List[Tuple[str, str]]] = {}
+        for key in keys:
+            by_lower.setdefault((key[0], key[1].lower()), []).append(key)
+
+        # (entity_type, lowercased name) -> stored canonical names, oldest first
+        canonical: Dict[Tuple[str, str], List[str]] = {}
+        aliased: Dict[Tuple[str, str], str] = {}
+        lookups = list(by_lower)
+        for start in range(0, len(lookups), _LOOKUP_CHUNK_SIZE):
+            chunk = lookups[start:start + _LOOKUP_CHUNK_SIZE]
+            placeholders = ", ".join("(?, ?)" for _ in chunk)
+            params = [value for lookup in chunk for value in lookup]
+            cursor = conn.execute(f"""
+                SELECT entity_type, canonical_name FROM entities
+                WHERE (entity_type, LOWER(canonical_name)) IN (VALUES {placeholders})
+                ORDER BY id
+            """, params)
+            for row in cursor:
+                lookup = (row["entity_type"], row["canonical_name"].lower())
+                canonical.setdefault(lookup, []).append(row["canonical_name"])
+
+        unmatched = [lookup for lookup in lookups if lookup not in canonical]
+        for start in range(0, len(unmatched), _LOOKUP_CHUNK_SIZE):
+            chunk = unmatched[start:start + _LOOKUP_CHUNK_SIZE]
+            placeholders = ", ".join("(?, ?)" for _ in chunk)
+            params = [value for lookup in chunk for value in lookup]
+            cursor = conn.execute(f"""
+                SELECT e.entity_type, e.canonical_name, LOWER(a.value) AS alias
+                FROM entities e, json_each(COALESCE(e.aliases, '[]')) a
+                WHERE (e.entity_type, LOWER(a.value)) IN (VALUES {placeholders})
+                ORDER BY e.id
+            """, params)
+            for row in cursor:
+                aliased.setdefault((row["entity_type"], row["alias"]), row["canonical_name"])
+
+        matches: Dict[Tuple[str, str], Tuple[str, str]] = {}
+        for lookup, requested in by_lower.items():
+            names = canonical.get(lookup)
+            for key in requested:
+                if names:
+                    matches[key] = key if key[1] in names else (key[0], names[0])
+                elif lookup in aliased:
+                    matches[key] = (key[0], aliased[lookup])
+        return matches
+
+    def _resolve_entity_ids(
+        self,
+        conn: sqlite3.Connection,
+        keys: set
+    ) -> Dict[Tuple[str, str], int]:
+        """
+        Map (entity_type, canonical_name) keys to ids.
+
+        Served from the in-memory id map where possible; the rest are fetched
+        with chunked row-value IN lookups against the UNIQUE index.
+        """
+        resolved = {key: self._entity_ids[key] for key in keys if key in self._entity_ids}
+        missing = [key for key in keys if key not in resolved]
+
+        for start in range(0, len(missing), _LOOKUP_CHUNK_SIZE):
+            chunk = missing[start:start + _LOOKUP_CHUNK_SIZE]
+            placeholders = ", ".join("(?, ?)" for _ in chunk)
+            params = [value for key in chunk for value in key]
+            cursor = conn.execute(f"""
+                SELECT id, entity_type, canonical_name FROM entities
+                WHERE (entity_type, canonical_name) IN (VALUES {placeholders})
+            """, params)
+            for row in cursor:
+                resolved[(row["entity_type"], row["canonical_name"])] = row["id"]
+
+        return resolved
+
     # =========================================================================
     # Statistics and Maintenance
     # =========================================================================
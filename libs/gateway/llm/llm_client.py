@@ -19,12 +19,15 @@ Architecture Note:
 Author: v4.0 Migration - Production Integration
 Date: 2025-11-16
 Updated: 2026-02-02 (added Qwen inference params and stop tokens)
+Updated: call_stream() for SSE streaming (streaming coordinator)
 """
 
 import json
 import logging
 import httpx
-from typing import Dict, Any, Optional, List
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from libs.core.tracing import start_span
 
 logger = logging.getLogger(__name__)
 
@@ -66,35 +69,18 @@ class LLMClient:
         self.coordinator_headers = coordinator_headers or {}
         self.timeout = timeout
 
-    async def call(
+    def _build_request(
         self,
         prompt: str,
-        role: str,  # "guide" or "coordinator"
-        max_tokens: int = 1000,
-        temperature: float = 0.7,
-        top_p: Optional[float] = None,
-        top_k: Optional[int] = None,
-        repetition_penalty: Optional[float] = None,
-        stop: Optional[List[str]] = None,
-        timeout: Optional[float] = None
-    ) -> str:
-        """
-        Call LLM with prompt.
-
-        Args:
-            prompt: System + user prompt
-            role: "guide" or "coordinator" (selects URL and model)
-            max_tokens: Maximum tokens to generate
-            temperature: Sampling temperature (default 0.7 per Qwen recommendation)
-            top_p: Nucleus sampling threshold (default 0.8 per Qwen)
-            top_k: Top-k sampling (default 20 per Qwen)
-            repetition_penalty: Repetition penalty (default 1.05 per Qwen)
-            stop: Stop sequences (default ChatML tokens)
-            timeout: Override default timeout
-
-        Returns:
-            LLM response text
-        """
+        role: str,
+        max_tokens: int,
+        temperature: float,
+        top_p: Optional[float],
+        top_k: Optional[int],
+        repetition_penalty: Optional[float],
+        stop: Optional[List[str]]
+    ) -> Tuple[str, Dict[str, str], Dict[str, Any]]:
+        """Select URL/model for the role and build the chat payload."""
         url = self.guide_url if role == "guide" else self.coordinator_url
         model = self.guide_model if role == "guide" else self.coordinator_model
         headers = self.guide_headers if role == "guide" else self.coordinator_headers
@@ -126,7 +112,49 @@ class LLMClient:
             f"[LLMClient] Calling {role} LLM: {url} "
             f"(max_tokens={max_tokens}, temp={temperature}, top_p={payload.get('top_p')})"
         )
+        return url, headers, payload
+
+    async def call(
+        self,
+        prompt: str,
+        role: str,  # "guide" or "coordinator"
+        max_tokens: int = 1000,
+        temperature: float = 0.7,
+        top_p: Optional[float] = None,
+        top_k: Optional[int] = None,
+        repetition_penalty: Optional[float] = None,
+        stop: Optional[List[str]] = None,
+        timeout: Optional[float] = None
+    ) -> str:
+        """
+        Call LLM with prompt.
+
+        Args:
+            prompt: System + user prompt
+            role: "guide" or "coordinator" (selects URL and model)
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature (default 0.7 per Qwen recommendation)
+            top_p: Nucleus sampling threshold (default 0.8 per Qwen)
+            top_k: Top-k sampling (default 20 per Qwen)
+            repetition_penalty: Repetition penalty (default 1.05 per Qwen)
+            stop: Stop sequences (default ChatML tokens)
+            timeout: Override default timeout
+
+        Returns:
+            LLM response text
+        """
+        url, headers, payload = self._build_request(
+            prompt, role, max_tokens, temperature, top_p, top_k, repetition_penalty, stop
+        )
+        model = payload["model"]
 
+        span = start_span("llm.call", kind="client", attributes={
+            "llm.role": role,
+            "llm.model": model,
+            "llm.max_tokens": max_tokens,
+            "llm.temperature": temperature,
+            "llm.prompt_chars": len(prompt),
+        })
         try:
             async with httpx.AsyncClient(timeout=timeout or self.timeout) as client:
                 response = await client.post(url, json=payload, headers=headers)
@@ -135,6 +163,13 @@ class LLMClient:
                 result = response.json()
                 content = result["choices"][0]["message"]["content"]
 
+                usage = result.get("usage") or {}
+                span.set_attribute("llm.response_chars", len(content))
+                if usage:
+                    span.set_attribute("llm.prompt_tokens", usage.get("prompt_tokens"))
+                    span.set_attribute("llm.completion_tokens", usage.get("completion_tokens"))
+                span.end()
+
                 logger.info(f"[LLMClient] {role} LLM response: {len(content)} chars")
                 # Debug: log first 300 chars for troubleshooting parse errors
                 if role == "query_analyzer":
@@ -143,10 +178,88 @@ class LLMClient:
 
         except httpx.TimeoutException as e:
             logger.error(f"[LLMClient] {role} LLM timeout: {e}")
+            span.end(e)
             raise
         except httpx.HTTPStatusError as e:
             logger.error(f"[LLMClient] {role} LLM HTTP error: {e.response.status_code}")
+            span.end(e)
             raise
         except Exception as e:
             logger.error(f"[LLMClient] {role} LLM error: {e}")
+            span.end(e)
+            raise
+
+    async def call_stream(
+        self,
+        prompt: str,
+        role: str,
+        max_tokens: int = 1000,
+        temperature: float = 0.7,
+        top_p: Optional[float] = None,
+        top_k: Optional[int] = None,
+        repetition_penalty: Optional[float] = None,
+        stop: Optional[List[str]] = None,
+        timeout: Optional[float] = None
+    ) -> AsyncIterator[str]:
+        """
+        Call LLM with prompt and yield the response text as it is generated.
+
+        Same arguments as call(). Uses OpenAI-compatible SSE streaming; closing
+        the iterator early (e.g. once the needed JSON has arrived) closes the
+        connection, which stops generation on vLLM.
+
+        Yields:
+            Response text deltas
+        """
+        url, headers, payload = self._build_request(
+            prompt, role, max_tokens, temperature, top_p, top_k, repetition_penalty, stop
+        )
+        payload["stream"] = True
+
+        span = start_span("llm.call", kind="client", attributes={
+            "llm.role": role,
+            "llm.model": payload["model"],
+            "llm.max_tokens": max_tokens,
+            "llm.temperature": temperature,
+            "llm.prompt_chars": len(prompt),
+            "llm.stream": True,
+        })
+        chars = 0
+        try:
+            async with httpx.AsyncClient(timeout=timeout or self.timeout) as client:
+                async with client.stream("POST", url, json=payload, headers=headers) as response:
+                    response.raise_for_status()
+                    async for line in response.aiter_lines():
+                        if not line.startswith("data:"):
+                            continue
+                        data = line[5:].strip()
+                        if data == "[DONE]":
+                            break
+                        try:
+                            chunk = json.loads(data)
+                        except json.JSONDecodeError:
+                            continue
+                        choices = chunk.get("choices") or [{}]
+                        delta = (choices[0].get("delta") or {}).get("content")
+                        if delta:
+                            chars += len(delta)
+                            yield delta
+
+            logger.info(f"[LLMClient] {role} LLM streamed response: {chars} chars")
+
+        except httpx.TimeoutException as e:
+            logger.error(f"[LLMClient] {role} LLM stream timeout: {e}")
+            span.record_error(e)
+            raise
+        except httpx.HTTPStatusError as e:
+            logger.error(f"[LLMClient] {role} LLM stream HTTP error: {e.response.status_code}")
+            span.record_error(e)
+            raise
+        except Exception as e:
+            logger.error(f"[LLMClient] {role} LLM stream error: {e}")
+            span.record_error(e)
             raise
+        finally:
+            # Also reached when the caller stops early (GeneratorExit)
+            span.set_attribute("llm.response_chars", chars)
+            span.end()
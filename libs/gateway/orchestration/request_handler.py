@@ -14,6 +14,7 @@ Architecture Reference:
 - architecture/main-system-patterns/unified-flow.md
 """
 
+import asyncio
 import json
 import logging
 import re
@@ -40,9 +41,15 @@ class RequestHandlerConfig:
         self,
         max_validation_retries: int = 3,
         confidence_threshold: float = 0.70,
+        speculative_context: bool = False,
+        incremental_retry: bool = False,
     ):
         self.max_validation_retries = max_validation_retries
         self.confidence_threshold = confidence_threshold
+        # Run Phase 2 lookups concurrently with Phase 1.5 (discarded on CLARIFY)
+        self.speculative_context = speculative_context
+        # Reuse tool results across validation retries (re-run only invalidated tools)
+        self.incremental_retry = incremental_retry
 
 
 class RequestHandler:
@@ -77,6 +84,7 @@ class RequestHandler:
         # Phase callbacks
         self._phase1_reflection: Optional[Callable] = None
         self._phase2_context_gatherer: Optional[Callable] = None
+        self._phase2_prefetch: Optional[Callable] = None
         self._phase3_4_planning_loop: Optional[Callable] = None
         self._phase5_synthesis: Optional[Callable] = None
         self._phase6_validation: Optional[Callable] = None
@@ -114,6 +122,7 @@ class RequestHandler:
         update_plan_state_from_validation: Callable,
         get_turn_metrics: Callable,
         set_turn_metrics: Callable,
+        phase2_prefetch: Optional[Callable] = None,
     ):
         """Set callbacks to UnifiedFlow methods."""
         self._emit_phase_event = emit_phase_event
@@ -124,6 +133,7 @@ class RequestHandler:
         self._finalize_turn_metrics = finalize_turn_metrics
         self._phase1_reflection = phase1_reflection
         self._phase2_context_gatherer = phase2_context_gatherer
+        self._phase2_prefetch = phase2_prefetch
         self._phase3_4_planning_loop = phase3_4_planning_loop
         self._phase5_synthesis = phase5_synthesis
         self._phase6_validation = phase6_validation
@@ -192,6 +202,11 @@ class RequestHandler:
         # === PHASE 1.5 + PHASE 2.x: Query Analysis Validation and context gathering ===
         logger.info("[RequestHandler] Starting Phase 1.5 + Phase 2.1/2.2/2.5 (validation + context)")
 
+        # Speculative Phase 2: start the LLM-free lookups now, overlapped with Phase 1.5
+        prefetch_task: Optional[asyncio.Task] = None
+        if self.config.speculative_context and self._phase2_prefetch:
+            prefetch_task = asyncio.create_task(self._run_phase2_prefetch(context_doc))
+
         # Phase 1.5: Query Analysis Validation (fast gate - PROCEED or CLARIFY)
         phase1_start = time.time()
         query_preview = context_doc.query[:200] if context_doc.query else ""
@@ -203,7 +218,12 @@ class RequestHandler:
         )
         self._start_phase("phase1_5_validation")
         context_doc.update_execution_state(1, "Query Analysis Validation (Phase 1.5)")
-        context_doc, decision = await self._phase1_reflection(context_doc, turn_dir)
+        try:
+            context_doc, decision = await self._phase1_reflection(context_doc, turn_dir)
+        except BaseException:
+            await self._cancel_phase2_prefetch(prefetch_task)
+            raise
+        phase1_end = time.time()
         context_doc.record_decision(decision)
         self._end_phase("phase1_5_validation")
         self._record_decision("query_analysis_validation", decision)
@@ -225,6 +245,9 @@ class RequestHandler:
         ))
 
         if decision == "CLARIFY":
+            if prefetch_task:
+                await self._cancel_phase2_prefetch(prefetch_task)
+                self._record_decision("speculative_context", "cancelled")
             clarification = self._extract_clarification(context_doc)
             return {
                 "response": clarification,
@@ -243,7 +266,11 @@ class RequestHandler:
         )
         self._start_phase("phase2_context_gatherer")
         context_doc.update_execution_state(2, "Context Gatherer")
-        context_doc = await self._phase2_context_gatherer(context_doc)
+        speculation = await self._await_phase2_prefetch(prefetch_task, phase1_start, phase1_end)
+        if speculation.get("gatherer"):
+            context_doc = await self._phase2_context_gatherer(context_doc, gatherer=speculation.pop("gatherer"))
+        else:
+            context_doc = await self._phase2_context_gatherer(context_doc)
         self._end_phase("phase2_context_gatherer")
         phase2_duration = int((time.time() - phase2_start) * 1000)
         num_sources = len(context_doc.source_references) if hasattr(context_doc, 'source_references') else 0
@@ -262,7 +289,7 @@ class RequestHandler:
             f"Found {num_sources} relevant sources",
             confidence=0.85,
             duration_ms=phase2_duration,
-            details={"sources_found": num_sources},
+            details={"sources_found": num_sources, **speculation},
             output_summary=f"Found {num_sources} sources: {source_list_str}",
             output_raw=section2_raw,
         )
@@ -276,136 +303,153 @@ class RequestHandler:
         # === PHASE 2.5: Constraint Extraction ===
         self._extract_and_write_constraints(context_doc, turn_dir)
 
-        # === PHASE 3-4-5-6: Unified Planning-Validation loop ===
-        while retry_count < self.config.max_validation_retries:
-            logger.info(f"[RequestHandler] Planning-Validation iteration {retry_count + 1}/{self.config.max_validation_retries}")
-
-            # Phase 3-4: Unified Planning Loop
-            phase34_start = time.time()
-            await self._emit_phase_event(
-                trace_id, 3, "active",
-                f"Planning strategy (iteration {retry_count + 1})",
-                details={"iteration": retry_count + 1},
-                input_summary=f"{num_sources} sources, mode={mode}, iteration {retry_count + 1}",
-            )
-            await emit_action_event(ActionEvent(
-                trace_id=trace_id, action_type="route",
-                label=f"Planning iteration {retry_count + 1}",
-            ))
-            self._start_phase("phase3_4_planning_loop")
-            context_doc.update_execution_state(
-                phase=3,
-                phase_name="Planner-Coordinator",
-                iteration=retry_count + 1,
-                max_iterations=self.config.max_validation_retries
-            )
-            context_doc, ticket_content, toolresults_content = await self._phase3_4_planning_loop(
-                context_doc, turn_dir, mode, intent, trace_id=trace_id
-            )
-            self._end_phase("phase3_4_planning_loop")
-            phase34_duration = int((time.time() - phase34_start) * 1000)
-
-            # Check if planning was blocked
-            coordinator_blocked = False
-            section4 = context_doc.get_section(4) if context_doc.has_section(4) else ""
-            if "BLOCKED" in section4 or "too many tool failures" in section4.lower():
-                coordinator_blocked = True
-                logger.warning(f"[RequestHandler] Planning was BLOCKED due to tool failures")
-
-            # Emit planner completion event
-            num_tools = len(context_doc.claims) if hasattr(context_doc, 'claims') else 0
-            section3_raw = context_doc.get_section(3) if context_doc.has_section(3) else ""
-            await self._emit_phase_event(
-                trace_id, 3, "completed",
-                f"Planning complete, {num_tools} claims gathered",
-                confidence=0.8 if not coordinator_blocked else 0.4,
-                duration_ms=phase34_duration,
-                details={"claims": num_tools, "blocked": coordinator_blocked},
-                output_summary=f"{num_tools} claims gathered, blocked={coordinator_blocked}",
-                output_raw=section3_raw,
-            )
+        # Incremental retries: tool results are kept per (session, turn, tool, args) across attempts
+        reuse = None
+        reuse_history: List[Dict[str, Any]] = []
+        if self.config.incremental_retry:
+            from libs.gateway.execution.tool_result_reuse import get_tool_result_reuse
+            reuse = get_tool_result_reuse()
+            reuse.begin_turn(session_id, turn_number)
 
-            # Phase 6: Synthesis
-            phase6_start = time.time()
-            num_claims = len(context_doc.claims) if hasattr(context_doc, 'claims') else 0
-            await self._emit_phase_event(
-                trace_id, 6, "active", "Generating response from gathered context",
-                input_summary=f"Sections 0-4, {num_claims} claims",
-                input_raw=toolresults_content[:2000] if toolresults_content else "",
-            )
-            self._start_phase("phase6_synthesis")
-            context_doc.update_execution_state(6, "Synthesis")
-            context_doc, response = await self._phase5_synthesis(context_doc, turn_dir, mode)
-            self._end_phase("phase6_synthesis")
-            phase6_duration = int((time.time() - phase6_start) * 1000)
-            resp_len = len(response) if response else 0
-            await self._emit_phase_event(
-                trace_id, 6, "completed",
-                f"Response generated ({resp_len} chars)",
-                confidence=0.85,
-                duration_ms=phase6_duration,
-                details={"response_length": resp_len},
-                output_summary=f"Response: {response[:300]}..." if response and len(response) > 300 else f"Response: {response}" if response else "No response",
-                output_raw=response[:2000] if response else "",
-            )
+        # === PHASE 3-4-5-6: Unified Planning-Validation loop ===
+        try:
+            while retry_count < self.config.max_validation_retries:
+                logger.info(f"[RequestHandler] Planning-Validation iteration {retry_count + 1}/{self.config.max_validation_retries}")
+                if reuse:
+                    reuse.start_attempt(session_id, turn_number, retry_count + 1)
+
+                # Phase 3-4: Unified Planning Loop
+                phase34_start = time.time()
+                await self._emit_phase_event(
+                    trace_id, 3, "active",
+                    f"Planning strategy (iteration {retry_count + 1})",
+                    details={"iteration": retry_count + 1},
+                    input_summary=f"{num_sources} sources, mode={mode}, iteration {retry_count + 1}",
+                )
+                await emit_action_event(ActionEvent(
+                    trace_id=trace_id, action_type="route",
+                    label=f"Planning iteration {retry_count + 1}",
+                ))
+                self._start_phase("phase3_4_planning_loop")
+                context_doc.update_execution_state(
+                    phase=3,
+                    phase_name="Planner-Coordinator",
+                    iteration=retry_count + 1,
+                    max_iterations=self.config.max_validation_retries
+                )
+                context_doc, ticket_content, toolresults_content = await self._phase3_4_planning_loop(
+                    context_doc, turn_dir, mode, intent, trace_id=trace_id
+                )
+                self._end_phase("phase3_4_planning_loop")
+                phase34_duration = int((time.time() - phase34_start) * 1000)
+                reuse_details = {}
+                if reuse and retry_count > 0:
+                    reuse_details = self._write_retry_delta(context_doc, reuse, session_id, turn_number)
+                    reuse_history.append(reuse_details)
+
+                # Check if planning was blocked
+                coordinator_blocked = False
+                section4 = context_doc.get_section(4) if context_doc.has_section(4) else ""
+                if "BLOCKED" in section4 or "too many tool failures" in section4.lower():
+                    coordinator_blocked = True
+                    logger.warning(f"[RequestHandler] Planning was BLOCKED due to tool failures")
+
+                # Emit planner completion event
+                num_tools = len(context_doc.claims) if hasattr(context_doc, 'claims') else 0
+                section3_raw = context_doc.get_section(3) if context_doc.has_section(3) else ""
+                await self._emit_phase_event(
+                    trace_id, 3, "completed",
+                    f"Planning complete, {num_tools} claims gathered",
+                    confidence=0.8 if not coordinator_blocked else 0.4,
+                    duration_ms=phase34_duration,
+                    details={"claims": num_tools, "blocked": coordinator_blocked, **reuse_details},
+                    output_summary=f"{num_tools} claims gathered, blocked={coordinator_blocked}",
+                    output_raw=section3_raw,
+                )
 
-            # Check for synthesizer INVALID
-            synthesis_returned_invalid = False
-            invalid_reason = None
-            if response and response.strip().startswith('{'):
-                try:
-                    parsed = json.loads(response.strip())
-                    if parsed.get("_type") == "INVALID":
-                        synthesis_returned_invalid = True
-                        invalid_reason = parsed.get("reason", "Synthesizer could not generate valid response")
-                        logger.warning(f"[RequestHandler] Synthesizer returned INVALID: {invalid_reason}")
-                except (json.JSONDecodeError, ValueError):
-                    pass
+                # Phase 6: Synthesis
+                phase6_start = time.time()
+                num_claims = len(context_doc.claims) if hasattr(context_doc, 'claims') else 0
+                await self._emit_phase_event(
+                    trace_id, 6, "active", "Generating response from gathered context",
+                    input_summary=f"Sections 0-4, {num_claims} claims",
+                    input_raw=toolresults_content[:2000] if toolresults_content else "",
+                )
+                self._start_phase("phase6_synthesis")
+                context_doc.update_execution_state(6, "Synthesis")
+                context_doc, response = await self._phase5_synthesis(context_doc, turn_dir, mode)
+                self._end_phase("phase6_synthesis")
+                phase6_duration = int((time.time() - phase6_start) * 1000)
+                resp_len = len(response) if response else 0
+                await self._emit_phase_event(
+                    trace_id, 6, "completed",
+                    f"Response generated ({resp_len} chars)",
+                    confidence=0.85,
+                    duration_ms=phase6_duration,
+                    details={"response_length": resp_len},
+                    output_summary=f"Response: {response[:300]}..." if response and len(response) > 300 else f"Response: {response}" if response else "No response",
+                    output_raw=response[:2000] if response else "",
+                )
 
-            # Check if INVALID is due to research failure
-            research_failed_keywords = [
-                "no findings", "no successful tool", "research failed",
-                "couldn't find", "could not find", "unable to find",
-                "no results", "zero results", "empty results",
-                "multiple attempts", "repeated attempts", "search failed"
-            ]
-            invalid_reason_lower = invalid_reason.lower() if invalid_reason else ""
-            is_research_failure = any(kw in invalid_reason_lower for kw in research_failed_keywords)
-
-            if is_research_failure:
-                logger.warning(f"[RequestHandler] Synthesizer INVALID due to research failure - NOT retrying")
-                response = f"I wasn't able to find the information you requested. {invalid_reason}"
+                # Check for synthesizer INVALID
                 synthesis_returned_invalid = False
-                logger.info("[RequestHandler] Research failure - skipping validation")
-
-            if synthesis_returned_invalid and retry_count < self.config.max_validation_retries:
-                logger.info(f"[RequestHandler] Synthesizer INVALID - forcing RETRY")
-
-                # Import here to avoid circular dependency
-                from libs.gateway.validation.validation_result import ValidationResult, ValidationFailureContext
-
-                validation_result = ValidationResult(
-                    decision="RETRY",
-                    issues=[f"Synthesizer returned INVALID: {invalid_reason}"],
-                    confidence=0.0,
-                    revision_hints="Research needed - synthesizer could not answer from available context",
-                    failure_context=ValidationFailureContext(
-                        reason="synthesis_invalid",
-                        failed_urls=[],
-                        failed_claims=[],
-                        mismatches=[],
-                        retry_count=retry_count + 1
+                invalid_reason = None
+                if response and response.strip().startswith('{'):
+                    try:
+                        parsed = json.loads(response.strip())
+                        if parsed.get("_type") == "INVALID":
+                            synthesis_returned_invalid = True
+                            invalid_reason = parsed.get("reason", "Synthesizer could not generate valid response")
+                            logger.warning(f"[RequestHandler] Synthesizer returned INVALID: {invalid_reason}")
+                    except (json.JSONDecodeError, ValueError):
+                        pass
+
+                # Check if INVALID is due to research failure
+                research_failed_keywords = [
+                    "no findings", "no successful tool", "research failed",
+                    "couldn't find", "could not find", "unable to find",
+                    "no results", "zero results", "empty results",
+                    "multiple attempts", "repeated attempts", "search failed"
+                ]
+                invalid_reason_lower = invalid_reason.lower() if invalid_reason else ""
+                is_research_failure = any(kw in invalid_reason_lower for kw in research_failed_keywords)
+
+                if is_research_failure:
+                    logger.warning(f"[RequestHandler] Synthesizer INVALID due to research failure - NOT retrying")
+                    response = f"I wasn't able to find the information you requested. {invalid_reason}"
+                    synthesis_returned_invalid = False
+                    logger.info("[RequestHandler] Research failure - skipping validation")
+
+                if synthesis_returned_invalid and retry_count < self.config.max_validation_retries:
+                    logger.info(f"[RequestHandler] Synthesizer INVALID - forcing RETRY")
+
+                    # Import here to avoid circular dependency
+                    from libs.gateway.validation.validation_result import ValidationResult, ValidationFailureContext
+
+                    validation_result = ValidationResult(
+                        decision="RETRY",
+                        issues=[f"Synthesizer returned INVALID: {invalid_reason}"],
+                        confidence=0.0,
+                        revision_hints="Research needed - synthesizer could not answer from available context",
+                        failure_context=ValidationFailureContext(
+                            reason="synthesis_invalid",
+                            failed_urls=[],
+                            failed_claims=[],
+                            mismatches=[],
+                            retry_count=retry_count + 1
+                        )
                     )
-                )
 
-                await self._archive_attempt(turn_dir, retry_count)
-                await self._write_retry_context(
-                    turn_dir, validation_result.failure_context,
-                    session_id=session_id, turn_number=turn_number
-                )
-                await self._invalidate_claims(validation_result.failure_context)
+                    await self._archive_attempt(turn_dir, retry_count)
+                    await self._write_retry_context(
+                        turn_dir, validation_result.failure_context,
+                        session_id=session_id, turn_number=turn_number
+                    )
+                    await self._invalidate_claims(validation_result.failure_context)
+                    if reuse:
+                        reuse.mark_stale(session_id, turn_number, validation_result.failure_context)
 
-                section7_content = f"""**Decision:** RETRY
+                    section7_content = f"""**Decision:** RETRY
 **Confidence:** 0.00
 
 ### Issues
@@ -414,180 +458,186 @@ class RequestHandler:
 ### Suggested Fixes
 - Research needed to gather missing evidence.
 """
-                if context_doc.has_section(7):
-                    attempt_header = f"\n\n---\n\n#### Attempt {retry_count + 1}\n"
-                    context_doc.append_to_section(7, attempt_header + section7_content)
-                else:
-                    section_with_header = f"#### Attempt {retry_count + 1}\n{section7_content}"
-                    context_doc.append_section(7, "Validation", section_with_header)
-
-                retry_count += 1
-                continue
-
-            # Phase 7: Validation
-            phase7_start = time.time()
-            await self._emit_phase_event(
-                trace_id, 7, "active", "Validating response quality and accuracy",
-                input_summary=f"Response to validate ({len(response) if response else 0} chars)",
-                input_raw=response[:2000] if response else "",
-            )
-            self._start_phase("phase7_validation")
-            context_doc.update_execution_state(7, "Validation")
-            context_doc, response, validation_result = await self._phase6_validation(
-                context_doc, turn_dir, response, mode, retry_count
-            )
-            self._update_plan_state_from_validation(turn_dir, validation_result)
-            if validation_result:
-                context_doc.record_decision(validation_result.decision)
-            self._end_phase("phase7_validation")
-            self._record_decision("validation", validation_result.decision if validation_result else "UNKNOWN")
-            phase7_duration = int((time.time() - phase7_start) * 1000)
-            val_decision = validation_result.decision if validation_result else "UNKNOWN"
-            val_confidence = validation_result.confidence if validation_result else 0.0
-            val_issues = validation_result.issues if validation_result else []
-            section7_output = context_doc.get_section(7) if context_doc.has_section(7) else ""
-            await self._emit_phase_event(
-                trace_id, 7, "completed",
-                f"Validation: {val_decision}",
-                confidence=val_confidence,
-                duration_ms=phase7_duration,
-                details={"decision": val_decision, "issues": val_issues},
-                output_summary=f"{val_decision}, confidence: {val_confidence:.2f}, issues: {len(val_issues)}",
-                output_raw=section7_output,
-            )
-            await emit_action_event(ActionEvent(
-                trace_id=trace_id, action_type="decision",
-                label=f"Validation: {val_decision}",
-                detail=f"confidence={val_confidence:.2f}",
-                success=val_decision == "APPROVE",
-            ))
-
-            # Best-seen tracking
-            if validation_result and response:
-                current_confidence = validation_result.confidence
-                if current_confidence > best_seen_confidence:
-                    best_seen_response = response
-                    best_seen_confidence = current_confidence
-                    best_seen_attempt = retry_count + 1
-                    logger.info(
-                        f"[RequestHandler] Best-seen updated at attempt {best_seen_attempt}: "
-                        f"confidence {best_seen_confidence:.2f}"
-                    )
+                    if context_doc.has_section(7):
+                        attempt_header = f"\n\n---\n\n#### Attempt {retry_count + 1}\n"
+                        context_doc.append_to_section(7, attempt_header + section7_content)
+                    else:
+                        section_with_header = f"#### Attempt {retry_count + 1}\n{section7_content}"
+                        context_doc.append_section(7, "Validation", section_with_header)
+
+                    retry_count += 1
+                    continue
+
+                # Phase 7: Validation
+                phase7_start = time.time()
+                await self._emit_phase_event(
+                    trace_id, 7, "active", "Validating response quality and accuracy",
+                    input_summary=f"Response to validate ({len(response) if response else 0} chars)",
+                    input_raw=response[:2000] if response else "",
+                )
+                self._start_phase("phase7_validation")
+                context_doc.update_execution_state(7, "Validation")
+                context_doc, response, validation_result = await self._phase6_validation(
+                    context_doc, turn_dir, response, mode, retry_count
+                )
+                self._update_plan_state_from_validation(turn_dir, validation_result)
+                if validation_result:
+                    context_doc.record_decision(validation_result.decision)
+                self._end_phase("phase7_validation")
+                self._record_decision("validation", validation_result.decision if validation_result else "UNKNOWN")
+                phase7_duration = int((time.time() - phase7_start) * 1000)
+                val_decision = validation_result.decision if validation_result else "UNKNOWN"
+                val_confidence = validation_result.confidence if validation_result else 0.0
+                val_issues = validation_result.issues if validation_result else []
+                section7_output = context_doc.get_section(7) if context_doc.has_section(7) else ""
+                await self._emit_phase_event(
+                    trace_id, 7, "completed",
+                    f"Validation: {val_decision}",
+                    confidence=val_confidence,
+                    duration_ms=phase7_duration,
+                    details={"decision": val_decision, "issues": val_issues},
+                    output_summary=f"{val_decision}, confidence: {val_confidence:.2f}, issues: {len(val_issues)}",
+                    output_raw=section7_output,
+                )
+                await emit_action_event(ActionEvent(
+                    trace_id=trace_id, action_type="decision",
+                    label=f"Validation: {val_decision}",
+                    detail=f"confidence={val_confidence:.2f}",
+                    success=val_decision == "APPROVE",
+                ))
+
+                # Best-seen tracking
+                if validation_result and response:
+                    current_confidence = validation_result.confidence
+                    if current_confidence > best_seen_confidence:
+                        best_seen_response = response
+                        best_seen_confidence = current_confidence
+                        best_seen_attempt = retry_count + 1
+                        logger.info(
+                            f"[RequestHandler] Best-seen updated at attempt {best_seen_attempt}: "
+                            f"confidence {best_seen_confidence:.2f}"
+                        )
 
-            # Confidence threshold check
-            if validation_result and validation_result.decision == "APPROVE":
-                confidence = validation_result.confidence
-                checks = getattr(validation_result, 'checks', {}) or {}
+                # Confidence threshold check
+                if validation_result and validation_result.decision == "APPROVE":
+                    confidence = validation_result.confidence
+                    checks = getattr(validation_result, 'checks', {}) or {}
 
-                query_terms_missing = checks.get('query_terms_in_context') == False
-                term_substitution = checks.get('no_term_substitution') == False
+                    query_terms_missing = checks.get('query_terms_in_context') == False
+                    term_substitution = checks.get('no_term_substitution') == False
 
-                should_override = False
-                override_reason = []
+                    should_override = False
+                    override_reason = []
 
-                if confidence < self.config.confidence_threshold:
-                    should_override = True
-                    override_reason.append(f"confidence {confidence:.2f} below threshold {self.config.confidence_threshold}")
+                    if confidence < self.config.confidence_threshold:
+                        should_override = True
+                        override_reason.append(f"confidence {confidence:.2f} below threshold {self.config.confidence_threshold}")
 
-                if query_terms_missing:
-                    should_override = True
-                    override_reason.append("query terms missing from context")
+                    if query_terms_missing:
+                        should_override = True
+                        override_reason.append("query terms missing from context")
 
-                if term_substitution:
-                    should_override = True
-                    override_reason.append("term substitution detected")
+                    if term_substitution:
+                        should_override = True
+                        override_reason.append("term substitution detected")
 
-                if should_override and retry_count < self.config.max_validation_retries:
-                    logger.warning(
-                        f"[RequestHandler] OVERRIDING APPROVE to RETRY: {', '.join(override_reason)}"
-                    )
-                    from libs.gateway.validation.validation_result import ValidationResult, ValidationFailureContext
-                    validation_result = ValidationResult(
-                        decision="RETRY",
-                        issues=validation_result.issues + [f"Override: {', '.join(override_reason)}"],
-                        confidence=confidence,
-                        revision_hints=f"Research needed - {', '.join(override_reason)}",
-                        failure_context=ValidationFailureContext(
-                            reason="confidence_override",
-                            failed_urls=[],
-                            failed_claims=[],
-                            mismatches=[],
-                            retry_count=retry_count + 1
+                    if should_override and retry_count < self.config.max_validation_retries:
+                        logger.warning(
+                            f"[RequestHandler] OVERRIDING APPROVE to RETRY: {', '.join(override_reason)}"
+                        )
+                        from libs.gateway.validation.validation_result import ValidationResult, ValidationFailureContext
+                        validation_result = ValidationResult(
+                            decision="RETRY",
+                            issues=validation_result.issues + [f"Override: {', '.join(override_reason)}"],
+                            confidence=confidence,
+                            revision_hints=f"Research needed - {', '.join(override_reason)}",
+                            failure_context=ValidationFailureContext(
+                                reason="confidence_override",
+                                failed_urls=[],
+                                failed_claims=[],
+                                mismatches=[],
+                                retry_count=retry_count + 1
+                            )
                         )
-                    )
-
-            # Handle validation result
-            if validation_result.decision == "APPROVE":
-                logger.info(f"[RequestHandler] Validation APPROVED on iteration {retry_count + 1}")
 
-                retry_context_path = turn_dir.path / "retry_context.json"
-                if retry_context_path.exists():
-                    retry_context_path.unlink()
-                    logger.debug("[RequestHandler] Cleaned up retry_context.json")
+                # Handle validation result
+                if validation_result.decision == "APPROVE":
+                    logger.info(f"[RequestHandler] Validation APPROVED on iteration {retry_count + 1}")
 
-                break
+                    retry_context_path = turn_dir.path / "retry_context.json"
+                    if retry_context_path.exists():
+                        retry_context_path.unlink()
+                        logger.debug("[RequestHandler] Cleaned up retry_context.json")
 
-            elif validation_result.decision == "RETRY":
-                if coordinator_blocked:
-                    logger.warning(f"[RequestHandler] Skipping RETRY - coordinator was BLOCKED")
                     break
 
-                logger.info(f"[RequestHandler] Validation RETRY - looping back (iteration {retry_count + 1})")
+                elif validation_result.decision == "RETRY":
+                    if coordinator_blocked:
+                        logger.warning(f"[RequestHandler] Skipping RETRY - coordinator was BLOCKED")
+                        break
 
-                await self._archive_attempt(turn_dir, retry_count)
-                await self._write_retry_context(
-                    turn_dir, validation_result.failure_context,
-                    session_id=session_id, turn_number=turn_number
-                )
-                await self._invalidate_claims(validation_result.failure_context)
-
-                # Handle workflow_mismatch correction
-                suggested_fixes = []
-                if validation_result.failure_context:
-                    suggested_fixes = validation_result.failure_context.suggested_fixes or []
-                for fix in suggested_fixes:
-                    if isinstance(fix, str) and fix.startswith("workflow_mismatch:"):
-                        workflow_match = re.search(r'Should have used (\w+)', fix)
-                        if workflow_match:
-                            correct_workflow = workflow_match.group(1)
-                            logger.info(f"[RequestHandler] RETRY: Correcting workflow to {correct_workflow}")
-                            context_doc.workflow = correct_workflow
-                            context_doc.workflow_reason = f"Corrected by validation: {fix}"
-
-                retry_count += 1
-                continue
-
-            elif validation_result.decision == "FAIL":
-                logger.error(f"[RequestHandler] Validation FAILED: {validation_result.issues}")
-
-                # Best-seen recovery
-                current_confidence = validation_result.confidence if validation_result else 0.0
-                if best_seen_response and best_seen_confidence > current_confidence:
-                    logger.info(
-                        f"[RequestHandler] Using best-seen response from attempt {best_seen_attempt}"
-                    )
-                    response = best_seen_response
-                else:
-                    is_invalid_response = (
-                        not response or
-                        response.strip() == "" or
-                        '{"_type": "INVALID"}' in response or
-                        response.strip().startswith('{') and '_type' in response
-                    )
+                    logger.info(f"[RequestHandler] Validation RETRY - looping back (iteration {retry_count + 1})")
 
-                    if is_invalid_response:
-                        logger.warning(f"[RequestHandler] Replacing invalid response with fallback message")
-                        response = (
-                            "I apologize, but I wasn't able to complete your request successfully. "
-                            "The information I gathered wasn't sufficient to provide a reliable response. "
-                            "Could you try rephrasing your question, or would you like me to try again?"
+                    await self._archive_attempt(turn_dir, retry_count)
+                    await self._write_retry_context(
+                        turn_dir, validation_result.failure_context,
+                        session_id=session_id, turn_number=turn_number
+                    )
+                    await self._invalidate_claims(validation_result.failure_context)
+                    if reuse:
+                        reuse.mark_stale(session_id, turn_number, validation_result.failure_context)
+
+                    # Handle workflow_mismatch correction
+                    suggested_fixes = []
+                    if validation_result.failure_context:
+                        suggested_fixes = validation_result.failure_context.suggested_fixes or []
+                    for fix in suggested_fixes:
+                        if isinstance(fix, str) and fix.startswith("workflow_mismatch:"):
+                            workflow_match = re.search(r'Should have used (\w+)', fix)
+                            if workflow_match:
+                                correct_workflow = workflow_match.group(1)
+                                logger.info(f"[RequestHandler] RETRY: Correcting workflow to {correct_workflow}")
+                                context_doc.workflow = correct_workflow
+                                context_doc.workflow_reason = f"Corrected by validation: {fix}"
+
+                    retry_count += 1
+                    continue
+
+                elif validation_result.decision == "FAIL":
+                    logger.error(f"[RequestHandler] Validation FAILED: {validation_result.issues}")
+
+                    # Best-seen recovery
+                    current_confidence = validation_result.confidence if validation_result else 0.0
+                    if best_seen_response and best_seen_confidence > current_confidence:
+                        logger.info(
+                            f"[RequestHandler] Using best-seen response from attempt {best_seen_attempt}"
+                        )
+                        response = best_seen_response
+                    else:
+                        is_invalid_response = (
+                            not response or
+                            response.strip() == "" or
+                            '{"_type": "INVALID"}' in response or
+                            response.strip().startswith('{') and '_type' in response
                         )
 
-                break
+                        if is_invalid_response:
+                            logger.warning(f"[RequestHandler] Replacing invalid response with fallback message")
+                            response = (
+                                "I apologize, but I wasn't able to complete your request successfully. "
+                                "The information I gathered wasn't sufficient to provide a reliable response. "
+                                "Could you try rephrasing your question, or would you like me to try again?"
+                            )
 
-            else:
-                logger.warning(f"[RequestHandler] Unknown validation decision: {validation_result.decision}")
-                break
+                    break
+
+                else:
+                    logger.warning(f"[RequestHandler] Unknown validation decision: {validation_result.decision}")
+                    break
+        finally:
+            # Drop this turn's cached results even if the turn failed
+            if reuse:
+                reuse.end_turn(session_id, turn_number)
 
         # Check if we exhausted retries
         if retry_count >= self.config.max_validation_retries:
@@ -643,6 +693,8 @@ class RequestHandler:
         turn_metrics = self._get_turn_metrics()
         turn_metrics["retries"] = retry_count
         turn_metrics["claims_count"] = len(context_doc.claims)
+        if reuse_history:
+            turn_metrics["retry_reuse"] = reuse_history
         self._set_turn_metrics(turn_metrics)
 
         quality_score = validation_result.confidence if validation_result else 0.0
@@ -681,6 +733,105 @@ class RequestHandler:
         }
 
 
+    # =========================================================================
+    # INCREMENTAL RETRY
+    # =========================================================================
+
+    def _write_retry_delta(self, context_doc: "ContextDocument", reuse: Any, session_id: str, turn_number: int) -> Dict[str, Any]:
+        """
+        Append a Retry Delta block to §4 after a retry's planning loop.
+
+        Synthesis reads §4 alongside its previous draft in §6, so this tells it
+        which evidence is new this attempt and which carried over unchanged.
+
+        Returns:
+            Reuse metrics for this attempt (also emitted with the Phase 3 event)
+        """
+        stats = reuse.attempt_stats(session_id, turn_number)
+        if not stats:
+            return {}
+
+        def tool_list(tools: List[str]) -> str:
+            return ", ".join(f"`{t}`" for t in dict.fromkeys(tools)) or "none"
+
+        context_doc.append_to_section(4, f"""### Retry Delta (attempt {stats.attempt})
+**Reused from earlier attempts:** {stats.reused} ({tool_list(stats.reused_tools)})
+**Re-executed:** {stats.executed} ({tool_list(stats.executed_tools)})
+**Invalidated by validation:** {stats.invalidated}
+
+Revise the previous draft in §6 only where re-executed results change the evidence; keep what rests on reused results.
+""")
+        logger.info(
+            f"[RequestHandler] Retry attempt {stats.attempt}: reused {stats.reused} tool results "
+            f"(~{stats.reused_ms}ms saved), executed {stats.executed}, invalidated {stats.invalidated}"
+        )
+        return stats.to_dict()
+
+    # =========================================================================
+    # SPECULATIVE PHASE 2
+    # =========================================================================
+
+    async def _run_phase2_prefetch(self, context_doc: "ContextDocument") -> Tuple[Any, float, float]:
+        """Run the Phase 2 prefetch callback. Returns (gatherer, started, finished)."""
+        started = time.time()
+        self._start_phase("phase2_prefetch")
+        try:
+            gatherer = await self._phase2_prefetch(context_doc)
+        finally:
+            self._end_phase("phase2_prefetch")
+        return gatherer, started, time.time()
+
+    async def _cancel_phase2_prefetch(self, task: Optional[asyncio.Task]) -> None:
+        """Cancel a speculative prefetch and wait for it to unwind."""
+        if not task:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logger.debug(f"[RequestHandler] Speculative prefetch failed before cancel: {e}")
+        logger.info("[RequestHandler] Phase 1.5 returned CLARIFY - speculative Phase 2 cancelled")
+
+    async def _await_phase2_prefetch(
+        self,
+        task: Optional[asyncio.Task],
+        phase1_start: float,
+        phase1_end: float,
+    ) -> Dict[str, Any]:
+        """
+        Collect a speculative prefetch after Phase 1.5 decided PROCEED.
+
+        Returns:
+            Timing details for the Phase 2 event (prefetch_ms, overlap_ms,
+            wait_ms) plus "gatherer" if the prefetch succeeded. Empty when
+            speculation is off. A failed prefetch is logged and Phase 2 runs
+            its lookups itself.
+        """
+        if not task:
+            return {}
+
+        wait_start = time.time()
+        try:
+            gatherer, started, finished = await task
+        except Exception as e:
+            logger.warning(f"[RequestHandler] Speculative prefetch failed, gathering normally: {e}")
+            return {"speculative": False}
+
+        overlap = max(0.0, min(finished, phase1_end) - max(started, phase1_start))
+        timing = {
+            "speculative": True,
+            "prefetch_ms": int((finished - started) * 1000),
+            "overlap_ms": int(overlap * 1000),
+            "wait_ms": int((time.time() - wait_start) * 1000),
+        }
+        logger.info(
+            f"[RequestHandler] Speculative Phase 2 prefetch: {timing['prefetch_ms']}ms, "
+            f"{timing['overlap_ms']}ms overlapped with Phase 1.5"
+        )
+        return {**timing, "gatherer": gatherer}
+
     def _extract_and_write_constraints(
         self,
         context_doc: "ContextDocument",
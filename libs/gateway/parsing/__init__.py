@@ -24,6 +24,7 @@ Contains:
 - ResponseParser: LLM response parsing with JSON repair
 - ClaimsManager: Claims extraction with TTL and confidence
 - ForgivingParser: Defensive JSON parsing utilities
+- scan_json / StreamingJSONScanner: Single-pass lenient JSON extraction (also streamed)
 - QueryResolver: Reference resolution helpers (legacy)
 """
 
@@ -41,6 +42,7 @@ from libs.gateway.parsing.forgiving_parser import (
     ForgivingParser,
     ParseResult,
 )
+from libs.gateway.parsing.json_scanner import ScanResult, StreamingJSONScanner, scan_json
 from libs.gateway.parsing.query_resolver import QueryResolver, get_query_resolver
 
 __all__ = [
@@ -55,6 +57,9 @@ __all__ = [
     "get_claims_manager",
     "ForgivingParser",
     "ParseResult",
+    "ScanResult",
+    "StreamingJSONScanner",
+    "scan_json",
     "QueryResolver",
     "get_query_resolver",
 ]
@@ -16,8 +16,13 @@ import logging
 from typing import Any, Dict, List, Optional, Tuple, Union
 from dataclasses import dataclass, field
 
+from libs.gateway.parsing.json_scanner import scan_json
+
 logger = logging.getLogger(__name__)
 
+# Opening code fence ("```" / "```json") left before the JSON value
+_FENCE_PREFIX = re.compile(r"^```[\w-]*$")
+
 
 @dataclass
 class ParseResult:
@@ -34,9 +39,13 @@ class ForgivingParser:
 
     Strategies (in order):
     1. Direct JSON parse
-    2. JSON repair (trailing commas, quotes, etc.)
+    2. JSON repair (trailing commas, quotes, comments, truncated tails) -
+       done by the same single-pass scan as 1, see json_scanner.scan_json
     3. Semantic extraction (regex/keyword patterns)
     4. Sensible defaults
+
+    For streamed output use json_scanner.StreamingJSONScanner, which reports
+    top-level fields as soon as they close.
     """
 
     def parse(
@@ -57,39 +66,24 @@ class ForgivingParser:
         warnings = []
         schema = expected_schema or {}
 
-        # Strategy 1: Direct JSON parse
+        # Strategy 1: Direct JSON parse (strict first, then one lenient pass)
+        # Strategy 2: JSON repair happens inside that same pass (see json_scanner)
         try:
-            data = self._extract_json(raw_output)
+            data, repairs = self._extract_json(raw_output or "")
             if data is not None:
+                if repairs:
+                    warnings.append(f"JSON required repair ({', '.join(repairs)})")
                 validated = self._validate_and_default(data, schema)
                 return ParseResult(
                     data=validated,
                     success=True,
-                    strategy_used="json_direct",
+                    strategy_used="json_repaired" if repairs else "json_direct",
                     warnings=warnings
                 )
-        except json.JSONDecodeError as e:
-            warnings.append(f"JSON parse failed: {e}")
         except Exception as e:
             # Catch any other errors (like dict() on non-dict)
             warnings.append(f"JSON validation failed: {e}")
-            logger.warning(f"[ForgivingParser] Strategy 1 failed: {e}, raw preview: {raw_output[:200]}")
-
-        # Strategy 2: JSON repair
-        try:
-            repaired = self._repair_json(raw_output)
-            data = self._extract_json(repaired)
-            if data is not None:
-                warnings.append("JSON required repair")
-                validated = self._validate_and_default(data, schema)
-                return ParseResult(
-                    data=validated,
-                    success=True,
-                    strategy_used="json_repaired",
-                    warnings=warnings
-                )
-        except Exception as e:
-            warnings.append(f"JSON repair failed: {e}")
+            logger.warning(f"[ForgivingParser] JSON strategies failed: {e}, raw preview: {raw_output[:200]}")
 
         # Strategy 3: Semantic extraction
         try:
@@ -116,83 +110,42 @@ class ForgivingParser:
             warnings=warnings
         )
 
-    def _extract_json(self, text: str) -> Optional[Dict[str, Any]]:
-        """Extract JSON from text, handling code blocks and mixed content."""
-        text = text.strip()
-
-        # Strip markdown code blocks
-        if text.startswith("```"):
-            lines = text.split("\n")
-            lines = [l for l in lines if not l.startswith("```")]
-            text = "\n".join(lines).strip()
-
-        # Try direct parse first
-        try:
-            result = json.loads(text)
-            # Only return if it's a dict or list, not primitive types
-            if isinstance(result, (dict, list)):
-                return result
-        except json.JSONDecodeError:
-            pass
-
-        # Find JSON object boundaries
-        start = text.find("{")
-        end = text.rfind("}") + 1
-
-        if start >= 0 and end > start:
-            try:
-                result = json.loads(text[start:end])
-                if isinstance(result, dict):
-                    return result
-            except json.JSONDecodeError:
-                pass
+    def _extract_json(self, text: str) -> Tuple[Optional[Union[Dict[str, Any], List[Any]]], List[str]]:
+        """
+        Extract JSON from text, handling code blocks, mixed content and common errors.
 
-        # Try array
-        start = text.find("[")
-        end = text.rfind("]") + 1
+        Returns:
+            (value, repairs) - value is None if no usable JSON was found;
+            repairs lists the fixes applied (empty for valid JSON)
+        """
+        stripped = text.strip()
 
-        if start >= 0 and end > start:
+        # Fast path: the whole output is valid JSON (C decoder)
+        if stripped[:1] in ("{", "["):
             try:
-                result = json.loads(text[start:end])
-                if isinstance(result, list):
-                    return result
+                result = json.loads(stripped)
+                if isinstance(result, (dict, list)):
+                    return result, []
             except json.JSONDecodeError:
                 pass
 
-        return None
-
-    def _repair_json(self, text: str) -> str:
-        """Apply common JSON repairs."""
-        repaired = text
-
-        # Strip markdown code blocks
-        if "```" in repaired:
-            lines = repaired.split("\n")
-            lines = [l for l in lines if not l.startswith("```")]
-            repaired = "\n".join(lines)
-
-        # Fix trailing commas before closing brackets
-        repaired = re.sub(r',(\s*[}\]])', r'\1', repaired)
-
-        # Fix single quotes to double quotes (careful with apostrophes)
-        # Only replace single quotes that look like JSON delimiters
-        repaired = re.sub(r"'(\w+)'(\s*:)", r'"\1"\2', repaired)  # Keys
-        repaired = re.sub(r":\s*'([^']*)'", r': "\1"', repaired)   # String values
-
-        # Fix unquoted keys
-        repaired = re.sub(r'{\s*([a-zA-Z_]\w*)\s*:', r'{"\1":', repaired)
-        repaired = re.sub(r',\s*([a-zA-Z_]\w*)\s*:', r', "\1":', repaired)
-
-        # Fix JavaScript-style comments
-        repaired = re.sub(r'//[^\n]*\n', '\n', repaired)
-        repaired = re.sub(r'/\*.*?\*/', '', repaired, flags=re.DOTALL)
-
-        # Fix Python-style True/False/None
-        repaired = re.sub(r'\bTrue\b', 'true', repaired)
-        repaired = re.sub(r'\bFalse\b', 'false', repaired)
-        repaired = re.sub(r'\bNone\b', 'null', repaired)
-
-        return repaired
+        # Single pass over the text: locate the outermost object/array and repair it
+        scanned = scan_json(text)
+        if scanned is None:
+            return None, []
+
+        repairs = list(scanned.repairs)
+        if isinstance(scanned.value, dict):
+            # A "{" inside prose that only parsed by closing it at end of text
+            # (or yields nothing) is not JSON; let semantic extraction read the prose
+            in_prose = bool(_FENCE_PREFIX.sub("", text[:scanned.start].strip()))
+            if in_prose and ("truncated" in repairs or not scanned.value):
+                return None, []
+            return scanned.value, repairs
+        # Only trust arrays that needed no repair ("[citation]" in prose is not JSON)
+        if not repairs:
+            return scanned.value, repairs
+        return None, []
 
     def _semantic_extract(
         self,
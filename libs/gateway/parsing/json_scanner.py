@@ -0,0 +1,471 @@
+"""
+JSON Scanner - Single-pass lenient JSON extraction for LLM output.
+
+Finds the outermost JSON object/array in mixed text (prose, markdown fences)
+and parses it in one pass, repairing the usual LLM mistakes as it goes:
+
+- trailing / doubled / missing commas
+- unquoted and single-quoted keys, single-quoted strings
+- // and /* */ comments
+- Python literals (True/False/None)
+- raw newlines inside strings
+- truncated tails (unterminated strings, unclosed containers)
+
+StreamingJSONScanner applies the same parser incrementally to streamed output
+and reports each top-level field as soon as its value is closed, so callers
+can act on e.g. a planner's `steps` array before the rest of the response
+has arrived.
+
+Usage:
+    result = scan_json(raw_output)
+    if result is not None:
+        data, repairs = result.value, result.repairs
+
+    scanner = StreamingJSONScanner()
+    for chunk in stream:
+        for key, value in scanner.feed(chunk):
+            if key == "steps":
+                dispatch(value)
+"""
+
+import json
+import re
+from dataclasses import dataclass, field
+from json.decoder import scanstring
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+# Whitespace and comments between tokens (unterminated /* runs to the end)
+_SKIP = re.compile(r"(?:\s+|//[^\n]*|/\*(?:[^*]|\*(?!/))*(?:\*/|\Z))*")
+_NUMBER = re.compile(r"-?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?")
+_WORD = re.compile(r"[A-Za-z_$][\w$.\-]*")
+_BARE_VALUE = re.compile(r"[^,}\]\n]*")
+_NUMBER_TERMINATORS = frozenset(",}] \t\r\n/")
+_FENCE = "```"
+
+_LITERALS = {"true": True, "false": False, "null": None}
+_PYTHON_LITERALS = {"True": True, "False": False, "None": None}
+_ESCAPES = {"n": "\n", "t": "\t", "r": "\r", "b": "\b", "f": "\f", "/": "/", "\\": "\\", '"': '"', "'": "'"}
+
+# C decoder used for the valid parts of a value (strict=False: raw newlines in strings)
+_DECODER = json.JSONDecoder(strict=False)
+
+# Give up after this many failed start candidates (brackets inside prose)
+MAX_CANDIDATES = 32
+
+JSONValue = Union[Dict[str, Any], List[Any]]
+
+
+class _ScanError(ValueError):
+    """Raised when text at a candidate position is not JSON-like."""
+
+
+@dataclass
+class ScanResult:
+    """Outermost JSON value found in a text."""
+    value: JSONValue
+    start: int
+    end: int
+    complete: bool
+    repairs: List[str] = field(default_factory=list)
+
+
+class _Parser:
+    """
+    Recursive-descent lenient parser over one string.
+
+    Containers are first handed to the C decoder; when that fails, the
+    container is walked by hand and its children get the same treatment, so
+    only the path down to each error is parsed in Python.
+    """
+
+    def __init__(self, text: str):
+        self.text = text
+        self.length = len(text)
+        self.pos = 0
+        self.truncated = False
+        self.repairs: List[str] = []
+
+    def _repair(self, kind: str) -> None:
+        if kind not in self.repairs:
+            self.repairs.append(kind)
+
+    def _skip(self) -> bool:
+        """Skip whitespace/comments. Returns False at end of input or a closing code fence."""
+        match = _SKIP.match(self.text, self.pos)
+        if match.end() > self.pos:
+            if "/" in match.group(0):
+                self._repair("comments")
+            self.pos = match.end()
+        if self.pos >= self.length or self._at_fence_line():
+            self.truncated = True
+            return False
+        return True
+
+    def _at_fence_line(self) -> bool:
+        """True if a markdown code fence starts the current line (a fenced value was cut off)."""
+        if not self.text.startswith(_FENCE, self.pos):
+            return False
+        line_start = self.text.rfind("\n", 0, self.pos) + 1
+        return not self.text[line_start:self.pos].strip()
+
+    def parse_value(self) -> Any:
+        char = self.text[self.pos]
+        if char == "{" or char == "[":
+            # Valid sub-values go through the C decoder; only broken ones are walked here
+            try:
+                value, self.pos = _DECODER.raw_decode(self.text, self.pos)
+                return value
+            except json.JSONDecodeError:
+                pass
+            return self._parse_object() if char == "{" else self._parse_array()
+        if char == '"':
+            return self._parse_string()
+        if char == "'":
+            self._repair("single_quotes")
+            return self._parse_lenient_string("'")
+        if char == "-" or char == "." or char.isdigit():
+            return self._parse_number()
+        return self._parse_word()
+
+    def _parse_object(self) -> Dict[str, Any]:
+        self.pos += 1
+        result: Dict[str, Any] = {}
+        while self._skip():
+            char = self.text[self.pos]
+            if char == "}":
+                self.pos += 1
+                return result
+            if char == ",":
+                self._repair("extra_commas")
+                self.pos += 1
+                continue
+            if char == "]":
+                raise _ScanError(f"unexpected ']' in object at {self.pos}")
+
+            key = self._parse_key()
+            if not self._skip():
+                break
+            if self.text[self.pos] not in ":=":
+                raise _ScanError(f"expected ':' at {self.pos}")
+            self.pos += 1
+            if not self._skip():
+                break
+            if self.text[self.pos] in ",}":
+                self._repair("missing_values")
+                continue
+
+            value = self.parse_value()
+            result[key] = value
+            if not self._skip():
+                break
+            char = self.text[self.pos]
+            if char == ",":
+                self.pos += 1
+                if self._skip() and self.text[self.pos] == "}":
+                    self._repair("trailing_commas")
+            elif char != "}":
+                self._repair("missing_commas")
+        self._repair("truncated")
+        return result
+
+    def _parse_key(self) -> str:
+        char = self.text[self.pos]
+        if char == '"':
+            return self._parse_string()
+        if char == "'":
+            self._repair("single_quotes")
+            return self._parse_lenient_string("'")
+        match = _WORD.match(self.text, self.pos)
+        if not match:
+            raise _ScanError(f"invalid key at {self.pos}")
+        self._repair("unquoted_keys")
+        self.pos = match.end()
+        return match.group(0)
+
+    def _parse_array(self) -> List[Any]:
+        self.pos += 1
+        result: List[Any] = []
+        while self._skip():
+            char = self.text[self.pos]
+            if char == "]":
+                self.pos += 1
+                return result
+            if char == ",":
+                self._repair("extra_commas")
+                self.pos += 1
+                continue
+            if char == "}":
+                raise _ScanError(f"unexpected '}}' in array at {self.pos}")
+
+            result.append(self.parse_value())
+            if not self._skip():
+                break
+            char = self.text[self.pos]
+            if char == ",":
+                self.pos += 1
+                if self._skip() and self.text[self.pos] == "]":
+                    self._repair("trailing_commas")
+            elif char != "]":
+                self._repair("missing_commas")
+        self._repair("truncated")
+        return result
+
+    def _parse_string(self) -> str:
+        try:
+            value, self.pos = scanstring(self.text, self.pos + 1, False)
+            return value
+        except json.JSONDecodeError:
+            # Unterminated (truncated) or a bad escape - decode by hand
+            return self._parse_lenient_string('"')
+
+    def _parse_lenient_string(self, quote: str) -> str:
+        text = self.text
+        pos = self.pos + 1
+        chunks: List[str] = []
+        while pos < self.length:
+            end = pos
+            while end < self.length and text[end] != quote and text[end] != "\\":
+                end += 1
+            chunks.append(text[pos:end])
+            if end >= self.length:
+                pos = end
+                break
+            if text[end] == quote:
+                self.pos = end + 1
+                return "".join(chunks)
+            # Backslash escape
+            escape = text[end + 1:end + 2]
+            if escape == "u" and end + 6 <= self.length:
+                try:
+                    chunks.append(chr(int(text[end + 2:end + 6], 16)))
+                    pos = end + 6
+                    continue
+                except ValueError:
+                    pass
+            if not escape:
+                pos = end + 1
+                break
+            chunks.append(_ESCAPES.get(escape, escape))
+            pos = end + 2
+        self.pos = self.length
+        self.truncated = True
+        self._repair("truncated")
+        return "".join(chunks)
+
+    def _parse_number(self) -> Union[int, float, str]:
+        match = _NUMBER.match(self.text, self.pos)
+        if not match:
+            return self._parse_word()
+        end = match.end()
+        if end < self.length and self.text[end] not in _NUMBER_TERMINATORS:
+            # "3px", "2024-01-01": not a number, keep as text
+            return self._parse_word()
+        literal = match.group(0)
+        self.pos = end
+        try:
+            if any(c in literal for c in ".eE"):
+                return float(literal.rstrip("."))
+            return int(literal)
+        except ValueError:
+            return literal
+
+    def _parse_word(self) -> Any:
+        match = _WORD.match(self.text, self.pos)
+        if match:
+            word = match.group(0)
+            if word in _LITERALS:
+                self.pos = match.end()
+                return _LITERALS[word]
+            if word in _PYTHON_LITERALS:
+                self._repair("python_literals")
+                self.pos = match.end()
+                return _PYTHON_LITERALS[word]
+        # Bare text value up to the next delimiter
+        bare = _BARE_VALUE.match(self.text, self.pos)
+        value = bare.group(0).strip()
+        if not value:
+            raise _ScanError(f"unexpected {self.text[self.pos]!r} at {self.pos}")
+        self._repair("unquoted_values")
+        self.pos = bare.end()
+        return value
+
+
+def _parse_at(text: str, start: int) -> ScanResult:
+    parser = _Parser(text)
+    parser.pos = start
+    value = parser.parse_value()
+    return ScanResult(
+        value=value,
+        start=start,
+        end=parser.pos,
+        complete=not parser.truncated,
+        repairs=parser.repairs,
+    )
+
+
+def scan_json(text: str, start: int = 0) -> Optional[ScanResult]:
+    """
+    Find and parse the outermost JSON object or array in text.
+
+    Objects are preferred: an array is returned only if it encloses the first
+    object or there is no parseable object.
+
+    Args:
+        text: Raw LLM output (may contain prose, fences or be truncated)
+        start: Offset to start searching from
+
+    Returns:
+        ScanResult, or None if no JSON-like value was found
+    """
+    if not text:
+        return None
+
+    first_object = text.find("{", start)
+    first_array = text.find("[", start)
+
+    fallback: Optional[ScanResult] = None
+    if first_array != -1 and (first_object == -1 or first_array < first_object):
+        fallback = _scan_from(text, first_array, "[")
+        if fallback is not None and (first_object == -1 or fallback.end > first_object):
+            return fallback
+
+    if first_object != -1:
+        found = _scan_from(text, first_object, "{")
+        if found is not None:
+            return found
+
+    if fallback is None and first_array != -1:
+        fallback = _scan_from(text, first_array, "[")
+    return fallback
+
+
+def _scan_from(text: str, pos: int, opener: str) -> Optional[ScanResult]:
+    for _ in range(MAX_CANDIDATES):
+        if pos == -1:
+            return None
+        try:
+            return _parse_at(text, pos)
+        except (_ScanError, RecursionError):
+            pos = text.find(opener, pos + 1)
+    return None
+
+
+# ============================================================================
+# Streaming
+# ============================================================================
+
+class StreamingJSONScanner:
+    """
+    Incremental scanner for streamed JSON output.
+
+    Tracks string/bracket state across chunks (each character is looked at
+    once) and parses each top-level member when it closes.
+    """
+
+    def __init__(self):
+        self.buffer = ""
+        self.fields: Dict[Union[str, int], Any] = {}
+        self.done = False
+        self._pos = 0
+        self._root: Optional[str] = None  # "{" or "["
+        self._root_start = 0
+        self._depth = 0
+        self._quote: Optional[str] = None
+        self._escape = False
+        self._last = ""  # last significant character outside strings
+        self._member_start = 0
+        self._index = 0
+
+    def feed(self, chunk: str) -> List[Tuple[Union[str, int], Any]]:
+        """
+        Add a chunk of output.
+
+        Returns:
+            Newly closed top-level members: (key, value) for an object root,
+            (index, value) for an array root
+        """
+        self.buffer += chunk
+        closed: List[Tuple[Union[str, int], Any]] = []
+        text = self.buffer
+
+        while self._pos < len(text) and not self.done:
+            char = text[self._pos]
+            if self._root is None:
+                if char in "{[":
+                    self._root = char
+                    self._root_start = self._pos
+                    self._depth = 1
+                    self._member_start = self._pos + 1
+                self._pos += 1
+                continue
+
+            if self._quote is not None:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == self._quote:
+                    self._quote = None
+            elif char == '"' or (char == "'" and self._last in "{[,:"):
+                # A ' only opens a string at a token start (not "don't")
+                self._quote = char
+            elif char in "{[":
+                self._depth += 1
+            elif char in "}]":
+                self._depth -= 1
+                if self._depth == 0:
+                    closed.extend(self._close_member(self._pos))
+                    self.done = True
+            elif char == "," and self._depth == 1:
+                closed.extend(self._close_member(self._pos))
+                self._member_start = self._pos + 1
+            if self._quote is None and not char.isspace():
+                self._last = char
+            self._pos += 1
+
+        return closed
+
+    @property
+    def value_text(self) -> str:
+        """Text of the closed top-level value ("" until done)."""
+        return self.buffer[self._root_start:self._pos] if self.done else ""
+
+    def restart(self) -> List[Tuple[Union[str, int], Any]]:
+        """
+        Drop the closed top-level value and scan on for the next one.
+
+        For brackets in prose before the real JSON ("pick [x].\n{...}").
+        Returns members closed in the already-buffered text.
+        """
+        self.fields = {}
+        self.done = False
+        self._root = None
+        self._depth = 0
+        self._quote = None
+        self._escape = False
+        self._last = ""
+        self._index = 0
+        return self.feed("")
+
+    def _close_member(self, end: int) -> List[Tuple[Union[str, int], Any]]:
+        segment = self.buffer[self._member_start:end]
+        if not segment.strip():
+            return []
+        wrapped = "{" + segment + "}" if self._root == "{" else "[" + segment + "]"
+        try:
+            parsed = _parse_at(wrapped, 0).value
+        except (_ScanError, RecursionError):
+            return []
+        if isinstance(parsed, dict):
+            items = list(parsed.items())
+        else:
+            items = []
+            for value in parsed:
+                items.append((self._index, value))
+                self._index += 1
+        self.fields.update(items)
+        return items
+
+    def snapshot(self) -> Optional[ScanResult]:
+        """Best-effort parse of everything received so far (truncation repaired)."""
+        return scan_json(self.buffer)
@@ -1,16 +1,21 @@
 """
 Atomic turn number generation for V5 flow.
 
-Uses file locking to prevent race conditions when multiple concurrent
-requests try to create turns at the same time.
+Turn numbers are allocated from the turn_counters table in TurnIndexDB with a
+single UPDATE ... RETURNING per turn, so concurrent requests (and multiple
+gateway worker processes) never hand out the same number.
+
+Counters used to live in a .turn_counter.json file guarded by an fcntl lock;
+that file is imported into the database the first time a TurnCounter sees it.
 """
 
 import json
-import fcntl
 import logging
 from pathlib import Path
 from typing import Optional
 
+from libs.gateway.persistence.turn_index_db import TurnIndexDB, get_turn_index_db
+
 logger = logging.getLogger(__name__)
 
 
@@ -18,16 +23,20 @@ class TurnCounter:
     """
     Thread-safe, process-safe turn number counter.
 
-    Uses file locking to ensure atomic increment operations across
-    multiple concurrent requests.
+    Each turns directory is its own counter scope; within it there is one
+    sequence per session plus a "_global" sequence.
     """
 
-    def __init__(self, turns_dir: Path = None):
+    def __init__(self, turns_dir: Path = None, index_db: TurnIndexDB = None):
         # Use new consolidated path structure under obsidian_memory/Users/
         self.turns_dir = turns_dir or Path("panda_system_docs/obsidian_memory/Users/default/turns")
         self.turns_dir.mkdir(parents=True, exist_ok=True)
         self.counter_file = self.turns_dir / ".turn_counter.json"
-        self.lock_file = self.turns_dir / ".turn_lock"
+        self.index_db = index_db or get_turn_index_db(sync_on_startup=False)
+        self.scope = str(self.turns_dir.resolve())
+
+        if self.counter_file.exists():
+            self._migrate_json_counters()
 
     def get_next_turn_number(self, session_id: Optional[str] = None) -> int:
         """
@@ -40,44 +49,39 @@ class TurnCounter:
         Returns:
             Next turn number (guaranteed unique within scope)
         """
-        # Ensure lock file exists
-        self.lock_file.touch(exist_ok=True)
-
-        with open(self.lock_file, 'r+') as lock:
-            # Acquire exclusive lock
-            fcntl.flock(lock, fcntl.LOCK_EX)
-            try:
-                # Read current counters
-                if self.counter_file.exists():
-                    try:
-                        counters = json.loads(self.counter_file.read_text())
-                    except (json.JSONDecodeError, IOError):
-                        counters = {}
-                else:
-                    counters = {}
-
-                # Determine counter key
-                key = session_id if session_id else "_global"
-
-                # Get current value and increment
-                current = counters.get(key, self._scan_max_turn_number())
-                next_turn = current + 1
+        key = session_id if session_id else "_global"
+        next_turn = self.index_db.allocate_turn_number(
+            self.scope, key, seed=self._scan_max_turn_number
+        )
+        logger.debug(f"[TurnCounter] Allocated turn {next_turn} for {key}")
+        return next_turn
+
+    def _migrate_json_counters(self):
+        """
+        One-time import of the legacy .turn_counter.json file.
 
-                # Update counter
-                counters[key] = next_turn
-                self.counter_file.write_text(json.dumps(counters, indent=2))
+        The file is renamed afterwards so later instances skip this. If two
+        workers race here the import is idempotent (values merge with MAX).
+        """
+        try:
+            counters = json.loads(self.counter_file.read_text())
+        except (json.JSONDecodeError, IOError) as e:
+            logger.warning(f"[TurnCounter] Ignoring unreadable counter file {self.counter_file}: {e}")
+            counters = {}
 
-                logger.debug(f"[TurnCounter] Allocated turn {next_turn} for {key}")
-                return next_turn
+        if isinstance(counters, dict) and counters:
+            imported = self.index_db.import_turn_counters(self.scope, counters)
+            logger.info(f"[TurnCounter] Migrated {imported} counters from {self.counter_file}")
 
-            finally:
-                # Release lock
-                fcntl.flock(lock, fcntl.LOCK_UN)
+        try:
+            self.counter_file.rename(self.counter_file.with_name(".turn_counter.json.migrated"))
+        except FileNotFoundError:
+            pass  # Another worker migrated it first
 
     def _scan_max_turn_number(self) -> int:
         """
         Scan existing turn directories to find the maximum turn number.
-        Used for initial counter value when no counter file exists.
+        Only used to seed the first counter in a scope.
         """
         max_turn = 0
         try:
@@ -100,23 +104,8 @@ class TurnCounter:
         Args:
             session_id: Session to reset, or None for global counter
         """
-        self.lock_file.touch(exist_ok=True)
-
-        with open(self.lock_file, 'r+') as lock:
-            fcntl.flock(lock, fcntl.LOCK_EX)
-            try:
-                if self.counter_file.exists():
-                    counters = json.loads(self.counter_file.read_text())
-                else:
-                    counters = {}
-
-                key = session_id if session_id else "_global"
-                if key in counters:
-                    del counters[key]
-
-                self.counter_file.write_text(json.dumps(counters, indent=2))
-            finally:
-                fcntl.flock(lock, fcntl.LOCK_UN)
+        key = session_id if session_id else "_global"
+        self.index_db.reset_turn_counter(self.scope, key)
 
 
 # Global singleton for convenience
@@ -24,6 +24,12 @@ Schema:
     - validation_outcome: APPROVE, RETRY, REVISE, FAIL
     - quality_score: 0.0-1.0
     - (other metadata fields)
+
+Turn Counters:
+    The turn_counters table holds the next-turn sequence per (scope, counter_key),
+    where scope is a turns directory and counter_key a session ID (or "_global").
+    Unlike the turns table it is NOT rebuilt from the filesystem - it is the
+    allocator that TurnCounter uses, so rebuild_from_filesystem() leaves it alone.
 """
 
 import sqlite3
@@ -32,7 +38,7 @@ import logging
 import os
 import re
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Tuple
+from typing import Callable, List, Dict, Any, Optional, Tuple
 from datetime import datetime
 from dataclasses import dataclass, field
 import threading
@@ -106,6 +112,8 @@ class TurnIndexDB:
         if not hasattr(_local, 'connection') or _local.connection is None:
             _local.connection = sqlite3.connect(str(self.db_path))
             _local.connection.row_factory = sqlite3.Row
+            # WAL lets gateway workers allocate turns while others read the index
+            _local.connection.execute("PRAGMA journal_mode=WAL")
         return _local.connection
 
     def _init_db(self):
@@ -160,6 +168,7 @@ class TurnIndexDB:
         else:
             self._create_tables(conn)
 
+        self._create_counter_table(conn)
         conn.commit()
         logger.debug(f"[TurnIndexDB] Initialized at {self.db_path}")
 
@@ -206,6 +215,99 @@ class TurnIndexDB:
             (str(SCHEMA_VERSION),)
         )
 
+    def _create_counter_table(self, conn: sqlite3.Connection):
+        """Create the turn number allocation table (added after v4, so created separately)."""
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS turn_counters (
+                scope TEXT NOT NULL,
+                counter_key TEXT NOT NULL,
+                value INTEGER NOT NULL,
+                PRIMARY KEY (scope, counter_key)
+            ) WITHOUT ROWID
+        """)
+
+    # =========================================================================
+    # TURN NUMBER ALLOCATION
+    # =========================================================================
+
+    def allocate_turn_number(
+        self,
+        scope: str,
+        counter_key: str = "_global",
+        seed: Optional[Callable[[], int]] = None
+    ) -> int:
+        """
+        Atomically allocate the next turn number for a counter.
+
+        The common case is a single UPDATE ... RETURNING on the primary key, so
+        concurrent gateway workers serialize on SQLite's write lock instead of
+        a lock file. A counter seen for the first time starts after the highest
+        value already allocated in its scope, or after seed() if the scope is new.
+
+        Args:
+            scope: Counter namespace (the turns directory)
+            counter_key: Session ID, or "_global"
+            seed: Returns the current max turn number for a brand-new scope
+
+        Returns:
+            Allocated turn number
+        """
+        conn = self._get_connection()
+        try:
+            row = conn.execute("""
+                UPDATE turn_counters SET value = value + 1
+                WHERE scope = ? AND counter_key = ?
+                RETURNING value
+            """, (scope, counter_key)).fetchone()
+
+            if row is None:
+                scope_max = conn.execute(
+                    "SELECT MAX(value) FROM turn_counters WHERE scope = ?", (scope,)
+                ).fetchone()[0]
+                if scope_max is None:
+                    scope_max = seed() if seed else 0
+                # Another worker may create the row between the UPDATE and here
+                row = conn.execute("""
+                    INSERT INTO turn_counters (scope, counter_key, value) VALUES (?, ?, ?)
+                    ON CONFLICT(scope, counter_key) DO UPDATE SET value = value + 1
+                    RETURNING value
+                """, (scope, counter_key, scope_max + 1)).fetchone()
+
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+
+        return row[0]
+
+    def import_turn_counters(self, scope: str, counters: Dict[str, int]) -> int:
+        """
+        Merge legacy counter values into a scope, keeping the higher value.
+
+        Used for the one-time migration from the .turn_counter.json file; safe to
+        run more than once.
+
+        Returns:
+            Number of counters imported
+        """
+        rows = [(scope, key, int(value)) for key, value in counters.items()]
+        conn = self._get_connection()
+        conn.executemany("""
+            INSERT INTO turn_counters (scope, counter_key, value) VALUES (?, ?, ?)
+            ON CONFLICT(scope, counter_key) DO UPDATE SET value = MAX(value, excluded.value)
+        """, rows)
+        conn.commit()
+        return len(rows)
+
+    def reset_turn_counter(self, scope: str, counter_key: str = "_global"):
+        """Forget a counter so the next allocation re-seeds it."""
+        conn = self._get_connection()
+        conn.execute(
+            "DELETE FROM turn_counters WHERE scope = ? AND counter_key = ?",
+            (scope, counter_key)
+        )
+        conn.commit()
+
     # =========================================================================
     # REBUILD FROM FILESYSTEM (Source of Truth)
     # =========================================================================
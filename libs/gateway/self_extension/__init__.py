@@ -34,6 +34,12 @@ from libs.gateway.self_extension.sandbox_runner import (
     run_tool_tests,
 )
 
+from libs.gateway.self_extension.sandbox_pool import (
+    SandboxWorkerPool,
+    SandboxPoolError,
+    get_sandbox_pool,
+)
+
 from libs.gateway.self_extension.tool_creator import (
     ToolCreator,
     ToolCreationResult,
@@ -65,6 +71,10 @@ __all__ = [
     "TestResult",
     "get_sandbox_runner",
     "run_tool_tests",
+    # Sandbox Worker Pool
+    "SandboxWorkerPool",
+    "SandboxPoolError",
+    "get_sandbox_pool",
     # Tool Creator
     "ToolCreator",
     "ToolCreationResult",
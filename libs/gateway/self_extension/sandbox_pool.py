@@ -0,0 +1,262 @@
+"""
+Sandbox Worker Pool - Warm, pre-imported interpreters for sandbox tests.
+
+Tool creation iterates generate -> test many times, and each test run used to
+pay a full interpreter start plus pytest import. The pool keeps a few
+sandbox_worker.py processes alive with pytest (and optional preload modules)
+already imported. Each test file runs in a child forked from a warm worker:
+- starts with imports done (no interpreter/pytest startup)
+- gets CPU-time and address-space limits
+- exits after the run, so no state leaks between tests
+
+Workers are recycled after max_uses jobs, and replaced if they die or hang.
+Requires os.fork; SandboxRunner falls back to plain subprocesses without it.
+
+Architecture Reference:
+- architecture/concepts/TOOL_SYSTEM.md
+"""
+
+import asyncio
+import atexit
+import json
+import logging
+import os
+import signal
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+WORKER_SCRIPT = Path(__file__).with_name("sandbox_worker.py")
+
+DEFAULT_POOL_SIZE = min(os.cpu_count() or 2, 4)
+DEFAULT_MAX_USES = 50
+DEFAULT_MEMORY_LIMIT_MB = 2048
+
+# Extra seconds the pool waits past the job timeout before giving up on a worker
+WORKER_GRACE_SECONDS = 5
+
+
+class SandboxPoolError(Exception):
+    """The pool could not run a job (caller should fall back to a fresh subprocess)."""
+    pass
+
+
+def pool_supported() -> bool:
+    """Warm workers need fork()."""
+    return hasattr(os, "fork") and sys.platform != "win32"
+
+
+class SandboxWorker:
+    """One warm worker process."""
+
+    def __init__(self, process: asyncio.subprocess.Process, info: Dict[str, Any]):
+        self.process = process
+        self.info = info
+        self.uses = 0
+
+    @property
+    def alive(self) -> bool:
+        return self.process.returncode is None
+
+    async def run(self, job: Dict[str, Any], timeout: float) -> Dict[str, Any]:
+        self.uses += 1
+        self.process.stdin.write((json.dumps(job) + "\n").encode())
+        await self.process.stdin.drain()
+        line = await asyncio.wait_for(self.process.stdout.readline(), timeout=timeout + WORKER_GRACE_SECONDS)
+        if not line:
+            raise SandboxPoolError("worker exited during job")
+        return json.loads(line)
+
+    async def close(self) -> None:
+        if not self.alive:
+            return
+        try:
+            self.process.stdin.close()
+            await asyncio.wait_for(self.process.wait(), timeout=2)
+        except (asyncio.TimeoutError, Exception):
+            self.kill()
+
+    def kill(self) -> None:
+        """Kill the worker and any test child it has forked (same process group)."""
+        if self.alive:
+            try:
+                os.killpg(self.process.pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+
+
+class SandboxWorkerPool:
+    """
+    Pool of warm sandbox workers.
+
+    Features:
+    - Parallel test files (one job per worker at a time)
+    - Forked child per job: resource limits, clean state
+    - Recycling after max_uses jobs, replacement of dead/hung workers
+    """
+
+    def __init__(
+        self,
+        size: int = DEFAULT_POOL_SIZE,
+        max_uses: int = DEFAULT_MAX_USES,
+        python_path: Optional[str] = None,
+        env: Optional[Dict[str, str]] = None,
+        memory_limit_mb: int = DEFAULT_MEMORY_LIMIT_MB,
+        preload: Sequence[str] = (),
+    ):
+        """
+        Initialize worker pool (workers start lazily or via warm_up).
+
+        Args:
+            size: Max concurrent workers
+            max_uses: Jobs per worker before it is replaced
+            python_path: Interpreter for workers (default: current)
+            env: Environment for workers
+            memory_limit_mb: Address-space limit per test run (0 = none)
+            preload: Extra modules each worker imports up front
+        """
+        self.size = max(1, size)
+        self.max_uses = max_uses
+        self.python_path = python_path or sys.executable
+        self.env = dict(env if env is not None else os.environ)
+        self.env["SANDBOX_MEMORY_LIMIT_MB"] = str(memory_limit_mb)
+        self.env["SANDBOX_PRELOAD"] = ",".join(preload)
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._idle: List[SandboxWorker] = []
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._all: List[SandboxWorker] = []
+        self.stats = {"jobs": 0, "spawned": 0, "recycled": 0, "failures": 0}
+        # Set when workers can never work here (e.g. no pytest) - stop retrying
+        self.unavailable: Optional[str] = None
+
+    def _bind_loop(self) -> None:
+        """
+        Workers belong to the event loop that spawned them; start over on a new loop.
+
+        Callers that discard their loop (asyncio.run) should await close()
+        first: workers left behind here are only killed, and their transports
+        are finalized after the old loop is gone.
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+        for worker in self._all:
+            worker.kill()
+        self._loop = loop
+        self._idle = []
+        self._all = []
+        self._slots = asyncio.Semaphore(self.size)
+
+    async def _spawn(self) -> SandboxWorker:
+        process = await asyncio.create_subprocess_exec(
+            self.python_path, "-u", str(WORKER_SCRIPT),
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+            env=self.env,
+            # Own process group, so kill() also reaches a forked test child
+            start_new_session=True,
+        )
+        try:
+            line = await asyncio.wait_for(process.stdout.readline(), timeout=30)
+            info = json.loads(line) if line else {}
+        except (asyncio.TimeoutError, json.JSONDecodeError):
+            info = {}
+        if not info.get("ready"):
+            process.kill()
+            raise SandboxPoolError("worker failed to start")
+        if not info.get("pytest"):
+            process.kill()
+            self.unavailable = "pytest is not importable in the sandbox interpreter"
+            raise SandboxPoolError(self.unavailable)
+
+        worker = SandboxWorker(process, info)
+        self._all.append(worker)
+        self.stats["spawned"] += 1
+        logger.debug(f"[SandboxPool] Worker {info.get('pid')} ready (preloaded={info.get('preloaded')})")
+        return worker
+
+    async def warm_up(self, count: Optional[int] = None) -> int:
+        """Start idle workers ahead of time. Returns how many are idle."""
+        self._bind_loop()
+        missing = min(count or self.size, self.size) - len(self._all)
+        if missing > 0:
+            spawned = await asyncio.gather(*(self._spawn() for _ in range(missing)), return_exceptions=True)
+            self._idle.extend(w for w in spawned if isinstance(w, SandboxWorker))
+        return len(self._idle)
+
+    async def run(
+        self,
+        test_file: Path,
+        cwd: str,
+        timeout: float,
+        pytest_args: Sequence[str] = (),
+    ) -> Dict[str, Any]:
+        """
+        Run one pytest file in a warm worker.
+
+        Returns:
+            {"exit_code", "stdout", "stderr", "timed_out"}
+
+        Raises:
+            SandboxPoolError: If no worker could run the job
+        """
+        if not pool_supported():
+            raise SandboxPoolError("fork() not available")
+        if self.unavailable:
+            raise SandboxPoolError(self.unavailable)
+
+        self._bind_loop()
+        async with self._slots:
+            try:
+                worker = self._idle.pop() if self._idle else await self._spawn()
+            except OSError as e:
+                raise SandboxPoolError(f"could not start worker: {e}") from e
+            job = {"test_file": str(test_file), "cwd": cwd, "timeout": timeout, "args": list(pytest_args)}
+            try:
+                result = await worker.run(job, timeout)
+            except BaseException as e:
+                # Also on cancellation: a worker left mid-job can't be reused
+                worker.kill()
+                if worker in self._all:
+                    self._all.remove(worker)
+                if not isinstance(e, Exception):
+                    raise
+                self.stats["failures"] += 1
+                raise SandboxPoolError(f"worker failed: {e}") from e
+
+            self.stats["jobs"] += 1
+            if worker.uses >= self.max_uses or not worker.alive:
+                self.stats["recycled"] += 1
+                self._all.remove(worker)
+                await worker.close()
+            else:
+                self._idle.append(worker)
+            return result
+
+    async def close(self) -> None:
+        """Stop all workers (call before the owning event loop is closed)."""
+        workers, self._all, self._idle = self._all, [], []
+        await asyncio.gather(*(worker.close() for worker in workers))
+
+    def kill_all(self) -> None:
+        """Kill all workers without awaiting them (interpreter shutdown)."""
+        workers, self._all, self._idle = self._all, [], []
+        for worker in workers:
+            worker.kill()
+
+
+# Module-level singleton
+_pool: Optional[SandboxWorkerPool] = None
+
+
+def get_sandbox_pool(**kwargs) -> SandboxWorkerPool:
+    """Get or create the shared worker pool (kwargs apply only on creation)."""
+    global _pool
+    if _pool is None:
+        _pool = SandboxWorkerPool(**kwargs)
+        atexit.register(_pool.kill_all)
+    return _pool
@@ -8,6 +8,10 @@ Runs tests in isolated subprocess with:
 - Timeout enforcement
 - Output capture
 - Exit code checking
+
+Test files run in parallel on warm, pre-imported workers from
+SandboxWorkerPool (see sandbox_pool.py) when fork() is available, falling
+back to a fresh interpreter per test otherwise.
 """
 
 import asyncio
@@ -20,6 +24,14 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import List, Optional
 
+from libs.gateway.self_extension.sandbox_pool import (
+    DEFAULT_POOL_SIZE,
+    SandboxPoolError,
+    SandboxWorkerPool,
+    get_sandbox_pool,
+    pool_supported,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -62,14 +74,20 @@ class SandboxRunner:
     - Output capture (stdout/stderr)
     - Exit code checking
     - Python path isolation
+    - Warm worker pool with parallel test files
     """
 
     DEFAULT_TIMEOUT = 30  # seconds
 
+    # Same flags as the subprocess path
+    PYTEST_ARGS = ["-v", "--tb=short", "-x"]
+
     def __init__(
         self,
         timeout: int = DEFAULT_TIMEOUT,
-        python_path: Optional[str] = None
+        python_path: Optional[str] = None,
+        use_pool: bool = True,
+        pool: Optional[SandboxWorkerPool] = None
     ):
         """
         Initialize sandbox runner.
@@ -77,9 +95,28 @@ class SandboxRunner:
         Args:
             timeout: Maximum seconds per test
             python_path: Python interpreter to use (default: current)
+            use_pool: Run tests on warm pool workers when possible
+            pool: Worker pool (default: shared pool)
         """
         self.timeout = timeout
         self.python_path = python_path or sys.executable
+        self.use_pool = use_pool and pool_supported()
+        self._pool = pool
+
+    @property
+    def pool(self) -> Optional[SandboxWorkerPool]:
+        """Worker pool, created on first use (None if pooling is off)."""
+        if not self.use_pool:
+            return None
+        if self._pool is None:
+            self._pool = get_sandbox_pool(python_path=self.python_path, env=self._get_sandbox_env())
+        return self._pool
+
+    async def warm_up(self) -> int:
+        """Start pool workers ahead of the first test run. Returns idle worker count."""
+        if self.pool is None:
+            return 0
+        return await self.pool.warm_up()
 
     async def run_tests(
         self,
@@ -103,12 +140,24 @@ class SandboxRunner:
             tests_failed=0
         )
 
+        existing = []
         for test_file in test_files:
             if not test_file.exists():
                 logger.warning(f"[SandboxRunner] Test file not found: {test_file}")
                 continue
+            existing.append(test_file)
+
+        # Files are independent - run them side by side, at most pool-size at
+        # once (also when falling back to fresh interpreters)
+        limit = asyncio.Semaphore(self.pool.size if self.pool is not None else DEFAULT_POOL_SIZE)
+
+        async def run_bounded(test_file: Path) -> TestResult:
+            async with limit:
+                return await self.run_single_test(test_file, working_dir)
+
+        test_results = await asyncio.gather(*(run_bounded(test_file) for test_file in existing))
 
-            test_result = await self.run_single_test(test_file, working_dir)
+        for test_result in test_results:
             result.results.append(test_result)
             result.tests_run += 1
 
@@ -140,6 +189,12 @@ class SandboxRunner:
 
         cwd = str(working_dir) if working_dir else str(test_file.parent)
 
+        if self.pool is not None:
+            try:
+                return await self._run_in_pool(test_file, cwd, start_time)
+            except SandboxPoolError as e:
+                logger.warning(f"[SandboxRunner] Worker pool unavailable ({e}), using fresh interpreter")
+
         # Build command - use pytest if available, else direct python
         cmd = [
             self.python_path,
@@ -207,6 +262,41 @@ class SandboxRunner:
                 error_message=f"Execution error: {e}"
             )
 
+    async def _run_in_pool(
+        self,
+        test_file: Path,
+        cwd: str,
+        start_time: float
+    ) -> TestResult:
+        """Run a test file on a warm pool worker."""
+        import time
+
+        outcome = await self.pool.run(test_file, cwd, self.timeout, self.PYTEST_ARGS)
+        duration_ms = int((time.time() - start_time) * 1000)
+
+        if outcome.get("timed_out"):
+            return TestResult(
+                passed=False,
+                exit_code=-1,
+                stdout=outcome.get("stdout", ""),
+                stderr=outcome.get("stderr", ""),
+                duration_ms=duration_ms,
+                test_file=str(test_file),
+                error_message=f"Test timed out after {self.timeout}s"
+            )
+
+        exit_code = outcome.get("exit_code", -1)
+        passed = exit_code == 0
+        return TestResult(
+            passed=passed,
+            exit_code=exit_code,
+            stdout=outcome.get("stdout", ""),
+            stderr=outcome.get("stderr", ""),
+            duration_ms=duration_ms,
+            test_file=str(test_file),
+            error_message=None if passed else f"Test failed with exit code {exit_code}"
+        )
+
     async def _run_direct_python(
         self,
         test_file: Path,
@@ -289,8 +379,20 @@ class SandboxRunner:
         test_files: List[Path],
         working_dir: Optional[Path] = None
     ) -> SandboxResult:
-        """Synchronous wrapper for run_tests."""
-        return asyncio.run(self.run_tests(test_files, working_dir))
+        """
+        Synchronous wrapper for run_tests.
+
+        Pool workers are stopped before asyncio.run closes its loop; they
+        cannot outlive it.
+        """
+        async def run_and_close() -> SandboxResult:
+            try:
+                return await self.run_tests(test_files, working_dir)
+            finally:
+                if self._pool is not None:
+                    await self._pool.close()
+
+        return asyncio.run(run_and_close())
 
 
 # Module-level singleton
@@ -0,0 +1,152 @@
+"""
+Sandbox Worker - Warm interpreter process for the sandbox worker pool.
+
+Started by SandboxWorkerPool as `python sandbox_worker.py` (by path, so the
+self_extension package and its imports are not loaded here). On start it
+imports pytest plus any preload modules once, then serves jobs over
+stdin/stdout as JSON lines:
+
+    -> {"test_file": ..., "cwd": ..., "timeout": 30, "args": [...]}
+    <- {"exit_code": 0, "stdout": ..., "stderr": ..., "timed_out": false}
+
+Each job runs in a child forked from this warm process, so it starts with
+everything already imported, gets resource limits applied, and leaves no
+state behind (the child exits; the warm parent is never touched by a test).
+
+Standard library only.
+"""
+
+import importlib
+import json
+import os
+import signal
+import sys
+import tempfile
+import time
+
+# Poll interval while waiting on a job child
+_WAIT_POLL_SECONDS = 0.005
+
+
+def _apply_limits(timeout: float, memory_limit_mb: int) -> None:
+    """Resource limits for a job child (best effort - not every platform has them)."""
+    try:
+        import resource
+    except ImportError:
+        return
+
+    cpu_seconds = int(timeout) + 1
+    try:
+        resource.setrlimit(resource.RLIMIT_CPU, (cpu_seconds, cpu_seconds + 1))
+    except (ValueError, OSError):
+        pass
+    if memory_limit_mb:
+        limit = memory_limit_mb * 1024 * 1024
+        try:
+            resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+        except (ValueError, OSError):
+            pass
+
+
+def _run_child(job: dict, out_fd: int, err_fd: int, memory_limit_mb: int) -> None:
+    """Runs in the forked child. Never returns."""
+    exit_code = 1
+    try:
+        os.dup2(out_fd, 1)
+        os.dup2(err_fd, 2)
+        sys.stdout = os.fdopen(1, "w", buffering=1)
+        sys.stderr = os.fdopen(2, "w", buffering=1)
+        sys.stdin = open(os.devnull)
+
+        os.chdir(job["cwd"])
+        sys.path.insert(0, job["cwd"])
+        _apply_limits(job.get("timeout", 30), memory_limit_mb)
+
+        import pytest
+        exit_code = int(pytest.main([job["test_file"], *job.get("args", [])]))
+    except SystemExit as e:
+        exit_code = e.code if isinstance(e.code, int) else 1
+    except BaseException as e:  # noqa: BLE001 - report anything the test run raised
+        try:
+            sys.stderr.write(f"Sandbox worker error: {e!r}\n")
+        except Exception:
+            pass
+        exit_code = 1
+    finally:
+        try:
+            sys.stdout.flush()
+            sys.stderr.flush()
+        except Exception:
+            pass
+        os._exit(exit_code)
+
+
+def _run_job(job: dict, memory_limit_mb: int) -> dict:
+    timeout = float(job.get("timeout", 30))
+    with tempfile.TemporaryFile() as out, tempfile.TemporaryFile() as err:
+        pid = os.fork()
+        if pid == 0:
+            _run_child(job, out.fileno(), err.fileno(), memory_limit_mb)
+
+        deadline = time.monotonic() + timeout
+        timed_out = False
+        status = None
+        while status is None:
+            finished, raw_status = os.waitpid(pid, os.WNOHANG)
+            if finished:
+                status = raw_status
+            elif time.monotonic() >= deadline:
+                timed_out = True
+                os.kill(pid, signal.SIGKILL)
+                _, status = os.waitpid(pid, 0)
+            else:
+                time.sleep(_WAIT_POLL_SECONDS)
+
+        out.seek(0)
+        err.seek(0)
+        return {
+            "exit_code": -1 if timed_out else os.waitstatus_to_exitcode(status),
+            "stdout": out.read().decode("utf-8", errors="replace"),
+            "stderr": err.read().decode("utf-8", errors="replace"),
+            "timed_out": timed_out,
+        }
+
+
+def main() -> int:
+    memory_limit_mb = int(os.environ.get("SANDBOX_MEMORY_LIMIT_MB", "0") or 0)
+    preload = [m for m in os.environ.get("SANDBOX_PRELOAD", "").split(",") if m]
+
+    protocol = sys.stdout
+    # Anything imported modules print must not corrupt the protocol stream
+    sys.stdout = sys.stderr
+
+    ready = {"ready": True, "pid": os.getpid(), "pytest": True, "preloaded": []}
+    try:
+        importlib.import_module("pytest")
+    except ImportError:
+        ready["pytest"] = False
+    for module in preload:
+        try:
+            importlib.import_module(module)
+            ready["preloaded"].append(module)
+        except Exception:
+            pass
+
+    protocol.write(json.dumps(ready) + "\n")
+    protocol.flush()
+
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            response = _run_job(json.loads(line), memory_limit_mb)
+        except Exception as e:
+            response = {"exit_code": -1, "stdout": "", "stderr": str(e), "timed_out": False, "error": str(e)}
+        protocol.write(json.dumps(response) + "\n")
+        protocol.flush()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -14,6 +14,7 @@ Creation Flow:
 6. On success: register tool in catalog
 """
 
+import asyncio
 import json
 import logging
 from dataclasses import dataclass
@@ -34,7 +35,6 @@ from libs.gateway.self_extension.sandbox_runner import (
     SandboxRunner,
     SandboxResult,
     get_sandbox_runner,
-    run_tool_tests,
 )
 
 if TYPE_CHECKING:
@@ -146,6 +146,11 @@ class ToolCreator:
         if test_path:
             files_to_backup.append(test_path)
 
+        # Start sandbox workers while files are written (no-op if already warm)
+        warm_up = None
+        if test_content and not skip_tests:
+            warm_up = asyncio.create_task(self.sandbox_runner.warm_up())
+
         with RollbackContext(backup_manager, files_to_backup, plan_state_path) as ctx:
             try:
                 # Create directories
@@ -163,7 +168,9 @@ class ToolCreator:
 
                 # 5. Run tests (if provided and not skipped)
                 if test_content and test_path and not skip_tests:
-                    test_result = await run_tool_tests([test_path], working_dir=bundle_dir)
+                    if warm_up:
+                        await asyncio.gather(warm_up, return_exceptions=True)
+                    test_result = await self.sandbox_runner.run_tests([test_path], working_dir=bundle_dir)
                     result.test_result = test_result
 
                     if not test_result.success:
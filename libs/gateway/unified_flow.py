@@ -48,6 +48,7 @@ import asyncio
 import time
 import shutil
 import aiohttp
+from contextlib import aclosing
 from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime
 from pathlib import Path
@@ -80,6 +81,8 @@ from libs.gateway.llm.recipe_loader import load_recipe, select_recipe
 
 # Validation module
 from libs.gateway.validation.phase_metrics import PhaseMetrics, emit_phase_event as _emit_phase_event
+from libs.gateway.parsing.json_scanner import StreamingJSONScanner
+from libs.core.tracing import begin_turn_trace, start_phase_span, end_phase_span
 from libs.gateway.validation.response_confidence import (
     ResponseConfidenceCalculator,
     AggregateConfidence,
@@ -169,6 +172,19 @@ UNIFIED_FLOW_ENABLED = os.getenv("UNIFIED_FLOW_ENABLED", "false").lower() == "tr
 # When enabled, checks document sizes before LLM calls and logs compression needs
 SMART_SUMMARIZATION = os.getenv("SMART_SUMMARIZATION", "true").lower() == "true"
 
+# Speculative context - start Phase 2's non-LLM lookups while Phase 1.5 decides
+# PROCEED/CLARIFY, and cancel them on CLARIFY (opt-in)
+SPECULATIVE_CONTEXT = os.getenv("SPECULATIVE_CONTEXT", "false").lower() == "true"
+
+# Incremental retries - on validation RETRY, reuse this turn's tool results and
+# re-execute only the ones the validator invalidated (opt-in)
+INCREMENTAL_RETRY = os.getenv("INCREMENTAL_RETRY", "false").lower() == "true"
+
+# Streaming coordinator - read the Coordinator's selection as a token stream and
+# dispatch the workflow as soon as the JSON object closes, instead of waiting for
+# the end of generation (opt-in)
+STREAMING_COORDINATOR = os.getenv("STREAMING_COORDINATOR", "false").lower() == "true"
+
 # Maximum revision attempts for validation loop
 MAX_VALIDATION_REVISIONS = 2
 
@@ -316,7 +332,13 @@ class UnifiedFlow:
         )
 
         # Request handler for main request orchestration (extracted 2026-02-03)
-        self.request_handler = get_request_handler(llm_client=llm_client)
+        self.request_handler = get_request_handler(
+            llm_client=llm_client,
+            config=RequestHandlerConfig(
+                speculative_context=SPECULATIVE_CONTEXT,
+                incremental_retry=INCREMENTAL_RETRY,
+            ),
+        )
 
         # Executor loop for Phase 4 (extracted 2026-02-03)
         self.executor_loop = get_executor_loop(llm_client=llm_client)
@@ -342,10 +364,12 @@ class UnifiedFlow:
     def _start_phase(self, phase_name: str):
         """Mark the start of a phase for timing. Delegates to PhaseMetrics."""
         self.phase_metrics.start_phase(phase_name)
+        start_phase_span(phase_name)
 
     def _end_phase(self, phase_name: str, tokens_in: int = 0, tokens_out: int = 0):
         """Mark the end of a phase and record metrics. Delegates to PhaseMetrics."""
         self.phase_metrics.end_phase(phase_name, tokens_in, tokens_out)
+        end_phase_span(phase_name, {"tokens_in": tokens_in, "tokens_out": tokens_out})
 
     def _record_decision(self, decision_type: str, decision_value: str, context: str = ""):
         """Record a decision made during the turn. Delegates to PhaseMetrics."""
@@ -491,6 +515,15 @@ class UnifiedFlow:
         )
         turn_dir.create()
 
+        # Root span of this turn; ending it writes trace.json next to context.md
+        turn_span = begin_turn_trace(turn_dir.path, {
+            "panda.trace_id": trace_id,
+            "session_id": session_id,
+            "turn_number": turn_number,
+            "mode": mode,
+            "user_id": path_resolver.user_id,
+        })
+
         # Clean query: Remove UI-added prefixes
         clean_query = user_query
         for prefix in ["Question: ", "Answer: ", "Q: ", "A: "]:
@@ -608,6 +641,7 @@ class UnifiedFlow:
                 finalize_turn_metrics=self._finalize_turn_metrics,
                 phase1_reflection=self._phase1_reflection,
                 phase2_context_gatherer=self._phase2_context_gatherer,
+                phase2_prefetch=self._phase2_prefetch,
                 phase3_4_planning_loop=self._phase3_4_planning_loop,
                 phase5_synthesis=self._phase5_synthesis,
                 phase6_validation=self._phase6_validation,
@@ -636,6 +670,7 @@ class UnifiedFlow:
 
         except Exception as e:
             logger.exception(f"[UnifiedFlow] Error in request handling: {e}")
+            turn_span.record_error(e)
             return {
                 "response": f"I encountered an error processing your request: {str(e)}",
                 "error": str(e),
@@ -644,6 +679,8 @@ class UnifiedFlow:
                 "trace_id": trace_id,
                 "unified_flow": True
             }
+        finally:
+            turn_span.end()
 
     # ========== Phase Implementations ==========
 
@@ -678,22 +715,14 @@ class UnifiedFlow:
 
         raise RuntimeError("Phase 1.5 validation missing from query analysis; cannot proceed.")
 
-    async def _phase2_context_gatherer(self, context_doc: ContextDocument) -> ContextDocument:
-        """
-        Phase 2.1/2.2/2.5: Context Gatherer
-
-        Searches prior turns and builds §2 (Gathered Context).
-
-        Uses ContextGatherer2Phase: Retrieval + Synthesis + Validation
-        """
-        logger.info("[UnifiedFlow] Phase 2.1/2.2/2.5: Context Gatherer")
-
+    def _create_context_gatherer(self, context_doc: ContextDocument) -> ContextGatherer2Phase:
+        """Build a ContextGatherer2Phase for the request paths on context_doc."""
         # Use request-specific paths from context_doc, fall back to instance defaults
         turns_dir = getattr(context_doc, '_request_turns_dir', None) or self.turns_dir
         sessions_dir = getattr(context_doc, '_request_sessions_dir', None) or self.sessions_dir
         user_id = getattr(context_doc, 'user_id', None)
 
-        gatherer = ContextGatherer2Phase(
+        return ContextGatherer2Phase(
             session_id=context_doc.session_id,
             llm_client=self.llm_client,
             turns_dir=turns_dir,
@@ -703,6 +732,37 @@ class UnifiedFlow:
             user_id=user_id
         )
 
+    async def _phase2_prefetch(self, context_doc: ContextDocument) -> ContextGatherer2Phase:
+        """
+        Speculative Phase 2 lookups, run concurrently with Phase 1.5.
+
+        Returns the gatherer holding the prefetched results, to be handed back
+        to _phase2_context_gatherer if Phase 1.5 decides PROCEED.
+        """
+        gatherer = self._create_context_gatherer(context_doc)
+        await gatherer.prefetch(query=context_doc.query, turn_number=context_doc.turn_number)
+        return gatherer
+
+    async def _phase2_context_gatherer(
+        self,
+        context_doc: ContextDocument,
+        gatherer: Optional[ContextGatherer2Phase] = None
+    ) -> ContextDocument:
+        """
+        Phase 2.1/2.2/2.5: Context Gatherer
+
+        Searches prior turns and builds §2 (Gathered Context).
+
+        Uses ContextGatherer2Phase: Retrieval + Synthesis + Validation
+
+        Args:
+            context_doc: Current context document
+            gatherer: Gatherer returned by _phase2_prefetch, if speculation ran
+        """
+        logger.info("[UnifiedFlow] Phase 2.1/2.2/2.5: Context Gatherer")
+
+        gatherer = gatherer or self._create_context_gatherer(context_doc)
+
         # Gather context (creates a new ContextDocument with §0 and §1)
         new_doc = await gatherer.gather(
             query=context_doc.query,
@@ -958,16 +1018,12 @@ class UnifiedFlow:
         # REFLEX role (temp=0.4) for deterministic tool selection
         # See: architecture/LLM-ROLES/llm-roles-reference.md
         temperature = recipe._raw_spec.get("llm_params", {}).get("temperature", 0.4)
-        llm_response = await self.llm_client.call(
-            prompt=prompt,
-            role="coordinator",
+        selection = await self._coordinator_select(
+            prompt,
             max_tokens=recipe.token_budget.output,
             temperature=temperature
         )
 
-        # Parse workflow selection
-        selection = self.response_parser.parse_json(llm_response)
-
         if selection.get("_type") == "NEEDS_CLARIFICATION" or selection.get("status") == "needs_more_info":
             return {
                 "_type": "COORDINATOR_RESULT",
@@ -1037,6 +1093,72 @@ class UnifiedFlow:
         workflow_result["workflow_args"] = workflow_args
         return workflow_result
 
+    async def _coordinator_select(
+        self,
+        prompt: str,
+        max_tokens: int,
+        temperature: float
+    ) -> Dict[str, Any]:
+        """
+        Call the Coordinator LLM and parse its workflow selection.
+
+        With STREAMING_COORDINATOR the response is consumed as a stream and the
+        connection is closed as soon as the selection object is complete, so the
+        workflow starts without waiting for trailing text or the token budget.
+        Brackets in prose before the JSON ("pick [x]", "{research}") are
+        skipped: the stream only stops on an object with workflow_selected or
+        status. Falls back to a blocking call if streaming or parsing fails.
+        """
+        if STREAMING_COORDINATOR and hasattr(self.llm_client, "call_stream"):
+            scanner = StreamingJSONScanner()
+            selection: Optional[Dict[str, Any]] = None
+            try:
+                stream = self.llm_client.call_stream(
+                    prompt=prompt,
+                    role="coordinator",
+                    max_tokens=max_tokens,
+                    temperature=temperature
+                )
+                async with aclosing(stream):
+                    async for chunk in stream:
+                        scanner.feed(chunk)
+                        while scanner.done:
+                            selection = self._as_coordinator_selection(scanner.value_text)
+                            if selection is not None:
+                                break
+                            scanner.restart()
+                        if selection is not None:
+                            break
+                if selection is None:
+                    # Stream ended without a recognizable closed object
+                    selection = self.response_parser.parse_json(scanner.buffer)
+            except Exception as e:
+                logger.warning(f"[UnifiedFlow] Coordinator streaming failed, retrying without stream: {e}")
+            else:
+                logger.info(
+                    f"[UnifiedFlow] Coordinator selection streamed "
+                    f"({len(scanner.buffer)} chars, closed={scanner.done})"
+                )
+                return selection
+
+        llm_response = await self.llm_client.call(
+            prompt=prompt,
+            role="coordinator",
+            max_tokens=max_tokens,
+            temperature=temperature
+        )
+        return self.response_parser.parse_json(llm_response)
+
+    def _as_coordinator_selection(self, text: str) -> Optional[Dict[str, Any]]:
+        """Parse a closed JSON value; None unless it is a selection object."""
+        try:
+            parsed = self.response_parser.parse_json(text)
+        except Exception:
+            return None
+        if isinstance(parsed, dict) and ("workflow_selected" in parsed or "status" in parsed):
+            return parsed
+        return None
+
     def _parse_tool_selection(self, llm_response: str) -> Dict[str, Any]:
         """Parse tool selection from Coordinator. Delegates to ResponseParser."""
         return self.response_parser.parse_tool_selection(llm_response)
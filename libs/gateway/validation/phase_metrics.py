@@ -6,6 +6,9 @@ Extracted from UnifiedFlow to provide:
 - Reusable metrics across different orchestrators
 - Consistent timing and token tracking
 
+Phase, tool and turn samples are also written to the persistent metrics store
+(libs/core/metrics_store.py) for percentile queries across turns.
+
 Usage:
     metrics = PhaseMetrics()
     metrics.init_turn()
@@ -27,6 +30,7 @@ from typing import Any, Dict, List, Optional
 
 from apps.services.gateway.services.thinking import emit_thinking_event, ThinkingEvent
 from apps.phases import PHASE_NAMES
+from libs.core.metrics_store import record_metric
 
 logger = logging.getLogger(__name__)
 
@@ -131,6 +135,10 @@ class PhaseMetrics:
         record.duration_ms = int((record.end_time - record.start_time) * 1000)
         record.tokens_in = tokens_in
         record.tokens_out = tokens_out
+        record_metric(
+            "phase", phase_name,
+            {"latency_ms": record.duration_ms, "tokens_in": tokens_in, "tokens_out": tokens_out}
+        )
 
         logger.debug(
             f"[PhaseMetrics] Ended phase: {phase_name} "
@@ -177,6 +185,7 @@ class PhaseMetrics:
             success=success,
             duration_ms=duration_ms
         ))
+        record_metric("tool", tool_name, {"latency_ms": duration_ms}, success=success)
         logger.debug(
             f"[PhaseMetrics] Recorded tool call: {tool_name} "
             f"(success={success}, {duration_ms}ms)"
@@ -247,6 +256,12 @@ class PhaseMetrics:
             "validation_outcome": validation_outcome
         }
 
+        record_metric(
+            "flow", "turn",
+            {"latency_ms": total_duration_ms, "tokens_in": total_tokens_in, "tokens_out": total_tokens_out},
+            success=validation_outcome != "FAIL"
+        )
+
         logger.info(
             f"[PhaseMetrics] Turn finalized: {total_duration_ms}ms, "
             f"{total_tokens_in}/{total_tokens_out} tokens, "